@@ -112,3 +112,23 @@ def test_build_result_pack_strips_internal_backtest_columns():
     assert result.backtest_result is not None
     assert "has_leading_nan" not in result.backtest_result.columns
     assert result.backtest_result["equity"].to_list() == backtest["equity"].to_list()
+
+
+def test_result_pack_views_are_cached_and_column_projects_numpy():
+    """getter 只转换一次并复用；column() 按列返回 NumPy 数组，缺列时报 KeyError。"""
+    data = _data_pack()
+    backtest = pl.DataFrame({"equity": [10_000.0, 10_100.0, 10_050.0, 10_200.0]})
+    signals = pl.DataFrame({"entry_long": [True, False, False, True]})
+    result = build_result_pack(data=data, signals=signals, backtest_result=backtest)
+
+    assert result.backtest_result is result.backtest_result
+    assert result.mapping is result.mapping
+    assert data.mapping is data.mapping
+
+    equity = result.column("equity")
+    assert equity.tolist() == backtest["equity"].to_list()
+    assert result.column("equity") is equity
+    assert result.column("entry_long").tolist() == [True, False, False, True]
+
+    with pytest.raises(KeyError, match="missing"):
+        result.column("missing")
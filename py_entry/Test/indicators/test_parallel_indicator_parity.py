@@ -0,0 +1,78 @@
+"""
+多 source 指标并行计算一致性测试
+
+单回测入口（外层无并行）走 (source, indicator) 并行路径，
+批量回测入口（外层已并行）保持单线程串行路径，两者结果必须逐列一致。
+"""
+
+import polars as pl
+from polars.testing import assert_frame_equal
+
+from py_entry.data_generator import DataGenerationParams
+from py_entry.types import ArtifactRetention, ExecutionStage, Param
+from py_entry.Test.shared import (
+    TEST_START_TIME_MS,
+    make_backtest_runner,
+    make_engine_settings,
+)
+
+
+def _build_multi_source_indicators() -> dict:
+    """构造覆盖多 source、多指标的参数集。"""
+    return {
+        "ohlcv_15m": {
+            "sma_0": {"period": Param(20)},
+            "ema_0": {"period": Param(34)},
+            "rsi_0": {"period": Param(14)},
+            "bbands_0": {"period": Param(20), "std": Param(2.0)},
+        },
+        "ohlcv_1h": {
+            "macd_0": {
+                "fast_period": Param(12),
+                "slow_period": Param(26),
+                "signal_period": Param(9),
+            },
+            "adx_0": {"period": Param(14), "adxr_length": Param(2)},
+        },
+        "ohlcv_4h": {
+            "psar_0": {
+                "af0": Param(0.02),
+                "af_step": Param(0.02),
+                "max_af": Param(0.2),
+            },
+        },
+    }
+
+
+def test_parallel_indicators_match_single_thread_path():
+    """单回测并行路径与批量回测串行路径的指标输出一致。"""
+    data_params = DataGenerationParams(
+        timeframes=["15m", "1h", "4h"],
+        start_time=TEST_START_TIME_MS,
+        num_bars=3000,
+        fixed_seed=42,
+        base_data_key="ohlcv_15m",
+    )
+    bt = make_backtest_runner(
+        data_source=data_params,
+        indicators=_build_multi_source_indicators(),
+        engine_settings=make_engine_settings(
+            stop_stage=ExecutionStage.Indicator,
+            artifact_retention=ArtifactRetention.StopStageOnly,
+        ),
+    )
+
+    parallel_indicators = bt.run().raw.indicators
+    # 批量 >1 个任务时，每个任务都包在单线程池中执行。
+    batch_view = bt.batch([bt.params, bt.params])
+    serial_indicators = batch_view.items[0].raw.indicators
+
+    assert parallel_indicators is not None
+    assert serial_indicators is not None
+    assert set(parallel_indicators) == set(serial_indicators)
+    for source_key, parallel_df in parallel_indicators.items():
+        serial_df = serial_indicators[source_key]
+        assert isinstance(parallel_df, pl.DataFrame)
+        # 中文注释：两次运行各自提取参数 HashMap，列顺序一致依赖引擎按指标键排序输出。
+        assert parallel_df.columns == serial_df.columns
+        assert_frame_equal(parallel_df, serial_df)
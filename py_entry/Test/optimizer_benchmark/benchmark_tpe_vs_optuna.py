@@ -0,0 +1,115 @@
+"""TPE 采样器对比：Rust 原生 TPE vs Rust 加权高斯 vs Optuna TPESampler
+
+在 Sphere / Rosenbrock / Rastrigin / Ackley 基准函数上，以相同试验预算比较
+试验吞吐（trials/sec）与收敛值（最优目标值，越小越好）。
+"""
+
+import math
+import time
+
+import optuna
+from loguru import logger
+
+import pyo3_quant
+from py_entry.types import BenchmarkFunction, OptimizerConfig, OptimizerSampler
+
+py_run_optimizer_benchmark = pyo3_quant.backtest_engine.optimizer.py_run_optimizer_benchmark
+
+N_TRIALS_LIST = [200, 500, 1000]
+SAMPLES_PER_ROUND = 50
+SEED = 42
+
+FUNCTIONS = {
+    "sphere": (BenchmarkFunction.Sphere, [(-5.12, 5.12)] * 3),
+    "rosenbrock": (BenchmarkFunction.Rosenbrock, [(-5.0, 10.0)] * 2),
+    "rastrigin": (BenchmarkFunction.Rastrigin, [(-5.12, 5.12)] * 3),
+    "ackley": (BenchmarkFunction.Ackley, [(-32.768, 32.768)] * 3),
+}
+
+
+def _python_objective(func_name: str, x: list[float]) -> float:
+    """与 Rust BenchmarkFunction 同口径的 Python 实现（供 Optuna 使用）。"""
+    if func_name == "sphere":
+        return sum(v * v for v in x)
+    if func_name == "rosenbrock":
+        return sum(
+            100.0 * (x[i + 1] - x[i] ** 2) ** 2 + (1.0 - x[i]) ** 2
+            for i in range(len(x) - 1)
+        )
+    if func_name == "rastrigin":
+        return 10.0 * len(x) + sum(
+            v * v - 10.0 * math.cos(2.0 * math.pi * v) for v in x
+        )
+    n = len(x)
+    sum1 = sum(v * v for v in x)
+    sum2 = sum(math.cos(2.0 * math.pi * v) for v in x)
+    return (
+        -20.0 * math.exp(-0.2 * math.sqrt(sum1 / n))
+        - math.exp(sum2 / n)
+        + 20.0
+        + math.e
+    )
+
+
+def run_rust(func_name: str, n_trials: int, sampler: OptimizerSampler):
+    function, bounds = FUNCTIONS[func_name]
+    config = OptimizerConfig(
+        samples_per_round=SAMPLES_PER_ROUND,
+        max_samples=n_trials,
+        min_samples=n_trials,
+        max_rounds=math.ceil(n_trials / SAMPLES_PER_ROUND),
+        stop_patience=n_trials,
+        sampler=sampler,
+    )
+    start = time.perf_counter()
+    _, best_value = py_run_optimizer_benchmark(config, function, bounds, SEED)
+    return best_value, time.perf_counter() - start
+
+
+def run_optuna(func_name: str, n_trials: int):
+    _, bounds = FUNCTIONS[func_name]
+
+    def objective(trial: optuna.Trial) -> float:
+        x = [
+            trial.suggest_float(f"x{i}", low, high)
+            for i, (low, high) in enumerate(bounds)
+        ]
+        return _python_objective(func_name, x)
+
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    study = optuna.create_study(
+        direction="minimize", sampler=optuna.samplers.TPESampler(seed=SEED)
+    )
+    start = time.perf_counter()
+    study.optimize(objective, n_trials=n_trials)
+    return study.best_value, time.perf_counter() - start
+
+
+def run_comparison():
+    logger.info("=" * 80)
+    logger.info("TPE 对比: Rust TPE / Rust Gaussian / Optuna TPE")
+    logger.info("=" * 80)
+    logger.info(
+        f"{'function':<12} {'trials':>6} | "
+        f"{'rust_tpe':>10} {'trials/s':>10} | "
+        f"{'gaussian':>10} {'trials/s':>10} | "
+        f"{'optuna':>10} {'trials/s':>10}"
+    )
+
+    for func_name in FUNCTIONS:
+        for n_trials in N_TRIALS_LIST:
+            tpe_val, tpe_time = run_rust(func_name, n_trials, OptimizerSampler.Tpe)
+            gauss_val, gauss_time = run_rust(
+                func_name, n_trials, OptimizerSampler.Gaussian
+            )
+            optuna_val, optuna_time = run_optuna(func_name, n_trials)
+            logger.info(
+                f"{func_name:<12} {n_trials:>6} | "
+                f"{tpe_val:>10.4f} {n_trials / tpe_time:>10,.0f} | "
+                f"{gauss_val:>10.4f} {n_trials / gauss_time:>10,.0f} | "
+                f"{optuna_val:>10.4f} {n_trials / optuna_time:>10,.0f}"
+            )
+
+
+if __name__ == "__main__":
+    run_comparison()
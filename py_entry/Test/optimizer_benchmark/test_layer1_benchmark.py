@@ -1,5 +1,5 @@
 import pytest
-from py_entry.types import OptimizerConfig, BenchmarkFunction
+from py_entry.types import OptimizerConfig, OptimizerSampler, BenchmarkFunction
 import pyo3_quant
 
 # from pyo3_quant.backtest_engine.optimizer import py_run_optimizer_benchmark, BenchmarkFunction
@@ -17,6 +17,12 @@ TOLERANCE_DICT = {
     "ackley": 2.2,  # 同上
 }
 
+# TPE 在固定预算下的容差（单峰函数收敛判定，略宽于高斯采样器的精确收敛要求）
+TPE_TOLERANCE_DICT = {
+    "sphere": 0.1,
+    "rosenbrock": 2.0,
+}
+
 # 增加尝试次数，因为随机算法有概率性
 N_TRIALS = 500  # Rust 很快，可以多跑点
 
@@ -81,5 +87,37 @@ def test_rust_optimizer_benchmark(func_name, bounds, optimal_val):
     )
 
 
+@pytest.mark.parametrize(
+    "func_name, bounds",
+    [
+        ("sphere", [(-5.12, 5.12)] * 3),
+        ("rosenbrock", [(-5.0, 10.0)] * 2),
+    ],
+)
+def test_rust_tpe_sampler_benchmark(func_name, bounds):
+    """原生 TPE 采样器在单峰函数上应与加权高斯采样器同样收敛。"""
+    func_map = {
+        "sphere": BenchmarkFunction.Sphere,
+        "rosenbrock": BenchmarkFunction.Rosenbrock,
+    }
+    config = OptimizerConfig(
+        samples_per_round=50,
+        max_rounds=20,
+        explore_ratio=0.2,
+        stop_patience=20,
+        sampler=OptimizerSampler.Tpe,
+    )
+
+    results = [
+        py_run_optimizer_benchmark(config, func_map[func_name], bounds, seed)[1]
+        for seed in [42, 100, 2024]
+    ]
+
+    tolerance = TPE_TOLERANCE_DICT[func_name]
+    assert min(results) <= tolerance, (
+        f"TPE sampler failed on {func_name}. Got {min(results)}, expected <= {tolerance}"
+    )
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
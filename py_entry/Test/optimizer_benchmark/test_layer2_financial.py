@@ -214,3 +214,48 @@ class TestLayer2Financial:
             result.session.engine_settings.artifact_retention
             == ArtifactRetention.StopStageOnly
         )
+
+    def test_cross_symbol_optimization(self, backtest_setup):
+        """跨品种入口：独立优化逐品种对齐单品种结果，聚合优化按 min 取最差品种。"""
+        data_config, indicators, template, engine_settings, backtest_params = (
+            backtest_setup
+        )
+        runners = []
+        for seed in (2001, 2002):
+            data_config.fixed_seed = seed
+            runners.append(
+                make_backtest_runner(
+                    data_source=data_config,
+                    indicators=indicators,
+                    signal={},
+                    backtest=backtest_params,
+                    signal_template=template,
+                    engine_settings=engine_settings,
+                )
+            )
+        data_packs = [bt.data_pack for bt in runners]
+        config = OptimizerConfig(
+            samples_per_round=self.SAMPLES_PER_ROUND,
+            max_rounds=2,
+            optimize_metric=OptimizeMetric.CalmarRatioRaw,
+            seed=7,
+        )
+
+        per_symbol = runners[0].optimize_per_symbol(data_packs, config)
+        assert len(per_symbol) == len(runners)
+        for bt, result in zip(runners, per_symbol):
+            single = bt.optimize(config)
+            assert result.optimize_value == pytest.approx(single.optimize_value)
+
+        aggregated = runners[0].optimize_across_symbols(
+            data_packs, config, aggregate="min"
+        )
+        best = aggregated.best_params
+        worst = min(
+            bt.run(params_override=best).raw.performance["calmar_ratio_raw"]
+            for bt in runners
+        )
+        assert aggregated.optimize_value == pytest.approx(worst)
+
+        with pytest.raises(Exception, match="aggregate"):
+            runners[0].optimize_across_symbols(data_packs, config, aggregate="max")
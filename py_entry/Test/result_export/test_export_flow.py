@@ -1,12 +1,21 @@
+import io
+import zipfile
 from pathlib import Path
 from unittest.mock import patch
+
+import polars as pl
+import pytest
+from pydantic import ValidationError
+
 from py_entry.io import SaveConfig
 from py_entry.runner import FormatResultsConfig
 
 
 def test_export_flow(runner_with_results, tmp_path):
     runner = runner_with_results
-    bundle = runner.prepare_export(FormatResultsConfig(dataframe_format="csv"))
+    bundle = runner.prepare_export(
+        FormatResultsConfig(dataframe_format="csv", retain_buffers=True)
+    )
 
     assert bundle.buffers, "buffers should be populated"
     assert bundle.zip_buffer is not None, "zip_buffer should be populated"
@@ -35,3 +44,76 @@ def test_export_flow(runner_with_results, tmp_path):
     assert (output_path / "backtest_results").exists(), (
         "backtest_results dir should exist"
     )
+
+
+def test_streaming_export_matches_bundle(runner_with_results, tmp_path):
+    """流式导出与 bundle 的 ZIP 条目一致；parquet 条目以 stored 方式写入。"""
+    runner = runner_with_results
+    config = FormatResultsConfig(dataframe_format="parquet")
+
+    bundle = runner.prepare_export(config)
+    assert bundle.buffers == [], "默认不保留逐文件 buffers"
+
+    zip_path = tmp_path / "export.zip"
+    with open(zip_path, "wb") as f:
+        runner.write_export(f, config)
+
+    with zipfile.ZipFile(zip_path) as streamed:
+        with zipfile.ZipFile(io.BytesIO(bundle.zip_buffer)) as packaged:
+            assert streamed.namelist() == packaged.namelist()
+        for info in streamed.infolist():
+            if info.filename.endswith(".parquet"):
+                assert info.compress_type == zipfile.ZIP_STORED
+
+    # 未保留 buffers 时 save() 从 ZIP 解包落盘
+    output_path = tmp_path / "verify_streaming_export"
+    with patch(
+        "py_entry.io.result_export.validate_output_path",
+        side_effect=lambda x: Path(x),
+    ):
+        bundle.save(SaveConfig(output_dir=str(output_path)))
+    assert (output_path / "chartConfig.json").exists()
+
+
+def test_unsupported_dataframe_format_is_rejected():
+    """图表库无法读取的格式必须在配置阶段拒绝，不能导出无法渲染的 bundle。"""
+    with pytest.raises(ValidationError):
+        FormatResultsConfig(dataframe_format="feather")
+
+
+def test_arrow_export_frames_round_trip_to_csv_zip(runner_with_results):
+    """arrow 格式逐帧保留 IPC，按需生成的 ZIP 与 csv 格式的条目和 chart config 一致。"""
+    runner = runner_with_results
+    bundle = runner.prepare_export(FormatResultsConfig(dataframe_format="arrow"))
+    csv_bundle = runner.prepare_export(FormatResultsConfig(dataframe_format="csv"))
+
+    assert bundle.zip_buffer is None, "arrow 格式不应预先打 ZIP"
+    assert bundle.chart_config == csv_bundle.chart_config
+
+    frame = bundle.frames["backtest_results/backtest_result.arrow"]
+    df = pl.read_ipc_stream(io.BytesIO(frame))
+    assert df.height == runner.raw.backtest_result.height
+
+    with zipfile.ZipFile(io.BytesIO(bundle.zip_bytes())) as packaged:
+        with zipfile.ZipFile(io.BytesIO(csv_bundle.zip_buffer)) as expected:
+            assert packaged.namelist() == expected.namelist()
+            name = "backtest_results/backtest_result.csv"
+            assert pl.read_csv(packaged.read(name)).equals(
+                pl.read_csv(expected.read(name))
+            )
+
+
+def test_prepare_export_is_memoized_per_config(runner_with_results):
+    """相同配置复用缓存 bundle，显式失效后重新构建。"""
+    runner = runner_with_results
+    config = FormatResultsConfig(dataframe_format="csv")
+
+    bundle = runner.prepare_export(config)
+    assert runner.prepare_export(FormatResultsConfig(dataframe_format="csv")) is bundle
+    other = runner.prepare_export(FormatResultsConfig(dataframe_format="parquet"))
+    assert other is not bundle
+
+    runner.invalidate_export_cache()
+    rebuilt = runner.prepare_export(config)
+    assert rebuilt is not bundle
+    assert rebuilt.zip_buffer == bundle.zip_buffer
@@ -0,0 +1,86 @@
+import numpy as np
+import polars as pl
+
+from py_entry.io.dataframe_utils import ExportDataPackSnapshot, ExportResultSnapshot
+from py_entry.runner import FormatResultsConfig
+from py_entry.runner.results._export_lod import (
+    downsample_snapshots,
+    lttb_indices,
+    minmax_indices,
+)
+
+
+def _snapshots(n: int) -> tuple[ExportDataPackSnapshot, ExportResultSnapshot]:
+    """构造 n 行 base 数据：正弦价格、线性净值，第 137 行进场、第 421 行风控触发。"""
+    close = np.sin(np.linspace(0, 20, n))
+    entry = np.full(n, np.nan)
+    entry[137:300] = 1.0
+    risk = np.zeros(n, dtype=np.int8)
+    risk[421] = 1
+    data = ExportDataPackSnapshot(
+        mapping=pl.DataFrame({"ohlcv_15m": np.arange(n, dtype=np.uint32)}),
+        skip_mask=None,
+        source={"ohlcv_15m": pl.DataFrame({"index": np.arange(n), "close": close})},
+        base_data_key="ohlcv_15m",
+    )
+    result = ExportResultSnapshot(
+        indicators=None,
+        signals=None,
+        backtest_result=pl.DataFrame(
+            {
+                "equity": np.linspace(1.0, 2.0, n),
+                "entry_long_price": entry,
+                "risk_in_bar_direction": risk,
+            }
+        ),
+        performance=None,
+    )
+    return data, result
+
+
+def test_lttb_keeps_endpoints_and_budget():
+    y = np.random.default_rng(0).normal(size=5000)
+    rows = lttb_indices(y, 200)
+    assert len(rows) == 200
+    assert rows[0] == 0 and rows[-1] == 4999
+    assert np.all(np.diff(rows) > 0)
+
+
+def test_minmax_keeps_bucket_extremes():
+    y = np.zeros(1000)
+    y[333] = 10.0
+    y[777] = -10.0
+    rows = minmax_indices(y, 100)
+    assert 333 in rows and 777 in rows
+    assert len(rows) <= 102
+
+
+def test_downsample_keeps_event_rows_and_alignment():
+    data, result = _snapshots(5000)
+    lod_data, lod_result = downsample_snapshots(data, result, 200, "lttb")
+
+    index = lod_data.source["ohlcv_15m"]["index"].to_list()
+    assert 137 in index and 300 in index and 421 in index
+    assert lod_result.backtest_result is not None
+    assert lod_result.backtest_result.height == len(index)
+    assert lod_data.mapping.height == len(index)
+    assert lod_data.mapping["ohlcv_15m"].to_list() == index
+
+
+def test_downsample_noop_within_budget():
+    data, result = _snapshots(100)
+    assert downsample_snapshots(data, result, 200, "minmax") == (data, result)
+
+
+def test_prepare_export_builds_lod_tiers_lazily(runner_with_results):
+    runner = runner_with_results
+    bundle = runner.prepare_export(
+        FormatResultsConfig(dataframe_format="csv", lod_tiers=[400, 100])
+    )
+
+    assert bundle.lod_tiers == (100, 400)
+    assert bundle.tier_zip(100) is bundle.zip_buffer
+    full_zip = bundle.tier_zip(None)
+    assert len(full_zip) > len(bundle.zip_buffer)
+    # 同一档位只生成一次
+    assert bundle.tier_zip(None) is full_zip
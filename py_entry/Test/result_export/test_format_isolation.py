@@ -52,7 +52,7 @@ def test_prepare_export_does_not_mutate_original_dataframes(runner_with_results)
 def test_prepare_export_still_generates_export_artifacts(runner_with_results):
     """副本导出模式下仍应正常产出导出缓存和图表配置。"""
     bundle = runner_with_results.prepare_export(
-        FormatResultsConfig(dataframe_format="csv")
+        FormatResultsConfig(dataframe_format="csv", retain_buffers=True)
     )
     assert bundle.buffers
     assert bundle.zip_buffer is not None
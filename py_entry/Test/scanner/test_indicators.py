@@ -3,49 +3,12 @@ import pandas as pd
 import numpy as np
 from py_entry.scanner.indicators import (
     is_opening_bar,
-    calculate_ema,
-    calculate_macd,
-    calculate_cci,
     is_cross_above,
     is_cross_below,
 )
 
 
 class TestIndicators(unittest.TestCase):
-    def test_calculate_ema_basic(self):
-        close = pd.Series([1, 2, 3, 4, 5] * 10)  # 50 data points
-        ema = calculate_ema(close, period=10)
-        self.assertEqual(len(ema), 50)
-        self.assertFalse(ema.empty)
-        # Check last value approximately
-        # EMA(10) of steady stream
-        self.assertIsInstance(ema.iloc[-1], float)
-
-    def test_calculate_ema_not_enough_data(self):
-        close = pd.Series([1, 2])
-        # period > len(close) returns None in pandas-ta, so we get empty Series
-        ema = calculate_ema(close, period=5)
-        self.assertEqual(len(ema), 0)
-
-    def test_calculate_macd_basic(self):
-        close = pd.Series(np.random.randn(100) + 100)
-        macd, signal, hist = calculate_macd(close)
-        self.assertEqual(len(macd), 100)
-        self.assertEqual(len(signal), 100)
-        self.assertEqual(len(hist), 100)
-
-    def test_calculate_macd_empty(self):
-        close = pd.Series([], dtype=float)
-        macd, signal, hist = calculate_macd(close)
-        self.assertTrue(macd.empty)
-
-    def test_calculate_cci_basic(self):
-        high = pd.Series(np.random.randn(50) + 100)
-        low = pd.Series(np.random.randn(50) + 90)
-        close = pd.Series(np.random.randn(50) + 95)
-        cci = calculate_cci(high, low, close, period=14)
-        self.assertEqual(len(cci), 50)
-
     def test_is_cross_above_success(self):
         # We need [-2] (last completed) > 100 and [-3] <= 100
         # Data: [98, 102, 105]
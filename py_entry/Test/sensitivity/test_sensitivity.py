@@ -301,3 +301,59 @@ def test_jitter_magnitude_statistically(sensitivity_setup):
 
     # 2. 统计检查：均值应接近原始值 (大数定律)
     assert pytest.approx(np.mean(vals), rel=0.1) == original_val
+
+
+def _add_sl_pct_param(bt):
+    """追加回测参数 sl_pct，使样本中出现只改回测维度的点。"""
+    bp = bt.params.backtest
+    bp.sl_pct = Param(value=0.02, optimize=True, min=0.01, max=0.05)
+    bt.params.backtest = bp
+
+
+def test_morris_design_reports_elementary_effects(sensitivity_setup):
+    """Morris 设计：样本数按轨迹取整，逐参数给出 μ* / σ 与弹性。"""
+    bt = sensitivity_setup
+    _add_sl_pct_param(bt)
+
+    config = SensitivityConfig(
+        jitter_ratio=0.2, n_samples=12, design="morris", seed=42
+    )
+    result = bt.sensitivity(config=config)
+
+    # 2 个参数 -> 每条轨迹 3 个点，12 // 3 = 4 条轨迹
+    assert result.design == "morris"
+    assert result.total_samples_requested == 12
+    assert [p.name for p in result.parameters] == [
+        "0_ohlcv_15m:sma_period",
+        "2__sl_pct",
+    ]
+    for p in result.parameters:
+        assert p.mu_star is not None and p.mu_star >= 0.0
+        assert p.sigma is not None and p.sigma >= 0.0
+    assert "Design: morris" in result.report()
+
+
+def test_sobol_design_is_deterministic_and_bounded(sensitivity_setup):
+    """Sobol 设计：固定种子可复现，采样点落在抖动区间内。"""
+    bt = sensitivity_setup
+    _add_sl_pct_param(bt)
+
+    config = SensitivityConfig(jitter_ratio=0.2, n_samples=16, design="sobol", seed=7)
+    result1 = bt.sensitivity(config=config)
+    result2 = bt.sensitivity(config=config)
+
+    assert [s.values for s in result1.samples] == [s.values for s in result2.samples]
+    assert len(result1.parameters) == 2
+    for sample in result1.samples:
+        assert round(14 * 0.8) <= sample.values[0] <= round(14 * 1.2)
+        assert 0.016 - 1e-9 <= sample.values[1] <= 0.024 + 1e-9
+
+
+def test_unknown_design_error(sensitivity_setup):
+    """未知的 design 应直接报错。"""
+    bt = sensitivity_setup
+
+    with pytest.raises(Exception) as excinfo:
+        bt.sensitivity(config=SensitivityConfig(n_samples=5, design="grid"))
+
+    assert "design must be one of" in str(excinfo.value)
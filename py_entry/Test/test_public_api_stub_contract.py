@@ -100,6 +100,8 @@ def test_public_api_stub_contract() -> None:
         "warmup_mode",
         "ignore_indicator_warmup",
         "optimizer_config",
+        "precompute_indicators",
+        "checkpoint_dir",
     }
 
     wf_mode_block = _class_block(stub_text, "WfWarmupMode")
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import cast
 from types import SimpleNamespace
 
+import numpy as np
 import polars as pl
 import pyo3_quant
 import pytest
@@ -21,6 +22,9 @@ from py_entry.runner import RunnerSession
 from py_entry.runner import SensitivityView
 from py_entry.runner import SingleBacktestView
 from py_entry.runner import WalkForwardView
+from py_entry.runner._optuna_execution import _select_promoted
+from py_entry.runner._optuna_param_apply import build_param_set
+from py_entry.runner._optuna_sampling import extract_optimizable_params
 from py_entry.runner.results.optuna_optimization_view import OptunaOptimizationRaw
 from py_entry.types import ArtifactRetention, ExecutionStage, LogicOp, OptimizeMetric
 from py_entry.types import OptimizationResult, Param
@@ -310,13 +314,13 @@ def test_optuna_uses_formal_mode_settings_in_batch_mode(monkeypatch):
     fake_result = SimpleNamespace(performance={"calmar_ratio_raw": 1.0})
     captured_settings: list[SettingContainer] = []
 
-    def fake_batch(data, params, template, engine_settings):
+    def fake_batch(data, base_param, values, template, engine_settings):
         captured_settings.append(engine_settings)
-        return [fake_result for _ in params]
+        return [fake_result for _ in range(values.shape[0])]
 
     monkeypatch.setattr(
         pyo3_quant.backtest_engine,
-        "run_batch_backtest",
+        "run_batch_backtest_from_values",
         fake_batch,
     )
 
@@ -335,6 +339,79 @@ def test_optuna_uses_formal_mode_settings_in_batch_mode(monkeypatch):
     )
 
 
+def test_batch_from_values_matches_per_trial_param_sets():
+    """参数矩阵批量回测必须与逐 trial 构造参数集的批量回测逐项一致。"""
+    bt = _make_optuna_contract_backtest()
+    base = bt.params
+    # 中文注释：min=3、step=2 的取值网格为 3/5/7，不是 step 的整数倍，不能被按 0 起点量化。
+    indicators = base.indicators
+    indicators["ohlcv_15m"]["sma_slow"]["period"] = Param(
+        value=9, optimize=True, min=3, max=11, step=2
+    )
+    base.indicators = indicators
+    infos = extract_optimizable_params(base)
+    columns = pyo3_quant.backtest_engine.optimizable_param_keys(base)
+    assert sorted(columns) == sorted(info.unique_key for info in infos)
+
+    rows = [{"sma_fast": 3, "sma_slow": 5}, {"sma_fast": 7, "sma_slow": 11}]
+    trial_values = [
+        {info.unique_key: float(row[info.group.split(":")[1]]) for info in infos}
+        for row in rows
+    ]
+    matrix = np.array(
+        [[values[key] for key in columns] for values in trial_values],
+        dtype=np.float64,
+    )
+    settings = make_engine_settings()
+
+    from_values = pyo3_quant.backtest_engine.run_batch_backtest_from_values(
+        bt.data_pack, base, matrix, bt.template_config, settings
+    )
+    per_trial = pyo3_quant.backtest_engine.run_batch_backtest(
+        bt.data_pack,
+        [build_param_set(base, infos, values) for values in trial_values],
+        bt.template_config,
+        settings,
+    )
+
+    assert len(from_values) == len(per_trial) == len(rows)
+    for left, right in zip(from_values, per_trial):
+        assert left.performance == right.performance
+        assert left.backtest_result.equals(right.backtest_result)
+
+
+def test_optimizer_keeps_pruned_low_fidelity_samples():
+    """低保真筛选淘汰的候选以 fidelity < 1.0 的 SamplePoint 留在优化结果中。"""
+    bt = _make_optuna_contract_backtest()
+    result = bt.optimize(
+        OptimizerConfig(
+            samples_per_round=10,
+            max_samples=20,
+            min_samples=20,
+            max_rounds=2,
+            fidelity_ratio=0.5,
+            promote_ratio=0.3,
+            seed=1,
+        )
+    ).raw
+
+    assert len(result.pruned_samples) == sum(s.pruned_count for s in result.history)
+    assert len(result.pruned_samples) > 0
+    assert all(s.fidelity == 0.5 for s in result.pruned_samples)
+    assert all(s.fidelity == 1.0 for s in result.top_k_samples)
+
+
+@pytest.mark.parametrize("direction", ["maximize", "minimize"])
+def test_optuna_promotion_ranks_nan_last(direction):
+    """低保真指标为 NaN 的 trial 不能挤掉有效 trial 晋级。"""
+    config = OptunaConfig(direction=direction, promote_ratio=0.3)
+    low_values = [float("nan"), 1.0, float("nan"), 3.0, 2.0, float("nan")]
+
+    promoted = _select_promoted(low_values, config)
+
+    assert promoted == ({3, 4} if direction == "maximize" else {1, 4})
+
+
 def test_optuna_uses_formal_mode_settings_in_parallel_mode(monkeypatch):
     """Optuna parallel trial 必须固定使用 performance + stop-stage-only。"""
     bt = _make_optuna_contract_backtest()
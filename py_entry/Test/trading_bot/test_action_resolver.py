@@ -1,8 +1,10 @@
+import polars as pl
 import pytest
 import pyo3_quant
 from py_entry.trading_bot.signal import SignalState  # Pydantic Model
 
 resolve_actions = pyo3_quant.backtest_engine.action_resolver.resolve_actions
+resolve_actions_batch = pyo3_quant.backtest_engine.action_resolver.resolve_actions_batch
 
 
 def parse_signal_rs(row: dict, symbol: str, sl: bool, tp: bool) -> SignalState:
@@ -101,3 +103,42 @@ class TestActionResolver:
         ]
         assert len(tp_actions) == 2
         assert {action.price for action in tp_actions} == {50500.0, 50800.0}
+
+
+class TestResolveActionsBatch:
+    def test_batch_matches_row_dict(self):
+        """批量解析按列读取目标行，结果与逐行字典解析一致"""
+        btc = pl.DataFrame(
+            {
+                "frame_state": [0, 2],
+                "entry_long_price": [None, 50000.0],
+                "sl_pct_price_long": [None, 49000.0],
+            }
+        )
+        eth = pl.DataFrame(
+            {
+                "frame_state": [5, 0],
+                "entry_long_price": [None, None],
+                "extra": ["a", "b"],
+            }
+        )
+
+        states = [
+            SignalState.model_validate(raw)
+            for raw in resolve_actions_batch(
+                [btc, eth], ["BTC/USDT", "ETH/USDT"], [True, True], [False, False], -1
+            )
+        ]
+        expected = parse_signal_rs(btc.row(-1, named=True), "BTC/USDT", True, False)
+        assert states[0] == expected
+        assert states[1].actions == []
+
+        prev = resolve_actions_batch([eth], ["ETH/USDT"], [True], [False], index=-2)
+        assert SignalState.model_validate(prev[0]).has_exit is True
+
+    def test_batch_rejects_bad_input(self):
+        df = pl.DataFrame({"frame_state": [2]})
+        with pytest.raises(IndexError):
+            resolve_actions_batch([df], ["BTC/USDT"], [True], [False], index=-2)
+        with pytest.raises(ValueError):
+            resolve_actions_batch([df], [], [True], [False])
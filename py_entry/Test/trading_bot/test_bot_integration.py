@@ -1,3 +1,7 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+
 import pytest
 from py_entry.trading_bot import (
     TradingBot,
@@ -9,6 +13,17 @@ from py_entry.trading_bot import (
 from .test_mocks import MockCallbacks
 from py_entry.trading_bot.models import PositionStructure
 
+# 2026-02-16 01:15:00 UTC，即并发测试 time_func 所在 15m 周期的开盘时间
+CYCLE_PERIOD_START_MS = 1771204500000
+
+
+def _rows_until(last_ms: int) -> list[list[float]]:
+    """生成两根以 last_ms 结尾的 15m K 线，满足机器人的新鲜度检查。"""
+    return [
+        [last_ms - 900_000, 50000.0, 50100.0, 49900.0, 50050.0, 1000.0],
+        [last_ms, 50050.0, 50200.0, 50000.0, 50150.0, 1200.0],
+    ]
+
 
 class TestEntryFlow:
     """进场流程集成测试"""
@@ -271,3 +286,98 @@ class TestOrderTypeOverride:
         # 应该没有任何下单动作
         assert "create_limit_order" not in methods
         assert "create_market_order" not in methods
+
+
+class TestConcurrentCycle:
+    """单轮多品种并发测试"""
+
+    def test_due_symbols_run_concurrently(self):
+        """阻塞回调在品种线程池中并发执行，并记录每个品种的耗时"""
+        symbols = ["BTC/USDT", "ETH/USDT", "SOL/USDT", "BNB/USDT"]
+        mock = MockCallbacks()
+        mock.strategy_params = [
+            StrategyParams(base_data_key="ohlcv_15m", symbol=symbol)
+            for symbol in symbols
+        ]
+        mock.ohlcv_rows = _rows_until(CYCLE_PERIOD_START_MS)
+        original_fetch = mock.fetch_ohlcv
+
+        def slow_fetch(*args, **kwargs):
+            time.sleep(0.2)
+            return original_fetch(*args, **kwargs)
+
+        mock.fetch_ohlcv = slow_fetch
+        bot = TradingBot(
+            callbacks=mock,
+            config=BotConfig(max_concurrent_symbols=len(symbols)),
+            time_func=lambda: datetime(2026, 2, 16, 1, 15, 2, tzinfo=timezone.utc),
+        )
+
+        start = time.perf_counter()
+        asyncio.run(bot._run_cycle())
+        elapsed = time.perf_counter() - start
+        bot.stop()
+
+        # 中文注释：串行需要 0.8s 以上，并发应接近单个品种的耗时。
+        assert elapsed < 0.6
+        assert set(bot.symbol_latencies) == set(symbols)
+        assert all(latency >= 0.2 for latency in bot.symbol_latencies.values())
+        assert set(bot._last_run_times) == set(symbols)
+
+    def test_async_callbacks_and_rate_limit(self):
+        """async 回调交回事件循环执行；同一交易所的请求按配置限速"""
+        symbols = ["BTC/USDT", "ETH/USDT", "SOL/USDT"]
+        mock = MockCallbacks()
+        mock.strategy_params = [
+            StrategyParams(base_data_key="ohlcv_15m", symbol=symbol)
+            for symbol in symbols
+        ]
+        mock.ohlcv_rows = _rows_until(CYCLE_PERIOD_START_MS)
+        original_fetch = mock.fetch_ohlcv
+        fetch_times: list[float] = []
+
+        async def async_fetch(*args, **kwargs):
+            fetch_times.append(time.monotonic())
+            return original_fetch(*args, **kwargs)
+
+        mock.fetch_ohlcv = async_fetch
+        bot = TradingBot(
+            callbacks=mock,
+            config=BotConfig(exchange_rate_limits={"binance": 10.0}),
+            time_func=lambda: datetime(2026, 2, 16, 1, 15, 2, tzinfo=timezone.utc),
+        )
+
+        asyncio.run(bot._run_cycle())
+        bot.stop()
+
+        assert set(bot._last_run_times) == set(symbols)
+        fetch_times.sort()
+        gaps = [b - a for a, b in zip(fetch_times, fetch_times[1:])]
+        assert len(gaps) == len(symbols) - 1
+        assert all(gap >= 0.09 for gap in gaps)
+
+    def test_run_after_stop_recreates_symbol_pool(self):
+        """stop() 关闭品种线程池后再次 run()，品种仍能正常执行"""
+        mock = MockCallbacks()
+        mock.strategy_params = [
+            StrategyParams(base_data_key="ohlcv_15m", symbol="BTC/USDT")
+        ]
+        mock.ohlcv_rows = _rows_until(CYCLE_PERIOD_START_MS)
+        bot = TradingBot(
+            callbacks=mock,
+            config=BotConfig(loop_interval_sec=0.01),
+            time_func=lambda: datetime(2026, 2, 16, 1, 15, 2, tzinfo=timezone.utc),
+        )
+
+        async def run_until_executed():
+            task = asyncio.create_task(bot.run())
+            while "BTC/USDT" not in bot._last_run_times:
+                await asyncio.sleep(0.01)
+            bot.stop()
+            await task
+
+        for _ in range(2):
+            # 中文注释：清空执行记录，让同一周期在第二次 run() 中重新到期。
+            bot._last_run_times.clear()
+            asyncio.run(asyncio.wait_for(run_until_executed(), timeout=5))
+            assert bot._symbol_pool is None
@@ -6,7 +6,7 @@ from py_entry.strategy_hub.core.spec import SearchSpaceSpec, VariantPayload
 from py_entry.strategy_hub.core.spec_loader import load_spec
 from py_entry.strategy_hub.registry import RegistryResolvedItem
 from py_entry.trading_bot import LiveStrategyCallbacks
-from py_entry.types import LogicOp, SignalGroup, SignalTemplate
+from py_entry.types import ExecutionStage, LogicOp, SignalGroup, SignalTemplate
 
 from .test_mocks import MockCallbacks
 
@@ -202,7 +202,16 @@ class TestLiveStrategyCallbacks:
         result = callbacks.run_backtest(params, df)
         assert result.success is True, result.message
         assert result.data is not None
-        assert result.data.height == 320
+        # 中文注释：预编译执行器只返回 parse_signal(-1/-2) 需要的最后两行。
+        assert result.data.height == 2
+
+        runner = callbacks._runner_by_key[(params.symbol, params.base_data_key)]
+        assert runner.engine_settings.stop_stage == ExecutionStage.Backtest
+        assert runner.engine_settings.tail_rows == 2
+        runner.engine_settings.tail_rows = None
+        full = runner.run(df)
+        assert full.height == 320
+        assert full.tail(2).equals(result.data)
 
     def test_should_not_repeat_symbol_validation_in_callbacks(self, monkeypatch):
         """同品种校验由注册器负责，callbacks 不重复校验。"""
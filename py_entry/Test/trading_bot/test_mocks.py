@@ -42,6 +42,10 @@ class MockCallbacks:
             StrategyParams(base_data_key="ohlcv_15m", symbol="BTC/USDT")
         ]
         self.positions: List[PositionStructure] = []
+        self.ohlcv_rows: List[List[float]] = [
+            [1700000000000, 50000.0, 50100.0, 49900.0, 50050.0, 1000.0],
+            [1700000900000, 50050.0, 50200.0, 50000.0, 50150.0, 1200.0],
+        ]
         self.balance = BalanceStructure(
             free={"USDT": 10000.0},
             used={"USDT": 0.0},
@@ -134,13 +138,7 @@ class MockCallbacks:
     ) -> CallbackResult[List[List[float]]]:
         self._log("fetch_ohlcv", symbol=symbol, timeframe=timeframe)
         # 返回假数据
-        return CallbackResult(
-            success=True,
-            data=[
-                [1700000000000, 50000.0, 50100.0, 49900.0, 50050.0, 1000.0],
-                [1700000900000, 50050.0, 50200.0, 50000.0, 50150.0, 1200.0],
-            ],
-        )
+        return CallbackResult(success=True, data=self.ohlcv_rows)
 
     def fetch_market_info(
         self, exchange_name: str, market: str, mode: str, symbol: str
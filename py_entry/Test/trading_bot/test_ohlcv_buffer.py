@@ -0,0 +1,124 @@
+from unittest.mock import MagicMock
+
+from py_entry.trading_bot import CallbackResult, Callbacks, StrategyParams
+from py_entry.trading_bot._ohlcv_buffer import OhlcvRingBuffer, load_ohlcv_frame
+
+PERIOD_MS = 900_000
+
+
+def _bars(start: int, count: int) -> list[list[float]]:
+    """从第 start 根开始生成 count 根连续 15m K 线，close 等于序号。"""
+    return [
+        [i * PERIOD_MS, float(i), float(i) + 1, float(i) - 1, float(i), 1.0]
+        for i in range(start, start + count)
+    ]
+
+
+class TestOhlcvRingBuffer:
+    """测试滚动 K 线缓冲区"""
+
+    def test_seed_keeps_latest_capacity_rows(self):
+        buffer = OhlcvRingBuffer(capacity=4, period_ms=PERIOD_MS)
+        buffer.seed(_bars(0, 6))
+
+        df = buffer.frame()
+        assert df.columns == ["timestamp", "open", "high", "low", "close", "volume"]
+        assert df["close"].to_list() == [2.0, 3.0, 4.0, 5.0]
+        assert buffer.last_timestamp == 5 * PERIOD_MS
+
+    def test_update_appends_and_wraps(self):
+        """增量合并：覆盖未收盘的最后一根，追加新 K 线，环绕后视图仍然有序"""
+        buffer = OhlcvRingBuffer(capacity=4, period_ms=PERIOD_MS)
+        buffer.seed(_bars(0, 4))
+
+        latest = _bars(3, 4)
+        latest[0][4] = 99.0
+        assert buffer.update(latest) is True
+
+        df = buffer.frame()
+        assert df["timestamp"].to_list() == [i * PERIOD_MS for i in range(3, 7)]
+        assert df["close"].to_list() == [99.0, 4.0, 5.0, 6.0]
+
+    def test_update_detects_gap(self):
+        buffer = OhlcvRingBuffer(capacity=4, period_ms=PERIOD_MS)
+        buffer.seed(_bars(0, 4))
+        assert buffer.update(_bars(5, 2)) is False
+
+
+class TestLoadOhlcvFrame:
+    """测试增量拉取与缺口重新同步"""
+
+    def test_incremental_then_resync_on_gap(self):
+        mock = MagicMock(spec=Callbacks)
+        params = StrategyParams(base_data_key="ohlcv_15m", symbol="BTC/USDT")
+        buffer = OhlcvRingBuffer(capacity=10, period_ms=PERIOD_MS)
+
+        # 首次：全量播种
+        mock.fetch_ohlcv.return_value = CallbackResult(success=True, data=_bars(0, 10))
+        load_ohlcv_frame(mock, params, buffer)
+        assert mock.fetch_ohlcv.call_args.kwargs["since"] is None
+
+        # 之后：只拉取 last_timestamp 之后的 K 线
+        mock.fetch_ohlcv.return_value = CallbackResult(success=True, data=_bars(9, 2))
+        result = load_ohlcv_frame(mock, params, buffer)
+        assert mock.fetch_ohlcv.call_args.kwargs["since"] == 9 * PERIOD_MS
+        assert result.data["close"].to_list()[-1] == 10.0
+        assert mock.fetch_ohlcv.call_count == 2
+
+        # 缺口：增量之后自动全量重新同步
+        mock.fetch_ohlcv.side_effect = [
+            CallbackResult(success=True, data=_bars(20, 1)),
+            CallbackResult(success=True, data=_bars(11, 10)),
+        ]
+        result = load_ohlcv_frame(mock, params, buffer)
+        assert mock.fetch_ohlcv.call_count == 4
+        assert mock.fetch_ohlcv.call_args.kwargs["since"] is None
+        assert result.data["close"].to_list() == [float(i) for i in range(11, 21)]
+
+    def test_empty_incremental_response_resyncs(self):
+        """增量返回空列表时最新 K 线停留在上一周期，必须全量重新同步"""
+        mock = MagicMock(spec=Callbacks)
+        params = StrategyParams(base_data_key="ohlcv_15m", symbol="BTC/USDT")
+        buffer = OhlcvRingBuffer(capacity=10, period_ms=PERIOD_MS)
+        buffer.seed(_bars(0, 10))
+
+        mock.fetch_ohlcv.side_effect = [
+            CallbackResult(success=True, data=[]),
+            CallbackResult(success=True, data=_bars(1, 10)),
+        ]
+        result = load_ohlcv_frame(mock, params, buffer, expected_last_ms=10 * PERIOD_MS)
+
+        assert result.success
+        assert mock.fetch_ohlcv.call_count == 2
+        assert mock.fetch_ohlcv.call_args.kwargs["since"] is None
+        assert buffer.last_timestamp == 10 * PERIOD_MS
+
+    def test_truncated_incremental_response_resyncs(self):
+        """since=last、limit=capacity 的增量被截断、没追到当前周期时全量重新同步"""
+        mock = MagicMock(spec=Callbacks)
+        params = StrategyParams(base_data_key="ohlcv_15m", symbol="BTC/USDT")
+        buffer = OhlcvRingBuffer(capacity=10, period_ms=PERIOD_MS)
+        buffer.seed(_bars(0, 10))
+
+        mock.fetch_ohlcv.side_effect = [
+            CallbackResult(success=True, data=_bars(9, 10)),
+            CallbackResult(success=True, data=_bars(16, 10)),
+        ]
+        result = load_ohlcv_frame(mock, params, buffer, expected_last_ms=25 * PERIOD_MS)
+
+        assert result.success
+        assert mock.fetch_ohlcv.call_count == 2
+        assert mock.fetch_ohlcv.call_args.kwargs["since"] is None
+        assert result.data["close"].to_list() == [float(i) for i in range(16, 26)]
+
+    def test_stale_full_sync_fails(self):
+        """全量同步后仍落后于当前周期，本轮直接失败，不用旧数据跑策略"""
+        mock = MagicMock(spec=Callbacks)
+        params = StrategyParams(base_data_key="ohlcv_15m", symbol="BTC/USDT")
+        buffer = OhlcvRingBuffer(capacity=10, period_ms=PERIOD_MS)
+
+        mock.fetch_ohlcv.return_value = CallbackResult(success=True, data=_bars(0, 10))
+        result = load_ohlcv_frame(mock, params, buffer, expected_last_ms=12 * PERIOD_MS)
+
+        assert not result.success
+        assert "滞后" in result.message
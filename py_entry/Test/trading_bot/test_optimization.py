@@ -10,6 +10,12 @@ from py_entry.trading_bot import (
     MarketOrderRequest,
     CancelAllOrdersRequest,
     OptimizationCallbacks,
+    CycleCallbacks,
+    MarketInfoCache,
+    BalanceResponse,
+    BalanceStructure,
+    MarketInfoResponse,
+    PositionStructure,
     TradingBot,
     StrategyParams,
     Callbacks,
@@ -137,6 +143,113 @@ class TestOptimizationCallbacks:
         assert mock_inner.cancel_all_orders.call_count == 2
 
 
+class TestCycleCallbacks:
+    """测试单轮跨品种缓存"""
+
+    ACCOUNT = ("binance", "future", "live")
+
+    @pytest.fixture
+    def mock_inner(self):
+        mock = MagicMock(spec=Callbacks)
+        mock.fetch_positions.return_value = CallbackResult(
+            success=True,
+            data=PositionsResponse(
+                positions=[
+                    PositionStructure(symbol="BTC/USDT", contracts=1.0, side="long"),
+                    PositionStructure(symbol="ETH/USDT", contracts=2.0, side="short"),
+                ]
+            ),
+        )
+        mock.fetch_balance.return_value = CallbackResult(
+            success=True,
+            data=BalanceResponse(
+                balance=BalanceStructure(
+                    free={"USDT": 1000.0}, used={"USDT": 0.0}, total={"USDT": 1000.0}
+                )
+            ),
+        )
+        mock.fetch_market_info.return_value = CallbackResult(
+            success=True,
+            data=MarketInfoResponse(
+                symbol="BTC/USDT",
+                linear=True,
+                settle="USDT",
+                precision_amount=0.001,
+                min_amount=0.001,
+                contract_size=1.0,
+                leverage=1,
+            ),
+        )
+        mock.create_market_order.return_value = CallbackResult(success=True)
+        return mock
+
+    def _proxy(self, mock_inner, market_info_cache=None):
+        return CycleCallbacks(
+            mock_inner,
+            {self.ACCOUNT: ["BTC/USDT", "ETH/USDT"]},
+            market_info_cache,
+        )
+
+    def test_positions_batched_across_symbols(self, mock_inner):
+        """同轮各品种的持仓查询合并为一次批量请求，并按 symbol 过滤"""
+        proxy = self._proxy(mock_inner)
+
+        btc = proxy.fetch_positions(*self.ACCOUNT, ["BTC/USDT"])
+        eth = proxy.fetch_positions(*self.ACCOUNT, ["ETH/USDT"])
+
+        assert mock_inner.fetch_positions.call_count == 1
+        mock_inner.fetch_positions.assert_called_with(
+            *self.ACCOUNT, ["BTC/USDT", "ETH/USDT"]
+        )
+        assert [p.symbol for p in btc.data.positions] == ["BTC/USDT"]
+        assert [p.symbol for p in eth.data.positions] == ["ETH/USDT"]
+
+        # 不在本轮批量范围内的 symbol 直接透传
+        proxy.fetch_positions(*self.ACCOUNT, ["SOL/USDT"])
+        assert mock_inner.fetch_positions.call_count == 2
+
+    def test_balance_shared_and_invalidated_by_order(self, mock_inner):
+        """余额每账户只查一次；下单后失效，且该 symbol 持仓不再走批量结果"""
+        proxy = self._proxy(mock_inner)
+
+        proxy.fetch_balance(*self.ACCOUNT)
+        proxy.fetch_balance(*self.ACCOUNT)
+        proxy.fetch_positions(*self.ACCOUNT, ["BTC/USDT"])
+        assert mock_inner.fetch_balance.call_count == 1
+        assert mock_inner.fetch_positions.call_count == 1
+
+        proxy.create_market_order(
+            MarketOrderRequest(
+                exchange_name="binance",
+                market="future",
+                mode="live",
+                symbol="BTC/USDT",
+                side="buy",
+                amount=1.0,
+            )
+        )
+
+        proxy.fetch_balance(*self.ACCOUNT)
+        assert mock_inner.fetch_balance.call_count == 2
+        proxy.fetch_positions(*self.ACCOUNT, ["BTC/USDT"])
+        assert mock_inner.fetch_positions.call_count == 2
+        # 其他品种仍使用批量结果
+        proxy.fetch_positions(*self.ACCOUNT, ["ETH/USDT"])
+        assert mock_inner.fetch_positions.call_count == 2
+
+    def test_market_info_cached_across_cycles(self, mock_inner):
+        """市场信息缓存跨轮次复用，TTL 为 0 时不缓存"""
+        cache = MarketInfoCache(ttl_sec=3600)
+        self._proxy(mock_inner, cache).fetch_market_info(*self.ACCOUNT, "BTC/USDT")
+        self._proxy(mock_inner, cache).fetch_market_info(*self.ACCOUNT, "BTC/USDT")
+        assert mock_inner.fetch_market_info.call_count == 1
+
+        no_cache = MarketInfoCache(ttl_sec=0)
+        self._proxy(mock_inner, no_cache).fetch_market_info(*self.ACCOUNT, "BTC/USDT")
+        self._proxy(mock_inner, no_cache).fetch_market_info(*self.ACCOUNT, "BTC/USDT")
+        assert mock_inner.fetch_market_info.call_count == 3
+
+
 class TestTimeframeParsing:
     """测试 Timeframe 解析修复"""
 
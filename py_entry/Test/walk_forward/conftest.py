@@ -8,7 +8,7 @@ import polars as pl
 import pytest
 
 from py_entry.Test.shared.constants import TEST_START_TIME_MS
-from py_entry.data_generator import DataGenerationParams
+from py_entry.data_generator import DataGenerationParams, DirectDataConfig
 from py_entry.runner import Backtest
 from py_entry.types import (
     ArtifactRetention,
@@ -91,15 +91,21 @@ def build_sma_cross_backtest(
         no_trade: bool = False,
         with_backtest_params: bool = False,
         seed: int = 42,
+        data: dict[str, pl.DataFrame] | None = None,
     ) -> Backtest:
-        data_cfg = DataGenerationParams(
-            timeframes=["15m"],
-            start_time=TEST_START_TIME_MS,
-            num_bars=num_bars,
-            base_data_key=wf_base_key,
-            fixed_seed=seed,
-            allow_gaps=False,
-        )
+        # 中文注释：传入 data 时直接使用给定行情（num_bars/seed 不再生效），便于构造同前缀的数据。
+        data_cfg: DataGenerationParams | DirectDataConfig
+        if data is not None:
+            data_cfg = DirectDataConfig(data=data, base_data_key=wf_base_key)
+        else:
+            data_cfg = DataGenerationParams(
+                timeframes=["15m"],
+                start_time=TEST_START_TIME_MS,
+                num_bars=num_bars,
+                base_data_key=wf_base_key,
+                fixed_seed=seed,
+                allow_gaps=False,
+            )
 
         indicators = {
             wf_base_key: {
@@ -0,0 +1,51 @@
+"""Walk-Forward 断点续跑端到端测试。"""
+
+from __future__ import annotations
+
+import shutil
+from collections.abc import Callable
+from pathlib import Path
+
+from py_entry.runner import Backtest
+from py_entry.types import WalkForwardConfig
+
+
+def test_checkpoint_resume_recomputes_only_missing_window(
+    build_sma_cross_backtest: Callable[..., Backtest],
+    build_wf_cfg: Callable[..., WalkForwardConfig],
+    tmp_path: Path,
+):
+    """删除最后一个窗口的断点后重跑：结果不变，且只有该窗口被重新计算落盘。"""
+    bt = build_sma_cross_backtest(num_bars=1_200, with_backtest_params=True)
+    cfg = build_wf_cfg(
+        train_active_bars=300,
+        test_active_bars=150,
+        min_warmup_bars=60,
+        optimizer_rounds=8,
+    )
+    cfg.checkpoint_dir = str(tmp_path)
+    first = bt.walk_forward(cfg)
+
+    # 中文注释：同一数据与配置只对应一个哈希目录，其下每个窗口一个子目录。
+    (hash_dir,) = list(tmp_path.iterdir())
+    window_dirs = sorted(hash_dir.glob("window_*"))
+    assert len(window_dirs) == len(first.window_results) > 1
+    mtimes = {d.name: (d / "state.arrow").stat().st_mtime_ns for d in window_dirs}
+
+    shutil.rmtree(window_dirs[-1])
+    second = bt.walk_forward(cfg)
+
+    assert list(tmp_path.iterdir()) == [hash_dir]
+    rerun_dirs = sorted(hash_dir.glob("window_*"))
+    assert [d.name for d in rerun_dirs] == [d.name for d in window_dirs]
+    for d in rerun_dirs[:-1]:
+        assert (d / "state.arrow").stat().st_mtime_ns == mtimes[d.name]
+
+    for old, new in zip(first.window_results, second.window_results):
+        assert new.test_pack_result.backtest_result.equals(
+            old.test_pack_result.backtest_result
+        )
+    old_stitched = first.stitched_pack_result.backtest_result
+    new_stitched = second.stitched_pack_result.backtest_result
+    assert old_stitched is not None and new_stitched is not None
+    assert new_stitched["equity"].equals(old_stitched["equity"])
@@ -290,7 +290,9 @@ def test_wf_stitched_time_strictly_increasing(wf_default, wf_base_key: str):
 
 def test_wf_stitched_export_uses_backtest_schedule_not_single_param_set(wf_default):
     """stitched 导出必须以 segmented replay schedule 为正式参数解释层。"""
-    bundle = wf_default.prepare_export(FormatResultsConfig(dataframe_format="csv"))
+    bundle = wf_default.prepare_export(
+        FormatResultsConfig(dataframe_format="csv", retain_buffers=True)
+    )
     assert bundle.buffers
 
     exported_paths = {str(path) for path, _ in bundle.buffers}
@@ -398,3 +400,28 @@ def test_wf_boundary_cross_inheritance_not_reset_to_initial(
 
     if checked == 0:
         pytest.skip("当前数据/参数未触发跨窗继承，跳过该断言分支。")
+
+
+@pytest.mark.parametrize("ignore_indicator_warmup", [False, True])
+def test_wf_precompute_indicators_matches_per_window(
+    build_sma_cross_backtest: Callable[..., Backtest],
+    build_wf_cfg: Callable[..., WalkForwardConfig],
+    ignore_indicator_warmup: bool,
+):
+    """全量预计算切片与逐窗重算的 stitched 资金曲线必须完全一致（含窗口预热段置空）。"""
+    bt = build_sma_cross_backtest(num_bars=1_200, with_backtest_params=True)
+
+    def _run(precompute: bool) -> pl.Series:
+        cfg = build_wf_cfg(
+            train_active_bars=300,
+            test_active_bars=150,
+            min_warmup_bars=20,
+            ignore_indicator_warmup=ignore_indicator_warmup,
+            optimizer_rounds=8,
+        )
+        cfg.precompute_indicators = precompute
+        stitched = bt.walk_forward(cfg).stitched_pack_result.backtest_result
+        assert stitched is not None
+        return stitched["equity"]
+
+    assert _run(True).equals(_run(False))
@@ -0,0 +1,111 @@
+"""增量 Walk-Forward 契约测试。"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from py_entry.runner import Backtest
+from py_entry.types import WalkForwardConfig
+
+
+def _assert_same_window(old, new) -> None:
+    assert new.meta.window_id == old.meta.window_id
+    assert new.meta.test_active_time_range == old.meta.test_active_time_range
+    assert new.test_pack_result.backtest_result.equals(
+        old.test_pack_result.backtest_result
+    )
+
+
+def test_incremental_reuses_unchanged_windows(
+    build_sma_cross_backtest: Callable[..., Backtest],
+    build_wf_cfg: Callable[..., WalkForwardConfig],
+):
+    """数据未变时所有窗口原样复用，拼接结果与上一次完全一致。"""
+    bt = build_sma_cross_backtest(num_bars=1_200, with_backtest_params=True)
+    cfg = build_wf_cfg(
+        train_active_bars=300,
+        test_active_bars=150,
+        min_warmup_bars=60,
+        optimizer_rounds=8,
+    )
+    previous = bt.walk_forward(cfg)
+    incremental = bt.walk_forward_incremental(previous, cfg)
+
+    assert len(incremental.window_results) == len(previous.window_results)
+    for old, new in zip(previous.window_results, incremental.window_results):
+        _assert_same_window(old, new)
+
+    old_stitched = previous.stitched_pack_result.backtest_result
+    new_stitched = incremental.stitched_pack_result.backtest_result
+    assert old_stitched is not None and new_stitched is not None
+    assert new_stitched["equity"].equals(old_stitched["equity"])
+    assert (
+        incremental.stitched_result.meta.next_window_hint.based_on_window_id
+        == previous.stitched_result.meta.next_window_hint.based_on_window_id
+    )
+
+
+def test_incremental_appended_bars_match_full_run(
+    build_sma_cross_backtest: Callable[..., Backtest],
+    build_wf_cfg: Callable[..., WalkForwardConfig],
+    wf_base_key: str,
+):
+    """尾部追加 k 个测试段：前缀窗口原样复用，新增窗口与整段重跑一致。"""
+    test_active_bars = 150
+    num_bars, appended = 1_200, 3 * test_active_bars
+    generated = build_sma_cross_backtest(num_bars=num_bars + appended)
+    full_df = generated.data_pack.source[wf_base_key]
+    short_bt = build_sma_cross_backtest(
+        num_bars=num_bars,
+        with_backtest_params=True,
+        data={wf_base_key: full_df.head(num_bars)},
+    )
+    long_bt = build_sma_cross_backtest(
+        num_bars=num_bars + appended,
+        with_backtest_params=True,
+        data={wf_base_key: full_df},
+    )
+    cfg = build_wf_cfg(
+        train_active_bars=300,
+        test_active_bars=test_active_bars,
+        min_warmup_bars=60,
+        optimizer_rounds=8,
+    )
+
+    previous = short_bt.walk_forward(cfg)
+    incremental = long_bt.walk_forward_incremental(previous, cfg)
+    full = long_bt.walk_forward(cfg)
+
+    assert len(incremental.window_results) == len(full.window_results)
+    assert len(incremental.window_results) > len(previous.window_results)
+    # 中文注释：旧结果的最后一窗测试段可能随新数据变化，除它以外的前缀窗口必须原样复用。
+    for old, new in zip(previous.window_results[:-1], incremental.window_results):
+        _assert_same_window(old, new)
+    for expected, new in zip(full.window_results, incremental.window_results):
+        _assert_same_window(expected, new)
+
+    full_stitched = full.stitched_pack_result.backtest_result
+    new_stitched = incremental.stitched_pack_result.backtest_result
+    assert full_stitched is not None and new_stitched is not None
+    assert new_stitched["equity"].equals(full_stitched["equity"])
+
+
+def test_incremental_recomputes_all_windows_when_optimizer_config_changes(
+    build_sma_cross_backtest: Callable[..., Backtest],
+    build_wf_cfg: Callable[..., WalkForwardConfig],
+):
+    """优化器配置变化时不复用任何旧窗口，结果与新配置整段重跑一致。"""
+    bt = build_sma_cross_backtest(num_bars=1_200, with_backtest_params=True)
+    geometry = dict(train_active_bars=300, test_active_bars=150, min_warmup_bars=60)
+    old_cfg = build_wf_cfg(**geometry, optimizer_rounds=8, optimizer_seed=42)
+    new_cfg = build_wf_cfg(**geometry, optimizer_rounds=12, optimizer_seed=7)
+
+    previous = bt.walk_forward(old_cfg)
+    incremental = bt.walk_forward_incremental(previous, new_cfg)
+    full = bt.walk_forward(new_cfg)
+
+    assert previous.raw.settings_hash != full.raw.settings_hash
+    assert incremental.raw.settings_hash == full.raw.settings_hash
+    assert len(incremental.window_results) == len(full.window_results)
+    for expected, new in zip(full.window_results, incremental.window_results):
+        _assert_same_window(expected, new)
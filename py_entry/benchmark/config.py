@@ -3,6 +3,10 @@ OPT_SAMPLES_LIST = [2000]  # 采样数量
 NUM_RUNS = 3
 WARMUP_RUNS = 1
 
+# 主循环吞吐基准 (bars/sec) 的 K 线规模与回归容差
+MAIN_LOOP_BARS_LIST = [10_000, 100_000, 1_000_000, 10_000_000]
+MAIN_LOOP_REGRESSION_TOLERANCE = 0.15  # 低于基线 15% 视为回归
+
 # 策略 A 参数范围: SMA + TSL (极端扩大)
 STRATEGY_A_PARAMS = {
     "sma_fast": (2, 5000),
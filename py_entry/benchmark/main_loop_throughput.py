@@ -0,0 +1,161 @@
+"""
+回测主循环吞吐基准（bars/sec）
+
+直接调用 Rust `run_backtest`，绕开指标与信号阶段，只测主循环 + 输出组装。
+单段 schedule 走免逐行选参的快路径；回归守卫把本次吞吐与落盘基线比较，
+任一规模低于 `基线 * (1 - 容差)` 时以非零退出码失败。
+基线与机器强相关，不随仓库提交：基线缺失时只打印警告并跳过比较，
+传 `--require-baseline`（固定机器 / CI）时缺失即失败。
+
+用法:
+    python -m py_entry.benchmark.main_loop_throughput
+    python -m py_entry.benchmark.main_loop_throughput --update-baseline
+    python -m py_entry.benchmark.main_loop_throughput --require-baseline
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+from loguru import logger
+
+import pyo3_quant
+from pyo3_quant.backtest_engine.data_ops import build_data_pack
+from py_entry.types import BacktestParams, Param, SourceRange
+
+from .config import (
+    MAIN_LOOP_BARS_LIST,
+    MAIN_LOOP_REGRESSION_TOLERANCE,
+    NUM_RUNS,
+    WARMUP_RUNS,
+)
+from .data_utils import generate_ohlcv
+
+BASE_DATA_KEY = "ohlcv_15m"
+BASELINE_PATH = (
+    Path(__file__).parents[2] / "doc" / "benchmark" / "main_loop_baseline.json"
+)
+
+
+def build_inputs(num_bars: int):
+    """构造 DataPack 与周期性进出场信号。"""
+    pl_df, _ = generate_ohlcv(num_bars)
+    pack = build_data_pack(
+        source={BASE_DATA_KEY: pl_df},
+        base_data_key=BASE_DATA_KEY,
+        ranges={
+            BASE_DATA_KEY: SourceRange(
+                warmup_bars=0, active_bars=num_bars, pack_bars=num_bars
+            )
+        },
+    )
+    # 中文注释：每 40 根开多、20 根后平多，交错开空，保证状态机在全程都有仓位切换。
+    index = np.arange(num_bars)
+    signals = pl.DataFrame(
+        {
+            "entry_long": index % 40 == 0,
+            "exit_long": index % 40 == 20,
+            "entry_short": index % 40 == 25,
+            "exit_short": index % 40 == 35,
+        }
+    )
+    return pack, signals
+
+
+def build_params() -> BacktestParams:
+    """启用 PCT 组风控列，覆盖可选列写入路径。"""
+    return BacktestParams(
+        initial_capital=10000.0,
+        fee_fixed=0.0,
+        fee_pct=0.0005,
+        sl_pct=Param(0.02),
+        tp_pct=Param(0.05),
+        tsl_pct=Param(0.01),
+    )
+
+
+def measure_bars_per_sec(num_bars: int) -> float:
+    """取多次运行耗时中位数，换算为 bars/sec。"""
+    pack, signals = build_inputs(num_bars)
+    params = build_params()
+    run_backtest = pyo3_quant.backtest_engine.backtester.run_backtest
+
+    for _ in range(WARMUP_RUNS):
+        run_backtest(pack, signals, params)
+
+    elapsed = []
+    for _ in range(NUM_RUNS):
+        start = time.perf_counter()
+        run_backtest(pack, signals, params)
+        elapsed.append(time.perf_counter() - start)
+
+    return num_bars / statistics.median(elapsed)
+
+
+def check_regression(
+    current: dict[str, float],
+    baseline: dict[str, float],
+    tolerance: float = MAIN_LOOP_REGRESSION_TOLERANCE,
+) -> list[str]:
+    """返回低于基线容差的规模描述；基线缺失的规模不参与比较。"""
+    failures = []
+    for num_bars, bars_per_sec in current.items():
+        expected = baseline.get(num_bars)
+        if expected is None:
+            continue
+        floor = expected * (1.0 - tolerance)
+        if bars_per_sec < floor:
+            failures.append(
+                f"{num_bars} bars: {bars_per_sec:,.0f} bars/s < 下限 {floor:,.0f} bars/s"
+            )
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="回测主循环吞吐基准")
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="用本次结果覆盖基线"
+    )
+    parser.add_argument(
+        "--require-baseline", action="store_true", help="基线文件缺失时以非零退出码失败"
+    )
+    args = parser.parse_args()
+
+    current: dict[str, float] = {}
+    for num_bars in MAIN_LOOP_BARS_LIST:
+        bars_per_sec = measure_bars_per_sec(num_bars)
+        current[str(num_bars)] = bars_per_sec
+        logger.info(f"{num_bars:>10} bars: {bars_per_sec:,.0f} bars/s")
+
+    if args.update_baseline:
+        BASELINE_PATH.write_text(json.dumps(current, indent=2) + "\n")
+        logger.success(f"基线已写入 {BASELINE_PATH}")
+        return 0
+
+    if not BASELINE_PATH.exists():
+        # 中文注释：基线只对生成它的机器有意义，新检出的仓库没有基线时只测量不比较；
+        # 固定机器上的守卫应传 --require-baseline，避免静默放过回归。
+        message = f"基线文件 {BASELINE_PATH} 不存在；请先用 --update-baseline 生成"
+        if args.require_baseline:
+            logger.error(message)
+            return 1
+        logger.warning(f"{message}，本次跳过回归比较")
+        return 0
+
+    failures = check_regression(current, json.loads(BASELINE_PATH.read_text()))
+    if failures:
+        for failure in failures:
+            logger.error(f"吞吐回归: {failure}")
+        return 1
+
+    logger.success("主循环吞吐未回归")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,4 @@
-from .zip_utils import create_zip_buffer
+from .zip_utils import create_zip_buffer, read_zip_buffers, write_zip_stream
 from .auth import (
     get_local_dir,
     get_token,
@@ -39,6 +39,8 @@ from .result_export import (
 
 __all__ = [
     "create_zip_buffer",
+    "write_zip_stream",
+    "read_zip_buffers",
     "get_local_dir",
     "get_token",
     "request_token",
@@ -34,26 +34,6 @@ class ExportResultSnapshot:
     performance: Optional[dict[str, float]]
 
 
-def reorder_columns(
-    df: pl.DataFrame,
-    priority_order: list[str],
-) -> pl.DataFrame:
-    """重新排列 DataFrame 的列顺序
-
-    Args:
-        df: 要处理的 DataFrame
-        priority_order: 优先顺序的列名列表
-
-    Returns:
-        列顺序重新排列后的 DataFrame
-    """
-    current_columns = df.columns
-    final_column_order = [col for col in priority_order if col in current_columns] + [
-        col for col in current_columns if col not in priority_order
-    ]
-    return df.select(final_column_order)
-
-
 def add_contextual_columns_to_dataframes(
     data_pack: Optional[DataPack],
     result: ResultPack,
@@ -65,6 +45,7 @@ def add_contextual_columns_to_dataframes(
 
     这里不会直接修改传入的 data_pack / result。
     正式 pack 类型已收口为只读对象，导出链只返回导出态快照。
+    所有表先构建为 LazyFrame，最后通过一次 pl.collect_all 并行求值。
 
     Args:
         data_pack: 数据包，包含 mapping, skip_mask, source 等字段
@@ -80,94 +61,74 @@ def add_contextual_columns_to_dataframes(
         # 不能依赖原地修改 dict[key] 写回对象。
         time_source_provider = data_pack.source.copy()
 
-    export_data_pack: Optional[ExportDataPackSnapshot] = None
-    if data_pack is not None:
-        processed_mapping = process_dataframe(
-            data_pack.mapping,
-            add_index,
-            add_time,
-            add_date,
-            None,
-            data_pack,
-            time_source_provider,
-        )
-        processed_skip_mask = None
-        if data_pack.skip_mask is not None:
-            processed_skip_mask = process_dataframe(
-                data_pack.skip_mask,
-                add_index,
-                add_time,
-                add_date,
-                None,
-                data_pack,
-                time_source_provider,
+    # (槽位, 子键, LazyFrame)：槽位对应快照字段，子键用于 source / indicators 字典。
+    plans: list[tuple[str, Optional[str], pl.LazyFrame]] = []
+
+    def plan(slot: str, sub_key: Optional[str], df: pl.DataFrame, key: Optional[str]):
+        plans.append(
+            (
+                slot,
+                sub_key,
+                _contextual_lazy(
+                    df,
+                    add_index,
+                    add_time,
+                    add_date,
+                    key,
+                    data_pack,
+                    time_source_provider,
+                ),
             )
+        )
 
-        processed_source: dict[str, pl.DataFrame] = {}
+    if data_pack is not None:
+        plan("mapping", None, data_pack.mapping, None)
+        if data_pack.skip_mask is not None:
+            plan("skip_mask", None, data_pack.skip_mask, None)
         for key, df in data_pack.source.items():
-            processed_source[key] = process_dataframe(
-                df,
-                add_index,
-                add_time,
-                add_date,
-                key,
-                data_pack,
-                time_source_provider,
-            )
-
-        export_data_pack = ExportDataPackSnapshot(
-            mapping=processed_mapping,
-            skip_mask=processed_skip_mask,
-            source=processed_source,
-            base_data_key=data_pack.base_data_key,
-        )
+            plan("source", key, df, key)
 
     # 中文注释：导出态 indicators 继续保留公开形态（携带 time 列），
     # 这里仅生成快照，不再写回 ResultPack。
-    processed_indicators = None
     if result.indicators is not None:
-        processed_indicators = {}
         for key, df in result.indicators.items():
-            processed_indicators[key] = process_dataframe(
-                df,
-                add_index,
-                add_time,
-                add_date,
-                key,
-                data_pack,
-                time_source_provider,
+            plan("indicators", key, df, key)
+
+    if data_pack is not None:
+        if result.signals is not None:
+            plan("signals", None, result.signals, data_pack.base_data_key)
+        if result.backtest_result is not None:
+            plan(
+                "backtest_result",
+                None,
+                result.backtest_result,
+                data_pack.base_data_key,
             )
 
-    processed_signals = None
-    if result.signals is not None and data_pack is not None:
-        processed_signals = process_dataframe(
-            result.signals,
-            add_index,
-            add_time,
-            add_date,
-            data_pack.base_data_key,
-            data_pack,
-            time_source_provider,
-        )
+    collected = pl.collect_all([lf for _, _, lf in plans])
+    frames: dict[str, Optional[pl.DataFrame]] = {}
+    keyed: dict[str, dict[str, pl.DataFrame]] = {"source": {}, "indicators": {}}
+    for (slot, sub_key, _), df in zip(plans, collected):
+        if sub_key is None:
+            frames[slot] = df
+        else:
+            keyed[slot][sub_key] = df
 
-    processed_backtest = None
-    if result.backtest_result is not None and data_pack is not None:
-        processed_backtest = process_dataframe(
-            result.backtest_result,
-            add_index,
-            add_time,
-            add_date,
-            data_pack.base_data_key,
-            data_pack,
-            time_source_provider,
+    export_data_pack: Optional[ExportDataPackSnapshot] = None
+    if data_pack is not None:
+        export_data_pack = ExportDataPackSnapshot(
+            mapping=frames["mapping"],
+            skip_mask=frames.get("skip_mask"),
+            source=keyed["source"],
+            base_data_key=data_pack.base_data_key,
         )
 
     return (
         export_data_pack,
         ExportResultSnapshot(
-            indicators=processed_indicators,
-            signals=processed_signals,
-            backtest_result=processed_backtest,
+            indicators=keyed["indicators"] if result.indicators is not None else None,
+            signals=frames.get("signals"),
+            backtest_result=frames.get("backtest_result"),
             performance=dict(result.performance)
             if result.performance is not None
             else None,
@@ -198,19 +159,42 @@ def process_dataframe(
     Returns:
         处理后的DataFrame
     """
+    return _contextual_lazy(
+        df,
+        add_index,
+        add_time,
+        add_date,
+        source_key,
+        data_pack,
+        time_source_provider,
+    ).collect()
+
+
+def _contextual_lazy(
+    df: pl.DataFrame,
+    add_index: bool,
+    add_time: bool,
+    add_date: bool,
+    source_key: Optional[str],
+    data_pack: Optional[DataPack],
+    time_source_provider: Optional[dict[str, pl.DataFrame]],
+) -> pl.LazyFrame:
+    """构建添加上下文列的 LazyFrame，不复制原始数据；参数含义同 process_dataframe。"""
     original_add_time = add_time
     if add_date:
         add_time = True
 
-    result_df = df.clone()
+    lf = df.lazy()
+    columns = list(df.columns)
 
     # 1. 确保 df 有 index 列，这是 join 的基础
-    if "index" not in result_df.columns:
-        result_df = result_df.with_row_index("index")
+    if "index" not in columns:
+        lf = lf.with_row_index("index")
+        columns.insert(0, "index")
 
     # 2. 如果需要 time 或 date，就 join time 列
     if (
-        "time" not in result_df.columns
+        "time" not in columns
         and add_time
         and data_pack is not None
         and time_source_provider is not None
@@ -225,32 +209,35 @@ def process_dataframe(
 
         if time_df_source is not None and "time" in time_df_source.columns:
             # 确保 time_df_source 也有 index 列
+            time_lf = time_df_source.lazy()
             if "index" not in time_df_source.columns:
-                time_df_source = time_df_source.with_row_index("index")
+                time_lf = time_lf.with_row_index("index")
 
             # 使用 join 精确合并
-            result_df = result_df.join(
-                time_df_source.select(["index", "time"]), on="index", how="left"
-            )
+            lf = lf.join(time_lf.select(["index", "time"]), on="index", how="left")
+            columns.append("time")
 
     # 3. 计算 date 列
-    if add_date and "date" not in result_df.columns and "time" in result_df.columns:
-        result_df = result_df.with_columns(
+    if add_date and "date" not in columns and "time" in columns:
+        lf = lf.with_columns(
             pl.col("time")
             .cast(pl.Datetime(time_unit="ms", time_zone="UTC"))
             .dt.strftime("%Y-%m-%d %H:%M:%S%.3f")
             .alias("date")
         )
+        columns.append("date")
 
     # 4. 如果最初未请求 index，则删除
-    if not add_index and "index" in result_df.columns:
-        result_df = result_df.drop("index")
+    if not add_index and "index" in columns:
+        columns.remove("index")
 
     # 5. 如果最初未请求 time，则删除
-    if not original_add_time and "time" in result_df.columns:
-        result_df = result_df.drop("time")
+    if not original_add_time and "time" in columns:
+        columns.remove("time")
 
     # 6. 确保最终的列顺序
-    result_df = reorder_columns(result_df, ["index", "time", "date"])
-
-    return result_df
+    priority_order = ["index", "time", "date"]
+    final_column_order = [col for col in priority_order if col in columns] + [
+        col for col in columns if col not in priority_order
+    ]
+    return lf.select(final_column_order)
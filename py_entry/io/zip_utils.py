@@ -1,7 +1,7 @@
 import zipfile
 import io
 from pathlib import Path
-from typing import List, Tuple
+from typing import BinaryIO, Iterable, List, Tuple, Union
 
 
 def create_zip_buffer(
@@ -35,3 +35,38 @@ def create_zip_buffer(
 
     zip_buffer.seek(0)
     return zip_buffer.getvalue()
+
+
+def write_zip_stream(
+    entries: Iterable[Tuple[Path, Union[bytes, memoryview]]],
+    target: BinaryIO,
+    compress_level: int = 1,
+    stored_suffixes: Tuple[str, ...] = (".parquet",),
+) -> None:
+    """
+    把 (路径, 字节) 条目逐个写入已打开的 ZIP 目标（文件、socket.makefile("wb") 等）。
+
+    entries 可以是生成器，写完一项即可释放该项内存；目标不可 seek 时
+    zipfile 会自动改用数据描述符，因此也适用于网络流。
+    stored_suffixes 中的文件（默认 parquet，本身已压缩）以 stored 方式写入，不再重复压缩。
+    """
+    with zipfile.ZipFile(
+        target, "w", zipfile.ZIP_DEFLATED, compresslevel=compress_level
+    ) as zipf:
+        for path, data in entries:
+            compress_type = (
+                zipfile.ZIP_STORED
+                if Path(path).suffix in stored_suffixes
+                else zipfile.ZIP_DEFLATED
+            )
+            zipf.writestr(str(path), data, compress_type=compress_type)
+
+
+def read_zip_buffers(zip_data: bytes) -> List[Tuple[Path, io.BytesIO]]:
+    """把 ZIP 字节数据解包为 (路径, 字节流) 列表，用于未保留 buffers 时的落盘。"""
+    with zipfile.ZipFile(io.BytesIO(zip_data)) as zipf:
+        return [
+            (Path(info.filename), io.BytesIO(zipf.read(info)))
+            for info in zipf.infolist()
+            if not info.is_dir()
+        ]
@@ -1,10 +1,13 @@
+import math
 from typing import TYPE_CHECKING
 from typing import List
 
+import numpy as np
 import optuna
 import pyo3_quant
 from loguru import logger
 
+from py_entry.types import DataPack
 from py_entry.types import OptunaConfig
 from py_entry.types import ResultPack
 from py_entry.types import SettingContainer
@@ -28,6 +31,33 @@ def _extract_trial_metric(result: ResultPack, metric_key: str) -> float:
     return performance[metric_key]
 
 
+def _build_prefix_data_pack(data_pack: DataPack, fidelity_ratio: float) -> DataPack:
+    """低保真 DataPack：保留完整 base 预热段，active 段只取前 fidelity_ratio 比例。"""
+    base_range = data_pack.ranges[data_pack.base_data_key]
+    active_bars = max(base_range.active_bars, 1)
+    prefix_active = min(max(math.ceil(active_bars * fidelity_ratio), 1), active_bars)
+    return pyo3_quant.backtest_engine.data_ops.slice_data_pack(
+        data_pack, 0, base_range.warmup_bars + prefix_active
+    )
+
+
+def _select_promoted(low_values: list[float], config: OptunaConfig) -> set[int]:
+    """按优化方向排序低保真指标，返回晋级 trial 下标集合。"""
+    promote_count = min(
+        max(math.ceil(len(low_values) * config.promote_ratio), 1), len(low_values)
+    )
+    maximize = config.direction == "maximize"
+    # 中文注释：NaN（如无交易时的 Calmar）与任何值比较都为 False，会打乱排序；
+    # 按优化方向映射为最差值，保证有效 trial 优先晋级。
+    worst = -math.inf if maximize else math.inf
+    ranked = sorted(
+        range(len(low_values)),
+        key=lambda idx: worst if math.isnan(low_values[idx]) else low_values[idx],
+        reverse=maximize,
+    )
+    return set(ranked[:promote_count])
+
+
 def run_batch_mode(
     study: optuna.Study,
     backtest: "Backtest",
@@ -37,7 +67,27 @@ def run_batch_mode(
     metric_key: str,
     engine_settings: SettingContainer,
 ) -> None:
-    """批量 ask/tell 模式（利用 Rust batch 并行）。"""
+    """批量 ask/tell 模式（利用 Rust batch 并行）。
+
+    每批采样值按 Rust 可优化参数顺序写成 (trials, dims) 的 float64 矩阵，
+    由 Rust 在基础参数集上逐行写回，不再逐 trial 构造 SingleParamSet。
+
+    fidelity_ratio < 1 时启用多保真度筛选：整批先在 active 前缀上回测，
+    只有排名靠前的 promote_ratio 比例跑全量回测，其余以 PRUNED 状态反馈给 study。
+    """
+    if not 0.0 < config.fidelity_ratio <= 1.0:
+        raise ValueError(f"fidelity_ratio 必须在 (0, 1] 内，当前为 {config.fidelity_ratio}")
+    if not 0.0 < config.promote_ratio <= 1.0:
+        raise ValueError(f"promote_ratio 必须在 (0, 1] 内，当前为 {config.promote_ratio}")
+
+    screening = config.fidelity_ratio < 1.0
+    prefix_pack = (
+        _build_prefix_data_pack(backtest.data_pack, config.fidelity_ratio)
+        if screening
+        else None
+    )
+    # 中文注释：列顺序以 Rust 的 extract_optimizable_params 为准，键与 Optuna 参数名一致。
+    columns = pyo3_quant.backtest_engine.optimizable_param_keys(base_params)
     n_trials_done = 0
 
     while n_trials_done < config.n_trials:
@@ -45,26 +95,45 @@ def run_batch_mode(
 
         # 1) 批量采样 (Ask)
         trials: list[optuna.Trial] = []
-        batch_param_sets: list[SingleParamSet] = []
-        for _ in range(current_batch_size):
+        batch_values = np.empty((current_batch_size, len(columns)), dtype=np.float64)
+        for row in range(current_batch_size):
             trial = study.ask()
             trials.append(trial)
             trial_vals = sample_trial_values(trial, param_infos)
-            batch_param_sets.append(
-                build_param_set(base_params, param_infos, trial_vals)
+            batch_values[row] = [trial_vals[key] for key in columns]
+
+        # 2) 低保真筛选：整批在 active 前缀上回测，淘汰排名靠后的 trial。
+        promoted = set(range(current_batch_size))
+        if prefix_pack is not None:
+            low_results = pyo3_quant.backtest_engine.run_batch_backtest_from_values(
+                prefix_pack,
+                base_params,
+                batch_values,
+                backtest.template_config,
+                engine_settings,
             )
-
-        # 2) 批量回测：Optuna 固定使用 performance-only 正式模式。
-        results = pyo3_quant.backtest_engine.run_batch_backtest(
+            low_values = [
+                _extract_trial_metric(result, metric_key) for result in low_results
+            ]
+            promoted = _select_promoted(low_values, config)
+            for idx in range(current_batch_size):
+                if idx not in promoted:
+                    trials[idx].report(low_values[idx], 0)
+                    study.tell(trials[idx], state=optuna.trial.TrialState.PRUNED)
+
+        # 3) 批量回测：Optuna 固定使用 performance-only 正式模式。
+        promoted_idx = sorted(promoted)
+        results = pyo3_quant.backtest_engine.run_batch_backtest_from_values(
             backtest.data_pack,
-            batch_param_sets,
+            base_params,
+            batch_values[promoted_idx],
             backtest.template_config,
             engine_settings,
         )
 
-        # 3) 反馈结果 (Tell)
-        for trial, result in zip(trials, results):
-            study.tell(trial, _extract_trial_metric(result, metric_key))
+        # 4) 反馈结果 (Tell)
+        for idx, result in zip(promoted_idx, results):
+            study.tell(trials[idx], _extract_trial_metric(result, metric_key))
 
         n_trials_done += current_batch_size
         if config.show_progress_bar:
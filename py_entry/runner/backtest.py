@@ -1,5 +1,5 @@
 import time
-from typing import Optional, List
+from typing import Optional, List, Sequence
 from loguru import logger
 
 import pyo3_quant
@@ -13,6 +13,7 @@ from py_entry.types import (
     OptimizerConfig,
     OptunaConfig,
     WalkForwardConfig,
+    WalkForwardResult,
     SensitivityConfig,
 )
 
@@ -109,6 +110,7 @@ class Backtest:
         return SettingContainer(
             stop_stage=engine_settings.stop_stage,
             artifact_retention=engine_settings.artifact_retention,
+            tail_rows=engine_settings.tail_rows,
         )
 
     def _session_for(self, engine_settings: SettingContainer) -> RunnerSession:
@@ -230,6 +232,76 @@ class Backtest:
 
         return result
 
+    def optimize_across_symbols(
+        self,
+        data_packs: Sequence[DataPack],
+        config: Optional[OptimizerConfig] = None,
+        aggregate: str = "mean",
+        params_override: Optional[SingleParamSet] = None,
+    ) -> OptimizationView:
+        """跨品种聚合优化：求一组在全部品种上聚合指标（mean / min / median）最优的参数"""
+        start_time = time.perf_counter() if self.enable_timing else None
+
+        config = config or OptimizerConfig()
+        target_params = params_override or self.params
+        engine_settings = self._mode_engine_settings(
+            ArtifactRetention.StopStageOnly,
+        )
+
+        raw_result = (
+            pyo3_quant.backtest_engine.optimizer.py_run_optimizer_across_symbols(
+                list(data_packs),
+                target_params,
+                self.template_config,
+                engine_settings,
+                config,
+                aggregate,
+            )
+        )
+
+        result = OptimizationView(
+            raw=raw_result,
+            session=self._session_for(engine_settings),
+        )
+
+        if self.enable_timing and start_time is not None:
+            elapsed = time.perf_counter() - start_time
+            logger.info(f"Backtest.optimize_across_symbols() 耗时: {elapsed:.4f}秒")
+
+        return result
+
+    def optimize_per_symbol(
+        self,
+        data_packs: Sequence[DataPack],
+        config: Optional[OptimizerConfig] = None,
+        params_override: Optional[SingleParamSet] = None,
+    ) -> List[OptimizationView]:
+        """逐品种独立优化（一次调用、共享并行工作池），结果顺序与 data_packs 一致"""
+        start_time = time.perf_counter() if self.enable_timing else None
+
+        config = config or OptimizerConfig()
+        target_params = params_override or self.params
+        engine_settings = self._mode_engine_settings(
+            ArtifactRetention.StopStageOnly,
+        )
+
+        raw_results = pyo3_quant.backtest_engine.optimizer.py_run_optimizer_per_symbol(
+            list(data_packs),
+            target_params,
+            self.template_config,
+            engine_settings,
+            config,
+        )
+
+        session = self._session_for(engine_settings)
+        results = [OptimizationView(raw=raw, session=session) for raw in raw_results]
+
+        if self.enable_timing and start_time is not None:
+            elapsed = time.perf_counter() - start_time
+            logger.info(f"Backtest.optimize_per_symbol() 耗时: {elapsed:.4f}秒")
+
+        return results
+
     def optimize_with_optuna(
         self,
         config: Optional[OptunaConfig] = None,
@@ -273,6 +345,45 @@ class Backtest:
 
         return result
 
+    def walk_forward_incremental(
+        self,
+        previous: WalkForwardView | WalkForwardResult,
+        config: WalkForwardConfig,
+        params_override: Optional[SingleParamSet] = None,
+    ) -> WalkForwardView:
+        """增量向前测试：复用上一次结果中数据未变的窗口，只计算新增窗口。"""
+        start_time = time.perf_counter() if self.enable_timing else None
+
+        target_params = params_override or self.params
+        engine_settings = self._mode_engine_settings(
+            ArtifactRetention.AllCompletedStages,
+        )
+        previous_raw = (
+            previous.raw if isinstance(previous, WalkForwardView) else previous
+        )
+
+        raw_result = (
+            pyo3_quant.backtest_engine.walk_forward.run_walk_forward_incremental(
+                self.data_pack,
+                target_params,
+                self.template_config,
+                engine_settings,
+                config,
+                previous_raw,
+            )
+        )
+
+        result = WalkForwardView(
+            raw=raw_result,
+            session=self._session_for(engine_settings),
+        )
+
+        if self.enable_timing and start_time is not None:
+            elapsed = time.perf_counter() - start_time
+            logger.info(f"Backtest.walk_forward_incremental() 耗时: {elapsed:.4f}秒")
+
+        return result
+
     def sensitivity(
         self,
         config: Optional[SensitivityConfig] = None,
@@ -147,17 +147,173 @@ function prepareContainer(el) {
     }
 }
 
-async function render({ model, el }) {
-    const rawZipData = model.get('zip_data');
-    const zipBytes = normalizeToBytes(rawZipData);
+// [Arrow 传输]
+// frames 为 路径 -> 字节：.arrow 条目是 Arrow IPC 流，其余（JSON）原样转发。
+// 图表库只认 zipData，这里把 IPC 帧解码为 csv，和 JSON 一起打成 stored ZIP 再挂载。
+const CRC32_TABLE = (() => {
+    const table = new Uint32Array(256);
+    for (let n = 0; n < 256; n += 1) {
+        let c = n;
+        for (let k = 0; k < 8; k += 1) {
+            c = c & 1 ? 0xedb88320 ^ (c >>> 1) : c >>> 1;
+        }
+        table[n] = c >>> 0;
+    }
+    return table;
+})();
+
+function crc32(bytes) {
+    let c = 0xffffffff;
+    for (let i = 0; i < bytes.length; i += 1) {
+        c = CRC32_TABLE[(c ^ bytes[i]) & 0xff] ^ (c >>> 8);
+    }
+    return (c ^ 0xffffffff) >>> 0;
+}
+
+// 不压缩的 ZIP（stored），只写本地头、中央目录与结束记录；文件名按 UTF-8 标记。
+function buildStoredZip(entries) {
+    const encoder = new TextEncoder();
+    const records = entries.map(([path, data]) => ({ name: encoder.encode(path), data, crc: crc32(data), offset: 0 }));
+    const localSize = records.reduce((sum, r) => sum + 30 + r.name.length + r.data.length, 0);
+    const centralSize = records.reduce((sum, r) => sum + 46 + r.name.length, 0);
+    const out = new Uint8Array(localSize + centralSize + 22);
+    const view = new DataView(out.buffer);
+    const dosDate = (1 << 5) | 1; // 1980-01-01
+    let offset = 0;
+    for (const r of records) {
+        r.offset = offset;
+        view.setUint32(offset, 0x04034b50, true);
+        view.setUint16(offset + 4, 20, true);
+        view.setUint16(offset + 6, 0x0800, true);
+        view.setUint16(offset + 12, dosDate, true);
+        view.setUint32(offset + 14, r.crc, true);
+        view.setUint32(offset + 18, r.data.length, true);
+        view.setUint32(offset + 22, r.data.length, true);
+        view.setUint16(offset + 26, r.name.length, true);
+        out.set(r.name, offset + 30);
+        out.set(r.data, offset + 30 + r.name.length);
+        offset += 30 + r.name.length + r.data.length;
+    }
+    const centralStart = offset;
+    for (const r of records) {
+        view.setUint32(offset, 0x02014b50, true);
+        view.setUint16(offset + 4, 20, true);
+        view.setUint16(offset + 6, 20, true);
+        view.setUint16(offset + 8, 0x0800, true);
+        view.setUint16(offset + 14, dosDate, true);
+        view.setUint32(offset + 16, r.crc, true);
+        view.setUint32(offset + 20, r.data.length, true);
+        view.setUint32(offset + 24, r.data.length, true);
+        view.setUint16(offset + 28, r.name.length, true);
+        view.setUint32(offset + 42, r.offset, true);
+        out.set(r.name, offset + 46);
+        offset += 46 + r.name.length;
+    }
+    view.setUint32(offset, 0x06054b50, true);
+    view.setUint16(offset + 8, records.length, true);
+    view.setUint16(offset + 10, records.length, true);
+    view.setUint32(offset + 12, offset - centralStart, true);
+    view.setUint32(offset + 16, centralStart, true);
+    return out;
+}
+
+// 与 Polars write_csv 的写法对齐：null 为空，NaN / inf 沿用 Polars 文本，含分隔符的字符串加引号。
+function csvCell(value) {
+    if (value === null || value === undefined) return '';
+    if (typeof value === 'number') {
+        if (Number.isNaN(value)) return 'NaN';
+        if (value === Infinity) return 'inf';
+        if (value === -Infinity) return '-inf';
+        return String(value);
+    }
+    const text = String(value);
+    return /[",\r\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text;
+}
+
+function tableToCsv(table) {
+    const names = table.schema.fields.map((field) => field.name);
+    const columns = names.map((_, i) => table.getChildAt(i));
+    const lines = [names.map(csvCell).join(',')];
+    for (let row = 0; row < table.numRows; row += 1) {
+        lines.push(columns.map((column) => csvCell(column.get(row))).join(','));
+    }
+    return `${lines.join('\n')}\n`;
+}
+
+let arrowModulePromise = null;
+
+function loadArrowModule(url) {
+    // 只在首次遇到 frames 时加载，失败后允许下次重试。
+    if (!arrowModulePromise) {
+        arrowModulePromise = import(url).catch((error) => {
+            arrowModulePromise = null;
+            throw error;
+        });
+    }
+    return arrowModulePromise;
+}
+
+async function framesToZipBytes(model, frames) {
+    const { tableFromIPC } = await loadArrowModule(model.get('arrow_lib_url'));
+    const encoder = new TextEncoder();
+    const entries = [];
+    for (const [path, value] of Object.entries(frames)) {
+        const bytes = normalizeToBytes(value);
+        if (!bytes) continue;
+        if (path.endsWith('.arrow')) {
+            const csv = tableToCsv(tableFromIPC(bytes));
+            entries.push([`${path.slice(0, -'.arrow'.length)}.csv`, encoder.encode(csv)]);
+        } else {
+            entries.push([path, bytes]);
+        }
+    }
+    return buildStoredZip(entries);
+}
+
+async function resolveZipBytes(model) {
+    const frames = model.get('frames');
+    if (frames && Object.keys(frames).length > 0) {
+        return framesToZipBytes(model, frames);
+    }
+    return normalizeToBytes(model.get('zip_data'));
+}
+
+// 每个容器的挂载序号：解码是异步的，档位连续切换时只挂载最后一次的数据。
+const mountSeq = new WeakMap();
+
+async function mountFromModel(model, el) {
+    const seq = (mountSeq.get(el) || 0) + 1;
+    mountSeq.set(el, seq);
+
+    let zipBytes;
+    try {
+        zipBytes = await resolveZipBytes(model);
+    } catch (error) {
+        console.error('❌ [ChartDashboardWidget] Arrow 帧解码失败:', error);
+        setError(el, `无法解码 Arrow 数据 (${error.message})`);
+        return;
+    }
+    if (mountSeq.get(el) !== seq) return;
     if (!zipBytes) {
+        const rawZipData = model.get('zip_data');
         const ctorName = rawZipData && rawZipData.constructor ? rawZipData.constructor.name : typeof rawZipData;
         console.error('❌ [ChartDashboardWidget] 未找到可识别的 ZIP 数据，收到类型:', ctorName, rawZipData);
         setError(el, `未找到图表数据（收到类型: ${ctorName}）`);
         return;
     }
 
-    const config = model.get('config');
+    try {
+        // 切换降采样档位时 zip_data / frames 会被替换，重新挂载前先清空旧图表。
+        el.innerHTML = '';
+        prepareContainer(el);
+        window.ChartDashboardLib.mountDashboard(el, { zipData: bytesToBase64(zipBytes), config: model.get('config') });
+    } catch (error) {
+        console.error('❌ [ChartDashboardWidget] 图表挂载失败:', error);
+        setError(el, error.message);
+    }
+}
+
+async function render({ model, el }) {
     const target = resolveRenderTarget(model, el);
     const aspectRatio = model.get('aspect_ratio');
     const embedFiles = model.get('embed_files');
@@ -199,13 +355,16 @@ async function render({ model, el }) {
         return;
     }
 
-    try {
-        prepareContainer(el);
-        window.ChartDashboardLib.mountDashboard(el, { zipData: bytesToBase64(zipBytes), config });
-    } catch (error) {
-        console.error('❌ [ChartDashboardWidget] 图表挂载失败:', error);
-        setError(el, error.message);
-    }
+    await mountFromModel(model, el);
+    // lod_tier 只由 Python 侧设置（图表库没有可见区间变化事件可挂接），
+    // Python 按档位生成并替换 zip_data / frames 后，这里只负责重新挂载。
+    const onDataChange = () => mountFromModel(model, el);
+    model.on('change:zip_data', onDataChange);
+    model.on('change:frames', onDataChange);
+    return () => {
+        model.off('change:zip_data', onDataChange);
+        model.off('change:frames', onDataChange);
+    };
 }
 
 export default { render };
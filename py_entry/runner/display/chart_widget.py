@@ -6,9 +6,12 @@ ChartDashboardWidget - 使用 anywidget 实现的图表仪表盘组件
 
 import anywidget
 import traitlets
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 from pathlib import Path
 
+if TYPE_CHECKING:
+    from ..results.prepared_export_bundle import PreparedExportBundle
+
 _ASSET_DIR = Path(__file__).parent
 # 直接内嵌 ESM/CSS 字符串，避免 marimo 在动态加载 @file 模块时偶发 404。
 _ESM_SOURCE = (_ASSET_DIR / "chart_widget.js").read_text(encoding="utf-8")
@@ -25,9 +28,24 @@ class ChartDashboardWidget(anywidget.AnyWidget):
     # 二进制 ZIP 数据（自动在 Python 和 JavaScript 之间传输）
     zip_data = traitlets.Bytes().tag(sync=True)
 
+    # Arrow IPC 帧与 JSON 条目（路径 -> 字节）；非空时优先于 zip_data。
+    # 每个值作为独立二进制 buffer 传输，前端用 apache-arrow 解码为 csv 后交给图表库。
+    frames = traitlets.Dict(default_value={}).tag(sync=True)
+    # 前端按需动态加载的 apache-arrow ESM 地址，仅 frames 非空时使用。
+    arrow_lib_url = traitlets.Unicode(
+        default_value="https://esm.sh/apache-arrow@17.0.0"
+    ).tag(sync=True)
+
     # 仪表盘配置
     config = traitlets.Dict(default_value={}).tag(sync=True)
 
+    # 降采样档位（升序点数预算）与当前档位；lod_tier=0 表示完整数据。
+    # lod_tier 是 Python 侧控制项：图表库不暴露可见区间变化事件，前端不会自动切档。
+    # 在 Python 中赋值（如 widget.lod_tier = 0）时，由 tier_loader 按需生成该档 bundle，
+    # 并替换 zip_data（arrow 格式替换 frames）。
+    lod_tiers = traitlets.List(traitlets.Int(), default_value=[]).tag(sync=True)
+    lod_tier = traitlets.Int(default_value=0).tag(sync=True)
+
     # 容器样式配置
     # 目标环境：jupyter / marimo
     target = traitlets.Unicode(default_value="jupyter").tag(sync=True)
@@ -58,6 +76,7 @@ class ChartDashboardWidget(anywidget.AnyWidget):
         *,
         zip_data: bytes,
         config: Dict[str, Any],
+        frames: Optional[Dict[str, bytes]] = None,
         target: str = "jupyter",
         width: str = "100%",
         aspect_ratio: str = "16/9",
@@ -66,11 +85,15 @@ class ChartDashboardWidget(anywidget.AnyWidget):
         embed_files: bool = True,
         js_content: str = "",
         css_content: str = "",
+        lod_tiers: Optional[List[int]] = None,
+        tier_loader: Optional[Callable[[Optional[int]], "PreparedExportBundle"]] = None,
         **kwargs: Any,
     ) -> None:
+        lod_tiers = list(lod_tiers or [])
         super().__init__(
             zip_data=zip_data,
             config=config,
+            frames=frames or {},
             target=target,
             width=width,
             aspect_ratio=aspect_ratio,
@@ -79,5 +102,19 @@ class ChartDashboardWidget(anywidget.AnyWidget):
             embed_files=embed_files,
             js_content=js_content,
             css_content=css_content,
+            lod_tiers=lod_tiers,
+            lod_tier=lod_tiers[0] if lod_tiers else 0,
             **kwargs,
         )
+        self._tier_loader = tier_loader
+        self.observe(self._on_lod_tier_change, names="lod_tier")
+
+    def _on_lod_tier_change(self, change: Dict[str, Any]) -> None:
+        """切换降采样档位：生成（或取缓存）对应数据并推送给前端。"""
+        if self._tier_loader is None:
+            return
+        tier = self._tier_loader(change["new"] or None)
+        if tier.frames:
+            self.frames = tier.frames
+        else:
+            self.zip_data = tier.zip_bytes()
@@ -34,7 +34,7 @@ def render_as_html(bundle: "PreparedExportBundle", config: DisplayConfig) -> HTM
     start_time = time.perf_counter() if bundle.enable_timing else None
 
     # 1. 获取 zip_data
-    zip_data = bundle.zip_buffer
+    zip_data = bundle.zip_bytes()
 
     # 2. 编码数据为 base64
     zip_base64 = base64.b64encode(zip_data).decode("utf-8")
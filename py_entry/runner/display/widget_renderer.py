@@ -46,7 +46,9 @@ def render_as_widget(bundle: "PreparedExportBundle", config: DisplayConfig):
 
     # 创建 widget
     widget = ChartDashboardWidget(
-        zip_data=bundle.zip_buffer,  # 直接传递 bytes，无需 base64 编码
+        # 直接传递 bytes，无需 base64 编码；arrow 格式逐帧传输，不再生成 ZIP
+        zip_data=b"" if bundle.frames else bundle.zip_bytes(),
+        frames=bundle.frames,
         config=config.override.to_dict() if config.override else {},
         target=config.target,
         width=config.width,
@@ -56,6 +58,8 @@ def render_as_widget(bundle: "PreparedExportBundle", config: DisplayConfig):
         embed_files=config.embed_files,
         js_content=js_content,
         css_content=css_content,
+        lod_tiers=list(bundle.lod_tiers),
+        tier_loader=bundle.tier if bundle.lod_tiers else None,
     )
 
     if bundle.enable_timing and start_time is not None:
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, ConfigDict
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Literal, Optional, Union
 from py_entry.types import (
     IndicatorsParams,
     SignalParams,
@@ -36,7 +36,10 @@ class FormatResultsConfig(BaseModel):
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    dataframe_format: str = "csv"
+    # 图表库只能读取 csv / parquet，其他格式在构造时直接拒绝。
+    # arrow：widget 逐帧传输 Arrow IPC，前端解码为 csv 后交给图表库，省去 Python 侧
+    # 编码 csv 与打 ZIP；save / upload / HTML 仍得到 csv ZIP（按需生成）。
+    dataframe_format: Literal["csv", "parquet", "arrow"] = "csv"
     compress_level: int = 1
     parquet_compression: ParquetCompression = "zstd"
     chart_config: Optional[ChartConfig] = None
@@ -44,6 +47,15 @@ class FormatResultsConfig(BaseModel):
     add_index: bool = True
     add_time: bool = True
     add_date: bool = True
+    # 降采样档位：每条关键序列（价格、净值）的点数预算，None 表示导出全部 K 线。
+    # 默认导出最粗一档；其余档位与完整数据在 Python 中设置 widget.lod_tier 时按需生成。
+    lod_tiers: Optional[list[int]] = None
+    lod_method: Literal["lttb", "minmax"] = "lttb"
+    # 编码 DataFrame 的线程数，None 交给线程池默认值。
+    export_workers: Optional[int] = None
+    # 是否在 bundle 中保留逐文件 buffers；默认只保留 ZIP，save() 时再从 ZIP 解包。
+    # arrow 格式已按条目保留 frames，不再额外保留 buffers。
+    retain_buffers: bool = False
 
 
 class DiagnoseStatesConfig(BaseModel):
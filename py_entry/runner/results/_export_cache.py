@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable
+
+from py_entry.runner.params import FormatResultsConfig
+from py_entry.runner.results.prepared_export_bundle import PreparedExportBundle
+
+# 每个结果视图最多缓存的导出 bundle 数量。
+EXPORT_CACHE_SIZE = 4
+
+
+class ExportBundleCache:
+    """按 FormatResultsConfig 缓存已准备好的导出 bundle，LRU 淘汰。"""
+
+    def __init__(self, maxsize: int = EXPORT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._bundles: OrderedDict[str, PreparedExportBundle] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._bundles)
+
+    def get_or_build(
+        self,
+        config: FormatResultsConfig,
+        build: Callable[[], PreparedExportBundle],
+    ) -> PreparedExportBundle:
+        """命中时直接返回缓存 bundle，否则构建并写入缓存。"""
+        key = config.model_dump_json()
+        bundle = self._bundles.get(key)
+        if bundle is not None:
+            self._bundles.move_to_end(key)
+            return bundle
+        bundle = build()
+        if self.maxsize > 0:
+            self._bundles[key] = bundle
+            while len(self._bundles) > self.maxsize:
+                self._bundles.popitem(last=False)
+        return bundle
+
+    def clear(self) -> None:
+        self._bundles.clear()
@@ -0,0 +1,174 @@
+"""导出降采样（level-of-detail）阶段。
+
+大样本回测导出时，按 base 行统一选出保留行，再对所有与 base 对齐的 DataFrame
+（base source、base 指标、signals、backtest_result、mapping、skip_mask）做同一次 gather，
+保证各表行对齐不被破坏；非 base 周期的 source/指标通过 mapping 索引访问，保持完整。
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Literal
+
+import numpy as np
+import polars as pl
+
+from py_entry.io.dataframe_utils import ExportDataPackSnapshot, ExportResultSnapshot
+
+LodMethod = Literal["lttb", "minmax"]
+
+# 参与选点的关键序列：base 价格与净值曲线。
+_PRICE_COLUMN = "close"
+_EQUITY_COLUMN = "equity"
+# 交易进出场价格列：取值出现或变化的行必须保留。
+_TRADE_COLUMNS = (
+    "entry_long_price",
+    "entry_short_price",
+    "exit_long_price",
+    "exit_short_price",
+)
+_RISK_COLUMN = "risk_in_bar_direction"
+
+
+def lttb_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets 选点，x 轴为行号；返回升序行号。"""
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n, dtype=np.int64)
+
+    y = np.nan_to_num(np.asarray(y, dtype=np.float64))
+    x = np.arange(n, dtype=np.float64)
+    # 首尾两点固定，中间 n_out - 2 个桶覆盖 [1, n - 1)。
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    anchor = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        area = np.abs(
+            (x[anchor] - avg_x) * (y[start:end] - y[anchor])
+            - (x[anchor] - x[start:end]) * (avg_y - y[anchor])
+        )
+        anchor = int(start + np.argmax(area))
+        selected[i + 1] = anchor
+    return selected
+
+
+def minmax_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """按桶保留最小值与最大值所在行（每桶 2 点），外加首尾；返回升序行号。"""
+    n = len(y)
+    if n_out >= n or n_out < 2:
+        return np.arange(n, dtype=np.int64)
+
+    y = np.asarray(y, dtype=np.float64)
+    edges = np.linspace(0, n, n_out // 2 + 1).astype(np.int64)
+    picked = [0, n - 1]
+    for start, end in zip(edges[:-1], edges[1:]):
+        if end <= start:
+            continue
+        segment = y[start:end]
+        if np.isnan(segment).all():
+            continue
+        picked.append(int(start + np.nanargmin(segment)))
+        picked.append(int(start + np.nanargmax(segment)))
+    return np.unique(np.asarray(picked, dtype=np.int64))
+
+
+def _event_rows(backtest: pl.DataFrame) -> np.ndarray:
+    """交易进出场与风控触发行：价格列取值出现/变化，或 risk_in_bar_direction 非 0。"""
+    conditions = []
+    for name in _TRADE_COLUMNS:
+        if name not in backtest.columns:
+            continue
+        value = pl.col(name).fill_nan(None)
+        conditions.append(
+            value.is_not_null() & (value != value.shift(1)).fill_null(True)
+        )
+    if _RISK_COLUMN in backtest.columns:
+        conditions.append(pl.col(_RISK_COLUMN) != 0)
+    if not conditions:
+        return np.empty(0, dtype=np.int64)
+
+    mask = backtest.select(pl.any_horizontal(conditions).fill_null(False)).to_series()
+    return np.flatnonzero(mask.to_numpy())
+
+
+def select_lod_rows(
+    data: ExportDataPackSnapshot,
+    result: ExportResultSnapshot,
+    max_points: int,
+    method: LodMethod = "lttb",
+) -> np.ndarray | None:
+    """
+    选出 base 保留行。
+
+    max_points 为每条关键序列的点数预算；结果是各序列选点与事件行的并集。
+    base 行数不超过预算时返回 None，表示无需降采样。
+    """
+    base = data.source[data.base_data_key]
+    n = base.height
+    if n <= max_points:
+        return None
+
+    pick = lttb_indices if method == "lttb" else minmax_indices
+    series: list[np.ndarray] = []
+    if _PRICE_COLUMN in base.columns:
+        series.append(base[_PRICE_COLUMN].to_numpy())
+    backtest = result.backtest_result
+    if backtest is not None and _EQUITY_COLUMN in backtest.columns:
+        series.append(backtest[_EQUITY_COLUMN].to_numpy())
+    if not series:
+        # 没有可用于选点的序列时退化为等距抽样。
+        series.append(np.zeros(n))
+        pick = minmax_indices
+
+    parts = [pick(y, max_points) for y in series]
+    if backtest is not None:
+        parts.append(_event_rows(backtest))
+    return np.unique(np.concatenate(parts))
+
+
+def downsample_snapshots(
+    data: ExportDataPackSnapshot,
+    result: ExportResultSnapshot,
+    max_points: int,
+    method: LodMethod = "lttb",
+) -> tuple[ExportDataPackSnapshot, ExportResultSnapshot]:
+    """对所有与 base 对齐的导出表执行同一次行 gather。"""
+    rows = select_lod_rows(data, result, max_points, method)
+    if rows is None:
+        return data, result
+
+    key = data.base_data_key
+    take = pl.Series("rows", rows, dtype=pl.UInt32)
+
+    def gather(df: pl.DataFrame | None) -> pl.DataFrame | None:
+        return None if df is None else df.select(pl.all().gather(take))
+
+    source = dict(data.source)
+    source[key] = gather(source[key])
+    indicators = None
+    if result.indicators is not None:
+        indicators = dict(result.indicators)
+        if key in indicators:
+            indicators[key] = gather(indicators[key])
+
+    return (
+        replace(
+            data,
+            mapping=gather(data.mapping),
+            skip_mask=gather(data.skip_mask),
+            source=source,
+        ),
+        replace(
+            result,
+            indicators=indicators,
+            signals=gather(result.signals),
+            backtest_result=gather(result.backtest_result),
+        ),
+    )
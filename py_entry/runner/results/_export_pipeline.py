@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import io
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Iterator
 
 from loguru import logger
 
@@ -16,9 +17,10 @@ from pyo3_quant.backtest_engine.data_ops import (
 from py_entry.charts.generation import generate_default_chart_config
 from py_entry.io._converters_serialization import convert_to_serializable
 from py_entry.io._converters_serialization import dumps_json_bytes
-from py_entry.io.zip_utils import create_zip_buffer
+from py_entry.io.zip_utils import write_zip_stream
 from py_entry.io.dataframe_utils import add_contextual_columns_to_dataframes
 from py_entry.runner.params import FormatResultsConfig
+from py_entry.runner.results._export_lod import downsample_snapshots
 from py_entry.runner.results.prepared_export_bundle import PreparedExportBundle
 from py_entry.runner.results.runner_session import RunnerSession
 from py_entry.types import ResultPack, SingleParamSet
@@ -80,6 +82,11 @@ def copy_result_pack_for_export(
     )
 
 
+def _dashboard_format(config: FormatResultsConfig) -> str:
+    """图表库读取的文件格式：arrow 只是 widget 传输编码，落盘与 chart config 仍为 csv。"""
+    return "csv" if config.dataframe_format == "arrow" else config.dataframe_format
+
+
 def _build_chart_config(
     export_data_snapshot: Any,
     export_result_snapshot: Any,
@@ -96,7 +103,7 @@ def _build_chart_config(
         export_data_snapshot,
         export_result_snapshot,
         chart_params,
-        config.dataframe_format,
+        _dashboard_format(config),
         config.indicator_layout,
     )
 
@@ -110,11 +117,78 @@ def _dataframe_to_buffer(
     buf = io.BytesIO()
     if dataframe_format == "csv":
         df.write_csv(buf)
+    elif dataframe_format == "arrow":
+        import polars as pl
+
+        # 不压缩：前端 apache-arrow 直接读取 IPC 流，省去解压开销；
+        # oldest 兼容级别把字符串写成 large_utf8，apache-arrow JS 不认 Utf8View。
+        df.write_ipc_stream(
+            buf, compression="uncompressed", compat_level=pl.CompatLevel.oldest()
+        )
     else:
         df.write_parquet(buf, compression=parquet_compression)
     return buf
 
 
+def _iter_export_entries(
+    payload: ExportPayload,
+    *,
+    dataframe_format: str,
+    parquet_compression: "ParquetCompression",
+    max_workers: int | None = None,
+) -> Iterator[tuple[Path, io.BytesIO]]:
+    """
+    按固定顺序产出导出条目。
+
+    DataFrame 在线程池中并行编码（Polars 写入在 Rust 侧执行，不占用 GIL），
+    按提交顺序逐个产出，调用方写完即可释放。
+    """
+    paths = [Path(path) for path in payload.data_frames]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        encoded = executor.map(
+            lambda df: _dataframe_to_buffer(df, dataframe_format, parquet_compression),
+            payload.data_frames.values(),
+        )
+        yield from zip(paths, encoded)
+    for path, obj in payload.json_dicts.items():
+        yield Path(path), io.BytesIO(dumps_json_bytes(obj))
+    if payload.chart_config is not None:
+        yield (
+            Path("chartConfig.json"),
+            io.BytesIO(dumps_json_bytes(convert_to_serializable(payload.chart_config))),
+        )
+
+
+def stream_export_payload(
+    payload: ExportPayload,
+    target: BinaryIO,
+    *,
+    dataframe_format: str,
+    parquet_compression: "ParquetCompression",
+    compress_level: int,
+    max_workers: int | None = None,
+    retained: list[tuple[Path, io.BytesIO]] | None = None,
+) -> None:
+    """
+    把导出负载直接流式写成 ZIP。
+
+    parquet 条目以 stored 方式写入；retained 非空时额外收集逐文件 buffers。
+    """
+
+    def entries() -> Iterator[tuple[Path, memoryview]]:
+        for path, buf in _iter_export_entries(
+            payload,
+            dataframe_format=dataframe_format,
+            parquet_compression=parquet_compression,
+            max_workers=max_workers,
+        ):
+            if retained is not None:
+                retained.append((path, buf))
+            yield path, buf.getbuffer()
+
+    write_zip_stream(entries(), target, compress_level=compress_level)
+
+
 def package_export_payload(
     payload: ExportPayload,
     *,
@@ -122,48 +196,106 @@ def package_export_payload(
     parquet_compression: "ParquetCompression",
     compress_level: int,
     enable_timing: bool = False,
+    max_workers: int | None = None,
+    retain_buffers: bool = False,
 ) -> PreparedExportBundle:
-    """将导出负载打成正式 bundle。"""
+    """将导出负载打成正式 bundle；默认只保留 ZIP 字节。"""
+    if dataframe_format == "arrow":
+        return _package_arrow_frames(
+            payload,
+            compress_level=compress_level,
+            enable_timing=enable_timing,
+            max_workers=max_workers,
+        )
     start_time = time.perf_counter() if enable_timing else None
     buffers: list[tuple[Path, io.BytesIO]] = []
-    for path, df in payload.data_frames.items():
-        buffers.append(
-            (
-                Path(path),
-                _dataframe_to_buffer(df, dataframe_format, parquet_compression),
-            )
-        )
-    for path, obj in payload.json_dicts.items():
-        buffers.append((Path(path), io.BytesIO(dumps_json_bytes(obj))))
-    if payload.chart_config is not None:
-        buffers.append(
-            (
-                Path("chartConfig.json"),
-                io.BytesIO(
-                    dumps_json_bytes(convert_to_serializable(payload.chart_config))
-                ),
-            )
-        )
-    zip_buffer = create_zip_buffer(buffers, compress_level=compress_level)
+    zip_io = io.BytesIO()
+    stream_export_payload(
+        payload,
+        zip_io,
+        dataframe_format=dataframe_format,
+        parquet_compression=parquet_compression,
+        compress_level=compress_level,
+        max_workers=max_workers,
+        retained=buffers if retain_buffers else None,
+    )
     if enable_timing and start_time is not None:
         elapsed = time.perf_counter() - start_time
         logger.info(f"package_export_payload() 耗时: {elapsed:.4f}秒")
     return PreparedExportBundle(
         buffers=buffers,
-        zip_buffer=zip_buffer,
+        zip_buffer=zip_io.getvalue(),
+        chart_config=payload.chart_config,
+        enable_timing=enable_timing,
+    )
+
+
+def _package_arrow_frames(
+    payload: ExportPayload,
+    *,
+    compress_level: int,
+    enable_timing: bool,
+    max_workers: int | None,
+) -> PreparedExportBundle:
+    """
+    arrow 格式：DataFrame 编码为 Arrow IPC 帧，连同 JSON 条目按导出路径索引。
+
+    帧路径的 .csv 后缀换成 .arrow，widget 前端解码后还原为 csv 条目再交给图表库；
+    save / upload / HTML 需要的 csv ZIP 由 zip_builder 从同一批帧按需生成。
+    """
+    start_time = time.perf_counter() if enable_timing else None
+    frame_paths = {
+        str(path): str(path.with_suffix(".arrow"))
+        for path in map(Path, payload.data_frames)
+    }
+    frames: dict[str, bytes] = {}
+    for path, buf in _iter_export_entries(
+        payload,
+        dataframe_format="arrow",
+        parquet_compression="uncompressed",
+        max_workers=max_workers,
+    ):
+        frames[frame_paths.get(str(path), str(path))] = buf.getvalue()
+    if enable_timing and start_time is not None:
+        elapsed = time.perf_counter() - start_time
+        logger.info(f"_package_arrow_frames() 耗时: {elapsed:.4f}秒")
+    return PreparedExportBundle(
+        buffers=[],
+        zip_buffer=None,
         chart_config=payload.chart_config,
         enable_timing=enable_timing,
+        frames=frames,
+        zip_builder=lambda: _arrow_frames_to_zip(frames, compress_level),
     )
 
 
+def _arrow_frames_to_zip(frames: dict[str, bytes], compress_level: int) -> bytes:
+    """把 Arrow IPC 帧还原为 csv 条目并打成图表库可读的 ZIP。"""
+    import polars as pl
+
+    def entries() -> Iterator[tuple[Path, bytes]]:
+        for path, data in frames.items():
+            if not path.endswith(".arrow"):
+                yield Path(path), data
+                continue
+            buf = io.BytesIO()
+            pl.read_ipc_stream(io.BytesIO(data)).write_csv(buf)
+            yield Path(path).with_suffix(".csv"), buf.getvalue()
+
+    zip_io = io.BytesIO()
+    write_zip_stream(entries(), zip_io, compress_level=compress_level)
+    return zip_io.getvalue()
+
+
 def _build_single_export_payload(
     *,
     session: RunnerSession,
     result: ResultPack,
     params: SingleParamSet,
     config: FormatResultsConfig,
+    lod_points: int | None = None,
 ) -> ExportPayload:
-    """构造 single export payload。"""
+    """构造 single export payload；lod_points 非空时按该点数预算降采样。"""
     export_data = copy_data_pack_for_export(session.data_pack)
     export_result = copy_result_pack_for_export(export_data, result)
     export_data_snapshot, export_result_snapshot = add_contextual_columns_to_dataframes(
@@ -175,6 +307,10 @@ def _build_single_export_payload(
     )
     if export_data_snapshot is None:
         raise ValueError("single export 失败：export_data_snapshot 不能为空")
+    if lod_points is not None:
+        export_data_snapshot, export_result_snapshot = downsample_snapshots(
+            export_data_snapshot, export_result_snapshot, lod_points, config.lod_method
+        )
     chart_config = _build_chart_config(
         export_data_snapshot,
         export_result_snapshot,
@@ -182,34 +318,31 @@ def _build_single_export_payload(
         backtest_schedule=None,
         config=config,
     )
+    file_format = _dashboard_format(config)
     data_frames: dict[str, Any] = {}
     json_dicts: dict[str, dict | list] = {}
     if export_result_snapshot.indicators is not None:
         for key, df in export_result_snapshot.indicators.items():
-            data_frames[
-                f"backtest_results/indicators_{key}.{config.dataframe_format}"
-            ] = df
+            data_frames[f"backtest_results/indicators_{key}.{file_format}"] = df
     if export_result_snapshot.signals is not None:
-        data_frames[f"backtest_results/signals.{config.dataframe_format}"] = (
+        data_frames[f"backtest_results/signals.{file_format}"] = (
             export_result_snapshot.signals
         )
     if export_result_snapshot.backtest_result is not None:
-        data_frames[f"backtest_results/backtest_result.{config.dataframe_format}"] = (
+        data_frames[f"backtest_results/backtest_result.{file_format}"] = (
             export_result_snapshot.backtest_result
         )
     if export_result_snapshot.performance is not None:
         json_dicts["backtest_results/performance.json"] = (
             export_result_snapshot.performance
         )
-    data_frames[f"data_pack/mapping.{config.dataframe_format}"] = (
-        export_data_snapshot.mapping
-    )
+    data_frames[f"data_pack/mapping.{file_format}"] = export_data_snapshot.mapping
     if export_data_snapshot.skip_mask is not None:
-        data_frames[f"data_pack/skip_mask.{config.dataframe_format}"] = (
+        data_frames[f"data_pack/skip_mask.{file_format}"] = (
             export_data_snapshot.skip_mask
         )
     for key, df in export_data_snapshot.source.items():
-        data_frames[f"data_pack/source_{key}.{config.dataframe_format}"] = df
+        data_frames[f"data_pack/source_{key}.{file_format}"] = df
     json_dicts["data_pack/base_data_key.json"] = {
         "base_data_key": export_data_snapshot.base_data_key
     }
@@ -253,8 +386,9 @@ def _build_walk_forward_export_payload(
     stitched_result: ResultPack,
     backtest_schedule: list[Any],
     config: FormatResultsConfig,
+    lod_points: int | None = None,
 ) -> ExportPayload:
-    """构造 WF stitched export payload。"""
+    """构造 WF stitched export payload；lod_points 非空时按该点数预算降采样。"""
     export_data = copy_data_pack_for_export(stitched_data)
     export_result = copy_result_pack_for_export(export_data, stitched_result)
     export_data_snapshot, export_result_snapshot = add_contextual_columns_to_dataframes(
@@ -266,6 +400,10 @@ def _build_walk_forward_export_payload(
     )
     if export_data_snapshot is None:
         raise ValueError("WF export 失败：export_data_snapshot 不能为空")
+    if lod_points is not None:
+        export_data_snapshot, export_result_snapshot = downsample_snapshots(
+            export_data_snapshot, export_result_snapshot, lod_points, config.lod_method
+        )
     chart_config = _build_chart_config(
         export_data_snapshot,
         export_result_snapshot,
@@ -273,34 +411,31 @@ def _build_walk_forward_export_payload(
         backtest_schedule=backtest_schedule,
         config=config,
     )
+    file_format = _dashboard_format(config)
     data_frames: dict[str, Any] = {}
     json_dicts: dict[str, dict | list] = {}
     if export_result_snapshot.indicators is not None:
         for key, df in export_result_snapshot.indicators.items():
-            data_frames[
-                f"backtest_results/indicators_{key}.{config.dataframe_format}"
-            ] = df
+            data_frames[f"backtest_results/indicators_{key}.{file_format}"] = df
     if export_result_snapshot.signals is not None:
-        data_frames[f"backtest_results/signals.{config.dataframe_format}"] = (
+        data_frames[f"backtest_results/signals.{file_format}"] = (
             export_result_snapshot.signals
         )
     if export_result_snapshot.backtest_result is not None:
-        data_frames[f"backtest_results/backtest_result.{config.dataframe_format}"] = (
+        data_frames[f"backtest_results/backtest_result.{file_format}"] = (
             export_result_snapshot.backtest_result
         )
     if export_result_snapshot.performance is not None:
         json_dicts["backtest_results/performance.json"] = (
             export_result_snapshot.performance
         )
-    data_frames[f"data_pack/mapping.{config.dataframe_format}"] = (
-        export_data_snapshot.mapping
-    )
+    data_frames[f"data_pack/mapping.{file_format}"] = export_data_snapshot.mapping
     if export_data_snapshot.skip_mask is not None:
-        data_frames[f"data_pack/skip_mask.{config.dataframe_format}"] = (
+        data_frames[f"data_pack/skip_mask.{file_format}"] = (
             export_data_snapshot.skip_mask
         )
     for key, df in export_data_snapshot.source.items():
-        data_frames[f"data_pack/source_{key}.{config.dataframe_format}"] = df
+        data_frames[f"data_pack/source_{key}.{file_format}"] = df
     json_dicts["data_pack/base_data_key.json"] = {
         "base_data_key": export_data_snapshot.base_data_key
     }
@@ -332,6 +467,52 @@ def _build_walk_forward_export_payload(
     )
 
 
+def _package_lod_tiers(
+    build_payload: Callable[[int | None], ExportPayload],
+    config: FormatResultsConfig,
+    enable_timing: bool,
+) -> PreparedExportBundle:
+    """按 lod_tiers 打包：默认 bundle 为最粗一档，其余档位交给 bundle 按需生成。"""
+
+    def package(
+        lod_points: int | None, retain_buffers: bool = False
+    ) -> PreparedExportBundle:
+        return package_export_payload(
+            build_payload(lod_points),
+            dataframe_format=config.dataframe_format,
+            parquet_compression=config.parquet_compression,
+            compress_level=config.compress_level,
+            enable_timing=enable_timing,
+            max_workers=config.export_workers,
+            retain_buffers=retain_buffers,
+        )
+
+    tiers = tuple(sorted(config.lod_tiers or ()))
+    bundle = package(_default_lod_points(config), config.retain_buffers)
+    if tiers:
+        bundle.lod_tiers = tiers
+        bundle.tier_builder = package
+    return bundle
+
+
+def _default_lod_points(config: FormatResultsConfig) -> int | None:
+    """默认导出档位：配置了 lod_tiers 时取最粗一档。"""
+    return min(config.lod_tiers) if config.lod_tiers else None
+
+
+def _stream_with_config(
+    payload: ExportPayload, target: BinaryIO, config: FormatResultsConfig
+) -> None:
+    stream_export_payload(
+        payload,
+        target,
+        dataframe_format=_dashboard_format(config),
+        parquet_compression=config.parquet_compression,
+        compress_level=config.compress_level,
+        max_workers=config.export_workers,
+    )
+
+
 def prepare_single_export_bundle(
     *,
     session: RunnerSession,
@@ -340,41 +521,77 @@ def prepare_single_export_bundle(
     config: FormatResultsConfig,
 ) -> PreparedExportBundle:
     """single view 的正式导出入口。"""
+    return _package_lod_tiers(
+        lambda lod_points: _build_single_export_payload(
+            session=session,
+            result=result,
+            params=params,
+            config=config,
+            lod_points=lod_points,
+        ),
+        config,
+        session.enable_timing,
+    )
+
+
+def prepare_walk_forward_export_bundle(
+    *,
+    session: RunnerSession,
+    stitched_data: Any,
+    stitched_result: ResultPack,
+    backtest_schedule: list[Any],
+    config: FormatResultsConfig,
+) -> PreparedExportBundle:
+    """WF view 的正式导出入口。"""
+    return _package_lod_tiers(
+        lambda lod_points: _build_walk_forward_export_payload(
+            session=session,
+            stitched_data=stitched_data,
+            stitched_result=stitched_result,
+            backtest_schedule=backtest_schedule,
+            config=config,
+            lod_points=lod_points,
+        ),
+        config,
+        session.enable_timing,
+    )
+
+
+def write_single_export_zip(
+    target: BinaryIO,
+    *,
+    session: RunnerSession,
+    result: ResultPack,
+    params: SingleParamSet,
+    config: FormatResultsConfig,
+) -> None:
+    """single view 的流式导出入口：直接写入已打开的文件或流，不构建 bundle。"""
     payload = _build_single_export_payload(
         session=session,
         result=result,
         params=params,
         config=config,
+        lod_points=_default_lod_points(config),
     )
-    return package_export_payload(
-        payload,
-        dataframe_format=config.dataframe_format,
-        parquet_compression=config.parquet_compression,
-        compress_level=config.compress_level,
-        enable_timing=session.enable_timing,
-    )
+    _stream_with_config(payload, target, config)
 
 
-def prepare_walk_forward_export_bundle(
+def write_walk_forward_export_zip(
+    target: BinaryIO,
     *,
     session: RunnerSession,
     stitched_data: Any,
     stitched_result: ResultPack,
     backtest_schedule: list[Any],
     config: FormatResultsConfig,
-) -> PreparedExportBundle:
-    """WF view 的正式导出入口。"""
+) -> None:
+    """WF view 的流式导出入口：直接写入已打开的文件或流，不构建 bundle。"""
     payload = _build_walk_forward_export_payload(
         session=session,
         stitched_data=stitched_data,
         stitched_result=stitched_result,
         backtest_schedule=backtest_schedule,
         config=config,
+        lod_points=_default_lod_points(config),
     )
-    return package_export_payload(
-        payload,
-        dataframe_format=config.dataframe_format,
-        parquet_compression=config.parquet_compression,
-        compress_level=config.compress_level,
-        enable_timing=session.enable_timing,
-    )
+    _stream_with_config(payload, target, config)
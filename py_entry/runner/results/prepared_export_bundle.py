@@ -1,15 +1,15 @@
 from __future__ import annotations
 
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from io import BytesIO
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 from loguru import logger
 
 from py_entry.io import DisplayConfig, SaveConfig, UploadConfig
-from py_entry.io import save_backtest_results, upload_backtest_results
+from py_entry.io import read_zip_buffers, save_backtest_results, upload_backtest_results
 
 if TYPE_CHECKING:
     from IPython.display import HTML
@@ -23,15 +23,50 @@ if TYPE_CHECKING:
 class PreparedExportBundle:
     """正式导出 bundle。"""
 
+    # 逐文件 buffers 仅在 FormatResultsConfig.retain_buffers=True 时保留，默认为空。
     buffers: list[tuple[Path, BytesIO]]
-    zip_buffer: bytes
+    # arrow 格式下为 None，首次经 zip_bytes() 访问时由 zip_builder 生成。
+    zip_buffer: bytes | None
     chart_config: "ChartConfig | None"
     enable_timing: bool = False
+    # Arrow IPC 帧与 JSON 条目（路径 -> 字节），仅 dataframe_format="arrow" 时非空，
+    # widget 优先逐条传输，由前端解码后交给图表库。
+    frames: dict[str, bytes] = field(default_factory=dict)
+    zip_builder: Callable[[], bytes] | None = None
+    # 降采样档位（升序点数预算）；当前 bundle 对应首档，其余档位经 tier_builder 按需生成。
+    lod_tiers: tuple[int, ...] = ()
+    tier_builder: Callable[[int | None], PreparedExportBundle] | None = None
+    _tiers: dict[int | None, PreparedExportBundle] = field(
+        default_factory=dict, repr=False
+    )
+
+    def tier(self, lod_points: int | None) -> PreparedExportBundle:
+        """取指定档位的 bundle（None 为完整数据），首次请求时生成并缓存。"""
+        if self.tier_builder is None or (
+            self.lod_tiers and lod_points == self.lod_tiers[0]
+        ):
+            return self
+        if lod_points not in self._tiers:
+            self._tiers[lod_points] = self.tier_builder(lod_points)
+        return self._tiers[lod_points]
+
+    def tier_zip(self, lod_points: int | None) -> bytes:
+        """取指定档位的 ZIP 字节。"""
+        return self.tier(lod_points).zip_bytes()
+
+    def zip_bytes(self) -> bytes:
+        """取 ZIP 字节；arrow 格式首次访问时才从 frames 生成并缓存。"""
+        if self.zip_buffer is None:
+            if self.zip_builder is None:
+                raise ValueError("bundle 既没有 zip_buffer 也没有 zip_builder")
+            self.zip_buffer = self.zip_builder()
+        return self.zip_buffer
 
     def save(self, config: SaveConfig) -> "PreparedExportBundle":
         """保存 bundle 到本地。"""
         start_time = time.perf_counter() if self.enable_timing else None
-        save_backtest_results(buffers=self.buffers, config=config)
+        buffers = self.buffers or read_zip_buffers(self.zip_bytes())
+        save_backtest_results(buffers=buffers, config=config)
         if self.enable_timing and start_time is not None:
             elapsed = time.perf_counter() - start_time
             logger.info(f"PreparedExportBundle.save() 耗时: {elapsed:.4f}秒")
@@ -40,7 +75,7 @@ class PreparedExportBundle:
     def upload(self, config: UploadConfig) -> "PreparedExportBundle":
         """上传 bundle 到远端。"""
         start_time = time.perf_counter() if self.enable_timing else None
-        upload_backtest_results(zip_data=self.zip_buffer, config=config)
+        upload_backtest_results(zip_data=self.zip_bytes(), config=config)
         if self.enable_timing and start_time is not None:
             elapsed = time.perf_counter() - start_time
             logger.info(f"PreparedExportBundle.upload() 耗时: {elapsed:.4f}秒")
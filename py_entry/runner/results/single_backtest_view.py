@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO
 
 from py_entry.runner.params import FormatResultsConfig
-from py_entry.runner.results._export_pipeline import prepare_single_export_bundle
+from py_entry.runner.results._export_cache import ExportBundleCache
+from py_entry.runner.results._export_pipeline import (
+    prepare_single_export_bundle,
+    write_single_export_zip,
+)
 from py_entry.runner.results.prepared_export_bundle import PreparedExportBundle
 from py_entry.runner.results.report_json import dump_report
 from py_entry.runner.results.runner_session import RunnerSession
@@ -18,10 +22,30 @@ class SingleBacktestView:
     raw: ResultPack
     params: SingleParamSet
     session: RunnerSession
+    _export_cache: ExportBundleCache = field(
+        default_factory=ExportBundleCache, init=False, repr=False
+    )
 
     def prepare_export(self, config: FormatResultsConfig) -> PreparedExportBundle:
-        """生成 single backtest 正式导出 bundle。"""
-        return prepare_single_export_bundle(
+        """生成 single backtest 正式导出 bundle；相同配置复用缓存。"""
+        return self._export_cache.get_or_build(
+            config,
+            lambda: prepare_single_export_bundle(
+                session=self.session,
+                result=self.raw,
+                params=self.params,
+                config=config,
+            ),
+        )
+
+    def invalidate_export_cache(self) -> None:
+        """清空导出 bundle 缓存。"""
+        self._export_cache.clear()
+
+    def write_export(self, target: BinaryIO, config: FormatResultsConfig) -> None:
+        """把 single backtest 导出 ZIP 直接流式写入已打开的文件或流。"""
+        write_single_export_zip(
+            target,
             session=self.session,
             result=self.raw,
             params=self.params,
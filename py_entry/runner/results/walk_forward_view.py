@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Optional
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Optional
 
 from py_entry.io._converters_serialization import convert_to_serializable
 from py_entry.runner.params import FormatResultsConfig
-from py_entry.runner.results._export_pipeline import prepare_walk_forward_export_bundle
+from py_entry.runner.results._export_cache import ExportBundleCache
+from py_entry.runner.results._export_pipeline import (
+    prepare_walk_forward_export_bundle,
+    write_walk_forward_export_zip,
+)
 from py_entry.runner.results.prepared_export_bundle import PreparedExportBundle
 from py_entry.runner.results.report_json import dump_report
 from py_entry.runner.results.runner_session import RunnerSession
@@ -25,6 +29,9 @@ class WalkForwardView:
 
     raw: WalkForwardResult
     session: RunnerSession
+    _export_cache: ExportBundleCache = field(
+        default_factory=ExportBundleCache, init=False, repr=False
+    )
 
     @property
     def is_robust(self) -> bool:
@@ -124,8 +131,26 @@ class WalkForwardView:
         return worst_id
 
     def prepare_export(self, config: FormatResultsConfig) -> PreparedExportBundle:
-        """生成 WF stitched 正式导出 bundle。"""
-        return prepare_walk_forward_export_bundle(
+        """生成 WF stitched 正式导出 bundle；相同配置复用缓存。"""
+        return self._export_cache.get_or_build(
+            config,
+            lambda: prepare_walk_forward_export_bundle(
+                session=self.session,
+                stitched_data=self.stitched_result.stitched_data,
+                stitched_result=self.stitched_pack_result,
+                backtest_schedule=list(self.stitched_result.meta.backtest_schedule),
+                config=config,
+            ),
+        )
+
+    def invalidate_export_cache(self) -> None:
+        """清空导出 bundle 缓存。"""
+        self._export_cache.clear()
+
+    def write_export(self, target: BinaryIO, config: FormatResultsConfig) -> None:
+        """把 WF stitched 导出 ZIP 直接流式写入已打开的文件或流。"""
+        write_walk_forward_export_zip(
+            target,
             session=self.session,
             stitched_data=self.stitched_result.stitched_data,
             stitched_result=self.stitched_pack_result,
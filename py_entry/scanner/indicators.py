@@ -1,7 +1,6 @@
-"""技术指标计算 - 使用 pandas-ta"""
+"""技术指标辅助函数 - 指标本身由策略经 DataPack 交给回测引擎计算"""
 
 import pandas as pd
-import pandas_ta as ta
 
 
 # ==============================================================================
@@ -94,63 +93,6 @@ def get_recent_closed_window(series: pd.Series, window_size: int) -> pd.Series:
     return series.iloc[start_idx:end_idx]
 
 
-def calculate_ema(close: pd.Series, period: int) -> pd.Series:
-    """计算 EMA"""
-    result = ta.ema(close, length=period)
-    return result if result is not None else pd.Series(dtype=float)
-
-
-def calculate_macd(
-    close: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9
-) -> tuple[pd.Series, pd.Series, pd.Series]:
-    """
-    计算 MACD
-
-    Returns:
-        (MACD线, 信号线, 柱状图)
-    """
-    macd_df = ta.macd(close, fast=fast, slow=slow, signal=signal)
-    if macd_df is None:
-        # 数据不足时可能返回 None
-        return pd.Series(), pd.Series(), pd.Series()
-
-    # pandas-ta 返回 DataFrame，列名格式：MACD_12_26_9, MACDh_12_26_9, MACDs_12_26_9
-    # 具体列名可能因版本略有不同，但通常符合命名规范
-    # 为了稳健，直接按位置取或构造列名
-    macd_col = f"MACD_{fast}_{slow}_{signal}"
-    hist_col = f"MACDh_{fast}_{slow}_{signal}"
-    signal_col = f"MACDs_{fast}_{slow}_{signal}"
-
-    return macd_df[macd_col], macd_df[signal_col], macd_df[hist_col]
-
-
-def calculate_cci(
-    high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14
-) -> pd.Series:
-    """计算 CCI"""
-    result = ta.cci(high, low, close, length=period)
-    return result if result is not None else pd.Series(dtype=float)
-
-
-def calculate_adx(
-    high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14
-) -> pd.Series:
-    """计算 ADX"""
-    # pandas-ta 的 adx 返回 DataFrame，包含 ADX, DMP, DMN
-    result = ta.adx(high, low, close, length=period)
-
-    if result is None:
-        return pd.Series(dtype=float)
-
-    # 列名通常是 ADX_14, DMP_14, DMN_14
-    # 动态匹配列名
-    adx_col = f"ADX_{period}"
-    if adx_col in result.columns:
-        return result[adx_col]
-
-    return pd.Series(dtype=float)
-
-
 def is_cross_above(series: pd.Series, threshold: float | pd.Series) -> bool:
     """判断上一根已完成K线是否上穿（基于[-2]和[-3]）"""
     if len(series) < 3:
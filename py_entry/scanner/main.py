@@ -7,7 +7,6 @@ import logging
 try:
     import tqsdk  # noqa: F401
     import pandas  # noqa: F401
-    import pandas_ta  # noqa: F401
     import httpx  # noqa: F401
 except ImportError as e:
     print("错误: 缺少必要的依赖库。请运行:")
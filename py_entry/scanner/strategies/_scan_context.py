@@ -118,8 +118,11 @@ class ScanContext:
             key = f"ohlcv_{self.timeframes[storage_key].name}"
             target_df = pdf if lookback is None else pdf.iloc[-lookback:]
 
+            # 中文注释：逐列取 numpy 构造，避免 pl.from_pandas 整表转换依赖 pyarrow。
             pl_df = (
-                pl.from_pandas(target_df)
+                pl.DataFrame(
+                    {col: target_df[col].to_numpy() for col in target_df.columns}
+                )
                 .rename({"datetime": "time"})
                 .with_columns(
                     (pl.col("time").cast(pl.Int64) // 1_000_000).alias("time")
@@ -32,7 +32,8 @@ from .bot_config import BotConfig
 from .bot import TradingBot, StepResult
 from .runtime_checks import RuntimeChecks
 from .executor import ActionExecutor
-from .optimization import OptimizationCallbacks
+from .optimization import CycleCallbacks, MarketInfoCache, OptimizationCallbacks
+from .live_runner import LiveStrategyRunner
 from .live_strategy_callbacks import LiveStrategyCallbacks
 
 __all__ = [
@@ -78,5 +79,8 @@ __all__ = [
     "RuntimeChecks",
     "ActionExecutor",
     "OptimizationCallbacks",
+    "CycleCallbacks",
+    "MarketInfoCache",
+    "LiveStrategyRunner",
     "LiveStrategyCallbacks",
 ]
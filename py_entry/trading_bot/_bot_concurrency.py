@@ -0,0 +1,89 @@
+import asyncio
+import inspect
+import threading
+import time
+from typing import Any, Optional
+
+# 交易所 API 回调的方法名前缀；只有这些调用参与限速。
+EXCHANGE_METHOD_PREFIXES = ("fetch_", "create_", "close_", "cancel_", "set_")
+
+
+class ExchangeRateLimiter:
+    """按交易所限速（每秒请求数），线程安全，供并发的品种线程共享。"""
+
+    def __init__(self, limits: dict[str, float]):
+        self._intervals = {
+            name: 1.0 / rate for name, rate in limits.items() if rate and rate > 0
+        }
+        self._next_slot: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, exchange_name: Optional[str]) -> None:
+        """占用一个请求时隙；未配置限速的交易所直接放行。"""
+        key = exchange_name or ""
+        interval = self._intervals.get(key)
+        if interval is None:
+            return
+        # 锁内只预约时隙，睡眠放在锁外，避免阻塞其他交易所的请求。
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(key, now))
+            self._next_slot[key] = slot + interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+def _exchange_name_of(args: tuple, kwargs: dict) -> Optional[str]:
+    """从回调参数中取交易所名：关键字参数、请求体字段或首个位置参数。"""
+    if "exchange_name" in kwargs:
+        return kwargs["exchange_name"]
+    request = kwargs.get("request", args[0] if args else None)
+    if request is not None and hasattr(request, "exchange_name"):
+        return request.exchange_name
+    if args and isinstance(args[0], str):
+        return args[0]
+    return None
+
+
+class ConcurrentCallbacks:
+    """
+    并发执行用的回调代理，运行在品种工作线程中。
+
+    功能：
+    1. 交易所 API 调用前按 BotConfig.exchange_rate_limits 限速
+    2. 回调若为 async 实现，把协程提交回事件循环执行，工作线程阻塞等待结果
+    """
+
+    def __init__(
+        self,
+        inner: Any,
+        rate_limiter: ExchangeRateLimiter,
+        loop: asyncio.AbstractEventLoop,
+    ):
+        self._inner = inner
+        self._rate_limiter = rate_limiter
+        self._loop = loop
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._inner, name)
+        if not callable(attr):
+            return attr
+        limited = name.startswith(EXCHANGE_METHOD_PREFIXES)
+
+        def call(*args, **kwargs):
+            if limited:
+                self._rate_limiter.acquire(_exchange_name_of(args, kwargs))
+            result = attr(*args, **kwargs)
+            if inspect.isawaitable(result):
+                return asyncio.run_coroutine_threadsafe(
+                    _await(result), self._loop
+                ).result()
+            return result
+
+        return call
+
+
+async def _await(awaitable: Any) -> Any:
+    """把任意 awaitable 包成协程，供 run_coroutine_threadsafe 使用。"""
+    return await awaitable
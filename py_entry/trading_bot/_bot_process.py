@@ -1,4 +1,4 @@
-import polars as pl
+from typing import Optional
 
 from .bot_config import BotConfig
 from .callbacks import Callbacks
@@ -8,41 +8,29 @@ from .runtime_checks import RuntimeChecks
 from .signal import SignalState
 from .strategy_params import StrategyParams
 from ._bot_signal_execution import StepResult, execute_signal
+from ._ohlcv_buffer import OhlcvRingBuffer, load_ohlcv_frame
 
 
-async def process_symbol(
+def process_symbol(
     callbacks: Callbacks,
     config: BotConfig,
     params: StrategyParams,
+    ohlcv_buffer: OhlcvRingBuffer,
+    expected_last_ms: Optional[int] = None,
 ) -> StepResult:
-    """处理单个品种。"""
+    """处理单个品种（同步执行，由 TradingBot 调度到品种线程池）。"""
     # 为单个 symbol 建立作用域代理，避免同轮重复调用。
     scoped_callbacks = OptimizationCallbacks(callbacks, params.symbol)
     scoped_runtime_checks = RuntimeChecks(scoped_callbacks)
     scoped_executor = ActionExecutor(scoped_callbacks, scoped_runtime_checks)
 
-    ohlcv_result = callbacks.fetch_ohlcv(
-        exchange_name=params.exchange_name,
-        market=params.market,
-        mode=params.mode,
-        symbol=params.symbol,
-        timeframe=params.base_data_key.split("_")[-1],
-        since=None,
-        limit=500,
-        enable_cache=True,
-        enable_test=False,
-    )
-    if not ohlcv_result.success:
+    # 滚动缓冲区已播种时只拉取新 K 线，直接得到列式视图；数据落后于当前周期时不执行。
+    ohlcv_result = load_ohlcv_frame(callbacks, params, ohlcv_buffer, expected_last_ms)
+    if not ohlcv_result.success or ohlcv_result.data is None:
         return StepResult(
             success=False, message=f"fetch_ohlcv failed: {ohlcv_result.message}"
         )
-
-    ohlcv_data = ohlcv_result.data or []
-    dataframe = pl.DataFrame(
-        ohlcv_data,
-        schema=["timestamp", "open", "high", "low", "close", "volume"],
-        orient="row",
-    )
+    dataframe = ohlcv_result.data
 
     backtest_result = callbacks.run_backtest(params, dataframe)
     if not backtest_result.success:
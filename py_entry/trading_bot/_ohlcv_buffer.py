@@ -0,0 +1,165 @@
+from typing import List, Optional, Sequence
+
+import numpy as np
+import polars as pl
+from loguru import logger
+
+from .callback_result import CallbackResult
+from .callbacks import Callbacks
+from .strategy_params import StrategyParams
+
+OHLCV_COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+
+
+class OhlcvRingBuffer:
+    """
+    单个 (symbol, base_data_key) 的滚动 K 线缓冲区，列式 NumPy 存储，容量固定。
+
+    每列分配 2 * capacity 的空间，每行同时写入 i 与 i + capacity 两个位置，
+    因此任意时刻的有效窗口 [start, start + count) 都是连续内存，可直接作为 Polars 视图。
+    """
+
+    def __init__(self, capacity: int, period_ms: int):
+        self.capacity = capacity
+        self.period_ms = period_ms
+        self._timestamp = np.zeros(2 * capacity, dtype=np.int64)
+        self._values = {
+            name: np.zeros(2 * capacity, dtype=np.float64)
+            for name in OHLCV_COLUMNS[1:]
+        }
+        self._start = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        if self._count == 0:
+            return None
+        return int(self._timestamp[self._start + self._count - 1])
+
+    def _write(self, idx: int, row: Sequence[float]) -> None:
+        for pos in (idx, idx + self.capacity):
+            self._timestamp[pos] = int(row[0])
+            for name, value in zip(OHLCV_COLUMNS[1:], row[1:6]):
+                self._values[name][pos] = value
+
+    def _append(self, row: Sequence[float]) -> None:
+        if self._count < self.capacity:
+            idx = (self._start + self._count) % self.capacity
+            self._count += 1
+        else:
+            # 满后覆盖最旧一行，窗口整体后移一格。
+            idx = self._start
+            self._start = (self._start + 1) % self.capacity
+        self._write(idx, row)
+
+    def seed(self, rows: List[List[float]]) -> None:
+        """用全量数据重建缓冲区，只保留最后 capacity 行。"""
+        self._start = 0
+        self._count = 0
+        for row in rows[-self.capacity :]:
+            self._append(row)
+
+    def update(self, rows: List[List[float]]) -> bool:
+        """
+        合并自 last_timestamp 起的增量数据。
+        返回 False 表示检测到缺口（或时间戳不连续），调用方应全量重新同步。
+        """
+        last = self.last_timestamp
+        if last is None:
+            return False
+        expected = last
+        for row in rows:
+            ts = int(row[0])
+            if ts < last:
+                continue
+            if ts == last:
+                if expected == last:
+                    # 上次拉取时最后一根可能尚未收盘，用最新数据覆盖。
+                    self._write((self._start + self._count - 1) % self.capacity, row)
+                continue
+            if ts != expected + self.period_ms:
+                return False
+            self._append(row)
+            expected = ts
+        return True
+
+    def frame(self) -> pl.DataFrame:
+        """返回当前窗口的 Polars 视图（尽量零拷贝），仅在下一次 update/seed 前有效。"""
+        window = slice(self._start, self._start + self._count)
+        return pl.DataFrame(
+            [pl.Series("timestamp", self._timestamp[window])]
+            + [
+                pl.Series(name, self._values[name][window])
+                for name in OHLCV_COLUMNS[1:]
+            ]
+        )
+
+
+def _fetch_rows(
+    callbacks: Callbacks,
+    params: StrategyParams,
+    since: Optional[int],
+    limit: int,
+) -> CallbackResult[List[List[float]]]:
+    return callbacks.fetch_ohlcv(
+        exchange_name=params.exchange_name,
+        market=params.market,
+        mode=params.mode,
+        symbol=params.symbol,
+        timeframe=params.base_data_key.split("_")[-1],
+        since=since,
+        limit=limit,
+        enable_cache=True,
+        enable_test=False,
+    )
+
+
+def _is_fresh(buffer: OhlcvRingBuffer, expected_last_ms: Optional[int]) -> bool:
+    """最新 K 线不早于期望的当前周期起点；未给出期望值时不做检查。"""
+    if expected_last_ms is None:
+        return True
+    last = buffer.last_timestamp
+    return last is not None and last >= expected_last_ms
+
+
+def load_ohlcv_frame(
+    callbacks: Callbacks,
+    params: StrategyParams,
+    buffer: OhlcvRingBuffer,
+    expected_last_ms: Optional[int] = None,
+) -> CallbackResult[pl.DataFrame]:
+    """
+    已播种时只拉取 last_timestamp 之后的 K 线；首次、缺口、增量失败或数据滞后时全量重新同步。
+
+    expected_last_ms 为当前周期起点（毫秒）。增量结果为空或被 limit 截断时，
+    最新 K 线会落后于它，此时改为全量同步；全量同步后仍落后则返回失败，避免基于过期 K 线下单。
+    """
+    last = buffer.last_timestamp
+    if last is not None:
+        result = _fetch_rows(callbacks, params, since=last, limit=buffer.capacity)
+        if (
+            result.success
+            and buffer.update(result.data or [])
+            and _is_fresh(buffer, expected_last_ms)
+        ):
+            return CallbackResult(success=True, data=buffer.frame())
+        logger.warning(
+            f"[{params.symbol}] K 线增量同步失败、存在缺口或数据滞后，执行全量重新同步"
+        )
+
+    result = _fetch_rows(callbacks, params, since=None, limit=buffer.capacity)
+    if not result.success:
+        return CallbackResult(success=False, message=result.message)
+    buffer.seed(result.data or [])
+    if not _is_fresh(buffer, expected_last_ms):
+        return CallbackResult(
+            success=False,
+            message=(
+                f"K 线数据滞后: 最新 K 线 {buffer.last_timestamp}，"
+                f"期望不早于 {expected_last_ms}"
+            ),
+        )
+    return CallbackResult(success=True, data=buffer.frame())
@@ -1,4 +1,7 @@
 import asyncio
+import inspect
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Callable, Optional
 from collections import Counter
@@ -11,7 +14,10 @@ from .runtime_checks import RuntimeChecks
 from .executor import ActionExecutor
 from .signal import SignalState
 from .strategy_params import StrategyParams
+from ._bot_concurrency import ConcurrentCallbacks, ExchangeRateLimiter
+from .optimization import AccountKey, CycleCallbacks, MarketInfoCache
 from ._bot_process import default_signal_state, process_symbol
+from ._ohlcv_buffer import OhlcvRingBuffer
 from ._bot_signal_execution import StepResult, execute_signal
 
 
@@ -32,18 +38,42 @@ class TradingBot:
         self.runtime_checks = RuntimeChecks(callbacks)
         self.executor = ActionExecutor(callbacks, self.runtime_checks)
 
+        # 品种并发：同步回调与回测在线程池中执行，交易所请求共享同一限速器。
+        # 线程池按需创建，stop() 关闭后再次 run() 会重建。
+        self._symbol_pool: Optional[ThreadPoolExecutor] = None
+        self._rate_limiter = ExchangeRateLimiter(self.config.exchange_rate_limits)
+        # 市场信息很少变化，跨轮次按 TTL 缓存。
+        self._market_info_cache = MarketInfoCache(self.config.market_info_ttl_sec)
+        # 每个 (symbol, base_data_key) 一个滚动 K 线缓冲区，首次全量播种后只拉增量。
+        self._ohlcv_buffers: dict[tuple[str, str], OhlcvRingBuffer] = {}
+
         # 运行时状态。
         self._last_run_times: dict[str, datetime] = {}
+        # 最近一次执行各品种的耗时（秒），包含排队等待线程的时间。
+        self.symbol_latencies: dict[str, float] = {}
         self._running = False
         self._log_handler_id: Optional[int] = None
+        self._add_log_handler()
 
-        # 仅添加当前 bot 的日志 handler，避免全局移除影响其他模块日志。
+    def _add_log_handler(self):
+        """仅添加当前 bot 的日志 handler，避免全局移除影响其他模块日志。"""
+        if self._log_handler_id is not None:
+            return
         self._log_handler_id = logger.add(
             lambda msg: print(msg, end=""),
             level=self.config.log_level,
             format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | {message}",
         )
 
+    def _get_symbol_pool(self) -> ThreadPoolExecutor:
+        """返回品种线程池，未创建或已被 stop() 关闭时新建。"""
+        if self._symbol_pool is None:
+            self._symbol_pool = ThreadPoolExecutor(
+                max_workers=self.config.max_concurrent_symbols,
+                thread_name_prefix="trading-bot-symbol",
+            )
+        return self._symbol_pool
+
     def _parse_period_minutes(self, base_data_key: str) -> int:
         """从 base_data_key 解析周期分钟数 (e.g. 'ohlcv_15m' -> 15)"""
         try:
@@ -92,6 +122,22 @@ class TradingBot:
         last_bucket = int(last_run.timestamp()) // period_seconds
         return now_bucket > last_bucket
 
+    def _ohlcv_buffer(self, params: StrategyParams) -> OhlcvRingBuffer:
+        """取得（必要时创建）品种的滚动 K 线缓冲区；容量配置变化时重建。"""
+        key = (params.symbol, params.base_data_key)
+        buffer = self._ohlcv_buffers.get(key)
+        if buffer is None or buffer.capacity != self.config.ohlcv_buffer_bars:
+            period_ms = self._parse_period_minutes(params.base_data_key) * 60_000
+            buffer = OhlcvRingBuffer(self.config.ohlcv_buffer_bars, period_ms)
+            self._ohlcv_buffers[key] = buffer
+        return buffer
+
+    def _current_period_start_ms(self, params: StrategyParams) -> int:
+        """当前周期起点（毫秒），作为本轮 K 线数据新鲜度的下限。"""
+        period_ms = self._parse_period_minutes(params.base_data_key) * 60_000
+        now_ms = int(self.time_func().timestamp() * 1000)
+        return now_ms // period_ms * period_ms
+
     def _mark_period_executed(self, params: StrategyParams):
         """标记本周期已执行"""
         self._last_run_times[params.symbol] = self.time_func()
@@ -99,6 +145,7 @@ class TradingBot:
     async def run(self):
         """主循环"""
         self._running = True
+        self._add_log_handler()
         logger.info("交易机器人启动")
 
         while self._running:
@@ -111,6 +158,8 @@ class TradingBot:
     async def _run_cycle(self):
         """单次循环"""
         params_result = self.callbacks.get_strategy_params()
+        if inspect.isawaitable(params_result):
+            params_result = await params_result
         if not params_result.success:
             logger.error(f"获取策略参数失败: {params_result.message}")
             return
@@ -127,20 +176,62 @@ class TradingBot:
                 f"重复 symbol: {duplicated_symbols}"
             )
 
-        for params in strategy_list:
-            if not self.is_new_period(params):
-                continue
+        # 到期品种并发执行，避免靠后的品种错过周期起点后的下单窗口。
+        due = [params for params in strategy_list if self.is_new_period(params)]
+        if not due:
+            return
+
+        # 同轮品种共享一层缓存：持仓批量查询、余额每账户一次、市场信息跨轮次复用。
+        symbols_by_account: dict[AccountKey, list[str]] = {}
+        for params in due:
+            account = (params.exchange_name, params.market, params.mode)
+            symbols_by_account.setdefault(account, []).append(params.symbol)
+        cycle_callbacks = CycleCallbacks(
+            ConcurrentCallbacks(
+                self.callbacks, self._rate_limiter, asyncio.get_running_loop()
+            ),
+            symbols_by_account,
+            self._market_info_cache,
+        )
+        await asyncio.gather(
+            *(self._run_symbol(params, cycle_callbacks) for params in due)
+        )
+
+    async def _run_symbol(
+        self, params: StrategyParams, callbacks: Optional[Callbacks] = None
+    ):
+        """执行单个到期品种并记录耗时；单品种异常不影响同轮其他品种。"""
+        logger.info(f"[{params.symbol}] 到达新周期，开始执行")
+        start = time.perf_counter()
+        try:
+            result = await self._process_symbol(params, callbacks)
+        except Exception as e:
+            result = StepResult(success=False, message=f"未捕获异常: {e}")
+        latency = time.perf_counter() - start
+        self.symbol_latencies[params.symbol] = latency
+        logger.debug(f"[{params.symbol}] 本周期耗时 {latency:.3f}s")
 
-            logger.info(f"[{params.symbol}] 到达新周期，开始执行")
-            result = await self._process_symbol(params)
-            if result.success:
-                self._mark_period_executed(params)
-            else:
-                logger.error(f"[{params.symbol}] 执行失败: {result.message}")
+        if result.success:
+            self._mark_period_executed(params)
+        else:
+            logger.error(f"[{params.symbol}] 执行失败: {result.message}")
 
-    async def _process_symbol(self, params: StrategyParams) -> StepResult:
-        """处理单个品种"""
-        return await process_symbol(self.callbacks, self.config, params)
+    async def _process_symbol(
+        self, params: StrategyParams, callbacks: Optional[Callbacks] = None
+    ) -> StepResult:
+        """处理单个品种：在品种线程池中执行，async 回调交回事件循环。"""
+        loop = asyncio.get_running_loop()
+        if callbacks is None:
+            callbacks = ConcurrentCallbacks(self.callbacks, self._rate_limiter, loop)
+        return await loop.run_in_executor(
+            self._get_symbol_pool(),
+            process_symbol,
+            callbacks,
+            self.config,
+            params,
+            self._ohlcv_buffer(params),
+            self._current_period_start_ms(params),
+        )
 
     def _execute_signal(
         self,
@@ -178,6 +269,9 @@ class TradingBot:
         """停止主循环"""
         self._running = False
         logger.info("交易机器人停止")
+        if self._symbol_pool is not None:
+            self._symbol_pool.shutdown(wait=False)
+            self._symbol_pool = None
         # 移除当前 bot 自己添加的日志 handler，避免重复输出。
         if self._log_handler_id is not None:
             logger.remove(self._log_handler_id)
@@ -14,5 +14,18 @@ class BotConfig(BaseModel):
     enable_aggregation: bool = Field(
         default=False, description="启用多策略聚合（当前版本不支持）"
     )
+    max_concurrent_symbols: int = Field(
+        default=8, ge=1, description="单轮并发处理的品种数（同步回调与回测所用线程池大小）"
+    )
+    exchange_rate_limits: dict[str, float] = Field(
+        default_factory=dict,
+        description="按交易所限速（每秒请求数），如 {'binance': 10}；未配置的交易所不限速",
+    )
+    ohlcv_buffer_bars: int = Field(
+        default=500, ge=2, description="每个品种滚动 K 线缓冲区的容量（根），即回测使用的 K 线数"
+    )
+    market_info_ttl_sec: float = Field(
+        default=3600.0, ge=0.0, description="fetch_market_info 跨轮次缓存时长（秒），0 表示不缓存"
+    )
 
     model_config = {"arbitrary_types_allowed": True}
@@ -47,18 +47,18 @@ class Callbacks(Protocol):
     ) -> CallbackResult[SignalState]:
         """解析回测结果，支持指定行索引（默认 -1 为最后一行）"""
         try:
-            row = df.row(index, named=True)
-            # 调用 Rust 解析器 (pyo3_quant.backtest_engine.action_resolver.resolve_actions)
+            # 调用 Rust 批量解析器，直接按列读取目标行，不构建逐行 Python 字典
             # 注意：必须使用完整的属性路径访问 Rust 函数
-            resolve_fn = pyo3_quant.backtest_engine.action_resolver.resolve_actions
+            resolve_fn = pyo3_quant.backtest_engine.action_resolver.resolve_actions_batch
 
-            # Rust 返回字典 {"actions": [...], "has_exit": bool}
+            # Rust 返回字典列表 [{"actions": [...], "has_exit": bool}]
             raw_result = resolve_fn(
-                row,
-                params.symbol,
-                params.sl_exit_in_bar,
-                params.tp_exit_in_bar,
-            )
+                [df],
+                [params.symbol],
+                [params.sl_exit_in_bar],
+                [params.tp_exit_in_bar],
+                index,
+            )[0]
 
             # 使用 Pydantic 验证并转换
             signal_state = SignalState.model_validate(raw_result)
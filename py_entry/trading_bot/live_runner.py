@@ -0,0 +1,69 @@
+"""live 策略预编译执行器。"""
+
+from __future__ import annotations
+
+import polars as pl
+
+import pyo3_quant
+from py_entry.data_generator import DirectDataConfig
+from py_entry.runner.setup_utils import build_data, build_signal_template
+from py_entry.strategy_hub.core.spec import CommonStrategySpec
+from py_entry.types import (
+    ArtifactRetention,
+    ExecutionStage,
+    SettingContainer,
+    SingleParamSet,
+    TemplateContainer,
+)
+
+
+class LiveStrategyRunner:
+    """
+    单个注册条目的预编译回测执行器，启动时构建一次。
+
+    持有解析后的参数、模板与执行设置，每根 K 线只需构建 DataPack 并执行回测；
+    执行设置固定停在 Backtest 阶段且只保留该阶段产物，跳过 live 用不到的绩效计算，
+    并由引擎只返回回测输出的最后 tail_rows 行。
+    """
+
+    def __init__(
+        self,
+        spec: CommonStrategySpec,
+        params: SingleParamSet,
+        *,
+        tail_rows: int = 2,
+    ):
+        self.base_data_key: str = spec.data_config.base_data_key
+        self.params = params
+        self.template = TemplateContainer(
+            signal=build_signal_template(spec.variant.signal_template)
+        )
+        self.engine_settings = SettingContainer(
+            stop_stage=ExecutionStage.Backtest,
+            artifact_retention=ArtifactRetention.StopStageOnly,
+            tail_rows=tail_rows,
+        )
+
+    def run(self, df: pl.DataFrame) -> pl.DataFrame:
+        """对最新 OHLCV 执行回测，返回 parse_signal 需要的尾部行。"""
+
+        source_df = (
+            df.rename({"timestamp": "time"})
+            if "timestamp" in df.columns and "time" not in df.columns
+            else df
+        )
+        data_pack = build_data(
+            data_source=DirectDataConfig(
+                data={self.base_data_key: source_df},
+                base_data_key=self.base_data_key,
+            )
+        )
+        result = pyo3_quant.backtest_engine.run_single_backtest(
+            data_pack,
+            self.params,
+            self.template,
+            self.engine_settings,
+        )
+        if result.backtest_result is None:
+            raise ValueError("回测结果为空")
+        return result.backtest_result
@@ -8,8 +8,7 @@ from typing import Any, Literal, cast
 
 import polars as pl
 
-from py_entry.data_generator import DirectDataConfig, OhlcvDataFetchConfig
-from py_entry.runner import Backtest
+from py_entry.data_generator import OhlcvDataFetchConfig
 from py_entry.runner.setup_utils import (
     build_backtest_params,
     build_indicators_params,
@@ -26,6 +25,7 @@ from py_entry.types import SingleParamSet
 
 from .callback_result import CallbackResult
 from .callbacks import Callbacks
+from .live_runner import LiveStrategyRunner
 from .signal import SignalState
 from .strategy_params import StrategyParams
 
@@ -51,6 +51,12 @@ class LiveStrategyCallbacks:
 
         self._params = [self._to_strategy_params(entry) for entry in entries]
 
+        # 中文注释：每个条目启动时预编译执行器，逐 bar 回测不再重建参数、模板与设置。
+        self._runner_by_key: dict[tuple[str, str], LiveStrategyRunner] = {
+            key: LiveStrategyRunner(entry, self._params_override_by_key[key])
+            for key, entry in self._entry_by_key.items()
+        }
+
     def _default_registry_path(self) -> Path:
         """返回唯一固定注册器路径。"""
 
@@ -211,11 +217,11 @@ class LiveStrategyCallbacks:
         params: StrategyParams,
         df: pl.DataFrame,
     ) -> CallbackResult[pl.DataFrame]:
-        """使用 live 策略执行回测并返回 DataFrame。"""
+        """使用预编译的 live 执行器回测，返回 parse_signal 所需的最后两行。"""
 
         try:
-            entry = self._entry_by_key.get((params.symbol, params.base_data_key))
-            if entry is None:
+            runner = self._runner_by_key.get((params.symbol, params.base_data_key))
+            if runner is None:
                 return CallbackResult(
                     success=False,
                     message=(
@@ -223,35 +229,7 @@ class LiveStrategyCallbacks:
                         f"base_data_key={params.base_data_key} 对应的 live 策略"
                     ),
                 )
-
-            source_df = (
-                df.rename({"timestamp": "time"})
-                if "timestamp" in df.columns and "time" not in df.columns
-                else df
-            )
-            data_source = DirectDataConfig(
-                data={params.base_data_key: source_df},
-                base_data_key=params.base_data_key,
-            )
-
-            variant = entry.variant
-            bt = Backtest(
-                data_source=data_source,
-                indicators=variant.indicators_params,
-                signal=variant.signal_params,
-                backtest=variant.backtest_params,
-                signal_template=variant.signal_template,
-                engine_settings=entry.engine_settings,
-                performance=entry.performance_params,
-            )
-            params_override = self._params_override_by_key.get(
-                (params.symbol, params.base_data_key)
-            )
-            result_view = bt.run(params_override=params_override)
-            backtest_df = result_view.raw.backtest_result
-            if backtest_df is None:
-                return CallbackResult(success=False, message="回测结果为空")
-            return CallbackResult(success=True, data=backtest_df)
+            return CallbackResult(success=True, data=runner.run(df))
         except Exception as exc:
             return CallbackResult(
                 success=False, message=f"live run_backtest 失败: {exc}"
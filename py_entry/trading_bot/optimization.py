@@ -1,5 +1,7 @@
+import threading
+import time
 import polars as pl
-from typing import Any, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from loguru import logger
 
 from .callback_result import CallbackResult
@@ -242,3 +244,192 @@ class OptimizationCallbacks:
         self, request: SetMarginModeRequest
     ) -> CallbackResult[GenericResponse]:
         return self._inner.set_margin_mode(request)
+
+
+# (exchange_name, market, mode)
+AccountKey = Tuple[str, str, str]
+
+
+class MarketInfoCache:
+    """
+    跨轮次的市场信息缓存（精度、最小下单量等很少变化），按 TTL 过期。
+    生命周期：随 TradingBot 存在，线程安全。
+    """
+
+    def __init__(self, ttl_sec: float):
+        self._ttl_sec = ttl_sec
+        self._entries: Dict[Tuple[str, str, str, str], Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str, str, str]) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            return value
+
+    def put(self, key: Tuple[str, str, str, str], value: Any) -> None:
+        if self._ttl_sec <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl_sec, value)
+
+
+class CycleCallbacks:
+    """
+    单轮循环内跨品种共享的 API 缓存代理。
+    生命周期：仅限于单次 Loop（_run_cycle），由同轮所有品种线程共享，线程安全。
+
+    功能：
+    1. fetch_positions：同一 (exchange, market, mode) 的到期品种合并为一次批量查询，按 symbol 过滤返回
+    2. fetch_balance：每个 (exchange, market, mode) 只查询一次
+    3. fetch_market_info：经 MarketInfoCache 跨轮次缓存
+    4. 失效规则与 OptimizationCallbacks 一致：下单/平仓使该账户的余额缓存失效，
+       并让该 symbol 此后的持仓查询绕过批量结果；cancel_order 不失效
+    其余回调原样透传。
+    """
+
+    def __init__(
+        self,
+        inner: Callbacks,
+        symbols_by_account: Dict[AccountKey, List[str]],
+        market_info_cache: Optional[MarketInfoCache] = None,
+    ):
+        self._inner = inner
+        self._symbols_by_account = symbols_by_account
+        self._market_info_cache = market_info_cache
+
+        # 状态存储
+        self._positions_cache: Dict[AccountKey, PositionsResponse] = {}
+        self._balance_cache: Dict[AccountKey, BalanceResponse] = {}
+        self._stale_symbols: set[Tuple[AccountKey, str]] = set()
+        self._lock = threading.Lock()
+        # 按缓存键加锁，同一键的并发请求只有一个真正访问交易所。
+        self._key_locks: Dict[Any, threading.Lock] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._inner, name)
+
+    def _key_lock(self, key: Any) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _cached(
+        self,
+        cache: Dict[Any, Any],
+        key: Any,
+        fetch: Callable[[], CallbackResult],
+    ) -> CallbackResult:
+        """命中则直接返回；否则在键锁内请求一次并缓存成功结果。"""
+        with self._key_lock((id(cache), key)):
+            with self._lock:
+                data = cache.get(key)
+            if data is not None:
+                return CallbackResult(success=True, data=data)
+            result = fetch()
+            if result.success and result.data is not None:
+                with self._lock:
+                    cache[key] = result.data
+            return result
+
+    # --- Cached Read Requests ---
+
+    def fetch_positions(
+        self, exchange_name: str, market: str, mode: str, symbols: Optional[List[str]]
+    ) -> CallbackResult[PositionsResponse]:
+        account = (exchange_name, market, mode)
+        batch_symbols = self._symbols_by_account.get(account, [])
+        with self._lock:
+            stale = any((account, s) in self._stale_symbols for s in symbols or [])
+        # 优化条件：查询的 symbol 均在本轮批量范围内，且未因下单/平仓失效
+        if not symbols or stale or not set(symbols) <= set(batch_symbols):
+            return self._inner.fetch_positions(exchange_name, market, mode, symbols)
+
+        result = self._cached(
+            self._positions_cache,
+            account,
+            lambda: self._inner.fetch_positions(
+                exchange_name, market, mode, batch_symbols
+            ),
+        )
+        if not result.success or result.data is None:
+            return result
+        wanted = set(symbols)
+        return CallbackResult(
+            success=True,
+            data=PositionsResponse(
+                positions=[p for p in result.data.positions if p.symbol in wanted]
+            ),
+        )
+
+    def fetch_balance(
+        self, exchange_name: str, market: str, mode: str
+    ) -> CallbackResult[BalanceResponse]:
+        return self._cached(
+            self._balance_cache,
+            (exchange_name, market, mode),
+            lambda: self._inner.fetch_balance(exchange_name, market, mode),
+        )
+
+    def fetch_market_info(
+        self, exchange_name: str, market: str, mode: str, symbol: str
+    ) -> CallbackResult[MarketInfoResponse]:
+        if self._market_info_cache is None:
+            return self._inner.fetch_market_info(exchange_name, market, mode, symbol)
+        key = (exchange_name, market, mode, symbol)
+        with self._key_lock(key):
+            data = self._market_info_cache.get(key)
+            if data is not None:
+                return CallbackResult(success=True, data=data)
+            result = self._inner.fetch_market_info(exchange_name, market, mode, symbol)
+            if result.success and result.data is not None:
+                self._market_info_cache.put(key, result.data)
+            return result
+
+    # --- Cache Invalidation Helpers ---
+
+    def _invalidate(self, request: Any) -> None:
+        """下单/平仓后：该账户余额重新查询，该 symbol 持仓不再使用批量结果"""
+        account = (request.exchange_name, request.market, request.mode)
+        with self._lock:
+            self._balance_cache.pop(account, None)
+            self._stale_symbols.add((account, request.symbol))
+
+    def _write(self, request: Any, call: Callable[[Any], CallbackResult]) -> Any:
+        # 请求前后各失效一次：其他品种线程可能在下单进行中重新填充余额缓存。
+        self._invalidate(request)
+        try:
+            return call(request)
+        finally:
+            self._invalidate(request)
+
+    # --- Write Requests (Invalidation) ---
+
+    def create_limit_order(
+        self, request: LimitOrderRequest
+    ) -> CallbackResult[OrderResponse]:
+        return self._write(request, self._inner.create_limit_order)
+
+    def create_market_order(
+        self, request: MarketOrderRequest
+    ) -> CallbackResult[OrderResponse]:
+        return self._write(request, self._inner.create_market_order)
+
+    def create_stop_market_order(
+        self, request: StopMarketOrderRequest
+    ) -> CallbackResult[OrderResponse]:
+        return self._write(request, self._inner.create_stop_market_order)
+
+    def create_take_profit_market_order(
+        self, request: TakeProfitMarketOrderRequest
+    ) -> CallbackResult[OrderResponse]:
+        return self._write(request, self._inner.create_take_profit_market_order)
+
+    def close_position(
+        self, request: ClosePositionRequest
+    ) -> CallbackResult[ClosePositionResponse]:
+        return self._write(request, self._inner.close_position)
@@ -10,6 +10,7 @@ from pyo3_quant import (
     DataPack,
     OptimizerConfig,
     OptimizeMetric,
+    OptimizerSampler,
     BenchmarkFunction,
     ArtifactRetention,
     SettingContainer,
@@ -36,6 +37,7 @@ from pyo3_quant import (
     SensitivityConfig,
     SensitivitySample,
     SensitivityResult,
+    ParameterSensitivity,
 )
 
 # Python 类型别名（无 Rust 对应）
@@ -81,6 +83,7 @@ __all__ = [
     "DataPack",
     "OptimizerConfig",
     "OptimizeMetric",
+    "OptimizerSampler",
     "BenchmarkFunction",
     "ArtifactRetention",
     "SettingContainer",
@@ -107,6 +110,7 @@ __all__ = [
     "SensitivityConfig",
     "SensitivitySample",
     "SensitivityResult",
+    "ParameterSensitivity",
     "SignalParams",
     "IndicatorsParams",
     "ParamContainer",
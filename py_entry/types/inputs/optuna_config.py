@@ -15,3 +15,5 @@ class OptunaConfig(BaseModel):
     show_progress_bar: bool = True
     storage: Optional[str] = None  # 可选持数据库存储 (例如 "sqlite:///optuna.db")
     study_name: Optional[str] = None  # Study 名称
+    fidelity_ratio: float = 1.0  # 低保真筛选使用的 active 段前缀比例 (1.0 = 关闭，仅 batch 模式)
+    promote_ratio: float = 0.3  # 每批晋级全量回测的 trial 比例
@@ -22,8 +22,10 @@ __all__ = [
     "OptimizationResult",
     "OptimizeMetric",
     "OptimizerConfig",
+    "OptimizerSampler",
     "Param",
     "ParamType",
+    "ParameterSensitivity",
     "PerformanceMetric",
     "PerformanceParams",
     "ResultPack",
@@ -571,6 +573,11 @@ class OptimizationResult:
         """
     @property
     def top_k_samples(self) -> builtins.list[SamplePoint]: ...
+    @property
+    def pruned_samples(self) -> builtins.list[SamplePoint]:
+        r"""
+        低保真筛选中未晋级的样本（fidelity < 1.0），指标只反映 active 前缀，不参与 top-k / TPE
+        """
 
 @typing.final
 class OptimizerConfig:
@@ -678,6 +685,46 @@ class OptimizerConfig:
         r"""
         随机种子（None 表示使用系统随机源）
         """
+    @property
+    def async_mode(self) -> builtins.bool:
+        r"""
+        异步稳态模式：取消轮次屏障，试验完成即补派新试验（固定种子下结果仍可复现）
+        """
+    @async_mode.setter
+    def async_mode(self, value: builtins.bool) -> None:
+        r"""
+        异步稳态模式：取消轮次屏障，试验完成即补派新试验（固定种子下结果仍可复现）
+        """
+    @property
+    def fidelity_ratio(self) -> builtins.float:
+        r"""
+        多保真度筛选：低保真评估使用的 active 段前缀比例（1.0 = 关闭）
+        """
+    @fidelity_ratio.setter
+    def fidelity_ratio(self, value: builtins.float) -> None:
+        r"""
+        多保真度筛选：低保真评估使用的 active 段前缀比例（1.0 = 关闭）
+        """
+    @property
+    def promote_ratio(self) -> builtins.float:
+        r"""
+        多保真度筛选：每轮晋级全量评估的候选比例
+        """
+    @promote_ratio.setter
+    def promote_ratio(self, value: builtins.float) -> None:
+        r"""
+        多保真度筛选：每轮晋级全量评估的候选比例
+        """
+    @property
+    def sampler(self) -> OptimizerSampler:
+        r"""
+        利用阶段采样器（Gaussian = 加权高斯，Tpe = 树结构 Parzen 估计器）
+        """
+    @sampler.setter
+    def sampler(self, value: OptimizerSampler) -> None:
+        r"""
+        利用阶段采样器（Gaussian = 加权高斯，Tpe = 树结构 Parzen 估计器）
+        """
     def __new__(
         cls,
         *,
@@ -696,6 +743,10 @@ class OptimizerConfig:
         ] = None,
         return_top_k: builtins.int = 10,
         seed: typing.Optional[builtins.int] = None,
+        async_mode: builtins.bool = False,
+        fidelity_ratio: builtins.float = 1.0,
+        promote_ratio: builtins.float = 0.3,
+        sampler: OptimizerSampler = OptimizerSampler.Gaussian,
     ) -> OptimizerConfig: ...
 
 @typing.final
@@ -781,6 +832,37 @@ class Param:
         step: builtins.float = 0.01,
     ) -> Param: ...
 
+@typing.final
+class ParameterSensitivity:
+    r"""
+    单个可优化参数的敏感度
+    """
+    @property
+    def name(self) -> builtins.str:
+        r"""
+        参数唯一键 `{type_idx}_{group}_{name}`
+        """
+    @property
+    def center_value(self) -> builtins.float:
+        r"""
+        中心参数值
+        """
+    @property
+    def elasticity(self) -> builtins.float:
+        r"""
+        弹性：目标指标相对变化 / 参数相对变化（中心值或中心指标为 0、参数未变动时为 NaN）
+        """
+    @property
+    def mu_star(self) -> typing.Optional[builtins.float]:
+        r"""
+        Morris 基本效应绝对值均值 μ*（归一化参数区间，仅 morris 设计）
+        """
+    @property
+    def sigma(self) -> typing.Optional[builtins.float]:
+        r"""
+        Morris 基本效应标准差 σ（仅 morris 设计）
+        """
+
 @typing.final
 class PerformanceParams:
     @property
@@ -837,6 +919,11 @@ class ResultPack:
     ) -> typing.Optional[builtins.dict[builtins.str, builtins.float]]: ...
     @property
     def base_data_key(self) -> builtins.str: ...
+    def column(self, name: builtins.str) -> typing.Any:
+        r"""
+        按列名返回 NumPy 数组（先查 backtest_result，再查 signals），结果缓存复用。
+        单 chunk 且无缺失值的数值列为零拷贝只读视图，不会转换整张表或 Python list。
+        """
 
 @typing.final
 class RoundSummary:
@@ -847,7 +934,20 @@ class RoundSummary:
     @property
     def median_value(self) -> builtins.float: ...
     @property
-    def sample_count(self) -> builtins.int: ...
+    def sample_count(self) -> builtins.int:
+        r"""
+        本轮样本总数（含记忆表命中的重复样本）
+        """
+    @property
+    def unique_count(self) -> builtins.int:
+        r"""
+        本轮实际执行评估的去重样本数
+        """
+    @property
+    def pruned_count(self) -> builtins.int:
+        r"""
+        本轮低保真筛选后未晋级全量评估的样本数
+        """
 
 @typing.final
 class SamplePoint:
@@ -869,6 +969,11 @@ class SamplePoint:
         r"""
         所有已计算的性能指标
         """
+    @property
+    def fidelity(self) -> builtins.float:
+        r"""
+        评估保真度：参与计算的 active 段比例（1.0 = 全量）
+        """
 
 @typing.final
 class SensitivityConfig:
@@ -898,12 +1003,26 @@ class SensitivityConfig:
     @property
     def distribution(self) -> builtins.str:
         r"""
-        分布类型: "uniform" (默认) 或 "normal"
+        分布类型: "uniform" (默认) 或 "normal"，仅 jitter 设计使用
         """
     @distribution.setter
     def distribution(self, value: builtins.str) -> None:
         r"""
-        分布类型: "uniform" (默认) 或 "normal"
+        分布类型: "uniform" (默认) 或 "normal"，仅 jitter 设计使用
+        """
+    @property
+    def design(self) -> builtins.str:
+        r"""
+        采样设计: "jitter" (默认，独立随机抖动)、"morris" (逐维 Morris 轨迹) 或 "sobol" (Sobol 低差异序列)
+
+        morris 设计按 `n_samples / (维度 + 1)` 条轨迹取整，sobol 最多支持 16 维
+        """
+    @design.setter
+    def design(self, value: builtins.str) -> None:
+        r"""
+        采样设计: "jitter" (默认，独立随机抖动)、"morris" (逐维 Morris 轨迹) 或 "sobol" (Sobol 低差异序列)
+
+        morris 设计按 `n_samples / (维度 + 1)` 条轨迹取整，sobol 最多支持 16 维
         """
     @property
     def seed(self) -> typing.Optional[builtins.int]:
@@ -931,6 +1050,7 @@ class SensitivityConfig:
         jitter_ratio: builtins.float = 0.05,
         n_samples: builtins.int = 100,
         distribution: builtins.str = "uniform",
+        design: builtins.str = "jitter",
         seed: typing.Optional[builtins.int] = None,
         metric: OptimizeMetric = OptimizeMetric.CalmarRatioRaw,
     ) -> SensitivityConfig: ...
@@ -943,13 +1063,18 @@ class SensitivityResult:
     @property
     def target_metric(self) -> builtins.str: ...
     @property
+    def design(self) -> builtins.str:
+        r"""
+        采样设计: "jitter" / "morris" / "sobol"
+        """
+    @property
     def original_value(self) -> builtins.float: ...
     @property
     def samples(self) -> builtins.list[SensitivitySample]: ...
     @property
     def total_samples_requested(self) -> builtins.int:
         r"""
-        请求采样总数（配置中的 n_samples）
+        请求采样总数（采样设计生成的点数；jitter / sobol 即 n_samples）
         """
     @property
     def successful_samples(self) -> builtins.int:
@@ -996,6 +1121,11 @@ class SensitivityResult:
         r"""
         最差样本（按目标指标升序，最多 5）
         """
+    @property
+    def parameters(self) -> builtins.list[ParameterSensitivity]:
+        r"""
+        逐参数敏感度，顺序与样本 `values` 一致
+        """
     def report(self) -> builtins.str:
         r"""
         生成敏感性分析报告文本
@@ -1032,11 +1162,22 @@ class SettingContainer:
     def artifact_retention(self) -> ArtifactRetention: ...
     @artifact_retention.setter
     def artifact_retention(self, value: ArtifactRetention) -> None: ...
+    @property
+    def tail_rows(self) -> typing.Optional[builtins.int]:
+        r"""
+        只保留回测输出的最后 N 行（N > 0，live 信号解析用）；None 表示完整输出
+        """
+    @tail_rows.setter
+    def tail_rows(self, value: typing.Optional[builtins.int]) -> None:
+        r"""
+        只保留回测输出的最后 N 行（N > 0，live 信号解析用）；None 表示完整输出
+        """
     def __new__(
         cls,
         *,
         stop_stage: ExecutionStage = ExecutionStage.Performance,
         artifact_retention: ArtifactRetention = ArtifactRetention.AllCompletedStages,
+        tail_rows: typing.Optional[builtins.int] = None,
     ) -> SettingContainer: ...
 
 @typing.final
@@ -1329,6 +1470,26 @@ class WalkForwardConfig:
         r"""
         内嵌的单次优化器配置
         """
+    @property
+    def precompute_indicators(self) -> builtins.bool:
+        r"""
+        是否在完整 DataPack 上预计算 sliceable 指标，并按窗口切片复用（非 sliceable 指标逐窗计算一次，窗口内各试验复用）
+        """
+    @precompute_indicators.setter
+    def precompute_indicators(self, value: builtins.bool) -> None:
+        r"""
+        是否在完整 DataPack 上预计算 sliceable 指标，并按窗口切片复用（非 sliceable 指标逐窗计算一次，窗口内各试验复用）
+        """
+    @property
+    def checkpoint_dir(self) -> typing.Optional[builtins.str]:
+        r"""
+        断点目录；设置后每个完成的窗口落盘，同配置重跑时跳过已完成窗口
+        """
+    @checkpoint_dir.setter
+    def checkpoint_dir(self, value: typing.Optional[builtins.str]) -> None:
+        r"""
+        断点目录；设置后每个完成的窗口落盘，同配置重跑时跳过已完成窗口
+        """
     def __new__(
         cls,
         *,
@@ -1338,6 +1499,8 @@ class WalkForwardConfig:
         warmup_mode: WfWarmupMode = WfWarmupMode.ExtendTest,
         ignore_indicator_warmup: builtins.bool = False,
         optimizer_config: typing.Optional[OptimizerConfig] = None,
+        precompute_indicators: builtins.bool = False,
+        checkpoint_dir: typing.Optional[builtins.str] = None,
     ) -> WalkForwardConfig: ...
 
 @typing.final
@@ -1351,6 +1514,11 @@ class WalkForwardResult:
     def window_results(self) -> builtins.list[WindowArtifact]: ...
     @property
     def stitched_result(self) -> StitchedArtifact: ...
+    @property
+    def settings_hash(self) -> builtins.int:
+        r"""
+        模板与 WF 配置（含优化器配置）的稳定哈希；增量续跑时不一致则不复用任何旧窗口
+        """
 
 @typing.final
 class WindowArtifact:
@@ -1549,6 +1717,28 @@ class OptimizeMetric(enum.Enum):
     def __str__(self) -> builtins.str: ...
     def __repr__(self) -> builtins.str: ...
 
+@typing.final
+class OptimizerSampler(enum.Enum):
+    r"""
+    利用阶段采样器枚举
+    """
+
+    Gaussian = ...
+    r"""
+    以 TopK 为中心的加权高斯采样
+    """
+    Tpe = ...
+    r"""
+    树结构 Parzen 估计器（TPE）
+    """
+
+    def as_str(self) -> builtins.str:
+        r"""
+        返回稳定的业务键名（用于程序逻辑）
+        """
+    def __str__(self) -> builtins.str: ...
+    def __repr__(self) -> builtins.str: ...
+
 @typing.final
 class ParamType(enum.Enum):
     r"""
@@ -1,6 +1,8 @@
 # This file is automatically generated by pyo3_stub_gen
 # ruff: noqa: E501, F401, F403, F405
 
+import numpy
+import numpy.typing
 import pyo3_quant
 from . import action_resolver
 from . import backtester
@@ -17,15 +19,22 @@ __all__ = [
     "backtester",
     "data_ops",
     "indicators",
+    "optimizable_param_keys",
     "optimizer",
     "performance_analyzer",
     "run_batch_backtest",
+    "run_batch_backtest_from_values",
     "run_single_backtest",
     "sensitivity",
     "signal_generator",
     "walk_forward",
 ]
 
+def optimizable_param_keys(param: pyo3_quant.SingleParamSet) -> list[str]:
+    r"""
+    参数矩阵的列键（`{type_idx}_{group}_{name}`），顺序即列顺序
+    """
+
 def run_batch_backtest(
     data: pyo3_quant.DataPack,
     params: list[pyo3_quant.SingleParamSet],
@@ -36,6 +45,17 @@ def run_batch_backtest(
     运行批量回测
     """
 
+def run_batch_backtest_from_values(
+    data: pyo3_quant.DataPack,
+    base_param: pyo3_quant.SingleParamSet,
+    values: numpy.typing.NDArray[numpy.float64],
+    template: pyo3_quant.TemplateContainer,
+    engine_settings: pyo3_quant.SettingContainer,
+) -> list[pyo3_quant.ResultPack]:
+    r"""
+    按 (试验数, 可优化维度) 的 float64 参数矩阵运行批量回测
+    """
+
 def run_single_backtest(
     data: pyo3_quant.DataPack,
     param: pyo3_quant.SingleParamSet,
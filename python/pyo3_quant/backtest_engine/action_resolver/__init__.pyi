@@ -6,6 +6,7 @@ import typing
 
 __all__ = [
     "resolve_actions",
+    "resolve_actions_batch",
 ]
 
 def resolve_actions(
@@ -17,3 +18,13 @@ def resolve_actions(
     r"""
     Python绑定：解析 DataFrame 行为字典 (SignalState Dict)
     """
+def resolve_actions_batch(
+    frames: typing.Sequence[typing.Any],
+    symbols: typing.Sequence[builtins.str],
+    sl_exit_in_bar: typing.Sequence[builtins.bool],
+    tp_exit_in_bar: typing.Sequence[builtins.bool],
+    index: builtins.int = -1,
+) -> builtins.list[typing.Any]:
+    r"""
+    Python绑定：批量解析多个品种回测结果的第 index 行（负数从末尾计），直接读列值，不构建逐行字典
+    """
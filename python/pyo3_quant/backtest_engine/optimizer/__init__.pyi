@@ -7,7 +7,9 @@ import typing
 
 __all__ = [
     "py_run_optimizer",
+    "py_run_optimizer_across_symbols",
     "py_run_optimizer_benchmark",
+    "py_run_optimizer_per_symbol",
 ]
 
 def py_run_optimizer(
@@ -21,6 +23,18 @@ def py_run_optimizer(
     运行优化器
     """
 
+def py_run_optimizer_across_symbols(
+    data: typing.Sequence[_pyo3_quant.DataPack],
+    param: _pyo3_quant.SingleParamSet,
+    template: _pyo3_quant.TemplateContainer,
+    engine_settings: _pyo3_quant.SettingContainer,
+    optimizer_config: _pyo3_quant.OptimizerConfig,
+    aggregate: builtins.str = "mean",
+) -> _pyo3_quant.OptimizationResult:
+    r"""
+    跨品种聚合优化：同一组参数在全部品种上回测，目标指标按 mean / min / median 聚合
+    """
+
 def py_run_optimizer_benchmark(
     config: _pyo3_quant.OptimizerConfig,
     function: _pyo3_quant.BenchmarkFunction,
@@ -30,3 +44,14 @@ def py_run_optimizer_benchmark(
     r"""
     Python 接口：运行基准函数优化
     """
+
+def py_run_optimizer_per_symbol(
+    data: typing.Sequence[_pyo3_quant.DataPack],
+    param: _pyo3_quant.SingleParamSet,
+    template: _pyo3_quant.TemplateContainer,
+    engine_settings: _pyo3_quant.SettingContainer,
+    optimizer_config: _pyo3_quant.OptimizerConfig,
+) -> builtins.list[_pyo3_quant.OptimizationResult]:
+    r"""
+    逐品种独立优化，共享同一个并行工作池；结果顺序与 data 一致
+    """
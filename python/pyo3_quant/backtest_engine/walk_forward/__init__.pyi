@@ -5,6 +5,7 @@ import pyo3_quant
 
 __all__ = [
     "run_walk_forward",
+    "run_walk_forward_incremental",
 ]
 
 def run_walk_forward(
@@ -17,3 +18,15 @@ def run_walk_forward(
     r"""
     运行滚动前推测试
     """
+
+def run_walk_forward_incremental(
+    data: pyo3_quant.DataPack,
+    param: pyo3_quant.SingleParamSet,
+    template: pyo3_quant.TemplateContainer,
+    engine_settings: pyo3_quant.SettingContainer,
+    walk_forward_config: pyo3_quant.WalkForwardConfig,
+    previous: pyo3_quant.WalkForwardResult,
+) -> pyo3_quant.WalkForwardResult:
+    r"""
+    增量滚动前推测试：复用上一次结果中未变化的窗口，只计算新增窗口
+    """
@@ -4,14 +4,32 @@ mod types;
 pub use resolver::{resolve_actions, ResolverParams};
 // pub use types::{SignalAction, SignalState};
 
-use pyo3::exceptions::PyValueError;
+use polars::prelude::{AnyValue, DataFrame};
+use pyo3::exceptions::{PyIndexError, PyValueError};
 use pyo3::prelude::*;
 use pyo3::types::{PyDict, PyList};
 use pyo3::PyErr;
+use pyo3_polars::PyDataFrame;
 use std::collections::HashMap;
 
 use pyo3_stub_gen::derive::*;
 
+// 仅提取解析器关心的数值列，避免把无关字段（如 bool）混入。
+// 这些列出现非数值类型时直接报错，防止静默吞掉脏数据。
+const REQUIRED_KEYS: [&str; 11] = [
+    "frame_state",
+    "entry_long_price",
+    "entry_short_price",
+    "sl_pct_price_long",
+    "sl_pct_price_short",
+    "sl_atr_price_long",
+    "sl_atr_price_short",
+    "tp_pct_price_long",
+    "tp_pct_price_short",
+    "tp_atr_price_long",
+    "tp_atr_price_short",
+];
+
 #[gen_stub_pyfunction(module = "pyo3_quant.backtest_engine.action_resolver")]
 #[pyfunction(name = "resolve_actions")]
 /// Python绑定：解析 DataFrame 行为字典 (SignalState Dict)
@@ -22,22 +40,6 @@ pub fn py_resolve_actions(
     sl_exit_in_bar: bool,
     tp_exit_in_bar: bool,
 ) -> PyResult<Py<PyAny>> {
-    // 仅提取解析器关心的数值列，避免把无关字段（如 bool）混入。
-    // 这些列出现非数值类型时直接报错，防止静默吞掉脏数据。
-    const REQUIRED_KEYS: [&str; 11] = [
-        "frame_state",
-        "entry_long_price",
-        "entry_short_price",
-        "sl_pct_price_long",
-        "sl_pct_price_short",
-        "sl_atr_price_long",
-        "sl_atr_price_short",
-        "tp_pct_price_long",
-        "tp_pct_price_short",
-        "tp_atr_price_long",
-        "tp_atr_price_short",
-    ];
-
     let mut row: HashMap<String, Option<f64>> = HashMap::new();
     for key in REQUIRED_KEYS {
         let maybe_value = row_dict.get_item(key)?;
@@ -54,8 +56,84 @@ pub fn py_resolve_actions(
         tp_exit_in_bar,
     };
     let state = resolve_actions(&row, &params);
+    state_to_py_dict(py, state)
+}
+
+#[gen_stub_pyfunction(module = "pyo3_quant.backtest_engine.action_resolver")]
+#[pyfunction(name = "resolve_actions_batch")]
+#[pyo3(signature = (frames, symbols, sl_exit_in_bar, tp_exit_in_bar, index=-1))]
+/// Python绑定：批量解析多个品种回测结果的第 index 行（负数从末尾计），直接读列值，不构建逐行字典
+pub fn py_resolve_actions_batch(
+    py: Python<'_>,
+    frames: Vec<PyDataFrame>,
+    symbols: Vec<String>,
+    sl_exit_in_bar: Vec<bool>,
+    tp_exit_in_bar: Vec<bool>,
+    index: i64,
+) -> PyResult<Vec<Py<PyAny>>> {
+    let n = frames.len();
+    if symbols.len() != n || sl_exit_in_bar.len() != n || tp_exit_in_bar.len() != n {
+        return Err(PyValueError::new_err(format!(
+            "frames/symbols/sl_exit_in_bar/tp_exit_in_bar 长度必须一致，当前为 {}/{}/{}/{}",
+            n,
+            symbols.len(),
+            sl_exit_in_bar.len(),
+            tp_exit_in_bar.len()
+        )));
+    }
+
+    frames
+        .into_iter()
+        .zip(symbols)
+        .zip(sl_exit_in_bar.into_iter().zip(tp_exit_in_bar))
+        .map(|((frame, symbol), (sl_exit_in_bar, tp_exit_in_bar))| {
+            let row = row_from_frame(&frame.0, index)?;
+            let params = ResolverParams {
+                symbol,
+                sl_exit_in_bar,
+                tp_exit_in_bar,
+            };
+            state_to_py_dict(py, resolve_actions(&row, &params))
+        })
+        .collect()
+}
+
+/// 从 DataFrame 第 `index` 行读取解析器所需列；缺失列或空值视为 None。
+fn row_from_frame(df: &DataFrame, index: i64) -> PyResult<HashMap<String, Option<f64>>> {
+    let height = df.height() as i64;
+    let idx = if index < 0 { height + index } else { index };
+    if idx < 0 || idx >= height {
+        return Err(PyIndexError::new_err(format!(
+            "行索引 {index} 超出范围（共 {height} 行）"
+        )));
+    }
+
+    let mut row = HashMap::with_capacity(REQUIRED_KEYS.len());
+    for key in REQUIRED_KEYS {
+        let value = match df.column(key) {
+            Ok(column) => {
+                let value = column.get(idx as usize).map_err(|e| {
+                    PyErr::new::<PyValueError, _>(format!("读取列 `{}` 失败: {}", key, e))
+                })?;
+                match value {
+                    AnyValue::Null => None,
+                    other => Some(other.extract::<f64>().ok_or_else(|| {
+                        PyErr::new::<PyValueError, _>(format!(
+                            "列 `{}` 需要为数值或 None: {}",
+                            key, other
+                        ))
+                    })?),
+                }
+            }
+            Err(_) => None,
+        };
+        row.insert(key.to_string(), value);
+    }
+    Ok(row)
+}
 
-    // Convert SignalState -> PyDict
+// Convert SignalState -> PyDict
+fn state_to_py_dict(py: Python<'_>, state: types::SignalState) -> PyResult<Py<PyAny>> {
     let dict = PyDict::new(py);
     let actions_list = PyList::empty(py);
 
@@ -76,6 +154,7 @@ pub fn py_resolve_actions(
 
 pub fn register_py_module(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(py_resolve_actions, m)?)?;
+    m.add_function(wrap_pyfunction!(py_resolve_actions_batch, m)?)?;
     Ok(())
 }
 
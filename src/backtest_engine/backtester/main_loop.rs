@@ -61,6 +61,14 @@ pub fn run_backtest_kernel(
     output_schema: ScheduleOutputSchema,
 ) -> Result<OutputBuffers, BacktestError> {
     let data_length = prepared_data.time.len();
+    if let Some(params) = params_selector.single_segment_params(data_length) {
+        return Ok(run_single_segment_kernel(
+            prepared_data,
+            params,
+            &output_schema,
+        ));
+    }
+
     let init_params = select_params_for_row(&mut params_selector, 0)
         .map_err(|e| BacktestError::ValidationError(e.to_string()))?;
 
@@ -77,10 +85,17 @@ pub fn run_backtest_kernel(
     let mut buf_iter = OutputBuffersIter::new(&mut buffers, 2);
     let mut data_iter = PreparedDataIter::new(&prepared_data, 2);
 
+    // 中文注释：写入配置只随 segment 切换重建，段内逐行复用。
+    let mut config_segment_idx = params_selector.segment_idx();
+    let mut current_config = init_config;
+
     while let (Some(mut row), Some((index, current_bar))) = (buf_iter.next(), data_iter.next()) {
         let current_params = select_params_for_row(&mut params_selector, index)
             .map_err(|e| BacktestError::ValidationError(e.to_string()))?;
-        let current_config = WriteConfig::from_params(current_params);
+        if params_selector.segment_idx() != config_segment_idx {
+            config_segment_idx = params_selector.segment_idx();
+            current_config = WriteConfig::from_params(current_params);
+        }
 
         state.current_index = index;
         state.prev_bar = state.current_bar;
@@ -93,6 +108,41 @@ pub fn run_backtest_kernel(
     Ok(buffers)
 }
 
+/// 单段 schedule 快路径。
+///
+/// 中文注释：参数在整段内恒定，省去逐行 `select_params_for_row`，
+/// 风控可选列的写入掩码（`WriteConfig`）也只在循环外构建一次。
+fn run_single_segment_kernel(
+    prepared_data: PreparedData,
+    params: &BacktestParams,
+    output_schema: &ScheduleOutputSchema,
+) -> OutputBuffers {
+    let data_length = prepared_data.time.len();
+    let mut buffers = OutputBuffers::from_schema(output_schema, data_length);
+    let mut state = BacktestState::new(params, &prepared_data);
+    let config = WriteConfig::from_params(params);
+
+    initialize_buffer_rows_0_and_1(&mut buffers, &mut state, &prepared_data, &config);
+
+    if data_length <= 2 {
+        return buffers;
+    }
+
+    let buf_iter = OutputBuffersIter::new(&mut buffers, 2);
+    let data_iter = PreparedDataIter::new(&prepared_data, 2);
+
+    for (mut row, (index, current_bar)) in buf_iter.zip(data_iter) {
+        state.current_index = index;
+        state.prev_bar = state.current_bar;
+        state.current_bar = current_bar;
+        state.calculate_position(params);
+        state.calculate_capital(params);
+        row.write(&state, &config);
+    }
+
+    buffers
+}
+
 /// 初始化输出缓冲区的第0行和第1行数据
 #[inline(never)]
 fn initialize_buffer_rows_0_and_1(
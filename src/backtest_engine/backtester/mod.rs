@@ -345,4 +345,28 @@ mod tests {
         assert_has_completed_long_trades(&legacy, 10);
         assert_dataframes_equal(&legacy, &current);
     }
+
+    #[test]
+    fn test_single_segment_fast_path_matches_segmented_schedule() {
+        let pack = build_test_pack();
+        let signals = build_test_signals();
+        let params = atr_params();
+        let ohlcv = get_ohlcv_dataframe(&pack).expect("ohlcv 应存在");
+        let atr_series = calculate_atr_if_needed(ohlcv, &params).expect("atr 应成功");
+        let height = pack.mapping.height();
+
+        // 中文注释：同参数拆成两段会强制走逐行选参的通用路径，结果必须与单段快路径逐项一致。
+        let single = vec![BacktestParamSegment::new(0, height, params.clone())];
+        let segmented = vec![
+            BacktestParamSegment::new(0, height / 2, params.clone()),
+            BacktestParamSegment::new(height / 2, height, params.clone()),
+        ];
+        let fast = run_backtest_with_schedule(&pack, &signals, atr_series.as_ref(), &single)
+            .expect("单段回测应成功");
+        let generic = run_backtest_with_schedule(&pack, &signals, atr_series.as_ref(), &segmented)
+            .expect("分段回测应成功");
+
+        assert_has_completed_long_trades(&fast, 10);
+        assert_dataframes_equal(&fast, &generic);
+    }
 }
@@ -8,6 +8,23 @@ pub struct ParamsSelector<'a> {
     segment_idx: usize,
 }
 
+impl<'a> ParamsSelector<'a> {
+    /// 中文注释：单段且覆盖 `[0, data_length)` 时直接返回该段参数，供主循环走免逐行选参的快路径。
+    pub fn single_segment_params(&self, data_length: usize) -> Option<&'a BacktestParams> {
+        match self.schedule {
+            [segment] if segment.start_row == 0 && segment.end_row >= data_length => {
+                Some(&segment.params)
+            }
+            _ => None,
+        }
+    }
+
+    /// 当前命中的 segment 下标（随 `select_params_for_row` 单调前进）。
+    pub fn segment_idx(&self) -> usize {
+        self.segment_idx
+    }
+}
+
 pub fn build_schedule_params_selector(schedule: &[BacktestParamSegment]) -> ParamsSelector<'_> {
     ParamsSelector {
         schedule,
@@ -17,7 +34,7 @@ pub fn build_schedule_params_selector(schedule: &[BacktestParamSegment]) -> Para
 
 /// 中文注释：row_idx 单调递增时，segment_idx 也只增不减，不允许越界沿用最后一段。
 pub fn select_params_for_row<'a>(
-    selector: &'a mut ParamsSelector<'_>,
+    selector: &mut ParamsSelector<'a>,
     row_idx: usize,
 ) -> Result<&'a BacktestParams, QuantError> {
     while selector.segment_idx < selector.schedule.len()
@@ -26,7 +43,8 @@ pub fn select_params_for_row<'a>(
         selector.segment_idx += 1;
     }
 
-    let segment = selector.schedule.get(selector.segment_idx).ok_or_else(|| {
+    let schedule = selector.schedule;
+    let segment = schedule.get(selector.segment_idx).ok_or_else(|| {
         BacktestError::ValidationError(format!(
             "row_idx={row_idx} 找不到对应 segment，schedule_len={}",
             selector.schedule.len()
@@ -76,5 +94,21 @@ mod tests {
             20_000.0
         );
         assert!(select_params_for_row(&mut selector, 5).is_err());
+        assert!(selector.single_segment_params(5).is_none());
+    }
+
+    #[test]
+    fn test_single_segment_params_contract() {
+        let schedule = vec![BacktestParamSegment::new(0, 5, params(10_000.0))];
+        let selector = build_schedule_params_selector(&schedule);
+
+        assert_eq!(
+            selector
+                .single_segment_params(5)
+                .expect("单段全覆盖应命中快路径")
+                .initial_capital,
+            10_000.0
+        );
+        assert!(selector.single_segment_params(6).is_none());
     }
 }
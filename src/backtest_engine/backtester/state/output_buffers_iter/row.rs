@@ -119,6 +119,8 @@ impl<'a> OutputRow<'a> {
     #[inline]
     pub fn write(&mut self, state: &BacktestState<'_>, config: &WriteConfig) {
         self.write_fixed(state);
-        self.write_optional_grouped(state, config);
+        if config.any_optional {
+            self.write_optional_grouped(state, config);
+        }
     }
 }
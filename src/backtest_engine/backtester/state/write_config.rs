@@ -33,6 +33,8 @@ pub struct WriteConfig {
     pub atr_funcs: FuncFlags,
     /// 是否需要写入 TSL_PSAR 列 (PSAR 只有 TSL)
     pub has_psar: bool,
+    /// 任一可选风控列启用；全关时主循环直接跳过可选列写入
+    pub any_optional: bool,
 }
 
 impl WriteConfig {
@@ -65,6 +67,9 @@ impl WriteConfig {
         // PSAR 组
         config.has_psar = params.is_tsl_psar_param_valid();
 
+        config.any_optional =
+            !config.pct_funcs.is_empty() || !config.atr_funcs.is_empty() || config.has_psar;
+
         config
     }
 }
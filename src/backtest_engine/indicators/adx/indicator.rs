@@ -1,6 +1,8 @@
 use super::super::registry::{require_resolved_param, Indicator};
 use super::config::ADXConfig;
 use super::pipeline::adx_eager;
+use super::state::AdxState;
+use crate::backtest_engine::indicators::streaming::StreamingIndicator;
 use crate::error::{IndicatorError, QuantError};
 use crate::types::Param;
 use polars::prelude::*;
@@ -8,6 +10,27 @@ use std::collections::HashMap;
 
 pub struct AdxIndicator;
 
+fn adx_params(
+    indicator_key: &str,
+    param_map: &HashMap<String, Param>,
+) -> Result<(i64, i64), QuantError> {
+    let period = param_map
+        .get("period")
+        .map(|param| param.value as i64)
+        .ok_or_else(|| {
+            IndicatorError::InvalidParameter(
+                indicator_key.to_string(),
+                "Missing or invalid 'period' parameter".to_string(),
+            )
+        })?;
+
+    let adxr_length = param_map
+        .get("adxr_length")
+        .map(|param| param.value as i64)
+        .unwrap_or(2);
+    Ok((period, adxr_length))
+}
+
 impl Indicator for AdxIndicator {
     fn calculate(
         &self,
@@ -15,20 +38,7 @@ impl Indicator for AdxIndicator {
         indicator_key: &str,
         param_map: &HashMap<String, Param>,
     ) -> Result<Vec<Series>, QuantError> {
-        let period = param_map
-            .get("period")
-            .map(|param| param.value as i64)
-            .ok_or_else(|| {
-                IndicatorError::InvalidParameter(
-                    indicator_key.to_string(),
-                    "Missing or invalid 'period' parameter".to_string(),
-                )
-            })?;
-
-        let adxr_length = param_map
-            .get("adxr_length")
-            .map(|param| param.value as i64)
-            .unwrap_or(2);
+        let (period, adxr_length) = adx_params(indicator_key, param_map)?;
 
         let mut config = ADXConfig::new(period, adxr_length);
         config.adx_alias = format!("{}_adx", indicator_key);
@@ -62,4 +72,24 @@ impl Indicator for AdxIndicator {
         // 中文注释：ADX 非预热段不允许中间空值。
         crate::backtest_engine::indicators::registry::WarmupMode::Strict
     }
+
+    fn sliceable(&self) -> bool {
+        false
+    }
+
+    fn create_state(
+        &self,
+        indicator_key: &str,
+        param_map: &HashMap<String, Param>,
+    ) -> Result<StreamingIndicator, QuantError> {
+        let (period, adxr_length) = adx_params(indicator_key, param_map)?;
+        let state = AdxState::new(period, adxr_length)?;
+        Ok(StreamingIndicator::new(
+            ["adx", "adxr", "plus_dm", "minus_dm"]
+                .iter()
+                .map(|suffix| format!("{}_{}", indicator_key, suffix))
+                .collect(),
+            state,
+        ))
+    }
 }
@@ -4,7 +4,9 @@ mod config;
 mod expr;
 mod indicator;
 mod pipeline;
+mod state;
 
 pub use config::ADXConfig;
 pub use indicator::AdxIndicator;
 pub use pipeline::{adx_eager, adx_lazy};
+pub use state::{AdxOutput, AdxState};
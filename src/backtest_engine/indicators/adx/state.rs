@@ -0,0 +1,198 @@
+use crate::backtest_engine::indicators::streaming::{ewm_step, Bar, IndicatorState};
+use crate::error::{IndicatorError, QuantError};
+use std::collections::VecDeque;
+
+const INDICATOR_NAME: &str = "adx";
+
+/// 单行 ADX 输出，字段顺序与批量输出列一致。
+#[derive(Debug, Clone, Copy, PartialEq)]
+pub struct AdxOutput {
+    pub adx: f64,
+    pub adxr: f64,
+    pub plus_dm: f64,
+    pub minus_dm: f64,
+}
+
+/// ADX 逐行递推状态。
+///
+/// 中文注释：逐行复刻 `adx_expr` 的表达式语义：
+/// 1. +DM/-DM 在第 period-1 行用前 period 行均值做种子；
+/// 2. TR 首行为空，种子窗口因此为空，平滑从第 period 行开始；
+/// 3. DX 在第 2*period-1 行用 [period, 2*period-1] 均值做种子；
+/// 4. ADXR 取 adxr_length 行之前的 ADX 求均值。
+#[derive(Debug, Clone)]
+pub struct AdxState {
+    period: usize,
+    adxr_length: usize,
+    alpha: f64,
+    index: usize,
+    prev_high: f64,
+    prev_low: f64,
+    prev_close: f64,
+    plus_seed_sum: f64,
+    minus_seed_sum: f64,
+    plus_ewm: f64,
+    minus_ewm: f64,
+    tr_ewm: f64,
+    dx_seed_sum: f64,
+    adx_ewm: f64,
+    adx_history: VecDeque<f64>,
+}
+
+impl AdxState {
+    pub fn new(period: i64, adxr_length: i64) -> Result<Self, QuantError> {
+        if period <= 0 {
+            return Err(IndicatorError::InvalidParameter(
+                INDICATOR_NAME.to_string(),
+                "Period must be positive".to_string(),
+            )
+            .into());
+        }
+        if adxr_length <= 0 {
+            return Err(IndicatorError::InvalidParameter(
+                INDICATOR_NAME.to_string(),
+                "ADXR Length must be positive".to_string(),
+            )
+            .into());
+        }
+        Ok(Self {
+            period: period as usize,
+            adxr_length: adxr_length as usize,
+            alpha: 1.0 / period as f64,
+            index: 0,
+            prev_high: f64::NAN,
+            prev_low: f64::NAN,
+            prev_close: f64::NAN,
+            plus_seed_sum: 0.0,
+            minus_seed_sum: 0.0,
+            plus_ewm: f64::NAN,
+            minus_ewm: f64::NAN,
+            tr_ewm: f64::NAN,
+            dx_seed_sum: 0.0,
+            adx_ewm: f64::NAN,
+            adx_history: VecDeque::with_capacity(adxr_length as usize),
+        })
+    }
+
+    /// 推进一根 K 线。
+    pub fn update(&mut self, high: f64, low: f64, close: f64) -> AdxOutput {
+        let i = self.index;
+        let p = self.period;
+        let p_f64 = p as f64;
+
+        let (plus_dm1, minus_dm1, tr) = if i == 0 {
+            (0.0, 0.0, f64::NAN)
+        } else {
+            let diff_p = high - self.prev_high;
+            let diff_m = self.prev_low - low;
+            let (plus, minus) = if diff_m > 0.0 && diff_p < diff_m {
+                (0.0, diff_m)
+            } else if diff_p > 0.0 && diff_p > diff_m {
+                (diff_p, 0.0)
+            } else {
+                (0.0, 0.0)
+            };
+            let tr = (high - low)
+                .abs()
+                .max((high - self.prev_close).abs())
+                .max((self.prev_close - low).abs());
+            (plus, minus, tr)
+        };
+
+        if i + 1 < p {
+            self.plus_seed_sum += plus_dm1;
+            self.minus_seed_sum += minus_dm1;
+        } else if i + 1 == p {
+            self.plus_seed_sum += plus_dm1;
+            self.minus_seed_sum += minus_dm1;
+            self.plus_ewm = self.plus_seed_sum / p_f64;
+            self.minus_ewm = self.minus_seed_sum / p_f64;
+        } else {
+            self.plus_ewm = ewm_step(self.plus_ewm, plus_dm1, self.alpha);
+            self.minus_ewm = ewm_step(self.minus_ewm, minus_dm1, self.alpha);
+        }
+        if i >= p {
+            self.tr_ewm = ewm_step(self.tr_ewm, tr, self.alpha);
+        }
+
+        let plus_smooth = if i + 1 >= p {
+            self.plus_ewm * p_f64
+        } else {
+            f64::NAN
+        };
+        let minus_smooth = if i + 1 >= p {
+            self.minus_ewm * p_f64
+        } else {
+            f64::NAN
+        };
+        let tr_smooth = if i >= p {
+            self.tr_ewm * p_f64
+        } else {
+            f64::NAN
+        };
+
+        let (plus_di, minus_di) = if tr_smooth > 0.0 {
+            (
+                100.0 * plus_smooth / tr_smooth,
+                100.0 * minus_smooth / tr_smooth,
+            )
+        } else {
+            (0.0, 0.0)
+        };
+        let di_sum = plus_di + minus_di;
+        let dx = if di_sum > 0.0 {
+            100.0 * (plus_di - minus_di).abs() / di_sum
+        } else {
+            0.0
+        };
+
+        let adx_seed_idx = 2 * p - 1;
+        if i >= p && i < adx_seed_idx {
+            self.dx_seed_sum += dx;
+        } else if i == adx_seed_idx {
+            self.dx_seed_sum += dx;
+            self.adx_ewm = self.dx_seed_sum / p_f64;
+        } else if i > adx_seed_idx {
+            self.adx_ewm = ewm_step(self.adx_ewm, dx, self.alpha);
+        }
+        let adx = if i >= adx_seed_idx {
+            self.adx_ewm
+        } else {
+            f64::NAN
+        };
+
+        let shifted_adx = if self.adx_history.len() == self.adxr_length {
+            self.adx_history.front().copied().unwrap_or(f64::NAN)
+        } else {
+            f64::NAN
+        };
+        self.adx_history.push_back(adx);
+        if self.adx_history.len() > self.adxr_length {
+            self.adx_history.pop_front();
+        }
+        let adxr = if i >= adx_seed_idx + self.adxr_length {
+            (adx + shifted_adx) * 0.5
+        } else {
+            f64::NAN
+        };
+
+        self.prev_high = high;
+        self.prev_low = low;
+        self.prev_close = close;
+        self.index += 1;
+
+        AdxOutput {
+            adx,
+            adxr,
+            plus_dm: plus_smooth,
+            minus_dm: minus_smooth,
+        }
+    }
+}
+
+impl IndicatorState for AdxState {
+    fn update(&mut self, bar: &Bar) -> Vec<f64> {
+        let output = AdxState::update(self, bar.high, bar.low, bar.close);
+        vec![output.adx, output.adxr, output.plus_dm, output.minus_dm]
+    }
+}
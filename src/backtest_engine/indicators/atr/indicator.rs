@@ -1,6 +1,8 @@
 use super::super::registry::{require_resolved_param, Indicator};
 use super::config::ATRConfig;
 use super::pipeline::atr_eager;
+use super::state::AtrState;
+use crate::backtest_engine::indicators::streaming::StreamingIndicator;
 use crate::error::{IndicatorError, QuantError};
 use crate::types::Param;
 use polars::prelude::*;
@@ -8,6 +10,22 @@ use std::collections::HashMap;
 
 pub struct AtrIndicator;
 
+fn period_param(
+    indicator_key: &str,
+    param_map: &HashMap<String, Param>,
+) -> Result<i64, QuantError> {
+    let period = param_map
+        .get("period")
+        .map(|param| param.value)
+        .ok_or_else(|| {
+            IndicatorError::InvalidParameter(
+                indicator_key.to_string(),
+                "Missing or invalid 'period' parameter".to_string(),
+            )
+        })? as i64;
+    Ok(period)
+}
+
 pub(crate) fn atr_required_warmup_bars(period: usize) -> usize {
     period
 }
@@ -19,16 +37,7 @@ impl Indicator for AtrIndicator {
         indicator_key: &str,
         param_map: &HashMap<String, Param>,
     ) -> Result<Vec<Series>, QuantError> {
-        let period = param_map
-            .get("period")
-            .map(|param| param.value)
-            .ok_or_else(|| {
-                IndicatorError::InvalidParameter(
-                    indicator_key.to_string(),
-                    "Missing or invalid 'period' parameter".to_string(),
-                )
-            })? as i64;
-
+        let period = period_param(indicator_key, param_map)?;
         let mut config = ATRConfig::new(period);
         config.alias_name = indicator_key.to_string();
 
@@ -49,4 +58,20 @@ impl Indicator for AtrIndicator {
         // 中文注释：ATR 非预热段不允许中间空值。
         crate::backtest_engine::indicators::registry::WarmupMode::Strict
     }
+
+    fn sliceable(&self) -> bool {
+        false
+    }
+
+    fn create_state(
+        &self,
+        indicator_key: &str,
+        param_map: &HashMap<String, Param>,
+    ) -> Result<StreamingIndicator, QuantError> {
+        let state = AtrState::new(period_param(indicator_key, param_map)?)?;
+        Ok(StreamingIndicator::new(
+            vec![indicator_key.to_string()],
+            state,
+        ))
+    }
 }
@@ -2,9 +2,11 @@ mod config;
 mod expr;
 mod indicator;
 mod pipeline;
+mod state;
 
 pub use config::ATRConfig;
 pub use expr::atr_expr;
 pub(crate) use indicator::atr_required_warmup_bars;
 pub use indicator::AtrIndicator;
 pub use pipeline::{atr_eager, atr_lazy};
+pub use state::AtrState;
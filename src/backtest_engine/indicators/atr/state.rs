@@ -0,0 +1,66 @@
+use crate::backtest_engine::indicators::streaming::ewm_step;
+use crate::backtest_engine::indicators::streaming::{true_range, Bar, IndicatorState};
+use crate::error::{IndicatorError, QuantError};
+
+/// ATR 流式状态。
+///
+/// 中文注释：与 `atr_expr` 一致——TR 首行为空，第 period 行用 TR[1..=period] 均值做种子，
+/// 之后按 `alpha = 1 / period` 递推。
+#[derive(Debug, Clone)]
+pub struct AtrState {
+    period: usize,
+    alpha: f64,
+    index: usize,
+    prev_close: f64,
+    seed_sum: f64,
+    value: f64,
+}
+
+impl AtrState {
+    pub fn new(period: i64) -> Result<Self, QuantError> {
+        if period <= 0 {
+            return Err(IndicatorError::InvalidParameter(
+                "atr".to_string(),
+                "Period must be positive".to_string(),
+            )
+            .into());
+        }
+        Ok(Self {
+            period: period as usize,
+            alpha: 1.0 / period as f64,
+            index: 0,
+            prev_close: f64::NAN,
+            seed_sum: 0.0,
+            value: f64::NAN,
+        })
+    }
+
+    /// 推进一根 K 线，返回该行 ATR。
+    pub fn update(&mut self, high: f64, low: f64, close: f64) -> f64 {
+        let i = self.index;
+        let tr = true_range(high, low, self.prev_close);
+        self.prev_close = close;
+        self.index += 1;
+
+        if i == 0 {
+            return f64::NAN;
+        }
+        if i < self.period {
+            self.seed_sum += tr;
+            return f64::NAN;
+        }
+        if i == self.period {
+            self.seed_sum += tr;
+            self.value = self.seed_sum / self.period as f64;
+            return self.value;
+        }
+        self.value = ewm_step(self.value, tr, self.alpha);
+        self.value
+    }
+}
+
+impl IndicatorState for AtrState {
+    fn update(&mut self, bar: &Bar) -> Vec<f64> {
+        vec![AtrState::update(self, bar.high, bar.low, bar.close)]
+    }
+}
@@ -4,11 +4,32 @@ use std::collections::HashMap;
 use super::super::registry::{require_resolved_param, Indicator};
 use super::config::BBandsConfig;
 use super::pipeline::bbands_eager;
+use super::state::BbandsState;
+use crate::backtest_engine::indicators::streaming::StreamingIndicator;
 use crate::error::{IndicatorError, QuantError};
 use crate::types::Param;
 
 pub struct BbandsIndicator;
 
+fn bbands_params(
+    indicator_key: &str,
+    params: &HashMap<String, Param>,
+) -> Result<(i64, f64), QuantError> {
+    let period = params
+        .get("period")
+        .ok_or_else(|| {
+            IndicatorError::ParameterNotFound("period".to_string(), indicator_key.to_string())
+        })?
+        .value as i64;
+    let std_multiplier = params
+        .get("std")
+        .ok_or_else(|| {
+            IndicatorError::ParameterNotFound("std".to_string(), indicator_key.to_string())
+        })?
+        .value;
+    Ok((period, std_multiplier))
+}
+
 impl Indicator for BbandsIndicator {
     fn calculate(
         &self,
@@ -16,18 +37,7 @@ impl Indicator for BbandsIndicator {
         indicator_key: &str,
         params: &HashMap<String, Param>,
     ) -> Result<Vec<Series>, QuantError> {
-        let period = params
-            .get("period")
-            .ok_or_else(|| {
-                IndicatorError::ParameterNotFound("period".to_string(), indicator_key.to_string())
-            })?
-            .value as i64;
-        let std_multiplier = params
-            .get("std")
-            .ok_or_else(|| {
-                IndicatorError::ParameterNotFound("std".to_string(), indicator_key.to_string())
-            })?
-            .value;
+        let (period, std_multiplier) = bbands_params(indicator_key, params)?;
 
         let mut config = BBandsConfig::new(period, std_multiplier);
         config.middle_band_alias = format!("{}_middle", indicator_key);
@@ -54,4 +64,24 @@ impl Indicator for BbandsIndicator {
         // 中文注释：BBands 非预热段不允许中间空值。
         crate::backtest_engine::indicators::registry::WarmupMode::Strict
     }
+
+    fn sliceable(&self) -> bool {
+        true
+    }
+
+    fn create_state(
+        &self,
+        indicator_key: &str,
+        params: &HashMap<String, Param>,
+    ) -> Result<StreamingIndicator, QuantError> {
+        let (period, std_multiplier) = bbands_params(indicator_key, params)?;
+        let state = BbandsState::new(period, std_multiplier)?;
+        Ok(StreamingIndicator::new(
+            ["lower", "middle", "upper", "bandwidth", "percent"]
+                .iter()
+                .map(|suffix| format!("{}_{}", indicator_key, suffix))
+                .collect(),
+            state,
+        ))
+    }
 }
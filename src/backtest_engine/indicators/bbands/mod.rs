@@ -2,8 +2,10 @@ mod config;
 mod expr;
 mod indicator;
 mod pipeline;
+mod state;
 
 pub use config::BBandsConfig;
 pub use expr::{bbands_expr, bbands_lazy};
 pub use indicator::BbandsIndicator;
 pub use pipeline::bbands_eager;
+pub use state::{BbandsOutput, BbandsState};
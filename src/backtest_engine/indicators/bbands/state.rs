@@ -0,0 +1,64 @@
+use crate::backtest_engine::indicators::streaming::{Bar, IndicatorState, RollingWindow};
+use crate::error::{IndicatorError, QuantError};
+
+/// 单行布林带输出，字段顺序与批量输出列一致。
+#[derive(Debug, Clone, Copy, PartialEq)]
+pub struct BbandsOutput {
+    pub lower: f64,
+    pub middle: f64,
+    pub upper: f64,
+    pub bandwidth: f64,
+    pub percent: f64,
+}
+
+/// 布林带流式状态：滑动窗口 O(1) 维护均值与总体标准差（ddof = 0）。
+#[derive(Debug, Clone)]
+pub struct BbandsState {
+    std_multiplier: f64,
+    window: RollingWindow,
+}
+
+impl BbandsState {
+    pub fn new(period: i64, std_multiplier: f64) -> Result<Self, QuantError> {
+        if period <= 0 {
+            return Err(IndicatorError::InvalidParameter(
+                "bbands".to_string(),
+                "Period must be positive".to_string(),
+            )
+            .into());
+        }
+        Ok(Self {
+            std_multiplier,
+            window: RollingWindow::new(period as usize),
+        })
+    }
+
+    /// 推进一根 K 线。
+    pub fn update(&mut self, close: f64) -> BbandsOutput {
+        self.window.push(close);
+        let middle = self.window.mean();
+        let std_dev = self.window.population_std();
+        let upper = middle + self.std_multiplier * std_dev;
+        let lower = middle - self.std_multiplier * std_dev;
+        BbandsOutput {
+            lower,
+            middle,
+            upper,
+            bandwidth: 100.0 * (upper - lower) / middle,
+            percent: (close - lower) / (upper - lower),
+        }
+    }
+}
+
+impl IndicatorState for BbandsState {
+    fn update(&mut self, bar: &Bar) -> Vec<f64> {
+        let output = BbandsState::update(self, bar.close);
+        vec![
+            output.lower,
+            output.middle,
+            output.upper,
+            output.bandwidth,
+            output.percent,
+        ]
+    }
+}
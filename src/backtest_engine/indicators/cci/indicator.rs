@@ -1,6 +1,8 @@
 use super::super::registry::{require_resolved_param, Indicator};
 use super::config::CCIConfig;
 use super::pipeline::cci_eager;
+use super::state::CciState;
+use crate::backtest_engine::indicators::streaming::StreamingIndicator;
 use crate::error::{IndicatorError, QuantError};
 use crate::types::Param;
 use polars::prelude::*;
@@ -8,6 +10,26 @@ use std::collections::HashMap;
 
 pub struct CciIndicator;
 
+fn cci_config(
+    indicator_key: &str,
+    params: &HashMap<String, Param>,
+) -> Result<CCIConfig, QuantError> {
+    let period = params
+        .get("period")
+        .ok_or_else(|| {
+            IndicatorError::ParameterNotFound("period".to_string(), indicator_key.to_string())
+        })?
+        .value as i64;
+
+    let mut config = CCIConfig::new(period);
+    config.alias_name = indicator_key.to_string();
+
+    if let Some(constant) = params.get("constant") {
+        config.constant = constant.value;
+    }
+    Ok(config)
+}
+
 impl Indicator for CciIndicator {
     fn calculate(
         &self,
@@ -15,20 +37,7 @@ impl Indicator for CciIndicator {
         indicator_key: &str,
         params: &HashMap<String, Param>,
     ) -> Result<Vec<Series>, QuantError> {
-        let period = params
-            .get("period")
-            .ok_or_else(|| {
-                IndicatorError::ParameterNotFound("period".to_string(), indicator_key.to_string())
-            })?
-            .value as i64;
-
-        let mut config = CCIConfig::new(period);
-        config.alias_name = indicator_key.to_string();
-
-        if let Some(constant) = params.get("constant") {
-            config.constant = constant.value;
-        }
-
+        let config = cci_config(indicator_key, params)?;
         let series = cci_eager(ohlcv_df, &config)?;
         Ok(vec![series])
     }
@@ -46,4 +55,21 @@ impl Indicator for CciIndicator {
         // 中文注释：CCI 非预热段不允许中间空值。
         crate::backtest_engine::indicators::registry::WarmupMode::Strict
     }
+
+    fn sliceable(&self) -> bool {
+        true
+    }
+
+    fn create_state(
+        &self,
+        indicator_key: &str,
+        params: &HashMap<String, Param>,
+    ) -> Result<StreamingIndicator, QuantError> {
+        let config = cci_config(indicator_key, params)?;
+        let state = CciState::new(config.period, config.constant)?;
+        Ok(StreamingIndicator::new(
+            vec![indicator_key.to_string()],
+            state,
+        ))
+    }
 }
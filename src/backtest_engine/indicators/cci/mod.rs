@@ -2,8 +2,10 @@ mod config;
 mod expr;
 mod indicator;
 mod pipeline;
+mod state;
 
 pub use config::CCIConfig;
 pub use expr::cci_expr;
 pub use indicator::CciIndicator;
 pub use pipeline::{cci_eager, cci_lazy};
+pub use state::CciState;
@@ -0,0 +1,58 @@
+use crate::backtest_engine::indicators::streaming::{Bar, IndicatorState, RollingWindow};
+use crate::error::{IndicatorError, QuantError};
+
+/// CCI 流式状态。
+///
+/// 中文注释：典型价均值走 O(1) 滑动窗口；平均绝对偏差依赖当前均值，
+/// 只能对窗口内 period 个值重扫，单步复杂度 O(period)，与历史长度无关。
+#[derive(Debug, Clone)]
+pub struct CciState {
+    period: usize,
+    constant: f64,
+    window: RollingWindow,
+}
+
+impl CciState {
+    pub fn new(period: i64, constant: f64) -> Result<Self, QuantError> {
+        if period <= 0 {
+            return Err(IndicatorError::InvalidParameter(
+                "cci".to_string(),
+                "Period must be positive".to_string(),
+            )
+            .into());
+        }
+        Ok(Self {
+            period: period as usize,
+            constant,
+            window: RollingWindow::new(period as usize),
+        })
+    }
+
+    /// 推进一根 K 线，返回该行 CCI。
+    pub fn update(&mut self, high: f64, low: f64, close: f64) -> f64 {
+        let tp = (high + low + close) / 3.0;
+        self.window.push(tp);
+        if !self.window.is_valid() {
+            return f64::NAN;
+        }
+
+        let sma = self.window.mean();
+        let period = self.period as f64;
+        // 中文注释：MAD 的均值按批量 `calculate_mad` 同样的顺序求和，保证逐位一致。
+        let exact_mean = self.window.values().iter().sum::<f64>() / period;
+        let mad = self
+            .window
+            .values()
+            .iter()
+            .map(|value| (value - exact_mean).abs())
+            .sum::<f64>()
+            / period;
+        (tp - sma) / (mad * self.constant)
+    }
+}
+
+impl IndicatorState for CciState {
+    fn update(&mut self, bar: &Bar) -> Vec<f64> {
+        vec![CciState::update(self, bar.high, bar.low, bar.close)]
+    }
+}
@@ -1,6 +1,8 @@
 use super::super::registry::{require_resolved_param, Indicator};
 use super::config::EMAConfig;
 use super::pipeline::ema_eager;
+use super::state::EmaState;
+use crate::backtest_engine::indicators::streaming::StreamingIndicator;
 use crate::error::{IndicatorError, QuantError};
 use crate::types::Param;
 use polars::prelude::*;
@@ -8,6 +10,15 @@ use std::collections::HashMap;
 
 pub struct EmaIndicator;
 
+fn period_param(indicator_key: &str, params: &HashMap<String, Param>) -> Result<i64, QuantError> {
+    Ok(params
+        .get("period")
+        .ok_or_else(|| {
+            IndicatorError::ParameterNotFound("period".to_string(), indicator_key.to_string())
+        })?
+        .value as i64)
+}
+
 impl Indicator for EmaIndicator {
     fn calculate(
         &self,
@@ -15,12 +26,7 @@ impl Indicator for EmaIndicator {
         indicator_key: &str,
         params: &HashMap<String, Param>,
     ) -> Result<Vec<Series>, QuantError> {
-        let period = params
-            .get("period")
-            .ok_or_else(|| {
-                IndicatorError::ParameterNotFound("period".to_string(), indicator_key.to_string())
-            })?
-            .value as i64;
+        let period = period_param(indicator_key, params)?;
 
         let mut config = EMAConfig::new(period);
         config.alias_name = indicator_key.to_string();
@@ -41,4 +47,20 @@ impl Indicator for EmaIndicator {
         // 中文注释：EMA 非预热段不允许中间空值。
         crate::backtest_engine::indicators::registry::WarmupMode::Strict
     }
+
+    fn sliceable(&self) -> bool {
+        false
+    }
+
+    fn create_state(
+        &self,
+        indicator_key: &str,
+        params: &HashMap<String, Param>,
+    ) -> Result<StreamingIndicator, QuantError> {
+        let state = EmaState::new(period_param(indicator_key, params)?)?;
+        Ok(StreamingIndicator::new(
+            vec![indicator_key.to_string()],
+            state,
+        ))
+    }
 }
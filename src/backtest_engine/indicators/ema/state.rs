@@ -0,0 +1,57 @@
+use crate::backtest_engine::indicators::streaming::{ewm_step, Bar, IndicatorState};
+use crate::error::{IndicatorError, QuantError};
+
+const INDICATOR_NAME: &str = "ema";
+
+/// EMA 逐行递推状态。
+///
+/// 中文注释：与批量实现口径一致——前 period 根累加做 SMA 种子，
+/// 之后按 `alpha = 2 / (period + 1)` 递推。
+#[derive(Debug, Clone, PartialEq)]
+pub struct EmaState {
+    period: usize,
+    alpha: f64,
+    seen: usize,
+    seed_sum: f64,
+    value: f64,
+}
+
+impl EmaState {
+    pub fn new(period: i64) -> Result<Self, QuantError> {
+        if period <= 0 {
+            return Err(IndicatorError::InvalidParameter(
+                INDICATOR_NAME.to_string(),
+                "Period must be positive".to_string(),
+            )
+            .into());
+        }
+        Ok(Self {
+            period: period as usize,
+            alpha: 2.0 / (period as f64 + 1.0),
+            seen: 0,
+            seed_sum: 0.0,
+            value: f64::NAN,
+        })
+    }
+
+    /// 推进一根 K 线，返回该行 EMA（种子完成前为 NaN）。
+    pub fn update(&mut self, close: f64) -> f64 {
+        if self.seen < self.period {
+            self.seen += 1;
+            self.seed_sum += close;
+            if self.seen == self.period {
+                self.value = self.seed_sum / self.period as f64;
+                return self.value;
+            }
+            return f64::NAN;
+        }
+        self.value = ewm_step(self.value, close, self.alpha);
+        self.value
+    }
+}
+
+impl IndicatorState for EmaState {
+    fn update(&mut self, bar: &Bar) -> Vec<f64> {
+        vec![EmaState::update(self, bar.close)]
+    }
+}
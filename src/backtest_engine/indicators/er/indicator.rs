@@ -1,6 +1,8 @@
 use super::super::registry::{require_resolved_param, Indicator};
 use super::config::ERConfig;
 use super::pipeline::er_eager;
+use super::state::ErState;
+use crate::backtest_engine::indicators::streaming::StreamingIndicator;
 use crate::error::{IndicatorError, QuantError};
 use crate::types::Param;
 use polars::prelude::*;
@@ -8,6 +10,23 @@ use std::collections::HashMap;
 
 pub struct ErIndicator;
 
+fn er_config(indicator_key: &str, params: &HashMap<String, Param>) -> Result<ERConfig, QuantError> {
+    let length = params
+        .get("length")
+        .ok_or_else(|| {
+            IndicatorError::ParameterNotFound("length".to_string(), indicator_key.to_string())
+        })?
+        .value as i64;
+
+    let mut config = ERConfig::new(length);
+    config.alias_name = indicator_key.to_string();
+
+    if let Some(drift) = params.get("drift") {
+        config.drift = drift.value as i64;
+    }
+    Ok(config)
+}
+
 impl Indicator for ErIndicator {
     fn calculate(
         &self,
@@ -15,20 +34,7 @@ impl Indicator for ErIndicator {
         indicator_key: &str,
         params: &HashMap<String, Param>,
     ) -> Result<Vec<Series>, QuantError> {
-        let length = params
-            .get("length")
-            .ok_or_else(|| {
-                IndicatorError::ParameterNotFound("length".to_string(), indicator_key.to_string())
-            })?
-            .value as i64;
-
-        let mut config = ERConfig::new(length);
-        config.alias_name = indicator_key.to_string();
-
-        if let Some(drift) = params.get("drift") {
-            config.drift = drift.value as i64;
-        }
-
+        let config = er_config(indicator_key, params)?;
         let series = er_eager(ohlcv_df, &config)?;
         Ok(vec![series])
     }
@@ -46,4 +52,21 @@ impl Indicator for ErIndicator {
         // 中文注释：ER 非预热段不允许中间空值。
         crate::backtest_engine::indicators::registry::WarmupMode::Strict
     }
+
+    fn sliceable(&self) -> bool {
+        true
+    }
+
+    fn create_state(
+        &self,
+        indicator_key: &str,
+        params: &HashMap<String, Param>,
+    ) -> Result<StreamingIndicator, QuantError> {
+        let config = er_config(indicator_key, params)?;
+        let state = ErState::new(config.length, config.drift)?;
+        Ok(StreamingIndicator::new(
+            vec![indicator_key.to_string()],
+            state,
+        ))
+    }
 }
@@ -2,8 +2,10 @@ mod config;
 mod expr;
 mod indicator;
 mod pipeline;
+mod state;
 
 pub use config::ERConfig;
 pub use expr::er_expr;
 pub use indicator::ErIndicator;
 pub use pipeline::{er_eager, er_lazy};
+pub use state::ErState;
@@ -0,0 +1,71 @@
+use crate::backtest_engine::indicators::streaming::{Bar, IndicatorState, RollingWindow};
+use crate::error::{IndicatorError, QuantError};
+use std::collections::VecDeque;
+
+/// ER（效率比）流式状态。
+///
+/// 中文注释：保留最近 max(length, drift)+1 根收盘价求位移，
+/// 单步波动 |close - close[drift]| 进入长度为 length 的滑动求和窗口。
+#[derive(Debug, Clone)]
+pub struct ErState {
+    length: usize,
+    drift: usize,
+    closes: VecDeque<f64>,
+    volatility: RollingWindow,
+}
+
+impl ErState {
+    pub fn new(length: i64, drift: i64) -> Result<Self, QuantError> {
+        if length <= 0 {
+            return Err(IndicatorError::InvalidParameter(
+                "er".to_string(),
+                "Length must be positive".to_string(),
+            )
+            .into());
+        }
+        if drift < 0 {
+            return Err(IndicatorError::InvalidParameter(
+                "er".to_string(),
+                "Drift must be non-negative".to_string(),
+            )
+            .into());
+        }
+        let length = length as usize;
+        let drift = drift as usize;
+        Ok(Self {
+            length,
+            drift,
+            closes: VecDeque::with_capacity(length.max(drift) + 2),
+            volatility: RollingWindow::new(length),
+        })
+    }
+
+    /// 取 `lag` 根之前的收盘价（不足时为 NaN，对齐 `diff` 的前导空值）。
+    fn lagged(&self, lag: usize) -> f64 {
+        let len = self.closes.len();
+        if lag < len {
+            self.closes[len - 1 - lag]
+        } else {
+            f64::NAN
+        }
+    }
+
+    /// 推进一根 K 线，返回该行 ER。
+    pub fn update(&mut self, close: f64) -> f64 {
+        self.closes.push_back(close);
+        if self.closes.len() > self.length.max(self.drift) + 1 {
+            self.closes.pop_front();
+        }
+
+        let abs_diff = (close - self.lagged(self.length)).abs();
+        let abs_volatility = (close - self.lagged(self.drift)).abs();
+        self.volatility.push(abs_volatility);
+        abs_diff / self.volatility.sum()
+    }
+}
+
+impl IndicatorState for ErState {
+    fn update(&mut self, bar: &Bar) -> Vec<f64> {
+        vec![ErState::update(self, bar.close)]
+    }
+}
@@ -1,8 +1,10 @@
 use super::config::DivergenceConfig;
 use super::expr::divergence_expr;
+use super::state::{divergence_output_names, DivergenceSource, DivergenceState};
 use crate::backtest_engine::indicators::{
-    cci::{cci_lazy, CCIConfig},
+    cci::{cci_lazy, CCIConfig, CciState},
     registry::{require_resolved_param, Indicator},
+    streaming::StreamingIndicator,
 };
 use crate::error::QuantError;
 use crate::types::Param;
@@ -12,6 +14,23 @@ use std::collections::HashMap;
 
 pub struct CciDivergenceIndicator;
 
+fn cci_divergence_configs(params: &HashMap<String, Param>) -> (CCIConfig, DivergenceConfig) {
+    let period = params.get("period").map(|p| p.value as i64).unwrap_or(14);
+    let window = params.get("window").map(|p| p.value as usize).unwrap_or(10);
+
+    let mut cci_cfg = CCIConfig::new(period);
+    cci_cfg.alias_name = "cci_temp".to_string();
+
+    let mut div_cfg = DivergenceConfig::new(window, &cci_cfg.alias_name);
+    if let Some(p) = params.get("gap") {
+        div_cfg.gap = p.value as i32;
+    }
+    if let Some(p) = params.get("recency") {
+        div_cfg.recency = p.value as i32;
+    }
+    (cci_cfg, div_cfg)
+}
+
 impl Indicator for CciDivergenceIndicator {
     fn calculate(
         &self,
@@ -19,20 +38,7 @@ impl Indicator for CciDivergenceIndicator {
         indicator_key: &str,
         params: &HashMap<String, Param>,
     ) -> Result<Vec<Series>, QuantError> {
-        let period = params.get("period").map(|p| p.value as i64).unwrap_or(14);
-        let window = params.get("window").map(|p| p.value as usize).unwrap_or(10);
-
-        let mut cci_cfg = CCIConfig::new(period);
-        cci_cfg.alias_name = "cci_temp".to_string();
-
-        let mut div_cfg = DivergenceConfig::new(window, &cci_cfg.alias_name);
-        if let Some(p) = params.get("gap") {
-            div_cfg.gap = p.value as i32;
-        }
-        if let Some(p) = params.get("recency") {
-            div_cfg.recency = p.value as i32;
-        }
-
+        let (cci_cfg, div_cfg) = cci_divergence_configs(params);
         let expr = divergence_expr(&div_cfg)?;
         let div_alias = format!("{}_struct", indicator_key);
 
@@ -80,4 +86,21 @@ impl Indicator for CciDivergenceIndicator {
         // 中文注释：CCI divergence 非预热段不允许中间空值。
         crate::backtest_engine::indicators::registry::WarmupMode::Strict
     }
+
+    fn sliceable(&self) -> bool {
+        false
+    }
+
+    fn create_state(
+        &self,
+        indicator_key: &str,
+        params: &HashMap<String, Param>,
+    ) -> Result<StreamingIndicator, QuantError> {
+        let (cci_cfg, div_cfg) = cci_divergence_configs(params);
+        let source = DivergenceSource::Cci(CciState::new(cci_cfg.period, cci_cfg.constant)?);
+        Ok(StreamingIndicator::new(
+            divergence_output_names(indicator_key),
+            DivergenceState::new(source, &div_cfg)?,
+        ))
+    }
 }
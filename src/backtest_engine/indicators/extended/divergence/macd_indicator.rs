@@ -1,8 +1,10 @@
 use super::config::DivergenceConfig;
 use super::expr::divergence_expr;
+use super::state::{divergence_output_names, DivergenceSource, DivergenceState};
 use crate::backtest_engine::indicators::{
-    macd::{macd_lazy, MACDConfig},
+    macd::{macd_lazy, MACDConfig, MacdState},
     registry::{require_resolved_param, Indicator},
+    streaming::StreamingIndicator,
 };
 use crate::error::QuantError;
 use crate::types::Param;
@@ -12,6 +14,34 @@ use std::collections::HashMap;
 
 pub struct MacdDivergenceIndicator;
 
+fn macd_divergence_configs(params: &HashMap<String, Param>) -> (MACDConfig, DivergenceConfig) {
+    let fast = params
+        .get("fast_period")
+        .map(|p| p.value as i64)
+        .unwrap_or(12);
+    let slow = params
+        .get("slow_period")
+        .map(|p| p.value as i64)
+        .unwrap_or(26);
+    let signal = params
+        .get("signal_period")
+        .map(|p| p.value as i64)
+        .unwrap_or(9);
+    let window = params.get("window").map(|p| p.value as usize).unwrap_or(10);
+
+    let mut macd_cfg = MACDConfig::new(fast, slow, signal);
+    macd_cfg.macd_alias = "macd_temp".to_string();
+
+    let mut div_cfg = DivergenceConfig::new(window, &macd_cfg.macd_alias);
+    if let Some(p) = params.get("gap") {
+        div_cfg.gap = p.value as i32;
+    }
+    if let Some(p) = params.get("recency") {
+        div_cfg.recency = p.value as i32;
+    }
+    (macd_cfg, div_cfg)
+}
+
 impl Indicator for MacdDivergenceIndicator {
     fn calculate(
         &self,
@@ -19,31 +49,7 @@ impl Indicator for MacdDivergenceIndicator {
         indicator_key: &str,
         params: &HashMap<String, Param>,
     ) -> Result<Vec<Series>, QuantError> {
-        let fast = params
-            .get("fast_period")
-            .map(|p| p.value as i64)
-            .unwrap_or(12);
-        let slow = params
-            .get("slow_period")
-            .map(|p| p.value as i64)
-            .unwrap_or(26);
-        let signal = params
-            .get("signal_period")
-            .map(|p| p.value as i64)
-            .unwrap_or(9);
-        let window = params.get("window").map(|p| p.value as usize).unwrap_or(10);
-
-        let mut macd_cfg = MACDConfig::new(fast, slow, signal);
-        macd_cfg.macd_alias = "macd_temp".to_string();
-
-        let mut div_cfg = DivergenceConfig::new(window, &macd_cfg.macd_alias);
-        if let Some(p) = params.get("gap") {
-            div_cfg.gap = p.value as i32;
-        }
-        if let Some(p) = params.get("recency") {
-            div_cfg.recency = p.value as i32;
-        }
-
+        let (macd_cfg, div_cfg) = macd_divergence_configs(params);
         let expr = divergence_expr(&div_cfg)?;
         let div_alias = format!("{}_struct", indicator_key);
 
@@ -97,4 +103,25 @@ impl Indicator for MacdDivergenceIndicator {
         // 中文注释：MACD divergence 非预热段不允许中间空值。
         crate::backtest_engine::indicators::registry::WarmupMode::Strict
     }
+
+    fn sliceable(&self) -> bool {
+        false
+    }
+
+    fn create_state(
+        &self,
+        indicator_key: &str,
+        params: &HashMap<String, Param>,
+    ) -> Result<StreamingIndicator, QuantError> {
+        let (macd_cfg, div_cfg) = macd_divergence_configs(params);
+        let source = DivergenceSource::Macd(MacdState::new(
+            macd_cfg.fast_period,
+            macd_cfg.slow_period,
+            macd_cfg.signal_period,
+        )?);
+        Ok(StreamingIndicator::new(
+            divergence_output_names(indicator_key),
+            DivergenceState::new(source, &div_cfg)?,
+        ))
+    }
 }
@@ -3,9 +3,11 @@ mod config;
 mod expr;
 mod macd_indicator;
 mod rsi_indicator;
+mod state;
 
 pub use cci_indicator::CciDivergenceIndicator;
 pub use config::DivergenceConfig;
 pub use expr::divergence_expr;
 pub use macd_indicator::MacdDivergenceIndicator;
 pub use rsi_indicator::RsiDivergenceIndicator;
+pub use state::{DivergenceSource, DivergenceState, DivergenceTracker};
@@ -1,8 +1,10 @@
 use super::config::DivergenceConfig;
 use super::expr::divergence_expr;
+use super::state::{divergence_output_names, DivergenceSource, DivergenceState};
 use crate::backtest_engine::indicators::{
     registry::{require_resolved_param, Indicator},
-    rsi::{rsi_lazy, RSIConfig},
+    rsi::{rsi_lazy, RSIConfig, RsiState},
+    streaming::StreamingIndicator,
 };
 use crate::error::QuantError;
 use crate::types::Param;
@@ -12,6 +14,23 @@ use std::collections::HashMap;
 
 pub struct RsiDivergenceIndicator;
 
+fn rsi_divergence_configs(params: &HashMap<String, Param>) -> (RSIConfig, DivergenceConfig) {
+    let period = params.get("period").map(|p| p.value as i64).unwrap_or(14);
+    let window = params.get("window").map(|p| p.value as usize).unwrap_or(10);
+
+    let mut rsi_cfg = RSIConfig::new(period);
+    rsi_cfg.alias_name = "rsi_temp".to_string();
+
+    let mut div_cfg = DivergenceConfig::new(window, &rsi_cfg.alias_name);
+    if let Some(p) = params.get("gap") {
+        div_cfg.gap = p.value as i32;
+    }
+    if let Some(p) = params.get("recency") {
+        div_cfg.recency = p.value as i32;
+    }
+    (rsi_cfg, div_cfg)
+}
+
 impl Indicator for RsiDivergenceIndicator {
     fn calculate(
         &self,
@@ -19,20 +38,7 @@ impl Indicator for RsiDivergenceIndicator {
         indicator_key: &str,
         params: &HashMap<String, Param>,
     ) -> Result<Vec<Series>, QuantError> {
-        let period = params.get("period").map(|p| p.value as i64).unwrap_or(14);
-        let window = params.get("window").map(|p| p.value as usize).unwrap_or(10);
-
-        let mut rsi_cfg = RSIConfig::new(period);
-        rsi_cfg.alias_name = "rsi_temp".to_string();
-
-        let mut div_cfg = DivergenceConfig::new(window, &rsi_cfg.alias_name);
-        if let Some(p) = params.get("gap") {
-            div_cfg.gap = p.value as i32;
-        }
-        if let Some(p) = params.get("recency") {
-            div_cfg.recency = p.value as i32;
-        }
-
+        let (rsi_cfg, div_cfg) = rsi_divergence_configs(params);
         let expr = divergence_expr(&div_cfg)?;
         let div_alias = format!("{}_struct", indicator_key);
 
@@ -80,4 +86,21 @@ impl Indicator for RsiDivergenceIndicator {
         // 中文注释：RSI divergence 非预热段不允许中间空值。
         crate::backtest_engine::indicators::registry::WarmupMode::Strict
     }
+
+    fn sliceable(&self) -> bool {
+        false
+    }
+
+    fn create_state(
+        &self,
+        indicator_key: &str,
+        params: &HashMap<String, Param>,
+    ) -> Result<StreamingIndicator, QuantError> {
+        let (rsi_cfg, div_cfg) = rsi_divergence_configs(params);
+        let source = DivergenceSource::Rsi(RsiState::new(rsi_cfg.period)?);
+        Ok(StreamingIndicator::new(
+            divergence_output_names(indicator_key),
+            DivergenceState::new(source, &div_cfg)?,
+        ))
+    }
 }
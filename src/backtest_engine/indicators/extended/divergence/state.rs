@@ -0,0 +1,193 @@
+use super::config::DivergenceConfig;
+use crate::backtest_engine::indicators::cci::CciState;
+use crate::backtest_engine::indicators::macd::MacdState;
+use crate::backtest_engine::indicators::rsi::RsiState;
+use crate::backtest_engine::indicators::streaming::bool_to_f64;
+use crate::backtest_engine::indicators::streaming::{Bar, IndicatorState};
+use crate::error::{IndicatorError, QuantError};
+use std::collections::VecDeque;
+
+/// 滑动窗口极值位置（单调队列，均摊 O(1)）。
+///
+/// 中文注释：批量实现用 `>=` / `<=` 扫描，同值取最后出现的位置；
+/// 入队时弹出所有“不优于”新值的队尾元素即可得到相同的并列规则。
+#[derive(Debug, Clone)]
+struct ExtremeQueue {
+    keep_max: bool,
+    items: VecDeque<(usize, f64)>,
+}
+
+impl ExtremeQueue {
+    fn new(keep_max: bool) -> Self {
+        Self {
+            keep_max,
+            items: VecDeque::new(),
+        }
+    }
+
+    fn push(&mut self, idx: usize, value: f64) {
+        while let Some(&(_, back)) = self.items.back() {
+            let dominated = if self.keep_max {
+                back <= value
+            } else {
+                back >= value
+            };
+            if !dominated {
+                break;
+            }
+            self.items.pop_back();
+        }
+        self.items.push_back((idx, value));
+    }
+
+    fn evict_before(&mut self, start_idx: usize) {
+        while self.items.front().is_some_and(|&(idx, _)| idx < start_idx) {
+            self.items.pop_front();
+        }
+    }
+
+    fn extreme_idx(&self) -> usize {
+        self.items.front().map(|&(idx, _)| idx).unwrap_or(0)
+    }
+
+    fn clear(&mut self) {
+        self.items.clear();
+    }
+}
+
+/// 价格与指标的顶/底背离流式判定，与 `divergence_expr` 逐行等价。
+#[derive(Debug, Clone)]
+pub struct DivergenceTracker {
+    window: usize,
+    gap: i32,
+    recency: i32,
+    index: usize,
+    last_nan_idx: Option<usize>,
+    max_price: ExtremeQueue,
+    min_price: ExtremeQueue,
+    max_indicator: ExtremeQueue,
+    min_indicator: ExtremeQueue,
+}
+
+impl DivergenceTracker {
+    pub fn new(config: &DivergenceConfig) -> Result<Self, QuantError> {
+        if config.window == 0 {
+            return Err(IndicatorError::InvalidParameter(
+                "divergence".to_string(),
+                "Window must be positive".to_string(),
+            )
+            .into());
+        }
+        Ok(Self {
+            window: config.window,
+            gap: config.gap,
+            recency: config.recency,
+            index: 0,
+            last_nan_idx: None,
+            max_price: ExtremeQueue::new(true),
+            min_price: ExtremeQueue::new(false),
+            max_indicator: ExtremeQueue::new(true),
+            min_indicator: ExtremeQueue::new(false),
+        })
+    }
+
+    /// 推进一行，返回 (顶背离, 底背离)。
+    pub fn update(&mut self, high: f64, low: f64, indicator: f64) -> (bool, bool) {
+        let i = self.index;
+        self.index += 1;
+
+        if high.is_nan() || low.is_nan() || indicator.is_nan() {
+            // 中文注释：NaN 之前的元素会先于 NaN 移出窗口，直接清空不影响后续结果。
+            self.last_nan_idx = Some(i);
+            self.max_price.clear();
+            self.min_price.clear();
+            self.max_indicator.clear();
+            self.min_indicator.clear();
+        } else {
+            self.max_price.push(i, high);
+            self.min_price.push(i, low);
+            self.max_indicator.push(i, indicator);
+            self.min_indicator.push(i, indicator);
+        }
+
+        if i + 1 < self.window {
+            return (false, false);
+        }
+        let start_idx = i + 1 - self.window;
+        if self
+            .last_nan_idx
+            .is_some_and(|nan_idx| nan_idx >= start_idx)
+        {
+            return (false, false);
+        }
+        self.max_price.evict_before(start_idx);
+        self.min_price.evict_before(start_idx);
+        self.max_indicator.evict_before(start_idx);
+        self.min_indicator.evict_before(start_idx);
+
+        let max_p_idx = self.max_price.extreme_idx();
+        let min_p_idx = self.min_price.extreme_idx();
+        let max_i_idx = self.max_indicator.extreme_idx();
+        let min_i_idx = self.min_indicator.extreme_idx();
+
+        let top_recency_ok = (i - max_p_idx) < self.recency as usize;
+        let top_gap = max_p_idx as i32 - max_i_idx as i32;
+        let top_ok = top_recency_ok && (max_p_idx > max_i_idx) && (top_gap >= self.gap);
+
+        let bot_recency_ok = (i - min_p_idx) < self.recency as usize;
+        let bot_gap = min_p_idx as i32 - min_i_idx as i32;
+        let bot_ok = bot_recency_ok && (min_p_idx > min_i_idx) && (bot_gap >= self.gap);
+
+        (top_ok, bot_ok)
+    }
+}
+
+/// 背离指标的底层振荡器。
+#[derive(Debug, Clone)]
+pub enum DivergenceSource {
+    Cci(CciState),
+    Rsi(RsiState),
+    Macd(MacdState),
+}
+
+impl DivergenceSource {
+    fn update(&mut self, bar: &Bar) -> f64 {
+        match self {
+            Self::Cci(state) => state.update(bar.high, bar.low, bar.close),
+            Self::Rsi(state) => state.update(bar.close),
+            Self::Macd(state) => state.update(bar.close).macd,
+        }
+    }
+}
+
+/// 背离指标的输出列名，与批量 `calculate` 一致。
+pub(crate) fn divergence_output_names(indicator_key: &str) -> Vec<String> {
+    ["top", "bottom", "value"]
+        .iter()
+        .map(|suffix| format!("{}_{}", indicator_key, suffix))
+        .collect()
+}
+
+/// cci/rsi/macd 背离的流式状态，输出顺序为 top, bottom, value。
+#[derive(Debug, Clone)]
+pub struct DivergenceState {
+    source: DivergenceSource,
+    tracker: DivergenceTracker,
+}
+
+impl DivergenceState {
+    pub fn new(source: DivergenceSource, config: &DivergenceConfig) -> Result<Self, QuantError> {
+        Ok(Self {
+            source,
+            tracker: DivergenceTracker::new(config)?,
+        })
+    }
+}
+
+impl IndicatorState for DivergenceState {
+    fn update(&mut self, bar: &Bar) -> Vec<f64> {
+        let value = self.source.update(bar);
+        let (top, bottom) = self.tracker.update(bar.high, bar.low, value);
+        vec![bool_to_f64(top), bool_to_f64(bottom), value]
+    }
+}
@@ -1,6 +1,8 @@
 use super::config::OpeningBarConfig;
 use super::pipeline::opening_bar_eager;
+use super::state::OpeningBarState;
 use crate::backtest_engine::indicators::registry::Indicator;
+use crate::backtest_engine::indicators::streaming::StreamingIndicator;
 use crate::backtest_engine::utils::validate_timestamp_ms;
 use crate::error::QuantError;
 use crate::types::Param;
@@ -10,6 +12,15 @@ use std::collections::HashMap;
 /// 开盘 K 线检测指标 (基于时间断层)。
 pub struct OpeningBarIndicator;
 
+fn opening_bar_config(indicator_key: &str, params: &HashMap<String, Param>) -> OpeningBarConfig {
+    // 获取阈值（秒），默认 3600 秒（1 小时）。
+    let threshold_sec = params.get("threshold").map(|p| p.value).unwrap_or(3600.0);
+
+    let mut config = OpeningBarConfig::new(threshold_sec);
+    config.alias_name = indicator_key.to_string();
+    config
+}
+
 impl Indicator for OpeningBarIndicator {
     fn calculate(
         &self,
@@ -17,11 +28,7 @@ impl Indicator for OpeningBarIndicator {
         indicator_key: &str,
         params: &HashMap<String, Param>,
     ) -> Result<Vec<Series>, QuantError> {
-        // 获取阈值（秒），默认 3600 秒（1 小时）。
-        let threshold_sec = params.get("threshold").map(|p| p.value).unwrap_or(3600.0);
-
-        let mut config = OpeningBarConfig::new(threshold_sec);
-        config.alias_name = indicator_key.to_string();
+        let config = opening_bar_config(indicator_key, params);
 
         // 仅检查第一根时间戳，保持原有校验粒度。
         if let Some(first_time) = ohlcv_df.column("time")?.i64()?.get(0) {
@@ -47,4 +54,20 @@ impl Indicator for OpeningBarIndicator {
         // 中文注释：opening-bar 非预热段不允许中间空值。
         crate::backtest_engine::indicators::registry::WarmupMode::Strict
     }
+
+    fn sliceable(&self) -> bool {
+        false
+    }
+
+    fn create_state(
+        &self,
+        indicator_key: &str,
+        params: &HashMap<String, Param>,
+    ) -> Result<StreamingIndicator, QuantError> {
+        let config = opening_bar_config(indicator_key, params);
+        Ok(StreamingIndicator::new(
+            vec![indicator_key.to_string()],
+            OpeningBarState::new(config.threshold_ms()),
+        ))
+    }
 }
@@ -2,8 +2,10 @@ mod config;
 mod expr;
 mod indicator;
 mod pipeline;
+mod state;
 
 pub use config::OpeningBarConfig;
 pub use expr::opening_bar_expr;
 pub use indicator::OpeningBarIndicator;
 pub use pipeline::{opening_bar_eager, opening_bar_lazy};
+pub use state::OpeningBarState;
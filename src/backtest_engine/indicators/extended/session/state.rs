@@ -0,0 +1,33 @@
+use crate::backtest_engine::indicators::streaming::bool_to_f64;
+use crate::backtest_engine::indicators::streaming::{Bar, IndicatorState};
+
+/// 开盘首根 K 线的流式状态：与上一根的时间间隔超过阈值即视为开盘。
+#[derive(Debug, Clone)]
+pub struct OpeningBarState {
+    threshold_ms: i64,
+    prev_time: Option<i64>,
+}
+
+impl OpeningBarState {
+    pub fn new(threshold_ms: i64) -> Self {
+        Self {
+            threshold_ms,
+            prev_time: None,
+        }
+    }
+
+    /// 推进一根 K 线，首行无前值时为 0.0（对齐批量 `fill_null(false)`）。
+    pub fn update(&mut self, time: i64) -> f64 {
+        let is_opening = self
+            .prev_time
+            .is_some_and(|prev| time - prev > self.threshold_ms);
+        self.prev_time = Some(time);
+        bool_to_f64(is_opening)
+    }
+}
+
+impl IndicatorState for OpeningBarState {
+    fn update(&mut self, bar: &Bar) -> Vec<f64> {
+        vec![OpeningBarState::update(self, bar.time)]
+    }
+}
@@ -1,6 +1,8 @@
 use super::config::SmaClosePctConfig;
 use super::pipeline::sma_close_pct_eager;
+use super::state::SmaClosePctState;
 use crate::backtest_engine::indicators::registry::{require_resolved_param, Indicator};
+use crate::backtest_engine::indicators::streaming::StreamingIndicator;
 use crate::error::{IndicatorError, QuantError};
 use crate::types::Param;
 use polars::prelude::*;
@@ -8,6 +10,15 @@ use std::collections::HashMap;
 
 pub struct SmaClosePctIndicator;
 
+fn period_param(indicator_key: &str, params: &HashMap<String, Param>) -> Result<i64, QuantError> {
+    Ok(params
+        .get("period")
+        .ok_or_else(|| {
+            IndicatorError::ParameterNotFound("period".to_string(), indicator_key.to_string())
+        })?
+        .value as i64)
+}
+
 impl Indicator for SmaClosePctIndicator {
     fn calculate(
         &self,
@@ -15,12 +26,7 @@ impl Indicator for SmaClosePctIndicator {
         indicator_key: &str,
         params: &HashMap<String, Param>,
     ) -> Result<Vec<Series>, QuantError> {
-        let period = params
-            .get("period")
-            .ok_or_else(|| {
-                IndicatorError::ParameterNotFound("period".to_string(), indicator_key.to_string())
-            })?
-            .value as i64;
+        let period = period_param(indicator_key, params)?;
 
         let mut config = SmaClosePctConfig::new(period);
         config.alias_name = indicator_key.to_string();
@@ -42,4 +48,20 @@ impl Indicator for SmaClosePctIndicator {
         // 中文注释：sma-close-pct 非预热段不允许中间空值。
         crate::backtest_engine::indicators::registry::WarmupMode::Strict
     }
+
+    fn sliceable(&self) -> bool {
+        true
+    }
+
+    fn create_state(
+        &self,
+        indicator_key: &str,
+        params: &HashMap<String, Param>,
+    ) -> Result<StreamingIndicator, QuantError> {
+        let state = SmaClosePctState::new(period_param(indicator_key, params)?)?;
+        Ok(StreamingIndicator::new(
+            vec![indicator_key.to_string()],
+            state,
+        ))
+    }
 }
@@ -2,8 +2,10 @@ mod config;
 mod expr;
 mod indicator;
 mod pipeline;
+mod state;
 
 pub use config::SmaClosePctConfig;
 pub use expr::sma_close_pct_expr;
 pub use indicator::SmaClosePctIndicator;
 pub use pipeline::sma_close_pct_eager;
+pub use state::SmaClosePctState;
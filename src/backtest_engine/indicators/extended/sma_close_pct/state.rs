@@ -0,0 +1,29 @@
+use crate::backtest_engine::indicators::sma::SmaState;
+use crate::backtest_engine::indicators::streaming::{Bar, IndicatorState};
+use crate::error::QuantError;
+
+/// 收盘价相对 SMA 偏离百分比的流式状态。
+#[derive(Debug, Clone)]
+pub struct SmaClosePctState {
+    sma: SmaState,
+}
+
+impl SmaClosePctState {
+    pub fn new(period: i64) -> Result<Self, QuantError> {
+        Ok(Self {
+            sma: SmaState::new(period)?,
+        })
+    }
+
+    /// 推进一根 K 线，返回 `(close - sma) / sma * 100`。
+    pub fn update(&mut self, close: f64) -> f64 {
+        let sma = self.sma.update(close);
+        (close - sma) / sma * 100.0
+    }
+}
+
+impl IndicatorState for SmaClosePctState {
+    fn update(&mut self, bar: &Bar) -> Vec<f64> {
+        vec![SmaClosePctState::update(self, bar.close)]
+    }
+}
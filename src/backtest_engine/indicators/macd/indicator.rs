@@ -1,6 +1,8 @@
 use super::super::registry::{require_resolved_param, Indicator};
 use super::config::MACDConfig;
 use super::pipeline::macd_eager;
+use super::state::MacdState;
+use crate::backtest_engine::indicators::streaming::StreamingIndicator;
 use crate::error::{IndicatorError, QuantError};
 use crate::types::Param;
 use polars::prelude::*;
@@ -8,6 +10,42 @@ use std::collections::HashMap;
 
 pub struct MacdIndicator;
 
+fn macd_periods(
+    indicator_key: &str,
+    param_map: &HashMap<String, Param>,
+) -> Result<(i64, i64, i64), QuantError> {
+    let fast_period = param_map
+        .get("fast_period")
+        .map(|param| param.value as i64)
+        .ok_or_else(|| {
+            IndicatorError::InvalidParameter(
+                indicator_key.to_string(),
+                "Missing or invalid 'fast_period' parameter".to_string(),
+            )
+        })?;
+
+    let slow_period = param_map
+        .get("slow_period")
+        .map(|param| param.value as i64)
+        .ok_or_else(|| {
+            IndicatorError::InvalidParameter(
+                indicator_key.to_string(),
+                "Missing or invalid 'slow_period' parameter".to_string(),
+            )
+        })?;
+
+    let signal_period = param_map
+        .get("signal_period")
+        .map(|param| param.value as i64)
+        .ok_or_else(|| {
+            IndicatorError::InvalidParameter(
+                indicator_key.to_string(),
+                "Missing or invalid 'signal_period' parameter".to_string(),
+            )
+        })?;
+    Ok((fast_period, slow_period, signal_period))
+}
+
 impl Indicator for MacdIndicator {
     fn calculate(
         &self,
@@ -15,35 +53,7 @@ impl Indicator for MacdIndicator {
         indicator_key: &str,
         param_map: &HashMap<String, Param>,
     ) -> Result<Vec<Series>, QuantError> {
-        let fast_period = param_map
-            .get("fast_period")
-            .map(|param| param.value as i64)
-            .ok_or_else(|| {
-                IndicatorError::InvalidParameter(
-                    indicator_key.to_string(),
-                    "Missing or invalid 'fast_period' parameter".to_string(),
-                )
-            })?;
-
-        let slow_period = param_map
-            .get("slow_period")
-            .map(|param| param.value as i64)
-            .ok_or_else(|| {
-                IndicatorError::InvalidParameter(
-                    indicator_key.to_string(),
-                    "Missing or invalid 'slow_period' parameter".to_string(),
-                )
-            })?;
-
-        let signal_period = param_map
-            .get("signal_period")
-            .map(|param| param.value as i64)
-            .ok_or_else(|| {
-                IndicatorError::InvalidParameter(
-                    indicator_key.to_string(),
-                    "Missing or invalid 'signal_period' parameter".to_string(),
-                )
-            })?;
+        let (fast_period, slow_period, signal_period) = macd_periods(indicator_key, param_map)?;
 
         let mut config = MACDConfig::new(fast_period, slow_period, signal_period);
         config.macd_alias = format!("{}_macd", indicator_key);
@@ -70,4 +80,25 @@ impl Indicator for MacdIndicator {
         // 中文注释：MACD 非预热段不允许中间空值。
         crate::backtest_engine::indicators::registry::WarmupMode::Strict
     }
+
+    fn sliceable(&self) -> bool {
+        false
+    }
+
+    fn create_state(
+        &self,
+        indicator_key: &str,
+        param_map: &HashMap<String, Param>,
+    ) -> Result<StreamingIndicator, QuantError> {
+        let (fast_period, slow_period, signal_period) = macd_periods(indicator_key, param_map)?;
+        let state = MacdState::new(fast_period, slow_period, signal_period)?;
+        Ok(StreamingIndicator::new(
+            vec![
+                format!("{}_macd", indicator_key),
+                format!("{}_hist", indicator_key),
+                format!("{}_signal", indicator_key),
+            ],
+            state,
+        ))
+    }
 }
@@ -2,8 +2,10 @@ mod config;
 mod expr;
 mod indicator;
 mod pipeline;
+mod state;
 
 pub use config::MACDConfig;
 pub use expr::macd_expr;
 pub use indicator::MacdIndicator;
 pub use pipeline::{macd_eager, macd_lazy};
+pub use state::{MacdOutput, MacdState};
@@ -0,0 +1,106 @@
+use crate::backtest_engine::indicators::ema::EmaState;
+use crate::backtest_engine::indicators::streaming::{Bar, IndicatorState};
+use crate::error::{IndicatorError, QuantError};
+
+/// 单行 MACD 输出。
+#[derive(Debug, Clone, Copy, PartialEq)]
+pub struct MacdOutput {
+    pub macd: f64,
+    pub signal: f64,
+    pub hist: f64,
+}
+
+/// MACD 流式状态。
+///
+/// 中文注释：与 `macd_lazy` 一致——快慢 EMA 都在第 slow-1 行完成 SMA 种子
+/// （快线种子窗口向后对齐到 [slow-fast, slow-1]），信号线在 MACD 首个有效行后
+/// 再累积 signal 行做种子；三条输出统一屏蔽到第 slow+signal-2 行之前。
+#[derive(Debug, Clone)]
+pub struct MacdState {
+    fast_offset: usize,
+    slow_lookback: usize,
+    total_lookback: usize,
+    index: usize,
+    fast: EmaState,
+    slow: EmaState,
+    signal: EmaState,
+}
+
+impl MacdState {
+    pub fn new(fast_period: i64, slow_period: i64, signal_period: i64) -> Result<Self, QuantError> {
+        for (value, label) in [
+            (fast_period, "Fast period must be positive"),
+            (slow_period, "Slow period must be positive"),
+            (signal_period, "Signal period must be positive"),
+        ] {
+            if value <= 0 {
+                return Err(IndicatorError::InvalidParameter(
+                    "macd".to_string(),
+                    label.to_string(),
+                )
+                .into());
+            }
+        }
+
+        let (fast_period, slow_period) = if slow_period < fast_period {
+            (slow_period, fast_period)
+        } else {
+            (fast_period, slow_period)
+        };
+        let slow_lookback = (slow_period - 1) as usize;
+
+        Ok(Self {
+            fast_offset: (slow_period - fast_period) as usize,
+            slow_lookback,
+            total_lookback: slow_lookback + (signal_period - 1) as usize,
+            index: 0,
+            fast: EmaState::new(fast_period)?,
+            slow: EmaState::new(slow_period)?,
+            signal: EmaState::new(signal_period)?,
+        })
+    }
+
+    /// 推进一根 K 线。
+    pub fn update(&mut self, close: f64) -> MacdOutput {
+        let i = self.index;
+        self.index += 1;
+
+        let fast = if i >= self.fast_offset {
+            self.fast.update(close)
+        } else {
+            f64::NAN
+        };
+        let slow = self.slow.update(close);
+
+        if i < self.slow_lookback {
+            return MacdOutput {
+                macd: f64::NAN,
+                signal: f64::NAN,
+                hist: f64::NAN,
+            };
+        }
+        let macd = fast - slow;
+        let signal = self.signal.update(macd);
+
+        if i < self.total_lookback {
+            return MacdOutput {
+                macd: f64::NAN,
+                signal: f64::NAN,
+                hist: f64::NAN,
+            };
+        }
+        MacdOutput {
+            macd,
+            signal,
+            hist: macd - signal,
+        }
+    }
+}
+
+impl IndicatorState for MacdState {
+    fn update(&mut self, bar: &Bar) -> Vec<f64> {
+        let output = MacdState::update(self, bar.close);
+        // 中文注释：与 `MacdIndicator::calculate` 的输出顺序一致：macd, hist, signal。
+        vec![output.macd, output.hist, output.signal]
+    }
+}
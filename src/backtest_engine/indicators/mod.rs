@@ -7,10 +7,12 @@ pub mod contracts;
 pub mod ema;
 pub mod er;
 pub mod macd;
+pub mod precomputed;
 pub mod psar;
 pub mod rma;
 pub mod rsi;
 pub mod sma;
+pub mod streaming;
 pub mod tr;
 pub mod utils;
 
@@ -24,32 +26,45 @@ use crate::types::{
     DataPack, IndicatorContract, IndicatorContractReport, IndicatorResults, IndicatorsParams, Param,
 };
 
+use crate::backtest_engine::utils::inner_parallelism_available;
 use crate::error::{IndicatorError, QuantError};
 use polars::prelude::*;
 use pyo3::prelude::*;
 use pyo3::IntoPyObject;
 use pyo3_polars::PyDataFrame;
+use rayon::prelude::*;
 use std::collections::HashMap;
 
-/// 计算单个周期的指标 (已重构)
-pub fn calculate_single_period_indicators(
-    ohlcv_df: &DataFrame,
+/// 按指标键排序的指标实例列表。
+///
+/// 中文注释：参数是 HashMap，每次提取都有独立的随机哈希种子；按键排序后输出列顺序
+/// 与遍历顺序、串行/并行路径都无关。
+pub(crate) fn sorted_indicator_instances(
     period_params: &HashMap<String, HashMap<String, Param>>,
-) -> Result<DataFrame, QuantError> {
+) -> Vec<(&String, &HashMap<String, Param>)> {
+    let mut instances: Vec<_> = period_params.iter().collect();
+    instances.sort_unstable_by(|a, b| a.0.cmp(b.0));
+    instances
+}
+
+/// 计算单个指标实例，返回该实例输出的全部列。
+fn calculate_indicator_instance(
+    ohlcv_df: &DataFrame,
+    indicator_key: &str,
+    param_map: &HashMap<String, Param>,
+) -> Result<Vec<Series>, QuantError> {
     let registry = get_indicator_registry();
-    let mut all_series: Vec<Series> = Vec::new();
+    let base_name = indicator_key.split('_').next().unwrap_or(indicator_key);
 
-    for (indicator_key, param_map) in period_params {
-        let base_name = indicator_key.split('_').next().unwrap_or(indicator_key);
+    let indicator = registry.get(base_name).ok_or_else(|| {
+        IndicatorError::NotImplemented(format!("Indicator '{}' is not supported.", base_name))
+    })?;
 
-        let indicator = registry.get(base_name).ok_or_else(|| {
-            IndicatorError::NotImplemented(format!("Indicator '{}' is not supported.", base_name))
-        })?;
-
-        let mut calculated_series = indicator.calculate(ohlcv_df, indicator_key, param_map)?;
-        all_series.append(&mut calculated_series);
-    }
+    indicator.calculate(ohlcv_df, indicator_key, param_map)
+}
 
+/// 把单个 source 的全部指标列拼成 DataFrame。
+fn assemble_indicator_frame(all_series: Vec<Series>) -> Result<DataFrame, QuantError> {
     if all_series.is_empty() {
         Ok(DataFrame::empty())
     } else {
@@ -58,22 +73,57 @@ pub fn calculate_single_period_indicators(
     }
 }
 
+/// 计算单个周期的指标 (已重构)
+pub fn calculate_single_period_indicators(
+    ohlcv_df: &DataFrame,
+    period_params: &HashMap<String, HashMap<String, Param>>,
+) -> Result<DataFrame, QuantError> {
+    let mut all_series: Vec<Series> = Vec::new();
+
+    for (indicator_key, param_map) in sorted_indicator_instances(period_params) {
+        let mut calculated_series =
+            calculate_indicator_instance(ohlcv_df, indicator_key, param_map)?;
+        all_series.append(&mut calculated_series);
+    }
+
+    assemble_indicator_frame(all_series)
+}
+
 /// 计算多周期指标
 /// 对每个数据源的每个周期分别计算指标,返回 IndicatorResults
+///
+/// 中文注释：自适应并行。外层没有任务级并行时（单回测、WF test 回放），
+/// 按 (source, indicator) 对展开并行；在 `process_param_in_single_thread`
+/// 内部调用时线程池只有 1 个线程，保持原有串行路径。
 pub fn calculate_indicators(
     processed_data: &DataPack,
     indicators_params: &IndicatorsParams,
+) -> Result<IndicatorResults, QuantError> {
+    let total_instances: usize = indicators_params.values().map(|group| group.len()).sum();
+    if total_instances > 1 && inner_parallelism_available() {
+        calculate_indicators_parallel(processed_data, indicators_params)
+    } else {
+        calculate_indicators_sequential(processed_data, indicators_params)
+    }
+}
+
+fn get_source_data<'a>(
+    processed_data: &'a DataPack,
+    source_name: &str,
+) -> Result<&'a DataFrame, QuantError> {
+    processed_data.source.get(source_name).ok_or_else(|| {
+        QuantError::Indicator(IndicatorError::DataSourceNotFound(source_name.to_string()))
+    })
+}
+
+fn calculate_indicators_sequential(
+    processed_data: &DataPack,
+    indicators_params: &IndicatorsParams,
 ) -> Result<IndicatorResults, QuantError> {
     let mut all_indicators: IndicatorResults = HashMap::new();
 
     for (source_name, mtf_indicator_params) in indicators_params.iter() {
-        let source_data = processed_data
-            .source
-            .get(source_name.as_str())
-            .ok_or_else(|| {
-                QuantError::Indicator(IndicatorError::DataSourceNotFound(source_name.to_string()))
-            })?;
-
+        let source_data = get_source_data(processed_data, source_name)?;
         let indicators_df = calculate_single_period_indicators(source_data, mtf_indicator_params)?;
         all_indicators.insert(source_name.clone(), indicators_df);
     }
@@ -81,17 +131,49 @@ pub fn calculate_indicators(
     Ok(all_indicators)
 }
 
+fn calculate_indicators_parallel(
+    processed_data: &DataPack,
+    indicators_params: &IndicatorsParams,
+) -> Result<IndicatorResults, QuantError> {
+    // 中文注释：任务顺序与串行路径一致（按指标键排序），保证输出列顺序不变。
+    let mut tasks: Vec<(usize, &DataFrame, &String, &HashMap<String, Param>)> = Vec::new();
+    let mut source_names: Vec<&String> = Vec::with_capacity(indicators_params.len());
+    for (source_name, mtf_indicator_params) in indicators_params.iter() {
+        let source_data = get_source_data(processed_data, source_name)?;
+        let source_idx = source_names.len();
+        source_names.push(source_name);
+        for (indicator_key, param_map) in sorted_indicator_instances(mtf_indicator_params) {
+            tasks.push((source_idx, source_data, indicator_key, param_map));
+        }
+    }
+
+    let task_results: Vec<(usize, Vec<Series>)> = tasks
+        .into_par_iter()
+        .map(|(source_idx, source_data, indicator_key, param_map)| {
+            calculate_indicator_instance(source_data, indicator_key, param_map)
+                .map(|series| (source_idx, series))
+        })
+        .collect::<Result<Vec<_>, QuantError>>()?;
+
+    let mut series_by_source: Vec<Vec<Series>> = vec![Vec::new(); source_names.len()];
+    for (source_idx, mut series) in task_results {
+        series_by_source[source_idx].append(&mut series);
+    }
+
+    let mut all_indicators: IndicatorResults = HashMap::new();
+    for (source_name, all_series) in source_names.into_iter().zip(series_by_source) {
+        all_indicators.insert(source_name.clone(), assemble_indicator_frame(all_series)?);
+    }
+
+    Ok(all_indicators)
+}
+
 use pyo3_stub_gen::derive::*;
 
-#[gen_stub_pyfunction(module = "pyo3_quant.backtest_engine.indicators")]
-#[pyfunction(name = "calculate_indicators")]
-pub fn py_calculate_indicators(
+fn indicator_results_into_py(
     py: Python<'_>,
-    processed_data: DataPack,
-    indicators_params: IndicatorsParams,
+    result_map: IndicatorResults,
 ) -> PyResult<HashMap<String, Py<PyAny>>> {
-    let result_map = calculate_indicators(&processed_data, &indicators_params)?;
-
     let mut py_result_map = HashMap::new();
     for (k, v) in result_map {
         let py_obj = PyDataFrame(v).into_pyobject(py).map_err(|e| {
@@ -106,6 +188,17 @@ pub fn py_calculate_indicators(
     Ok(py_result_map)
 }
 
+#[gen_stub_pyfunction(module = "pyo3_quant.backtest_engine.indicators")]
+#[pyfunction(name = "calculate_indicators")]
+pub fn py_calculate_indicators(
+    py: Python<'_>,
+    processed_data: DataPack,
+    indicators_params: IndicatorsParams,
+) -> PyResult<HashMap<String, Py<PyAny>>> {
+    let result_map = calculate_indicators(&processed_data, &indicators_params)?;
+    indicator_results_into_py(py, result_map)
+}
+
 /// 计算并返回指标契约聚合结果（供 Python/WF 预检消费）。
 #[gen_stub_pyfunction(module = "pyo3_quant.backtest_engine.indicators")]
 #[pyfunction(name = "resolve_indicator_contracts")]
@@ -0,0 +1,414 @@
+//! 全量预计算、按窗口切片复用的指标缓存。
+//!
+//! 中文注释：WF 相邻窗口大段重叠，同一组指标参数在每个窗口、每次试验上都会重算一遍。
+//! 对声明 `sliceable` 的指标，这里在完整 DataPack 上按 (source, 指标实例, 参数值) 只算一次，
+//! 之后任意由该 DataPack 切出的子 pack 都按时间定位偏移、零拷贝切片取用；
+//! 非 sliceable 指标（EMA / RMA / PSAR / ADX 等递推指标）的值依赖起算行，无法从全量序列切出，
+//! 改为按 (指标实例, 参数值, 子 pack 起始行, 行数) 缓存子 pack 上的直接计算结果：
+//! 同一窗口内各试验与测试段评估命中同一切片时直接复用，与逐窗计算逐值一致。
+//!
+//! 中文注释：全量序列在窗口开头的预热行上已有真实值，而窗口直接计算时这些行是空值；
+//! 切片时按全量序列的前导空值行数把窗口开头同样置空，保证两条路径整列一致。
+
+use super::registry::get_indicator_registry;
+use super::{assemble_indicator_frame, calculate_indicator_instance, sorted_indicator_instances};
+use crate::backtest_engine::data_ops::extract_time_values;
+use crate::error::{IndicatorError, QuantError};
+use crate::types::{DataPack, IndicatorResults, IndicatorsParams, Param};
+use polars::prelude::*;
+use std::collections::HashMap;
+use std::sync::RwLock;
+
+/// 缓存条目上限；超出后新组合退回子 pack 直接计算，避免连续参数把内存撑满。
+const MAX_CACHED_INSTANCES: usize = 4096;
+
+/// (source, 指标实例 key, 按参数名排序的参数值位模式)
+type CacheKey = (String, String, Vec<(String, u64)>);
+
+/// 非 sliceable 指标的切片缓存键：(CacheKey, 子 pack 在完整 source 中的起始行, 行数)
+type WindowCacheKey = (CacheKey, usize, usize);
+
+fn cache_key(
+    source_name: &str,
+    indicator_key: &str,
+    param_map: &HashMap<String, Param>,
+) -> CacheKey {
+    let mut values = param_map
+        .iter()
+        .map(|(name, param)| (name.clone(), param.value.to_bits()))
+        .collect::<Vec<_>>();
+    values.sort_unstable();
+    (source_name.to_string(), indicator_key.to_string(), values)
+}
+
+fn is_sliceable(indicator_key: &str) -> Result<bool, QuantError> {
+    let base_name = indicator_key.split('_').next().unwrap_or(indicator_key);
+    let indicator = get_indicator_registry().get(base_name).ok_or_else(|| {
+        IndicatorError::NotImplemented(format!("Indicator '{}' is not supported.", base_name))
+    })?;
+    Ok(indicator.sliceable())
+}
+
+/// 绑定一个完整 DataPack 的指标缓存，生命周期与一次 WF 运行相同。
+pub struct PrecomputedIndicators<'a> {
+    full: &'a DataPack,
+    times: HashMap<String, Vec<i64>>,
+    series: RwLock<HashMap<CacheKey, Vec<CachedSeries>>>,
+    window_series: RwLock<HashMap<WindowCacheKey, Vec<Series>>>,
+}
+
+/// 全量指标列及其前导空值（预热）行数。
+#[derive(Clone)]
+struct CachedSeries {
+    series: Series,
+    warmup: usize,
+}
+
+impl CachedSeries {
+    fn new(series: Series) -> Self {
+        let warmup = match series.f64() {
+            Ok(values) => values
+                .iter()
+                .take_while(|v| v.map_or(true, f64::is_nan))
+                .count(),
+            Err(_) => series
+                .is_null()
+                .iter()
+                .take_while(|v| *v == Some(true))
+                .count(),
+        };
+        Self { series, warmup }
+    }
+
+    /// 切出窗口 [offset, offset + height)，并把前 warmup 行替换为全量序列的预热空值，
+    /// 与直接在窗口上计算的结果逐行一致。
+    fn window(&self, offset: usize, height: usize) -> Result<Series, QuantError> {
+        let masked = self.warmup.min(height);
+        if masked == 0 || offset == 0 {
+            return Ok(self.series.slice(offset as i64, height));
+        }
+        let mut window = self.series.slice(0, masked);
+        window.append(&self.series.slice((offset + masked) as i64, height - masked))?;
+        Ok(window)
+    }
+}
+
+impl<'a> PrecomputedIndicators<'a> {
+    pub fn new(full: &'a DataPack) -> Result<Self, QuantError> {
+        let times = full
+            .source
+            .iter()
+            .map(|(key, df)| extract_time_values(df, key).map(|values| (key.clone(), values)))
+            .collect::<Result<HashMap<_, _>, _>>()?;
+        Ok(Self {
+            full,
+            times,
+            series: RwLock::new(HashMap::new()),
+            window_series: RwLock::new(HashMap::new()),
+        })
+    }
+
+    /// 已缓存的全量指标实例数。
+    pub fn len(&self) -> usize {
+        self.series.read().map(|map| map.len()).unwrap_or(0)
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.len() == 0
+    }
+
+    /// 已缓存的非 sliceable 指标切片数。
+    pub fn window_len(&self) -> usize {
+        self.window_series.read().map(|map| map.len()).unwrap_or(0)
+    }
+
+    /// 子 pack 某个 source 在完整 source 中的起始行；无法对齐时返回 None。
+    fn source_offset(&self, source_name: &str, window_df: &DataFrame) -> Option<usize> {
+        let full_times = self.times.get(source_name)?;
+        let window_times = window_df.column("time").ok()?.i64().ok()?;
+        let first = window_times.get(0)?;
+        let last = window_times.get(window_df.height() - 1)?;
+        let offset = full_times.binary_search(&first).ok()?;
+        let end = offset + window_df.height();
+        (end <= full_times.len() && full_times[end - 1] == last).then_some(offset)
+    }
+
+    /// 取完整 source 上的指标实例输出，未命中时计算并入表。
+    fn full_instance(
+        &self,
+        source_name: &str,
+        indicator_key: &str,
+        param_map: &HashMap<String, Param>,
+    ) -> Result<Option<Vec<CachedSeries>>, QuantError> {
+        let key = cache_key(source_name, indicator_key, param_map);
+        if let Some(hit) = self
+            .series
+            .read()
+            .ok()
+            .and_then(|map| map.get(&key).cloned())
+        {
+            return Ok(Some(hit));
+        }
+        if self.len() >= MAX_CACHED_INSTANCES {
+            return Ok(None);
+        }
+
+        let full_df = self.full.source.get(source_name).ok_or_else(|| {
+            QuantError::Indicator(IndicatorError::DataSourceNotFound(source_name.to_string()))
+        })?;
+        // 中文注释：锁外计算；并发试验偶尔重复计算同一组合，结果一致，先到者入表。
+        let computed = calculate_indicator_instance(full_df, indicator_key, param_map)?
+            .into_iter()
+            .map(CachedSeries::new)
+            .collect::<Vec<_>>();
+        if let Ok(mut map) = self.series.write() {
+            map.entry(key).or_insert_with(|| computed.clone());
+        }
+        Ok(Some(computed))
+    }
+
+    /// 取子 pack 切片上的非 sliceable 指标输出，未命中时在子 pack 上直接计算并入表。
+    fn window_instance(
+        &self,
+        window_df: &DataFrame,
+        source_name: &str,
+        indicator_key: &str,
+        param_map: &HashMap<String, Param>,
+        offset: usize,
+    ) -> Result<Vec<Series>, QuantError> {
+        let key = (
+            cache_key(source_name, indicator_key, param_map),
+            offset,
+            window_df.height(),
+        );
+        if let Some(hit) = self
+            .window_series
+            .read()
+            .ok()
+            .and_then(|map| map.get(&key).cloned())
+        {
+            return Ok(hit);
+        }
+
+        let computed = calculate_indicator_instance(window_df, indicator_key, param_map)?;
+        if let Ok(mut map) = self.window_series.write() {
+            // 中文注释：窗口向前滚动后旧切片不会再命中，超出上限时整体清空即可。
+            if map.len() >= MAX_CACHED_INSTANCES {
+                map.clear();
+            }
+            map.entry(key).or_insert_with(|| computed.clone());
+        }
+        Ok(computed)
+    }
+
+    /// 计算子 pack 的多周期指标：sliceable 指标取全量缓存切片，其余取子 pack 切片缓存。
+    pub fn calculate(
+        &self,
+        data: &DataPack,
+        indicators_params: &IndicatorsParams,
+    ) -> Result<IndicatorResults, QuantError> {
+        let mut all_indicators: IndicatorResults = HashMap::new();
+
+        for (source_name, mtf_indicator_params) in indicators_params.iter() {
+            let window_df = data.source.get(source_name.as_str()).ok_or_else(|| {
+                QuantError::Indicator(IndicatorError::DataSourceNotFound(source_name.to_string()))
+            })?;
+            let offset = self.source_offset(source_name, window_df);
+            let height = window_df.height();
+            let mut all_series: Vec<Series> = Vec::new();
+
+            for (indicator_key, param_map) in sorted_indicator_instances(mtf_indicator_params) {
+                let cached = match offset {
+                    Some(offset) if is_sliceable(indicator_key)? => self
+                        .full_instance(source_name, indicator_key, param_map)?
+                        .map(|series| {
+                            series
+                                .iter()
+                                .map(|s| s.window(offset, height))
+                                .collect::<Result<Vec<_>, _>>()
+                        })
+                        .transpose()?,
+                    _ => None,
+                };
+                let mut calculated = match (cached, offset) {
+                    (Some(series), _) => series,
+                    (None, Some(offset)) => self.window_instance(
+                        window_df,
+                        source_name,
+                        indicator_key,
+                        param_map,
+                        offset,
+                    )?,
+                    (None, None) => {
+                        calculate_indicator_instance(window_df, indicator_key, param_map)?
+                    }
+                };
+                all_series.append(&mut calculated);
+            }
+
+            all_indicators.insert(source_name.clone(), assemble_indicator_frame(all_series)?);
+        }
+
+        Ok(all_indicators)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::backtest_engine::data_ops::{
+        build_data_pack, derive_slice_indices_from_data_pack, slice_data_pack_by_base_window,
+    };
+    use crate::backtest_engine::indicators::calculate_indicators;
+    use crate::types::{ParamType, SourceRange};
+
+    const N: usize = 240;
+
+    fn full_pack() -> DataPack {
+        let close: Vec<f64> = (0..N)
+            .map(|i| 100.0 + (i as f64 * 0.21).sin() * 4.0 + (i as f64 * 0.05).cos() * 2.0)
+            .collect();
+        let df = DataFrame::new(vec![
+            Series::new(
+                "time".into(),
+                (0..N as i64).map(|i| i * 60_000).collect::<Vec<_>>(),
+            )
+            .into(),
+            Series::new("open".into(), close.clone()).into(),
+            Series::new(
+                "high".into(),
+                close.iter().map(|c| c + 1.0).collect::<Vec<_>>(),
+            )
+            .into(),
+            Series::new(
+                "low".into(),
+                close.iter().map(|c| c - 1.0).collect::<Vec<_>>(),
+            )
+            .into(),
+            Series::new("close".into(), close).into(),
+            Series::new("volume".into(), vec![1.0; N]).into(),
+        ])
+        .expect("ohlcv frame 应成功");
+        build_data_pack(
+            HashMap::from([("ohlcv_1m".to_string(), df)]),
+            "ohlcv_1m".to_string(),
+            HashMap::from([("ohlcv_1m".to_string(), SourceRange::new(0, N, N))]),
+            None,
+        )
+        .expect("DataPack 构建应成功")
+    }
+
+    fn params(period: f64) -> IndicatorsParams {
+        let param = Param::new(
+            period,
+            None,
+            None,
+            Some(ParamType::Integer),
+            false,
+            false,
+            1.0,
+        );
+        HashMap::from([(
+            "ohlcv_1m".to_string(),
+            HashMap::from([
+                (
+                    "sma_0".to_string(),
+                    HashMap::from([("period".to_string(), param.clone())]),
+                ),
+                (
+                    "ema_0".to_string(),
+                    HashMap::from([("period".to_string(), param)]),
+                ),
+            ]),
+        )])
+    }
+
+    #[test]
+    fn test_sliced_window_matches_direct_calculation() {
+        let full = full_pack();
+        let cache = PrecomputedIndicators::new(&full).expect("缓存构建应成功");
+        let indices = derive_slice_indices_from_data_pack(&full, 60, 120).expect("切片索引");
+        let window = slice_data_pack_by_base_window(&full, &indices).expect("窗口切片");
+        let params = params(20.0);
+
+        let cached = cache.calculate(&window, &params).expect("缓存路径");
+        let direct = calculate_indicators(&window, &params).expect("直接路径");
+        assert_eq!(cache.len(), 1, "只有 sliceable 的 sma 进入缓存");
+
+        let cached_df = &cached["ohlcv_1m"];
+        let direct_df = &direct["ohlcv_1m"];
+        assert_eq!(cached_df.height(), window.mapping.height());
+        let column = |df: &DataFrame, name: &str| -> Vec<f64> {
+            df.column(name)
+                .expect("指标列")
+                .f64()
+                .expect("f64 列")
+                .into_iter()
+                .map(|v| v.unwrap_or(f64::NAN))
+                .collect()
+        };
+        // 中文注释：sma 切片后预热（period - 1 行）同样为空，整列一致；ema 走子 pack 切片缓存。
+        for name in ["sma_0", "ema_0"] {
+            let (cached, direct) = (column(cached_df, name), column(direct_df, name));
+            for (c, d) in cached.iter().zip(&direct) {
+                assert!((c.is_nan() && d.is_nan()) || (c - d).abs() < 1e-12);
+            }
+        }
+        assert!(column(cached_df, "sma_0")[..19].iter().all(|v| v.is_nan()));
+
+        // 同一参数在另一窗口复用缓存，不新增条目。
+        let indices = derive_slice_indices_from_data_pack(&full, 100, 120).expect("切片索引");
+        let window = slice_data_pack_by_base_window(&full, &indices).expect("窗口切片");
+        cache.calculate(&window, &params).expect("缓存路径");
+        assert_eq!(cache.len(), 1);
+    }
+
+    fn param(value: f64) -> Param {
+        Param::new(value, None, None, Some(ParamType::Float), false, false, 1.0)
+    }
+
+    #[test]
+    fn test_stateful_indicators_reuse_window_slices() {
+        let full = full_pack();
+        let cache = PrecomputedIndicators::new(&full).expect("缓存构建应成功");
+        let params: IndicatorsParams = HashMap::from([(
+            "ohlcv_1m".to_string(),
+            HashMap::from([
+                (
+                    "ema_0".to_string(),
+                    HashMap::from([("period".to_string(), param(14.0))]),
+                ),
+                (
+                    "rma_0".to_string(),
+                    HashMap::from([("period".to_string(), param(14.0))]),
+                ),
+                (
+                    "adx_0".to_string(),
+                    HashMap::from([("period".to_string(), param(14.0))]),
+                ),
+                (
+                    "psar_0".to_string(),
+                    HashMap::from([
+                        ("af0".to_string(), param(0.02)),
+                        ("af_step".to_string(), param(0.02)),
+                        ("max_af".to_string(), param(0.2)),
+                    ]),
+                ),
+            ]),
+        )]);
+
+        // 中文注释：两个重叠窗口各自从窗口首行起算，切片缓存必须与逐窗直接计算逐值一致。
+        for (warmup, active) in [(60, 120), (100, 120)] {
+            let indices =
+                derive_slice_indices_from_data_pack(&full, warmup, active).expect("切片索引");
+            let window = slice_data_pack_by_base_window(&full, &indices).expect("窗口切片");
+            let direct = calculate_indicators(&window, &params).expect("直接路径");
+            for _ in 0..2 {
+                let cached = cache.calculate(&window, &params).expect("缓存路径");
+                assert!(cached["ohlcv_1m"].equals_missing(&direct["ohlcv_1m"]));
+            }
+        }
+        assert_eq!(cache.len(), 0, "递推指标不进入全量缓存");
+        assert_eq!(cache.window_len(), 8, "每个窗口每个指标实例只计算一次");
+    }
+}
@@ -6,9 +6,36 @@ use std::collections::HashMap;
 
 use super::config::PSARConfig;
 use super::pipeline::psar_eager;
+use super::state::PsarIndicatorState;
+use crate::backtest_engine::indicators::streaming::StreamingIndicator;
 
 pub struct PsarIndicator;
 
+fn psar_params(
+    indicator_key: &str,
+    params: &HashMap<String, Param>,
+) -> Result<(f64, f64, f64), QuantError> {
+    let af0 = params
+        .get("af0")
+        .ok_or_else(|| {
+            IndicatorError::ParameterNotFound("af0".to_string(), indicator_key.to_string())
+        })?
+        .value;
+    let af_step = params
+        .get("af_step")
+        .ok_or_else(|| {
+            IndicatorError::ParameterNotFound("af_step".to_string(), indicator_key.to_string())
+        })?
+        .value;
+    let max_af = params
+        .get("max_af")
+        .ok_or_else(|| {
+            IndicatorError::ParameterNotFound("max_af".to_string(), indicator_key.to_string())
+        })?
+        .value;
+    Ok((af0, af_step, max_af))
+}
+
 pub(crate) fn psar_required_warmup_bars() -> usize {
     2
 }
@@ -20,24 +47,7 @@ impl Indicator for PsarIndicator {
         indicator_key: &str,
         params: &HashMap<String, Param>,
     ) -> Result<Vec<Series>, QuantError> {
-        let af0 = params
-            .get("af0")
-            .ok_or_else(|| {
-                IndicatorError::ParameterNotFound("af0".to_string(), indicator_key.to_string())
-            })?
-            .value;
-        let af_step = params
-            .get("af_step")
-            .ok_or_else(|| {
-                IndicatorError::ParameterNotFound("af_step".to_string(), indicator_key.to_string())
-            })?
-            .value;
-        let max_af = params
-            .get("max_af")
-            .ok_or_else(|| {
-                IndicatorError::ParameterNotFound("max_af".to_string(), indicator_key.to_string())
-            })?
-            .value;
+        let (af0, af_step, max_af) = psar_params(indicator_key, params)?;
 
         let config = PSARConfig::new(af0, af_step, max_af);
         let result_df = psar_eager(ohlcv_df, &config)?;
@@ -87,4 +97,23 @@ impl Indicator for PsarIndicator {
     fn warmup_mode(&self) -> WarmupMode {
         WarmupMode::Relaxed
     }
+
+    fn sliceable(&self) -> bool {
+        false
+    }
+
+    fn create_state(
+        &self,
+        indicator_key: &str,
+        params: &HashMap<String, Param>,
+    ) -> Result<StreamingIndicator, QuantError> {
+        let (af0, af_step, max_af) = psar_params(indicator_key, params)?;
+        Ok(StreamingIndicator::new(
+            ["long", "short", "af", "reversal"]
+                .iter()
+                .map(|suffix| format!("{}_{}", indicator_key, suffix))
+                .collect(),
+            PsarIndicatorState::new(af0, af_step, max_af),
+        ))
+    }
 }
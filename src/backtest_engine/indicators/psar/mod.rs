@@ -3,9 +3,11 @@ mod expr;
 mod indicator;
 mod pipeline;
 pub(crate) mod psar_core;
+mod state;
 
 pub use config::PSARConfig;
 pub use expr::{psar_expr, psar_lazy};
 pub(crate) use indicator::psar_required_warmup_bars;
 pub use indicator::PsarIndicator;
 pub use pipeline::psar_eager;
+pub use state::{PsarIndicatorState, PsarOutput};
@@ -0,0 +1,115 @@
+use super::psar_core::{psar_first_iteration, psar_update, ForceDirection, PsarState};
+use crate::backtest_engine::indicators::streaming::{Bar, IndicatorState};
+
+/// 单行 PSAR 输出，字段顺序与批量输出列一致。
+#[derive(Debug, Clone, Copy, PartialEq)]
+pub struct PsarOutput {
+    pub long: f64,
+    pub short: f64,
+    pub af: f64,
+    pub reversal: f64,
+}
+
+/// PSAR 逐行递推状态。
+///
+/// 中文注释：逐行复用 `psar_core` 的首轮 / 常规迭代，
+/// 与 `psar_expr` 的批量循环逐行等价。
+#[derive(Debug, Clone)]
+pub struct PsarIndicatorState {
+    af0: f64,
+    af_step: f64,
+    max_af: f64,
+    bars_seen: usize,
+    prev_high: f64,
+    prev_low: f64,
+    prev_close: f64,
+    core: Option<PsarState>,
+    halted: bool,
+}
+
+impl PsarIndicatorState {
+    pub fn new(af0: f64, af_step: f64, max_af: f64) -> Self {
+        Self {
+            af0,
+            af_step,
+            max_af,
+            bars_seen: 0,
+            prev_high: f64::NAN,
+            prev_low: f64::NAN,
+            prev_close: f64::NAN,
+            core: None,
+            halted: false,
+        }
+    }
+
+    /// 推进一根 K 线。
+    pub fn update(&mut self, high: f64, low: f64, close: f64) -> PsarOutput {
+        let output = if self.bars_seen == 0 {
+            PsarOutput {
+                long: f64::NAN,
+                short: f64::NAN,
+                af: self.af0,
+                reversal: 0.0,
+            }
+        } else if self.halted {
+            PsarOutput {
+                long: f64::NAN,
+                short: f64::NAN,
+                af: f64::NAN,
+                reversal: 0.0,
+            }
+        } else if let Some(core) = self.core {
+            let (next, long, short, reversal) = psar_update(
+                &core,
+                high,
+                low,
+                self.prev_high,
+                self.prev_low,
+                self.af_step,
+                self.max_af,
+                None,
+            );
+            self.core = Some(next);
+            PsarOutput {
+                long,
+                short,
+                af: next.current_af,
+                reversal,
+            }
+        } else {
+            let (first, long, short, reversal) = psar_first_iteration(
+                self.prev_high,
+                high,
+                self.prev_low,
+                low,
+                self.prev_close,
+                ForceDirection::Auto,
+                self.af0,
+                self.af_step,
+                self.max_af,
+            );
+            // 中文注释：与批量实现一致，首轮结果为 NaN 时后续全部保持空输出。
+            self.halted = first.current_psar.is_nan();
+            self.core = Some(first);
+            PsarOutput {
+                long,
+                short,
+                af: first.current_af,
+                reversal,
+            }
+        };
+
+        self.prev_high = high;
+        self.prev_low = low;
+        self.prev_close = close;
+        self.bars_seen += 1;
+        output
+    }
+}
+
+impl IndicatorState for PsarIndicatorState {
+    fn update(&mut self, bar: &Bar) -> Vec<f64> {
+        let output = PsarIndicatorState::update(self, bar.high, bar.low, bar.close);
+        vec![output.long, output.short, output.af, output.reversal]
+    }
+}
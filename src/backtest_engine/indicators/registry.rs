@@ -15,6 +15,7 @@ use super::psar::PsarIndicator;
 use super::rma::RmaIndicator;
 use super::rsi::RsiIndicator;
 use super::sma::SmaIndicator;
+use super::streaming::StreamingIndicator;
 use super::tr::TrIndicator;
 use crate::error::{IndicatorError, QuantError};
 use crate::types::Param;
@@ -48,6 +49,18 @@ pub trait Indicator: Send + Sync {
     /// 返回该指标的运行时校验模式。
     /// 中文注释：强约束要求每个指标必须显式声明，禁止依赖默认实现。
     fn warmup_mode(&self) -> WarmupMode;
+
+    /// 在全量序列上计算后按窗口切片，active 段是否与直接在窗口数据上计算逐值一致。
+    /// 中文注释：只有回看长度有界（滚动窗口类）的指标可以声明 true；
+    /// 递推类指标的输出依赖序列起点，切片复用会改变 active 段数值，必须声明 false。
+    fn sliceable(&self) -> bool;
+
+    /// 创建与 `calculate` 逐行等价的流式状态（实盘 / 扫描器增量推进用）。
+    fn create_state(
+        &self,
+        indicator_key: &str,
+        params: &HashMap<String, Param>,
+    ) -> Result<StreamingIndicator, QuantError>;
 }
 
 /// 指标注册表类型别名
@@ -1,6 +1,8 @@
 use super::super::registry::{require_resolved_param, Indicator};
 use super::config::RMAConfig;
 use super::pipeline::rma_eager;
+use super::state::RmaState;
+use crate::backtest_engine::indicators::streaming::StreamingIndicator;
 use crate::error::{IndicatorError, QuantError};
 use crate::types::Param;
 use polars::prelude::*;
@@ -8,6 +10,22 @@ use std::collections::HashMap;
 
 pub struct RmaIndicator;
 
+fn period_param(
+    indicator_key: &str,
+    param_map: &HashMap<String, Param>,
+) -> Result<i64, QuantError> {
+    let period = param_map
+        .get("period")
+        .map(|p| p.value as i64)
+        .ok_or_else(|| {
+            IndicatorError::InvalidParameter(
+                indicator_key.to_string(),
+                "Missing or invalid 'period' parameter".to_string(),
+            )
+        })?;
+    Ok(period)
+}
+
 impl Indicator for RmaIndicator {
     fn calculate(
         &self,
@@ -15,16 +33,7 @@ impl Indicator for RmaIndicator {
         indicator_key: &str,
         param_map: &HashMap<String, Param>,
     ) -> Result<Vec<Series>, QuantError> {
-        let period = param_map
-            .get("period")
-            .map(|p| p.value as i64)
-            .ok_or_else(|| {
-                IndicatorError::InvalidParameter(
-                    indicator_key.to_string(),
-                    "Missing or invalid 'period' parameter".to_string(),
-                )
-            })?;
-
+        let period = period_param(indicator_key, param_map)?;
         let mut config = RMAConfig::new(period);
         config.alias_name = indicator_key.to_string();
 
@@ -45,4 +54,20 @@ impl Indicator for RmaIndicator {
         // 中文注释：RMA 非预热段不允许中间空值。
         crate::backtest_engine::indicators::registry::WarmupMode::Strict
     }
+
+    fn sliceable(&self) -> bool {
+        false
+    }
+
+    fn create_state(
+        &self,
+        indicator_key: &str,
+        param_map: &HashMap<String, Param>,
+    ) -> Result<StreamingIndicator, QuantError> {
+        let state = RmaState::new(period_param(indicator_key, param_map)?)?;
+        Ok(StreamingIndicator::new(
+            vec![indicator_key.to_string()],
+            state,
+        ))
+    }
 }
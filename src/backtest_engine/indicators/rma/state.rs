@@ -0,0 +1,44 @@
+use crate::backtest_engine::indicators::streaming::{ewm_step, Bar, IndicatorState};
+use crate::error::{IndicatorError, QuantError};
+
+const INDICATOR_NAME: &str = "rma";
+
+/// RMA 逐行递推状态。
+///
+/// 中文注释：批量实现是 `ewm_mean(alpha=1/period, min_periods=1)`，
+/// 首个值直接作为起点，不做 SMA 种子。
+#[derive(Debug, Clone, PartialEq)]
+pub struct RmaState {
+    period: usize,
+    alpha: f64,
+    value: f64,
+}
+
+impl RmaState {
+    pub fn new(period: i64) -> Result<Self, QuantError> {
+        if period <= 0 {
+            return Err(IndicatorError::InvalidParameter(
+                INDICATOR_NAME.to_string(),
+                "Period must be positive".to_string(),
+            )
+            .into());
+        }
+        Ok(Self {
+            period: period as usize,
+            alpha: 1.0 / period as f64,
+            value: f64::NAN,
+        })
+    }
+
+    /// 推进一根 K 线，返回该行 RMA。
+    pub fn update(&mut self, close: f64) -> f64 {
+        self.value = ewm_step(self.value, close, self.alpha);
+        self.value
+    }
+}
+
+impl IndicatorState for RmaState {
+    fn update(&mut self, bar: &Bar) -> Vec<f64> {
+        vec![RmaState::update(self, bar.close)]
+    }
+}
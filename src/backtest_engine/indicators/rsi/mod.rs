@@ -2,8 +2,10 @@ mod config;
 mod expr;
 mod indicator;
 mod pipeline;
+mod state;
 
 pub use config::RSIConfig;
 pub use expr::rsi_expr;
 pub use indicator::RsiIndicator;
 pub use pipeline::{rsi_eager, rsi_lazy};
+pub use state::RsiState;
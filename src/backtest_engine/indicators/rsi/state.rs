@@ -0,0 +1,77 @@
+use crate::backtest_engine::indicators::streaming::ewm_step;
+use crate::backtest_engine::indicators::streaming::{Bar, IndicatorState};
+use crate::error::{IndicatorError, QuantError};
+
+/// RSI 流式状态。
+///
+/// 中文注释：与 `rsi_expr` 一致——第 period 行用涨跌幅 [1..=period] 的均值做种子，
+/// 之后按 RMA（`alpha = 1 / period`）递推平均涨幅 / 跌幅。
+#[derive(Debug, Clone)]
+pub struct RsiState {
+    period: usize,
+    alpha: f64,
+    index: usize,
+    prev_close: f64,
+    gain_sum: f64,
+    loss_sum: f64,
+    avg_gain: f64,
+    avg_loss: f64,
+}
+
+impl RsiState {
+    pub fn new(period: i64) -> Result<Self, QuantError> {
+        if period <= 0 {
+            return Err(IndicatorError::InvalidParameter(
+                "rsi".to_string(),
+                "Period must be positive".to_string(),
+            )
+            .into());
+        }
+        Ok(Self {
+            period: period as usize,
+            alpha: 1.0 / period as f64,
+            index: 0,
+            prev_close: f64::NAN,
+            gain_sum: 0.0,
+            loss_sum: 0.0,
+            avg_gain: f64::NAN,
+            avg_loss: f64::NAN,
+        })
+    }
+
+    /// 推进一根 K 线，返回该行 RSI。
+    pub fn update(&mut self, close: f64) -> f64 {
+        let i = self.index;
+        let change = close - self.prev_close;
+        self.prev_close = close;
+        self.index += 1;
+
+        if i == 0 {
+            return f64::NAN;
+        }
+        let gain = if change > 0.0 { change } else { 0.0 };
+        let loss = if change < 0.0 { change.abs() } else { 0.0 };
+
+        if i < self.period {
+            self.gain_sum += gain;
+            self.loss_sum += loss;
+            return f64::NAN;
+        }
+        if i == self.period {
+            self.gain_sum += gain;
+            self.loss_sum += loss;
+            self.avg_gain = self.gain_sum / self.period as f64;
+            self.avg_loss = self.loss_sum / self.period as f64;
+        } else {
+            self.avg_gain = ewm_step(self.avg_gain, gain, self.alpha);
+            self.avg_loss = ewm_step(self.avg_loss, loss, self.alpha);
+        }
+        100.0 * self.avg_gain / (self.avg_gain + self.avg_loss)
+    }
+}
+
+impl IndicatorState for RsiState {
+    fn update(&mut self, bar: &Bar) -> Vec<f64> {
+        vec![RsiState::update(self, bar.close)]
+    }
+}
@@ -2,8 +2,10 @@ mod config;
 mod expr;
 mod indicator;
 mod pipeline;
+mod state;
 
 pub use config::SMAConfig;
 pub use expr::sma_expr;
 pub use indicator::SmaIndicator;
 pub use pipeline::{sma_eager, sma_lazy};
+pub use state::SmaState;
@@ -0,0 +1,37 @@
+use crate::backtest_engine::indicators::streaming::{Bar, IndicatorState, RollingWindow};
+use crate::error::{IndicatorError, QuantError};
+
+/// SMA 流式状态。
+///
+/// 中文注释：滑动窗口 O(1) 维护均值，窗口未满时输出 NaN（对齐 `min_periods = period`）。
+#[derive(Debug, Clone)]
+pub struct SmaState {
+    window: RollingWindow,
+}
+
+impl SmaState {
+    pub fn new(period: i64) -> Result<Self, QuantError> {
+        if period <= 0 {
+            return Err(IndicatorError::InvalidParameter(
+                "sma".to_string(),
+                "Period must be positive for SMA calculation".to_string(),
+            )
+            .into());
+        }
+        Ok(Self {
+            window: RollingWindow::new(period as usize),
+        })
+    }
+
+    /// 推进一个值，返回该行 SMA。
+    pub fn update(&mut self, value: f64) -> f64 {
+        self.window.push(value);
+        self.window.mean()
+    }
+}
+
+impl IndicatorState for SmaState {
+    fn update(&mut self, bar: &Bar) -> Vec<f64> {
+        vec![SmaState::update(self, bar.close)]
+    }
+}
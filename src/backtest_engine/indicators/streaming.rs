@@ -0,0 +1,466 @@
+//! 逐根推进的流式指标状态。
+//!
+//! 中文注释：每个注册指标都提供一个与批量 `Indicator::calculate` 逐行等价的流式状态，
+//! 先用历史 K 线 `init_from_history` 预热，之后每根新 K 线 `update` 只做 O(1)/O(window) 的增量计算，
+//! 供实盘 bot / 扫描器避免每个 tick 重算整段历史。
+
+use super::registry::get_indicator_registry;
+use crate::error::{IndicatorError, QuantError};
+use crate::types::Param;
+use polars::prelude::*;
+use std::collections::{HashMap, VecDeque};
+
+/// 单根 K 线输入。
+#[derive(Debug, Clone, Copy, PartialEq)]
+pub struct Bar {
+    pub time: i64,
+    pub open: f64,
+    pub high: f64,
+    pub low: f64,
+    pub close: f64,
+    pub volume: f64,
+}
+
+/// 与 Polars `ewm_mean(adjust=false)` 对齐的单步递推。
+pub(crate) fn ewm_step(prev: f64, value: f64, alpha: f64) -> f64 {
+    if prev.is_nan() {
+        value
+    } else {
+        (1.0 - alpha) * prev + alpha * value
+    }
+}
+
+pub(crate) fn bool_to_f64(flag: bool) -> f64 {
+    if flag {
+        1.0
+    } else {
+        0.0
+    }
+}
+
+/// 流式指标状态：逐根推进，返回值顺序与批量输出列一致。
+pub trait IndicatorState: Send {
+    fn update(&mut self, bar: &Bar) -> Vec<f64>;
+}
+
+/// 带输出列名的流式指标实例。
+pub struct StreamingIndicator {
+    output_names: Vec<String>,
+    state: Box<dyn IndicatorState>,
+}
+
+impl StreamingIndicator {
+    pub fn new(output_names: Vec<String>, state: impl IndicatorState + 'static) -> Self {
+        Self {
+            output_names,
+            state: Box::new(state),
+        }
+    }
+
+    /// 输出列名，与 `Indicator::calculate` 返回的 Series 名称逐一对应。
+    pub fn output_names(&self) -> &[String] {
+        &self.output_names
+    }
+
+    /// 推进一根 K 线，返回该行各输出列的值（布尔列以 1.0/0.0 表示）。
+    pub fn update(&mut self, bar: &Bar) -> Vec<f64> {
+        self.state.update(bar)
+    }
+}
+
+fn optional_f64_column(ohlcv_df: &DataFrame, name: &str) -> Result<Vec<f64>, QuantError> {
+    let height = ohlcv_df.height();
+    match ohlcv_df.column(name) {
+        Ok(column) => Ok(column
+            .cast(&DataType::Float64)?
+            .f64()?
+            .into_iter()
+            .map(|value| value.unwrap_or(f64::NAN))
+            .collect()),
+        Err(_) => Ok(vec![f64::NAN; height]),
+    }
+}
+
+/// 把 OHLCV DataFrame 展开为逐行 `Bar`。
+///
+/// 中文注释：缺失列按 NaN（time 按 0）填充，只依赖 close 的指标无需构造完整 OHLCV。
+pub fn bars_from_ohlcv(ohlcv_df: &DataFrame) -> Result<Vec<Bar>, QuantError> {
+    let height = ohlcv_df.height();
+    let time: Vec<i64> = match ohlcv_df.column("time") {
+        Ok(column) => column
+            .cast(&DataType::Int64)?
+            .i64()?
+            .into_iter()
+            .map(|value| value.unwrap_or(0))
+            .collect(),
+        Err(_) => vec![0; height],
+    };
+    let open = optional_f64_column(ohlcv_df, "open")?;
+    let high = optional_f64_column(ohlcv_df, "high")?;
+    let low = optional_f64_column(ohlcv_df, "low")?;
+    let close = optional_f64_column(ohlcv_df, "close")?;
+    let volume = optional_f64_column(ohlcv_df, "volume")?;
+
+    Ok((0..height)
+        .map(|i| Bar {
+            time: time[i],
+            open: open[i],
+            high: high[i],
+            low: low[i],
+            close: close[i],
+            volume: volume[i],
+        })
+        .collect())
+}
+
+/// 按注册表创建空的流式指标状态。
+pub fn create_indicator_state(
+    indicator_key: &str,
+    param_map: &HashMap<String, Param>,
+) -> Result<StreamingIndicator, QuantError> {
+    let base_name = indicator_key.split('_').next().unwrap_or(indicator_key);
+    let indicator = get_indicator_registry().get(base_name).ok_or_else(|| {
+        IndicatorError::NotImplemented(format!("Indicator '{}' is not supported.", base_name))
+    })?;
+    indicator.create_state(indicator_key, param_map)
+}
+
+/// 用历史 K 线预热流式状态，之后可直接对新 K 线调用 `update`。
+pub fn init_from_history(
+    ohlcv_df: &DataFrame,
+    indicator_key: &str,
+    param_map: &HashMap<String, Param>,
+) -> Result<StreamingIndicator, QuantError> {
+    let mut state = create_indicator_state(indicator_key, param_map)?;
+    for bar in bars_from_ohlcv(ohlcv_df)? {
+        state.update(&bar);
+    }
+    Ok(state)
+}
+
+/// 与批量 TR 同口径的单行真实波幅（首行无前收盘时为 NaN）。
+pub(crate) fn true_range(high: f64, low: f64, prev_close: f64) -> f64 {
+    if prev_close.is_nan() {
+        return f64::NAN;
+    }
+    (high - low)
+        .abs()
+        .max((high - prev_close).abs())
+        .max((prev_close - low).abs())
+}
+
+/// 固定长度滑动窗口，O(1) 维护均值与总体方差。
+///
+/// 中文注释：窗口内出现 NaN 时统计量输出 NaN（对齐 Polars rolling 的空值传播）；
+/// NaN 移出窗口后从缓冲区重算一次，避免 NaN 污染增量累加器。
+#[derive(Debug, Clone)]
+pub(crate) struct RollingWindow {
+    capacity: usize,
+    values: VecDeque<f64>,
+    nan_count: usize,
+    dirty: bool,
+    mean: f64,
+    m2: f64,
+}
+
+impl RollingWindow {
+    pub(crate) fn new(capacity: usize) -> Self {
+        Self {
+            capacity,
+            values: VecDeque::with_capacity(capacity + 1),
+            nan_count: 0,
+            dirty: false,
+            mean: 0.0,
+            m2: 0.0,
+        }
+    }
+
+    pub(crate) fn push(&mut self, value: f64) {
+        let evicted = if self.values.len() == self.capacity {
+            self.values.pop_front()
+        } else {
+            None
+        };
+        self.values.push_back(value);
+
+        if value.is_nan() {
+            self.nan_count += 1;
+        }
+        if evicted.is_some_and(f64::is_nan) {
+            self.nan_count -= 1;
+        }
+        if value.is_nan() || evicted.is_some_and(f64::is_nan) {
+            self.dirty = true;
+        }
+
+        if self.nan_count > 0 {
+            return;
+        }
+        if self.dirty {
+            self.recompute();
+            return;
+        }
+
+        let n = self.values.len() as f64;
+        match evicted {
+            None => {
+                let delta = value - self.mean;
+                self.mean += delta / n;
+                self.m2 += delta * (value - self.mean);
+            }
+            Some(old) => {
+                let new_mean = self.mean + (value - old) / n;
+                self.m2 += (value - old) * (value - new_mean + old - self.mean);
+                self.mean = new_mean;
+            }
+        }
+    }
+
+    fn recompute(&mut self) {
+        let n = self.values.len() as f64;
+        self.mean = self.values.iter().sum::<f64>() / n;
+        self.m2 = self
+            .values
+            .iter()
+            .map(|value| (value - self.mean).powi(2))
+            .sum();
+        self.dirty = false;
+    }
+
+    /// 窗口已满且不含 NaN。
+    pub(crate) fn is_valid(&self) -> bool {
+        self.values.len() == self.capacity && self.nan_count == 0
+    }
+
+    pub(crate) fn mean(&self) -> f64 {
+        if self.is_valid() {
+            self.mean
+        } else {
+            f64::NAN
+        }
+    }
+
+    pub(crate) fn sum(&self) -> f64 {
+        self.mean() * self.capacity as f64
+    }
+
+    /// 总体标准差（ddof = 0）。
+    pub(crate) fn population_std(&self) -> f64 {
+        if self.is_valid() {
+            (self.m2 / self.capacity as f64).max(0.0).sqrt()
+        } else {
+            f64::NAN
+        }
+    }
+
+    /// 窗口内的原始值（从旧到新）。
+    pub(crate) fn values(&self) -> &VecDeque<f64> {
+        &self.values
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use rand::rngs::StdRng;
+    use rand::{Rng, SeedableRng};
+
+    const CASES_PER_INDICATOR: u64 = 4;
+
+    /// 随机游走 OHLCV，time 为毫秒且夹杂休市跳空（覆盖 opening-bar）。
+    fn random_ohlcv(rng: &mut StdRng, len: usize) -> DataFrame {
+        let mut time = Vec::with_capacity(len);
+        let mut open = Vec::with_capacity(len);
+        let mut high = Vec::with_capacity(len);
+        let mut low = Vec::with_capacity(len);
+        let mut close = Vec::with_capacity(len);
+        let mut volume = Vec::with_capacity(len);
+
+        let mut t: i64 = 1_700_000_000_000;
+        let mut price = 100.0;
+        for _ in 0..len {
+            t += if rng.random_range(0..40) == 0 {
+                7_200_000
+            } else {
+                900_000
+            };
+            let prev = price;
+            price *= 1.0 + rng.random_range(-0.02..0.02);
+            let spread_up = rng.random_range(0.0..1.5);
+            let spread_down = rng.random_range(0.0..1.5);
+            time.push(t);
+            open.push(prev);
+            high.push(prev.max(price) + spread_up);
+            low.push(prev.min(price) - spread_down);
+            close.push(price);
+            volume.push(rng.random_range(1.0..1000.0));
+        }
+
+        DataFrame::new(vec![
+            Series::new("time".into(), time).into(),
+            Series::new("open".into(), open).into(),
+            Series::new("high".into(), high).into(),
+            Series::new("low".into(), low).into(),
+            Series::new("close".into(), close).into(),
+            Series::new("volume".into(), volume).into(),
+        ])
+        .expect("ohlcv frame 应成功")
+    }
+
+    fn params(pairs: &[(&str, f64)]) -> HashMap<String, Param> {
+        pairs
+            .iter()
+            .map(|(name, value)| {
+                (
+                    name.to_string(),
+                    Param::new(*value, None, None, None, false, false, 0.01),
+                )
+            })
+            .collect()
+    }
+
+    /// 每个注册指标随机抽取一组合法参数。
+    fn random_params(rng: &mut StdRng, base_name: &str) -> HashMap<String, Param> {
+        let period = rng.random_range(2..40) as f64;
+        match base_name {
+            "sma" | "ema" | "rma" | "rsi" | "atr" | "cci" | "sma-close-pct" => {
+                params(&[("period", period)])
+            }
+            "tr" => params(&[]),
+            "bbands" => params(&[("period", period), ("std", rng.random_range(1.0..3.0))]),
+            "adx" => params(&[
+                ("period", period),
+                ("adxr_length", rng.random_range(1..6) as f64),
+            ]),
+            "macd" => params(&[
+                ("fast_period", rng.random_range(2..15) as f64),
+                ("slow_period", rng.random_range(10..40) as f64),
+                ("signal_period", rng.random_range(2..12) as f64),
+            ]),
+            "er" => params(&[("length", period), ("drift", rng.random_range(1..4) as f64)]),
+            "psar" => params(&[("af0", 0.02), ("af_step", 0.02), ("max_af", 0.2)]),
+            "opening-bar" => params(&[("threshold", 3600.0)]),
+            "cci-divergence" | "rsi-divergence" => params(&[
+                ("period", period),
+                ("window", rng.random_range(3..20) as f64),
+                ("gap", rng.random_range(1..5) as f64),
+                ("recency", rng.random_range(1..5) as f64),
+            ]),
+            "macd-divergence" => params(&[
+                ("fast_period", rng.random_range(2..15) as f64),
+                ("slow_period", rng.random_range(10..40) as f64),
+                ("signal_period", rng.random_range(2..12) as f64),
+                ("window", rng.random_range(3..20) as f64),
+                ("gap", rng.random_range(1..5) as f64),
+                ("recency", rng.random_range(1..5) as f64),
+            ]),
+            other => panic!("未覆盖的注册指标: {other}"),
+        }
+    }
+
+    fn to_vec(series: &Series) -> Vec<f64> {
+        series
+            .cast(&DataType::Float64)
+            .expect("f64 cast")
+            .f64()
+            .expect("f64 列")
+            .into_iter()
+            .map(|v| v.unwrap_or(f64::NAN))
+            .collect()
+    }
+
+    fn assert_close(expected: &[f64], actual: &[f64], label: &str) {
+        assert_eq!(expected.len(), actual.len(), "{label} 长度不一致");
+        for (idx, (e, a)) in expected.iter().zip(actual).enumerate() {
+            if e.is_nan() || a.is_nan() {
+                assert!(
+                    e.is_nan() && a.is_nan(),
+                    "{label}[{idx}] NaN 不一致: {e} vs {a}"
+                );
+                continue;
+            }
+            if e.is_infinite() || a.is_infinite() {
+                assert_eq!(e, a, "{label}[{idx}] inf 不一致");
+                continue;
+            }
+            // 中文注释：滑动窗口统计与 Polars 的累加顺序不同，容许极小的浮点误差。
+            let tol = 1e-7 * e.abs().max(1.0);
+            assert!(
+                (e - a).abs() <= tol,
+                "{label}[{idx}] 数值不一致: {e} vs {a}"
+            );
+        }
+    }
+
+    #[test]
+    fn test_every_registered_indicator_streams_like_batch() {
+        let mut names: Vec<&String> = get_indicator_registry().keys().collect();
+        names.sort();
+
+        for base_name in names {
+            for case in 0..CASES_PER_INDICATOR {
+                let mut rng = StdRng::seed_from_u64(case * 7919 + base_name.len() as u64);
+                let len = rng.random_range(150..400);
+                let df = random_ohlcv(&mut rng, len);
+                let param_map = random_params(&mut rng, base_name);
+                let indicator_key = format!("{}_0", base_name);
+                let label = format!("{indicator_key}#case{case}");
+
+                let batch = get_indicator_registry()[base_name.as_str()]
+                    .calculate(&df, &indicator_key, &param_map)
+                    .unwrap_or_else(|e| panic!("{label} 批量计算失败: {e}"));
+
+                // 中文注释：随机切分点，前段预热、后段逐根推进，两段拼接需与批量逐行一致。
+                let split = rng.random_range(1..len);
+                let mut state = init_from_history(&df.slice(0, split), &indicator_key, &param_map)
+                    .unwrap_or_else(|e| panic!("{label} 预热失败: {e}"));
+                let full_stream = {
+                    let mut fresh =
+                        create_indicator_state(&indicator_key, &param_map).expect("state");
+                    bars_from_ohlcv(&df)
+                        .expect("bars")
+                        .iter()
+                        .map(|bar| fresh.update(bar))
+                        .collect::<Vec<_>>()
+                };
+                let tail = bars_from_ohlcv(&df.slice(split as i64, len - split))
+                    .expect("bars")
+                    .iter()
+                    .map(|bar| state.update(bar))
+                    .collect::<Vec<_>>();
+
+                assert_eq!(batch.len(), state.output_names().len(), "{label} 输出列数");
+                for (col_idx, series) in batch.iter().enumerate() {
+                    assert_eq!(
+                        series.name().as_str(),
+                        state.output_names()[col_idx],
+                        "{label} 输出列名/顺序"
+                    );
+                    let expected = to_vec(series);
+                    let streamed = full_stream
+                        .iter()
+                        .map(|row| row[col_idx])
+                        .collect::<Vec<_>>();
+                    assert_close(&expected, &streamed, &format!("{label}/{}", series.name()));
+
+                    let resumed = tail.iter().map(|row| row[col_idx]).collect::<Vec<_>>();
+                    assert_close(
+                        &expected[split..],
+                        &resumed,
+                        &format!("{label}/{} resumed", series.name()),
+                    );
+                }
+            }
+        }
+    }
+
+    #[test]
+    fn test_rolling_window_recovers_after_nan_leaves() {
+        let mut window = RollingWindow::new(3);
+        for value in [1.0, f64::NAN, 2.0, 3.0, 4.0] {
+            window.push(value);
+        }
+        assert!((window.mean() - 3.0).abs() < 1e-12);
+        assert!((window.population_std() - (2.0f64 / 3.0).sqrt()).abs() < 1e-12);
+    }
+}
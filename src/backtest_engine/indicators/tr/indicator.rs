@@ -1,6 +1,8 @@
 use super::super::registry::Indicator;
 use super::config::TRConfig;
 use super::pipeline::tr_eager;
+use super::state::TrState;
+use crate::backtest_engine::indicators::streaming::StreamingIndicator;
 use crate::error::QuantError;
 use crate::types::Param;
 use polars::prelude::*;
@@ -34,4 +36,19 @@ impl Indicator for TrIndicator {
         // 中文注释：TR 非预热段不允许中间空值。
         crate::backtest_engine::indicators::registry::WarmupMode::Strict
     }
+
+    fn sliceable(&self) -> bool {
+        true
+    }
+
+    fn create_state(
+        &self,
+        indicator_key: &str,
+        _params: &HashMap<String, Param>,
+    ) -> Result<StreamingIndicator, QuantError> {
+        Ok(StreamingIndicator::new(
+            vec![indicator_key.to_string()],
+            TrState::new(),
+        ))
+    }
 }
@@ -2,8 +2,10 @@ mod config;
 mod expr;
 mod indicator;
 mod pipeline;
+mod state;
 
 pub use config::TRConfig;
 pub use expr::tr_expr;
 pub use indicator::TrIndicator;
 pub use pipeline::{tr_eager, tr_lazy};
+pub use state::TrState;
@@ -0,0 +1,34 @@
+use crate::backtest_engine::indicators::streaming::{true_range, Bar, IndicatorState};
+
+/// TR 流式状态：只需保留上一根收盘价。
+#[derive(Debug, Clone)]
+pub struct TrState {
+    prev_close: f64,
+}
+
+impl TrState {
+    pub fn new() -> Self {
+        Self {
+            prev_close: f64::NAN,
+        }
+    }
+
+    /// 推进一根 K 线，首行无前收盘时为 NaN。
+    pub fn update(&mut self, high: f64, low: f64, close: f64) -> f64 {
+        let tr = true_range(high, low, self.prev_close);
+        self.prev_close = close;
+        tr
+    }
+}
+
+impl Default for TrState {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+
+impl IndicatorState for TrState {
+    fn update(&mut self, bar: &Bar) -> Vec<f64> {
+        vec![TrState::update(self, bar.high, bar.low, bar.close)]
+    }
+}
@@ -43,6 +43,11 @@ pub use crate::types::ResultPack;
 pub use module_registry::register_py_module;
 pub(crate) use pipeline::{
     build_public_result_pack, compile_public_setting_to_request, evaluate_param_set,
-    execute_single_pipeline, validate_mode_settings, PipelineOutput, PipelineRequest,
+    evaluate_param_set_from_signals, evaluate_param_set_precomputed, evaluate_signals,
+    execute_single_pipeline, retain_tail_rows, validate_mode_settings, PipelineOutput,
+    PipelineRequest,
+};
+pub use top_level_api::{
+    optimizable_param_keys, run_batch_backtest, run_batch_backtest_from_values,
+    run_single_backtest,
 };
-pub use top_level_api::{run_batch_backtest, run_single_backtest};
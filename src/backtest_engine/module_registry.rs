@@ -1,5 +1,8 @@
 use super::submodule_init::register_all_submodules;
-use super::top_level_api::{py_run_batch_backtest, py_run_single_backtest};
+use super::top_level_api::{
+    py_optimizable_param_keys, py_run_batch_backtest, py_run_batch_backtest_from_values,
+    py_run_single_backtest,
+};
 use pyo3::prelude::*;
 
 /// 注册 PyO3 模块的所有函数。
@@ -8,6 +11,8 @@ use pyo3::prelude::*;
 pub fn register_py_module(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(py_run_batch_backtest, m)?)?;
     m.add_function(wrap_pyfunction!(py_run_single_backtest, m)?)?;
+    m.add_function(wrap_pyfunction!(py_run_batch_backtest_from_values, m)?)?;
+    m.add_function(wrap_pyfunction!(py_optimizable_param_keys, m)?)?;
     register_all_submodules(m)?;
     Ok(())
 }
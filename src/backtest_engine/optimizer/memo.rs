@@ -0,0 +1,198 @@
+//! 量化采样的试验记忆表
+//!
+//! 量化（step / dtype）后大量采样会落到同一组参数值上，
+//! 记忆表以量化后的参数向量为键缓存评估结果，重复样本直接复用，不再跑完整流水线。
+
+use crate::error::QuantError;
+use rayon::prelude::*;
+use std::collections::hash_map::Entry;
+use std::collections::{HashMap, HashSet};
+
+/// 参数向量的哈希键（按位比较，`-0.0` 归一为 `0.0`）。
+pub fn memo_key(values: &[f64]) -> Vec<u64> {
+    values
+        .iter()
+        .map(|&v| {
+            if v == 0.0 {
+                0.0f64.to_bits()
+            } else {
+                v.to_bits()
+            }
+        })
+        .collect()
+}
+
+/// 单批评估结果。
+pub struct MemoBatch<V> {
+    /// 与输入批次逐一对齐；评估失败的样本为 None
+    pub outcomes: Vec<Option<V>>,
+    /// 本批实际执行评估的去重样本数
+    pub evaluated: usize,
+    /// 本批遇到的首个评估错误
+    pub first_error: Option<QuantError>,
+}
+
+/// 量化参数向量 → 评估结果的记忆表，生命周期与一次优化 / 敏感性运行相同。
+pub struct TrialMemo<V> {
+    table: HashMap<Vec<u64>, Option<V>>,
+    /// 已派发、结果尚未入表的参数向量 → 首个派发者的序号（仅异步稳态模式使用）
+    in_flight: HashMap<Vec<u64>, usize>,
+}
+
+impl<V> Default for TrialMemo<V> {
+    fn default() -> Self {
+        Self {
+            table: HashMap::new(),
+            in_flight: HashMap::new(),
+        }
+    }
+}
+
+impl<V: Clone + Send> TrialMemo<V> {
+    pub fn new() -> Self {
+        Self::default()
+    }
+
+    /// 已缓存的去重参数向量数。
+    pub fn len(&self) -> usize {
+        self.table.len()
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.table.is_empty()
+    }
+
+    /// 查询已入表的评估结果（外层 None 表示未评估过）。
+    pub fn get(&self, values: &[f64]) -> Option<&Option<V>> {
+        self.table.get(&memo_key(values))
+    }
+
+    /// 逐个写入评估结果，供非批量调度（异步稳态模式）使用；同时解除该向量的在途登记。
+    pub fn insert(&mut self, values: &[f64], outcome: Option<V>) {
+        let key = memo_key(values);
+        self.in_flight.remove(&key);
+        self.table.insert(key, outcome);
+    }
+
+    /// 登记即将派发评估的参数向量。
+    ///
+    /// 同一向量已在途时返回首个派发者的序号，调用方应等待并复用其结果而不是重复评估；
+    /// 否则以 `ticket` 登记并返回 None。
+    pub fn claim(&mut self, values: &[f64], ticket: usize) -> Option<usize> {
+        match self.in_flight.entry(memo_key(values)) {
+            Entry::Occupied(leader) => Some(*leader.get()),
+            Entry::Vacant(slot) => {
+                slot.insert(ticket);
+                None
+            }
+        }
+    }
+
+    /// 评估一批参数向量：表中已有或批内重复的向量只评估一次，其余并行评估后入表。
+    pub fn evaluate_batch<F>(&mut self, batch: &[Vec<f64>], eval: F) -> MemoBatch<V>
+    where
+        F: Fn(&[f64]) -> Result<V, QuantError> + Sync,
+    {
+        let mut seen = HashSet::new();
+        let pending: Vec<(Vec<u64>, &Vec<f64>)> = batch
+            .iter()
+            .filter_map(|values| {
+                let key = memo_key(values);
+                (!self.table.contains_key(&key) && seen.insert(key.clone()))
+                    .then_some((key, values))
+            })
+            .collect();
+        let evaluated = pending.len();
+
+        let results: Vec<(Vec<u64>, Result<V, QuantError>)> = pending
+            .into_par_iter()
+            .map(|(key, values)| (key, eval(values)))
+            .collect();
+
+        let mut first_error = None;
+        for (key, result) in results {
+            let outcome = match result {
+                Ok(value) => Some(value),
+                Err(err) => {
+                    first_error.get_or_insert(err);
+                    None
+                }
+            };
+            self.table.insert(key, outcome);
+        }
+
+        let outcomes = batch
+            .iter()
+            .map(|values| self.table.get(&memo_key(values)).cloned().flatten())
+            .collect();
+
+        MemoBatch {
+            outcomes,
+            evaluated,
+            first_error,
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use std::sync::atomic::{AtomicUsize, Ordering};
+
+    #[test]
+    fn test_duplicates_are_evaluated_once_across_batches() {
+        let calls = AtomicUsize::new(0);
+        let eval = |values: &[f64]| -> Result<f64, QuantError> {
+            calls.fetch_add(1, Ordering::SeqCst);
+            Ok(values.iter().sum())
+        };
+        let mut memo = TrialMemo::new();
+
+        let first = memo.evaluate_batch(
+            &[
+                vec![1.0, 2.0],
+                vec![1.0, 2.0],
+                vec![0.0, 3.0],
+                vec![-0.0, 3.0],
+            ],
+            eval,
+        );
+        assert_eq!(first.evaluated, 2);
+        assert_eq!(first.outcomes, vec![Some(3.0); 4]);
+
+        let second = memo.evaluate_batch(&[vec![1.0, 2.0], vec![2.0, 2.0]], eval);
+        assert_eq!(second.evaluated, 1);
+        assert_eq!(second.outcomes, vec![Some(3.0), Some(4.0)]);
+        assert_eq!(calls.load(Ordering::SeqCst), 3);
+        assert_eq!(memo.len(), 3);
+    }
+
+    #[test]
+    fn test_failed_evaluation_is_shared_by_duplicates() {
+        let mut memo: TrialMemo<f64> = TrialMemo::new();
+        let batch = memo.evaluate_batch(&[vec![1.0], vec![1.0], vec![2.0]], |values| {
+            if values[0] == 1.0 {
+                Err(QuantError::InvalidParam("boom".into()))
+            } else {
+                Ok(values[0])
+            }
+        });
+
+        assert_eq!(batch.evaluated, 2);
+        assert_eq!(batch.outcomes, vec![None, None, Some(2.0)]);
+        assert!(batch.first_error.is_some());
+    }
+
+    #[test]
+    fn test_claim_returns_leader_until_result_is_inserted() {
+        let mut memo: TrialMemo<f64> = TrialMemo::new();
+
+        assert_eq!(memo.claim(&[1.0, 0.0], 3), None);
+        assert_eq!(memo.claim(&[1.0, -0.0], 5), Some(3));
+        assert_eq!(memo.claim(&[2.0, 0.0], 6), None);
+
+        memo.insert(&[1.0, 0.0], Some(1.0));
+        assert_eq!(memo.get(&[1.0, 0.0]), Some(&Some(1.0)));
+        assert_eq!(memo.claim(&[1.0, 0.0], 7), None);
+    }
+}
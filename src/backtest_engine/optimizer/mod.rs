@@ -2,6 +2,7 @@ pub mod benchmark {
     pub use crate::types::BenchmarkFunction;
 }
 pub mod evaluation;
+pub mod memo;
 pub mod optimizer_core;
 pub mod param_extractor;
 pub mod py_bindings;
@@ -12,7 +13,13 @@ pub mod test_helpers;
 #[allow(unused_imports)]
 pub use benchmark::BenchmarkFunction;
 pub use evaluation::evaluate_param_values;
-pub use py_bindings::{py_run_optimizer, py_run_optimizer_benchmark};
-pub use runner::run_optimization;
+pub use py_bindings::{
+    py_run_optimizer, py_run_optimizer_across_symbols, py_run_optimizer_benchmark,
+    py_run_optimizer_per_symbol,
+};
+pub use runner::{
+    run_optimization, run_optimization_across_symbols, run_optimization_per_symbol,
+    run_optimization_with_precomputed,
+};
 #[allow(unused_imports)]
 pub use test_helpers::{create_dummy_backtest_params, create_dummy_performance_params};
@@ -17,6 +17,8 @@ pub struct ValidationResult {
 /// * `top_k_ratio` - TopK 比例
 /// * `samples_per_round` - 每轮采样数
 /// * `sigma_ratio` - 高斯核标准差比例
+/// * `fidelity_ratio` - 低保真评估的 active 段前缀比例
+/// * `promote_ratio` - 每轮晋级全量评估的候选比例
 ///
 /// # 返回
 /// 验证结果
@@ -25,6 +27,8 @@ pub fn validate_config(
     top_k_ratio: f64,
     samples_per_round: usize,
     sigma_ratio: f64,
+    fidelity_ratio: f64,
+    promote_ratio: f64,
 ) -> ValidationResult {
     let mut errors = Vec::new();
 
@@ -50,6 +54,20 @@ pub fn validate_config(
         errors.push(format!("sigma_ratio must be > 0, got {}", sigma_ratio));
     }
 
+    if !(fidelity_ratio > 0.0 && fidelity_ratio <= 1.0) {
+        errors.push(format!(
+            "fidelity_ratio must be in (0, 1], got {}",
+            fidelity_ratio
+        ));
+    }
+
+    if !(promote_ratio > 0.0 && promote_ratio <= 1.0) {
+        errors.push(format!(
+            "promote_ratio must be in (0, 1], got {}",
+            promote_ratio
+        ));
+    }
+
     ValidationResult {
         is_valid: errors.is_empty(),
         errors,
@@ -17,6 +17,13 @@ pub struct FlattenedParam {
     pub param: crate::types::inputs::Param,
 }
 
+impl FlattenedParam {
+    /// 参数唯一键 `{type_idx}_{group}_{name}`，与 Python 侧 Optuna 参数名一致
+    pub fn key(&self) -> String {
+        format!("{}_{}_{}", self.type_idx, self.group, self.name)
+    }
+}
+
 /// 量化参数值到指定精度
 ///
 /// # 参数
@@ -118,7 +125,18 @@ pub fn extract_optimizable_params(single_param: &SingleParamSet) -> Vec<Flattene
 /// * `val` - 要设置的值
 pub fn set_param_value(single_param: &mut SingleParamSet, flat_param: &FlattenedParam, val: f64) {
     let final_val = quantize_value(val, flat_param.param.step, flat_param.param.dtype);
+    assign_param_value(single_param, flat_param, final_val);
+}
 
+/// 将取值原样写入参数结构（不做 step 量化）
+///
+/// 中文注释：调用方已按自己的网格采样（如 Optuna 以 `min` 为起点按 step 取值），
+/// 再按 0 起点量化会改写合法取值，因此外部给定的参数矩阵走这里。
+pub fn assign_param_value(
+    single_param: &mut SingleParamSet,
+    flat_param: &FlattenedParam,
+    final_val: f64,
+) {
     match flat_param.type_idx {
         0 => {
             // Indicator
@@ -167,3 +185,14 @@ pub fn apply_values_to_param(
         set_param_value(single_param, &flat_params[dim], val);
     }
 }
+
+/// 批量原样写入取值（不做 step 量化），见 `assign_param_value`
+pub fn assign_values_to_param(
+    single_param: &mut SingleParamSet,
+    flat_params: &[FlattenedParam],
+    values: &[f64],
+) {
+    for (dim, &val) in values.iter().enumerate() {
+        assign_param_value(single_param, &flat_params[dim], val);
+    }
+}
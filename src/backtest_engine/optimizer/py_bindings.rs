@@ -1,4 +1,7 @@
-use super::runner::{run_optimization, run_optimization_generic, EvalMode};
+use super::runner::{
+    run_optimization, run_optimization_across_symbols, run_optimization_generic,
+    run_optimization_per_symbol, EvalMode,
+};
 use crate::types::{
     BenchmarkFunction, DataPack, OptimizationResult, OptimizerConfig, Param, ParamType,
     SettingContainer, SingleParamSet, TemplateContainer,
@@ -116,3 +119,69 @@ pub fn py_run_optimizer(
     )
     .map_err(|e| e.into())
 }
+
+#[gen_stub_pyfunction(
+    module = "pyo3_quant.backtest_engine.optimizer",
+    python = r#"
+def py_run_optimizer_across_symbols(
+    data: typing.Sequence[_pyo3_quant.DataPack],
+    param: _pyo3_quant.SingleParamSet,
+    template: _pyo3_quant.TemplateContainer,
+    engine_settings: _pyo3_quant.SettingContainer,
+    optimizer_config: _pyo3_quant.OptimizerConfig,
+    aggregate: builtins.str = "mean",
+) -> _pyo3_quant.OptimizationResult:
+    """跨品种聚合优化：同一组参数在全部品种上回测，目标指标按 mean / min / median 聚合"""
+"#
+)]
+#[pyfunction]
+#[pyo3(signature = (data, param, template, engine_settings, optimizer_config, aggregate="mean"))]
+pub fn py_run_optimizer_across_symbols(
+    data: Vec<DataPack>,
+    param: SingleParamSet,
+    template: TemplateContainer,
+    engine_settings: SettingContainer,
+    optimizer_config: OptimizerConfig,
+    aggregate: &str,
+) -> PyResult<OptimizationResult> {
+    run_optimization_across_symbols(
+        &data,
+        &param,
+        &template,
+        &engine_settings,
+        &optimizer_config,
+        aggregate,
+    )
+    .map_err(|e| e.into())
+}
+
+#[gen_stub_pyfunction(
+    module = "pyo3_quant.backtest_engine.optimizer",
+    python = r#"
+def py_run_optimizer_per_symbol(
+    data: typing.Sequence[_pyo3_quant.DataPack],
+    param: _pyo3_quant.SingleParamSet,
+    template: _pyo3_quant.TemplateContainer,
+    engine_settings: _pyo3_quant.SettingContainer,
+    optimizer_config: _pyo3_quant.OptimizerConfig,
+) -> builtins.list[_pyo3_quant.OptimizationResult]:
+    """逐品种独立优化，共享同一个并行工作池；结果顺序与 data 一致"""
+"#
+)]
+#[pyfunction]
+pub fn py_run_optimizer_per_symbol(
+    data: Vec<DataPack>,
+    param: SingleParamSet,
+    template: TemplateContainer,
+    engine_settings: SettingContainer,
+    optimizer_config: OptimizerConfig,
+) -> PyResult<Vec<OptimizationResult>> {
+    run_optimization_per_symbol(
+        &data,
+        &param,
+        &template,
+        &engine_settings,
+        &optimizer_config,
+    )
+    .map_err(|e| e.into())
+}
@@ -0,0 +1,151 @@
+//! 多保真度筛选（successive halving）
+//!
+//! 大多数候选参数在一小段数据上就能看出明显劣势。每轮先在 active 段前缀上做低保真评估，
+//! 只有排名靠前的 `promote_ratio` 比例晋级全量评估，其余直接淘汰，不再跑完整回测。
+
+use super::{evaluate_trial, EvalMode};
+use crate::backtest_engine::data_ops::{
+    derive_slice_indices_from_data_pack, slice_data_pack_by_base_window,
+};
+use crate::backtest_engine::optimizer::memo::TrialMemo;
+use crate::backtest_engine::optimizer::param_extractor::FlattenedParam;
+use crate::error::QuantError;
+use crate::types::{DataPack, OptimizerConfig, SamplePoint, SingleParamSet};
+
+/// 构造低保真 DataPack：保留完整 base 预热段，active 段只取前 `ratio` 比例。
+pub(super) fn build_prefix_data_pack(data: &DataPack, ratio: f64) -> Result<DataPack, QuantError> {
+    let base_range = data.ranges.get(&data.base_data_key).ok_or_else(|| {
+        QuantError::InvalidParam(format!(
+            "DataPack.ranges 缺少 base_data_key='{}'",
+            data.base_data_key
+        ))
+    })?;
+    let active_bars = base_range.active_bars.max(1);
+    let prefix_active = ((active_bars as f64 * ratio).ceil() as usize).clamp(1, active_bars);
+
+    let indices =
+        derive_slice_indices_from_data_pack(data, 0, base_range.warmup_bars + prefix_active)?;
+    slice_data_pack_by_base_window(data, &indices)
+}
+
+/// 低保真排名键：NaN（如无交易时的 Calmar）视为最差，避免排序时被当作与任何值相等。
+fn ranking_value(metric_value: f64) -> f64 {
+    if metric_value.is_nan() {
+        f64::NEG_INFINITY
+    } else {
+        metric_value
+    }
+}
+
+/// 低保真筛选：返回晋级全量评估的候选与被淘汰的低保真样本。
+pub(super) fn screen_candidates(
+    low_memo: &mut TrialMemo<SamplePoint>,
+    low_mode: &EvalMode<'_>,
+    param: &SingleParamSet,
+    flat_params: &[FlattenedParam],
+    optimize_metric: &str,
+    candidates: &[Vec<f64>],
+    config: &OptimizerConfig,
+) -> Result<(Vec<Vec<f64>>, Vec<SamplePoint>), QuantError> {
+    // 中文注释：低保真结果只用于本轮排名，不进入 top-k / TPE 观测，避免与全量指标混在一起比较；
+    // 被淘汰的样本带 fidelity < 1.0 返回，供调用方留档。
+    let batch = low_memo.evaluate_batch(candidates, |vals| {
+        evaluate_trial(low_mode, param, flat_params, optimize_metric, vals).map(|sample| {
+            SamplePoint {
+                fidelity: config.fidelity_ratio,
+                ..sample
+            }
+        })
+    });
+    if let Some(err) = batch.first_error {
+        return Err(err);
+    }
+
+    let mut ranked: Vec<(usize, SamplePoint)> = batch
+        .outcomes
+        .into_iter()
+        .enumerate()
+        .filter_map(|(idx, outcome)| outcome.map(|s| (idx, s)))
+        .collect();
+    // 中文注释：稳定排序，同分时保持采样顺序，固定种子下晋级集合可复现。
+    ranked.sort_by(|a, b| {
+        ranking_value(b.1.metric_value)
+            .partial_cmp(&ranking_value(a.1.metric_value))
+            .unwrap_or(std::cmp::Ordering::Equal)
+    });
+
+    let promote_count = ((candidates.len() as f64 * config.promote_ratio).ceil() as usize)
+        .clamp(1, candidates.len().max(1))
+        .min(ranked.len());
+    let pruned: Vec<SamplePoint> = ranked
+        .split_off(promote_count)
+        .into_iter()
+        .map(|(_, sample)| sample)
+        .collect();
+    let promoted: Vec<Vec<f64>> = ranked
+        .into_iter()
+        .map(|(idx, _)| candidates[idx].clone())
+        .collect();
+
+    Ok((promoted, pruned))
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::backtest_engine::data_ops::build_data_pack;
+    use crate::types::SourceRange;
+    use polars::prelude::*;
+    use std::collections::HashMap;
+
+    fn pack_with_warmup(warmup: usize, active: usize) -> DataPack {
+        let total = warmup + active;
+        let time: Vec<i64> = (0..total as i64).map(|i| i * 60_000).collect();
+        let close: Vec<f64> = (0..total).map(|i| 100.0 + i as f64).collect();
+        let df = DataFrame::new(vec![
+            Series::new("time".into(), time).into(),
+            Series::new("open".into(), close.clone()).into(),
+            Series::new("high".into(), close.clone()).into(),
+            Series::new("low".into(), close.clone()).into(),
+            Series::new("close".into(), close.clone()).into(),
+            Series::new("volume".into(), vec![1.0; total]).into(),
+        ])
+        .expect("ohlcv frame 应成功");
+        build_data_pack(
+            HashMap::from([("ohlcv_1m".to_string(), df)]),
+            "ohlcv_1m".to_string(),
+            HashMap::from([(
+                "ohlcv_1m".to_string(),
+                SourceRange::new(warmup, active, total),
+            )]),
+            None,
+        )
+        .expect("DataPack 构建应成功")
+    }
+
+    #[test]
+    fn test_prefix_pack_keeps_warmup_and_truncates_active() {
+        let pack = pack_with_warmup(20, 100);
+        let prefix = build_prefix_data_pack(&pack, 0.25).expect("前缀切片应成功");
+
+        let range = &prefix.ranges[&prefix.base_data_key];
+        assert_eq!(range.warmup_bars, 20);
+        assert_eq!(range.active_bars, 25);
+        assert_eq!(prefix.mapping.height(), 45);
+
+        let full = build_prefix_data_pack(&pack, 1.0).expect("全量切片应成功");
+        assert_eq!(full.ranges[&full.base_data_key].active_bars, 100);
+    }
+
+    #[test]
+    fn test_ranking_value_puts_nan_last() {
+        let mut values = vec![1.0, f64::NAN, 3.0, -2.0];
+        values.sort_by(|a, b| {
+            ranking_value(*b)
+                .partial_cmp(&ranking_value(*a))
+                .unwrap_or(std::cmp::Ordering::Equal)
+        });
+        assert_eq!(&values[..3], &[3.0, 1.0, -2.0]);
+        assert!(values[3].is_nan());
+    }
+}
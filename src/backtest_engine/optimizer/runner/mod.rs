@@ -2,29 +2,40 @@
 //!
 //! 主入口函数和并行调度逻辑
 
+mod fidelity;
+mod multi_symbol;
 mod rebuild;
 mod sampling;
+mod steady_state;
 
-use crate::backtest_engine::{evaluate_param_set, validate_mode_settings};
+use crate::backtest_engine::indicators::precomputed::PrecomputedIndicators;
+use crate::backtest_engine::optimizer::memo::TrialMemo;
 use crate::backtest_engine::optimizer::optimizer_core::{
     merge_top_k, should_stop_patience, validate_config,
 };
 use crate::backtest_engine::optimizer::param_extractor::{
-    apply_values_to_param, extract_optimizable_params,
+    apply_values_to_param, extract_optimizable_params, FlattenedParam,
 };
 use crate::backtest_engine::utils;
+use crate::backtest_engine::{
+    evaluate_param_set, evaluate_param_set_precomputed, validate_mode_settings,
+};
 use crate::error::{OptimizerError, QuantError};
 use crate::types::{
-    BenchmarkFunction, DataPack, OptimizationResult, OptimizerConfig, RoundSummary, SamplePoint,
-    SettingContainer, SingleParamSet, TemplateContainer,
+    BenchmarkFunction, DataPack, OptimizationResult, OptimizerConfig, OptimizerSampler,
+    RoundSummary, SamplePoint, SettingContainer, SingleParamSet, TemplateContainer,
 };
 use rand::rngs::StdRng;
-use rand::SeedableRng;
-use rayon::prelude::*;
+use rand::{Rng, SeedableRng};
 use std::collections::HashMap;
 
+use fidelity::{build_prefix_data_pack, screen_candidates};
+pub use multi_symbol::{
+    run_optimization_across_symbols, run_optimization_per_symbol, CrossSymbolAggregate, AGGREGATES,
+};
 use rebuild::rebuild_param_set;
 use sampling::generate_samples;
+use steady_state::run_steady_state;
 
 /// 评估模式枚举
 pub enum EvalMode<'a> {
@@ -33,6 +44,15 @@ pub enum EvalMode<'a> {
         data_pack: &'a DataPack,
         template: &'a TemplateContainer,
         settings: &'a SettingContainer,
+        /// WF 预计算模式下的全量指标缓存；None 时每次试验在 data_pack 上重算指标
+        precomputed: Option<&'a PrecomputedIndicators<'a>>,
+    },
+    /// 跨品种聚合模式：同一组参数逐品种回测，目标指标按 `aggregate` 聚合
+    MultiBacktest {
+        data_packs: &'a [DataPack],
+        template: &'a TemplateContainer,
+        settings: &'a SettingContainer,
+        aggregate: CrossSymbolAggregate,
     },
     /// 基准函数模式
     BenchmarkFunction { function: BenchmarkFunction },
@@ -49,6 +69,8 @@ pub fn run_optimization_generic(
         config.top_k_ratio,
         config.samples_per_round,
         config.sigma_ratio,
+        config.fidelity_ratio,
+        config.promote_ratio,
     );
     if !validation.is_valid {
         return Err(OptimizerError::InvalidConfig(format!(
@@ -71,13 +93,78 @@ pub fn run_optimization_generic(
         );
     }
 
+    let screening = config.fidelity_ratio < 1.0;
+    if screening && config.async_mode {
+        return Err(OptimizerError::InvalidConfig(
+            "fidelity_ratio < 1.0 is not supported in async_mode".into(),
+        )
+        .into());
+    }
+
+    if config.async_mode {
+        let base_seed: u64 = rng.random();
+        let outcome = run_steady_state(&eval_mode, param, &flat_params, config, base_seed)?;
+        return build_optimization_result(param, &flat_params, config, outcome);
+    }
+
     let n_dims = flat_params.len();
     let mut best_all_time: Option<SamplePoint> = None;
     let mut history = Vec::new();
     let mut total_samples = 0;
     let mut top_k_samples: Vec<SamplePoint> = Vec::new();
+    // 中文注释：TPE 需要全部全量评估观测（含坏样本）拟合 g(x)，高斯采样器只用 TopK。
+    let mut observations: Vec<SamplePoint> = Vec::new();
     let mut max_seen: f64 = f64::NEG_INFINITY;
     let optimize_metric = config.optimize_metric.as_str();
+    let mut memo = TrialMemo::new();
+
+    // 中文注释：多保真度筛选只对回测模式有意义（基准函数没有数据长度可截）。
+    let prefix_packs = match &eval_mode {
+        EvalMode::Backtest { data_pack, .. } if screening => Some(vec![build_prefix_data_pack(
+            data_pack,
+            config.fidelity_ratio,
+        )?]),
+        EvalMode::MultiBacktest { data_packs, .. } if screening => Some(
+            data_packs
+                .iter()
+                .map(|data_pack| build_prefix_data_pack(data_pack, config.fidelity_ratio))
+                .collect::<Result<Vec<_>, _>>()?,
+        ),
+        _ => None,
+    };
+    let low_fidelity_mode = match (&eval_mode, &prefix_packs) {
+        (
+            EvalMode::Backtest {
+                template,
+                settings,
+                precomputed,
+                ..
+            },
+            Some(packs),
+        ) => Some(EvalMode::Backtest {
+            data_pack: &packs[0],
+            template: *template,
+            settings: *settings,
+            precomputed: *precomputed,
+        }),
+        (
+            EvalMode::MultiBacktest {
+                template,
+                settings,
+                aggregate,
+                ..
+            },
+            Some(packs),
+        ) => Some(EvalMode::MultiBacktest {
+            data_packs: packs,
+            template: *template,
+            settings: *settings,
+            aggregate: *aggregate,
+        }),
+        _ => None,
+    };
+    let mut low_memo = TrialMemo::new();
+    let mut pruned_samples: Vec<SamplePoint> = Vec::new();
 
     for round in 1..=config.max_rounds {
         if total_samples >= config.max_samples {
@@ -97,48 +184,36 @@ pub fn run_optimization_generic(
             n_dims,
             &flat_params,
             &top_k_samples,
+            &observations,
             config,
             &mut rng,
             round,
         );
 
-        let round_results: Vec<Result<SamplePoint, QuantError>> = next_round_vals
-            .into_par_iter()
-            .map(|vals| {
-                let mut current_set = param.clone();
-                apply_values_to_param(&mut current_set, &flat_params, &vals);
-
-                let (metric_value, all_metrics) = match &eval_mode {
-                    EvalMode::Backtest {
-                        data_pack,
-                        template,
-                        settings: _settings,
-                    } => {
-                        // 单任务内部强制 Polars 单线程，避免双层并行冲突
-                        let metrics = utils::process_param_in_single_thread(|| {
-                            evaluate_param_set(data_pack, &current_set, template)
-                        })?;
-                        let val = metrics.get(optimize_metric).cloned().unwrap_or(0.0);
-
-                        (val, metrics)
-                    }
-                    EvalMode::BenchmarkFunction { function } => {
-                        // 基准函数默认最小化，优化器统一最大化，因此取负
-                        let val = function.evaluate(&vals);
-                        (-val, HashMap::new())
-                    }
-                };
-
-                Ok(SamplePoint {
-                    values: vals,
-                    metric_value,
-                    all_metrics,
-                })
-            })
-            .collect();
-
-        let successful_samples: Vec<SamplePoint> =
-            round_results.into_iter().collect::<Result<Vec<_>, _>>()?;
+        let (full_vals, round_pruned) = match &low_fidelity_mode {
+            Some(low_mode) => screen_candidates(
+                &mut low_memo,
+                low_mode,
+                param,
+                &flat_params,
+                optimize_metric,
+                &next_round_vals,
+                config,
+            )?,
+            None => (next_round_vals, Vec::new()),
+        };
+        let pruned_count = round_pruned.len();
+        pruned_samples.extend(round_pruned);
+
+        let batch = memo.evaluate_batch(&full_vals, |vals| {
+            evaluate_trial(&eval_mode, param, &flat_params, optimize_metric, vals)
+        });
+        if let Some(err) = batch.first_error {
+            return Err(err);
+        }
+
+        // 中文注释：重复样本直接复用记忆表结果，仍计入本轮样本总数。
+        let successful_samples: Vec<SamplePoint> = batch.outcomes.into_iter().flatten().collect();
 
         if successful_samples.is_empty() {
             return Err(
@@ -146,7 +221,9 @@ pub fn run_optimization_generic(
             );
         }
 
-        total_samples += successful_samples.len();
+        // 中文注释：被淘汰的候选也消耗了采样预算，一并计入样本数。
+        let round_sample_count = successful_samples.len() + pruned_count;
+        total_samples += round_sample_count;
 
         let mut successful_samples = successful_samples;
         successful_samples.sort_by(|a, b| {
@@ -160,6 +237,9 @@ pub fn run_optimization_generic(
 
         let k = ((n_samples as f64 * config.top_k_ratio) as usize).max(1);
         top_k_samples = merge_top_k(&top_k_samples, &successful_samples, k);
+        if config.sampler == OptimizerSampler::Tpe {
+            observations.extend(successful_samples.iter().cloned());
+        }
 
         if best_all_time
             .as_ref()
@@ -176,7 +256,9 @@ pub fn run_optimization_generic(
             round,
             best_value: max_seen,
             median_value: round_median,
-            sample_count: successful_samples.len(),
+            sample_count: round_sample_count,
+            unique_count: batch.evaluated,
+            pruned_count,
         });
 
         if total_samples >= config.min_samples
@@ -186,10 +268,109 @@ pub fn run_optimization_generic(
         }
     }
 
+    build_optimization_result(
+        param,
+        &flat_params,
+        config,
+        SearchOutcome {
+            best_all_time,
+            top_k_samples,
+            history,
+            total_samples,
+            pruned_samples,
+        },
+    )
+}
+
+/// 搜索阶段的产出，供同步 / 异步两种模式共用结果组装。
+struct SearchOutcome {
+    best_all_time: Option<SamplePoint>,
+    top_k_samples: Vec<SamplePoint>,
+    history: Vec<RoundSummary>,
+    total_samples: usize,
+    /// 低保真筛选淘汰的样本（异步稳态模式不做筛选，始终为空）
+    pruned_samples: Vec<SamplePoint>,
+}
+
+/// 评估单个试验：应用参数值并按评估模式计算目标指标。
+fn evaluate_trial(
+    eval_mode: &EvalMode<'_>,
+    param: &SingleParamSet,
+    flat_params: &[FlattenedParam],
+    optimize_metric: &str,
+    vals: &[f64],
+) -> Result<SamplePoint, QuantError> {
+    let mut current_set = param.clone();
+    apply_values_to_param(&mut current_set, flat_params, vals);
+
+    let (metric_value, all_metrics) = match eval_mode {
+        EvalMode::Backtest {
+            data_pack,
+            template,
+            settings: _settings,
+            precomputed,
+        } => {
+            // 单任务内部强制 Polars 单线程，避免双层并行冲突
+            let metrics = utils::process_param_in_single_thread(|| match precomputed {
+                Some(precomputed) => {
+                    evaluate_param_set_precomputed(data_pack, &current_set, template, precomputed)
+                }
+                None => evaluate_param_set(data_pack, &current_set, template),
+            })?;
+            let val = metrics.get(optimize_metric).cloned().unwrap_or(0.0);
+
+            (val, metrics)
+        }
+        EvalMode::MultiBacktest {
+            data_packs,
+            template,
+            aggregate,
+            ..
+        } => {
+            let per_symbol = utils::process_param_in_single_thread(|| {
+                data_packs
+                    .iter()
+                    .map(|data_pack| evaluate_param_set(data_pack, &current_set, template))
+                    .collect::<Result<Vec<_>, _>>()
+            })?;
+            let metrics = aggregate.merge_metrics(&per_symbol);
+            let val = metrics.get(optimize_metric).cloned().unwrap_or(0.0);
+
+            (val, metrics)
+        }
+        EvalMode::BenchmarkFunction { function } => {
+            // 基准函数默认最小化，优化器统一最大化，因此取负
+            let val = function.evaluate(vals);
+            (-val, HashMap::new())
+        }
+    };
+
+    Ok(SamplePoint {
+        values: vals.to_vec(),
+        metric_value,
+        all_metrics,
+        fidelity: 1.0,
+    })
+}
+
+fn build_optimization_result(
+    param: &SingleParamSet,
+    flat_params: &[FlattenedParam],
+    config: &OptimizerConfig,
+    outcome: SearchOutcome,
+) -> Result<OptimizationResult, QuantError> {
+    let SearchOutcome {
+        best_all_time,
+        top_k_samples,
+        history,
+        total_samples,
+        pruned_samples,
+    } = outcome;
+
     let best = best_all_time
         .ok_or_else(|| OptimizerError::SamplingFailed("No samples succeeded".into()))?;
 
-    let best_param_set = rebuild_param_set(param, &flat_params, &best.values);
+    let best_param_set = rebuild_param_set(param, flat_params, &best.values);
 
     let top_k_params: Vec<SingleParamSet> = top_k_samples
         .iter()
@@ -198,7 +379,7 @@ pub fn run_optimization_generic(
         } else {
             0
         })
-        .map(|s| rebuild_param_set(param, &flat_params, &s.values))
+        .map(|s| rebuild_param_set(param, flat_params, &s.values))
         .collect();
 
     Ok(OptimizationResult {
@@ -211,6 +392,7 @@ pub fn run_optimization_generic(
         history,
         top_k_params,
         top_k_samples,
+        pruned_samples,
     })
 }
 
@@ -221,6 +403,18 @@ pub fn run_optimization(
     template: &TemplateContainer,
     settings: &SettingContainer,
     config: &OptimizerConfig,
+) -> Result<OptimizationResult, QuantError> {
+    run_optimization_with_precomputed(data_pack, param, template, settings, config, None)
+}
+
+/// 运行参数优化，指标可取自全量预计算缓存（WF 预计算模式）。
+pub fn run_optimization_with_precomputed(
+    data_pack: &DataPack,
+    param: &SingleParamSet,
+    template: &TemplateContainer,
+    settings: &SettingContainer,
+    config: &OptimizerConfig,
+    precomputed: Option<&PrecomputedIndicators<'_>>,
 ) -> Result<OptimizationResult, QuantError> {
     validate_mode_settings(
         settings,
@@ -234,6 +428,7 @@ pub fn run_optimization(
             data_pack,
             template,
             settings,
+            precomputed,
         },
         param,
         config,
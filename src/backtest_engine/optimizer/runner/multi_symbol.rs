@@ -0,0 +1,157 @@
+//! 跨品种批量优化
+//!
+//! 同一策略在多个品种上优化时，逐个调用 `run_optimization` 会让每个品种各自经历轮次屏障与 Python 往返。
+//! 这里提供两种一次调用完成的入口：
+//! - 独立优化：各品种各自搜索，但共享同一个 rayon 工作窃取池，某个品种在轮尾等待时，
+//!   空闲线程会去执行其他品种的试验；
+//! - 聚合优化：同一组参数在全部品种上回测，目标指标按 mean / min / median 聚合，求跨品种稳健参数。
+
+use super::{run_optimization, run_optimization_generic, EvalMode};
+use crate::backtest_engine::validate_mode_settings;
+use crate::error::{OptimizerError, QuantError};
+use crate::types::{
+    ArtifactRetention, DataPack, ExecutionStage, OptimizationResult, OptimizerConfig,
+    PerformanceMetrics, SettingContainer, SingleParamSet, TemplateContainer,
+};
+use rayon::prelude::*;
+use std::collections::HashMap;
+
+/// 支持的跨品种聚合方式
+pub const AGGREGATES: [&str; 3] = ["mean", "min", "median"];
+
+/// 跨品种指标聚合方式
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum CrossSymbolAggregate {
+    Mean,
+    Min,
+    Median,
+}
+
+impl CrossSymbolAggregate {
+    pub fn parse(name: &str) -> Result<Self, QuantError> {
+        match name {
+            "mean" => Ok(Self::Mean),
+            "min" => Ok(Self::Min),
+            "median" => Ok(Self::Median),
+            other => Err(OptimizerError::InvalidConfig(format!(
+                "unknown cross-symbol aggregate '{other}', expected one of {AGGREGATES:?}"
+            ))
+            .into()),
+        }
+    }
+
+    fn apply(&self, values: &[f64]) -> f64 {
+        match self {
+            Self::Mean => values.iter().sum::<f64>() / values.len() as f64,
+            Self::Min => values.iter().copied().fold(f64::INFINITY, f64::min),
+            Self::Median => {
+                let mut sorted = values.to_vec();
+                sorted.sort_by(|a, b| a.total_cmp(b));
+                let mid = sorted.len() / 2;
+                if sorted.len() % 2 == 1 {
+                    sorted[mid]
+                } else {
+                    (sorted[mid - 1] + sorted[mid]) / 2.0
+                }
+            }
+        }
+    }
+
+    /// 逐指标聚合；只有全部品种都给出的指标才进入结果。
+    pub(super) fn merge_metrics(&self, per_symbol: &[PerformanceMetrics]) -> PerformanceMetrics {
+        let Some((first, rest)) = per_symbol.split_first() else {
+            return HashMap::new();
+        };
+        first
+            .keys()
+            .filter_map(|key| {
+                let values = std::iter::once(first[key])
+                    .chain(rest.iter().filter_map(|metrics| metrics.get(key).copied()))
+                    .collect::<Vec<_>>();
+                (values.len() == per_symbol.len()).then(|| (key.clone(), self.apply(&values)))
+            })
+            .collect()
+    }
+}
+
+fn ensure_symbols(data_packs: &[DataPack]) -> Result<(), QuantError> {
+    if data_packs.is_empty() {
+        return Err(OptimizerError::InvalidConfig(
+            "cross-symbol optimization requires data".into(),
+        )
+        .into());
+    }
+    Ok(())
+}
+
+/// 聚合优化：搜索一组在全部品种上聚合目标指标最优的参数。
+pub fn run_optimization_across_symbols(
+    data_packs: &[DataPack],
+    param: &SingleParamSet,
+    template: &TemplateContainer,
+    settings: &SettingContainer,
+    config: &OptimizerConfig,
+    aggregate: &str,
+) -> Result<OptimizationResult, QuantError> {
+    ensure_symbols(data_packs)?;
+    validate_mode_settings(
+        settings,
+        "run_optimization_across_symbols(...)",
+        ExecutionStage::Performance,
+        ArtifactRetention::StopStageOnly,
+    )?;
+
+    run_optimization_generic(
+        EvalMode::MultiBacktest {
+            data_packs,
+            template,
+            settings,
+            aggregate: CrossSymbolAggregate::parse(aggregate)?,
+        },
+        param,
+        config,
+    )
+}
+
+/// 独立优化：每个品种各自搜索，结果顺序与 `data_packs` 一致。
+pub fn run_optimization_per_symbol(
+    data_packs: &[DataPack],
+    param: &SingleParamSet,
+    template: &TemplateContainer,
+    settings: &SettingContainer,
+    config: &OptimizerConfig,
+) -> Result<Vec<OptimizationResult>, QuantError> {
+    ensure_symbols(data_packs)?;
+    // 中文注释：外层按品种并行，内层每轮的批量评估嵌套在同一个线程池里，由工作窃取填满轮尾空档。
+    data_packs
+        .par_iter()
+        .map(|data_pack| run_optimization(data_pack, param, template, settings, config))
+        .collect()
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_aggregate_merges_common_metrics() {
+        let per_symbol = vec![
+            HashMap::from([("calmar".to_string(), 1.0), ("only_first".to_string(), 9.0)]),
+            HashMap::from([("calmar".to_string(), 3.0)]),
+            HashMap::from([("calmar".to_string(), -2.0)]),
+        ];
+
+        let mean = CrossSymbolAggregate::Mean.merge_metrics(&per_symbol);
+        assert_eq!(mean.len(), 1);
+        assert!((mean["calmar"] - 2.0 / 3.0).abs() < 1e-12);
+        assert_eq!(
+            CrossSymbolAggregate::Min.merge_metrics(&per_symbol)["calmar"],
+            -2.0
+        );
+        assert_eq!(
+            CrossSymbolAggregate::Median.merge_metrics(&per_symbol)["calmar"],
+            1.0
+        );
+        assert!(CrossSymbolAggregate::parse("max").is_err());
+    }
+}
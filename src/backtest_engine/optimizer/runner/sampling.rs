@@ -1,9 +1,10 @@
 use crate::backtest_engine::optimizer::param_extractor::{quantize_value, FlattenedParam};
 use crate::backtest_engine::optimizer::sampler::{
-    lhs_sample, transform_sample, weighted_gaussian_sample,
+    inverse_transform_sample, lhs_sample, transform_sample, weighted_gaussian_sample, TpeSampler,
 };
-use crate::types::{OptimizerConfig, SamplePoint};
+use crate::types::{OptimizerConfig, OptimizerSampler, SamplePoint};
 use rand::rngs::StdRng;
+use rand::Rng;
 
 /// 生成一批采样点的参数值。
 pub(super) fn generate_samples(
@@ -12,6 +13,7 @@ pub(super) fn generate_samples(
     n_dims: usize,
     flat_params: &[FlattenedParam],
     top_k_samples: &[SamplePoint],
+    observations: &[SamplePoint],
     config: &OptimizerConfig,
     rng: &mut StdRng,
     current_round: usize,
@@ -37,33 +39,121 @@ pub(super) fn generate_samples(
         }
     }
 
+    // 利用部分：TPE（整轮共用一次拟合）
+    if exploitation_count > 0 && config.sampler == OptimizerSampler::Tpe && !observations.is_empty()
+    {
+        let tpe = fit_tpe(flat_params, observations);
+        for _ in 0..exploitation_count {
+            next_round_vals.push(tpe_sample(flat_params, &tpe, rng));
+        }
+        return next_round_vals;
+    }
+
     // 利用部分：加权高斯
     if exploitation_count > 0 && !top_k_samples.is_empty() {
         for _ in 0..exploitation_count {
-            let mut vals = Vec::new();
-            for (dim, p) in flat_params.iter().enumerate() {
-                let centers: Vec<(f64, f64)> = top_k_samples
-                    .iter()
-                    .enumerate()
-                    .map(|(i, s)| {
-                        let weight = (-(config.weight_decay * i as f64)).exp();
-                        (s.values[dim], weight)
-                    })
-                    .collect();
-
-                let val = weighted_gaussian_sample(
-                    &centers,
-                    p.param.min,
-                    p.param.max,
-                    current_sigma_ratio,
-                    p.param.log_scale,
-                    rng,
-                );
-                vals.push(quantize_value(val, p.param.step, p.param.dtype));
-            }
-            next_round_vals.push(vals);
+            next_round_vals.push(exploit_sample(
+                flat_params,
+                top_k_samples,
+                config,
+                current_sigma_ratio,
+                rng,
+            ));
         }
     }
 
     next_round_vals
 }
+
+/// 以 TopK 为加权高斯中心生成单个利用样本。
+fn exploit_sample(
+    flat_params: &[FlattenedParam],
+    top_k_samples: &[SamplePoint],
+    config: &OptimizerConfig,
+    sigma_ratio: f64,
+    rng: &mut StdRng,
+) -> Vec<f64> {
+    let mut vals = Vec::new();
+    for (dim, p) in flat_params.iter().enumerate() {
+        let centers: Vec<(f64, f64)> = top_k_samples
+            .iter()
+            .enumerate()
+            .map(|(i, s)| {
+                let weight = (-(config.weight_decay * i as f64)).exp();
+                (s.values[dim], weight)
+            })
+            .collect();
+
+        let val = weighted_gaussian_sample(
+            &centers,
+            p.param.min,
+            p.param.max,
+            sigma_ratio,
+            p.param.log_scale,
+            rng,
+        );
+        vals.push(quantize_value(val, p.param.step, p.param.dtype));
+    }
+    vals
+}
+
+/// 在全部已评估观测上拟合 TPE（参数值先映射回 [0, 1]）。
+fn fit_tpe(flat_params: &[FlattenedParam], observations: &[SamplePoint]) -> TpeSampler {
+    let u_points: Vec<Vec<f64>> = observations
+        .iter()
+        .map(|s| {
+            flat_params
+                .iter()
+                .zip(&s.values)
+                .map(|(p, &v)| {
+                    inverse_transform_sample(v, p.param.min, p.param.max, p.param.log_scale)
+                })
+                .collect()
+        })
+        .collect();
+    let scores: Vec<f64> = observations.iter().map(|s| s.metric_value).collect();
+    TpeSampler::fit(&u_points, &scores, flat_params.len())
+}
+
+/// 从 TPE 抽取单个样本并变换、量化到参数空间。
+fn tpe_sample(flat_params: &[FlattenedParam], tpe: &TpeSampler, rng: &mut StdRng) -> Vec<f64> {
+    tpe.sample(rng)
+        .into_iter()
+        .zip(flat_params)
+        .map(|(u, p)| {
+            let val = transform_sample(u, p.param.min, p.param.max, p.param.log_scale);
+            quantize_value(val, p.param.step, p.param.dtype)
+        })
+        .collect()
+}
+
+/// 异步稳态模式下逐个生成试验样本。
+///
+/// 中文注释：TopK 为空时必然探索；否则按 `explore_ratio` 概率探索（单点无法做 LHS，改为逐维均匀采样），
+/// 其余走利用：TPE 采样器在全部已提交观测上拟合；高斯采样器的 sigma 按虚拟轮次 `round` 衰减，与同步模式口径一致。
+pub(super) fn generate_trial_sample(
+    flat_params: &[FlattenedParam],
+    top_k_samples: &[SamplePoint],
+    observations: &[SamplePoint],
+    config: &OptimizerConfig,
+    rng: &mut StdRng,
+    round: usize,
+) -> Vec<f64> {
+    let explore = top_k_samples.is_empty() || rng.random::<f64>() < config.explore_ratio;
+    if !explore && config.sampler == OptimizerSampler::Tpe && !observations.is_empty() {
+        return tpe_sample(flat_params, &fit_tpe(flat_params, observations), rng);
+    }
+    if !explore {
+        let sigma_ratio = config.sigma_ratio / (round as f64).sqrt();
+        return exploit_sample(flat_params, top_k_samples, config, sigma_ratio, rng);
+    }
+
+    flat_params
+        .iter()
+        .map(|p| {
+            let u = rng.random::<f64>();
+            let val = transform_sample(u, p.param.min, p.param.max, p.param.log_scale);
+            quantize_value(val, p.param.step, p.param.dtype)
+        })
+        .collect()
+}
@@ -0,0 +1,395 @@
+//! 异步稳态优化模式
+//!
+//! 同步模式每轮要等最慢的试验结束才能排序、再采样，轮尾大量核心空转。
+//! 稳态模式把试验逐个投进 rayon 工作窃取池：任一试验完成即补派下一个，TopK 随结果到达而更新。
+//!
+//! 中文注释：为了在固定种子下可复现，结果按试验序号提交（重排缓冲）：
+//! 第 j 个试验在提交前沿达到 `j + 1 - samples_per_round` 时派发，只看到这么多已提交结果，
+//! 且使用由 `(base_seed, j)` 派生的独立 RNG，因此结果与线程数、完成先后无关。
+
+use super::sampling::generate_trial_sample;
+use super::{evaluate_trial, EvalMode, SearchOutcome};
+use crate::backtest_engine::optimizer::memo::TrialMemo;
+use crate::backtest_engine::optimizer::optimizer_core::{merge_top_k, should_stop_patience};
+use crate::backtest_engine::optimizer::param_extractor::FlattenedParam;
+use crate::error::{OptimizerError, QuantError};
+use crate::types::{OptimizerConfig, OptimizerSampler, RoundSummary, SamplePoint, SingleParamSet};
+use rand::rngs::StdRng;
+use rand::SeedableRng;
+use std::collections::{BTreeMap, HashMap};
+use std::panic::{catch_unwind, AssertUnwindSafe};
+use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::mpsc::{channel, Receiver, TryRecvError};
+
+/// 由基础种子与试验序号派生独立种子（SplitMix64 混合）。
+fn trial_seed(base_seed: u64, seq: usize) -> u64 {
+    let mut z = base_seed.wrapping_add((seq as u64).wrapping_mul(0x9E37_79B9_7F4A_7C15));
+    z = (z ^ (z >> 30)).wrapping_mul(0xBF58_476D_1CE4_E5B9);
+    z = (z ^ (z >> 27)).wrapping_mul(0x94D0_49BB_1331_11EB);
+    z ^ (z >> 31)
+}
+
+/// 等待一个试验结果。
+///
+/// 中文注释：协调线程本身若是 rayon worker，阻塞等待会白占一个线程（单线程池下直接死锁），
+/// 因此改为轮询并让出执行其他待办任务。
+fn receive<T>(rx: &Receiver<T>) -> T {
+    if rayon::current_thread_index().is_none() {
+        return rx.recv().expect("试验结果通道在协调结束前不会关闭");
+    }
+    loop {
+        match rx.try_recv() {
+            Ok(message) => return message,
+            Err(TryRecvError::Empty) => {
+                if rayon::yield_now() != Some(rayon::Yield::Executed) {
+                    std::thread::yield_now();
+                }
+            }
+            Err(TryRecvError::Disconnected) => {
+                unreachable!("试验结果通道在协调结束前不会关闭")
+            }
+        }
+    }
+}
+
+/// 按提交顺序累积的搜索状态。
+struct SteadyState<'a> {
+    config: &'a OptimizerConfig,
+    flat_params: &'a [FlattenedParam],
+    base_seed: u64,
+    window: usize,
+    top_k_size: usize,
+    top_k_samples: Vec<SamplePoint>,
+    /// TPE 拟合用的全部已提交观测（高斯采样器下保持为空）
+    observations: Vec<SamplePoint>,
+    best_all_time: Option<SamplePoint>,
+    max_seen: f64,
+    history: Vec<RoundSummary>,
+    round_values: Vec<f64>,
+    round_unique: usize,
+    total_samples: usize,
+    stopped: bool,
+}
+
+impl SteadyState<'_> {
+    /// 生成第 `seq` 个试验的参数值；每满 `window` 个试验视为一个虚拟轮次。
+    fn trial_values(&self, seq: usize) -> Vec<f64> {
+        let mut rng = StdRng::seed_from_u64(trial_seed(self.base_seed, seq));
+        generate_trial_sample(
+            self.flat_params,
+            &self.top_k_samples,
+            &self.observations,
+            self.config,
+            &mut rng,
+            seq / self.window + 1,
+        )
+    }
+
+    fn commit(&mut self, sample: SamplePoint, evaluated: bool) {
+        self.total_samples += 1;
+        self.round_unique += usize::from(evaluated);
+        self.round_values.push(sample.metric_value);
+
+        if sample.metric_value > self.max_seen {
+            self.max_seen = sample.metric_value;
+        }
+        if self
+            .best_all_time
+            .as_ref()
+            .is_none_or(|b| sample.metric_value > b.metric_value)
+        {
+            self.best_all_time = Some(sample.clone());
+        }
+        self.top_k_samples = merge_top_k(
+            &self.top_k_samples,
+            std::slice::from_ref(&sample),
+            self.top_k_size,
+        );
+        if self.config.sampler == OptimizerSampler::Tpe {
+            self.observations.push(sample);
+        }
+
+        if self.round_values.len() == self.window {
+            self.close_round();
+        }
+    }
+
+    /// 每满一个虚拟轮次记录 RoundSummary，并按同步模式的规则检查耐心停止。
+    fn close_round(&mut self) {
+        let mut values = std::mem::take(&mut self.round_values);
+        values.sort_by(|a, b| b.partial_cmp(a).unwrap_or(std::cmp::Ordering::Equal));
+
+        self.history.push(RoundSummary {
+            round: self.history.len() + 1,
+            best_value: self.max_seen,
+            median_value: values[values.len() / 2],
+            sample_count: values.len(),
+            unique_count: std::mem::take(&mut self.round_unique),
+            pruned_count: 0,
+        });
+
+        if self.total_samples >= self.config.min_samples
+            && should_stop_patience(&self.history, self.config.stop_patience)
+        {
+            self.stopped = true;
+        }
+    }
+}
+
+/// 运行异步稳态搜索。
+pub(super) fn run_steady_state(
+    eval_mode: &EvalMode<'_>,
+    param: &SingleParamSet,
+    flat_params: &[FlattenedParam],
+    config: &OptimizerConfig,
+    base_seed: u64,
+) -> Result<SearchOutcome, QuantError> {
+    let window = config.samples_per_round;
+    // 中文注释：同步模式按整轮推进，总试验数为整轮数 × 每轮样本数，这里保持同一上限。
+    let max_trials = config.max_samples.div_ceil(window).min(config.max_rounds) * window;
+    let optimize_metric = config.optimize_metric.as_str();
+
+    let mut state = SteadyState {
+        config,
+        flat_params,
+        base_seed,
+        window,
+        top_k_size: ((window as f64 * config.top_k_ratio) as usize).max(1),
+        top_k_samples: Vec::new(),
+        observations: Vec::new(),
+        best_all_time: None,
+        max_seen: f64::NEG_INFINITY,
+        history: Vec::new(),
+        round_values: Vec::with_capacity(window),
+        round_unique: 0,
+        total_samples: 0,
+        stopped: false,
+    };
+    let mut memo: TrialMemo<SamplePoint> = TrialMemo::new();
+    let mut ready: BTreeMap<usize, (Result<SamplePoint, QuantError>, bool)> = BTreeMap::new();
+    // 中文注释：首个派发者序号 → 与其参数相同、等待复用其结果的后续试验序号。
+    let mut followers: HashMap<usize, Vec<usize>> = HashMap::new();
+    let mut first_error: Option<QuantError> = None;
+    let cancelled = AtomicBool::new(false);
+    let (tx, rx) = channel::<(usize, Result<SamplePoint, QuantError>)>();
+
+    let mut dispatched = 0usize;
+    let mut committed = 0usize;
+    let mut in_flight = 0usize;
+
+    rayon::in_place_scope(|scope| loop {
+        // 1. 派发：在途试验不超过一个窗口，且每个试验只依赖已提交前沿
+        while !state.stopped && dispatched < max_trials && dispatched < committed + window {
+            let seq = dispatched;
+            let values = state.trial_values(seq);
+            dispatched += 1;
+
+            if let Some(Some(cached)) = memo.get(&values) {
+                ready.insert(seq, (Ok(cached.clone()), false));
+                continue;
+            }
+            if let Some(leader) = memo.claim(&values, seq) {
+                followers.entry(leader).or_default().push(seq);
+                continue;
+            }
+
+            in_flight += 1;
+            let tx = tx.clone();
+            let cancelled = &cancelled;
+            scope.spawn(move |_| {
+                let result = if cancelled.load(Ordering::Relaxed) {
+                    Err(OptimizerError::SamplingFailed("trial cancelled".into()).into())
+                } else {
+                    catch_unwind(AssertUnwindSafe(|| {
+                        evaluate_trial(eval_mode, param, flat_params, optimize_metric, &values)
+                    }))
+                    .unwrap_or_else(|_| {
+                        Err(OptimizerError::SamplingFailed("trial panicked".into()).into())
+                    })
+                };
+                let _ = tx.send((seq, result));
+            });
+        }
+
+        // 2. 提交：每次只推进一个序号，随后立即回到派发，保证派发时的 TopK 状态确定
+        if !state.stopped {
+            if let Some((result, evaluated)) = ready.remove(&committed) {
+                committed += 1;
+                match result {
+                    Ok(sample) => state.commit(sample, evaluated),
+                    Err(err) => {
+                        first_error = Some(err);
+                        state.stopped = true;
+                    }
+                }
+                if state.stopped {
+                    cancelled.store(true, Ordering::Relaxed);
+                }
+                continue;
+            }
+        }
+
+        // 3. 等待：停止后仍需收回在途试验，scope 结束前不能留下未完成任务
+        if in_flight == 0 {
+            break;
+        }
+        let (seq, result) = receive(&rx);
+        in_flight -= 1;
+        // 中文注释：结果到达即入表并分发给在途期间派发的同参数试验。
+        // 首个派发者序号最小，出错时会先于这些试验提交并停止搜索，它们无需结果。
+        if let Ok(sample) = &result {
+            memo.insert(&sample.values, Some(sample.clone()));
+            for follower in followers.remove(&seq).unwrap_or_default() {
+                ready.insert(follower, (Ok(sample.clone()), false));
+            }
+        }
+        ready.insert(seq, (result, true));
+    });
+
+    if let Some(err) = first_error {
+        return Err(err);
+    }
+    if state.total_samples == 0 {
+        return Err(OptimizerError::SamplingFailed("All samples in round failed".into()).into());
+    }
+
+    Ok(SearchOutcome {
+        best_all_time: state.best_all_time,
+        top_k_samples: state.top_k_samples,
+        history: state.history,
+        total_samples: state.total_samples,
+        pruned_samples: Vec::new(),
+    })
+}
+
+#[cfg(test)]
+mod tests {
+    use super::super::run_optimization_generic;
+    use super::*;
+    use crate::backtest_engine::optimizer::test_helpers::{
+        create_dummy_backtest_params, create_dummy_performance_params,
+    };
+    use crate::types::{BenchmarkFunction, Param, ParamType};
+    use std::collections::HashMap;
+
+    fn sphere_param_set(dims: usize) -> SingleParamSet {
+        let param = Param::new(
+            0.0,
+            Some(-5.0),
+            Some(5.0),
+            Some(ParamType::Float),
+            true,
+            false,
+            0.01,
+        );
+        uniform_param_set(dims, param)
+    }
+
+    fn uniform_param_set(dims: usize, param: Param) -> SingleParamSet {
+        let group = (0..dims)
+            .map(|i| (format!("x{i}"), param.clone()))
+            .collect::<HashMap<_, _>>();
+        SingleParamSet {
+            indicators: HashMap::from([(
+                "mock_tf".to_string(),
+                HashMap::from([("g1".to_string(), group)]),
+            )]),
+            signal: Default::default(),
+            backtest: create_dummy_backtest_params(),
+            performance: create_dummy_performance_params(),
+        }
+    }
+
+    fn async_config(seed: u64) -> OptimizerConfig {
+        OptimizerConfig {
+            samples_per_round: 20,
+            max_samples: 400,
+            min_samples: 100,
+            max_rounds: 50,
+            stop_patience: 5,
+            seed: Some(seed),
+            async_mode: true,
+            ..OptimizerConfig::default()
+        }
+    }
+
+    fn run_sphere(config: &OptimizerConfig) -> crate::types::OptimizationResult {
+        run_optimization_generic(
+            EvalMode::BenchmarkFunction {
+                function: BenchmarkFunction::Sphere,
+            },
+            &sphere_param_set(3),
+            config,
+        )
+        .expect("稳态优化应成功")
+    }
+
+    #[test]
+    fn test_steady_state_is_deterministic_with_fixed_seed() {
+        let config = async_config(7);
+        let first = run_sphere(&config);
+        let second = run_sphere(&config);
+
+        assert_eq!(first.total_samples, second.total_samples);
+        assert_eq!(first.optimize_value, second.optimize_value);
+        assert_eq!(
+            first
+                .top_k_samples
+                .iter()
+                .map(|s| &s.values)
+                .collect::<Vec<_>>(),
+            second
+                .top_k_samples
+                .iter()
+                .map(|s| &s.values)
+                .collect::<Vec<_>>()
+        );
+    }
+
+    #[test]
+    fn test_steady_state_respects_round_contract() {
+        let config = async_config(11);
+        let result = run_sphere(&config);
+
+        assert!(result.total_samples <= config.max_samples);
+        assert_eq!(result.total_samples % config.samples_per_round, 0);
+        assert_eq!(result.rounds, result.history.len());
+        for (idx, summary) in result.history.iter().enumerate() {
+            assert_eq!(summary.round, idx + 1);
+            assert_eq!(summary.sample_count, config.samples_per_round);
+            assert!(summary.unique_count <= summary.sample_count);
+        }
+        assert!(result
+            .history
+            .windows(2)
+            .all(|pair| pair[1].best_value >= pair[0].best_value));
+        // 中文注释：球函数最优为 0，取负后的目标值应明显接近 0。
+        assert!(result.optimize_value > -1.0);
+    }
+
+    #[test]
+    fn test_steady_state_evaluates_in_flight_duplicates_once() {
+        // 中文注释：两维整数参数各取 {-1, 0, 1}，仅 9 个不同取值；同一窗口内大量重复样本同时在途，
+        // 只有首个派发者应被评估，全程去重评估数不可能超过取值空间大小。
+        let param = Param::new(
+            0.0,
+            Some(-1.0),
+            Some(1.0),
+            Some(ParamType::Integer),
+            true,
+            false,
+            1.0,
+        );
+        let result = run_optimization_generic(
+            EvalMode::BenchmarkFunction {
+                function: BenchmarkFunction::Sphere,
+            },
+            &uniform_param_set(2, param),
+            &async_config(3),
+        )
+        .expect("稳态优化应成功");
+
+        let unique: usize = result.history.iter().map(|s| s.unique_count).sum();
+        assert!(unique <= 9, "去重评估数 {unique} 超过取值空间大小");
+    }
+}
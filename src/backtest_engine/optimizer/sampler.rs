@@ -104,3 +104,199 @@ pub fn weighted_gaussian_sample(
         sample_raw
     }
 }
+
+/// 将参数空间值映射回 [0, 1]（`transform_sample` 的逆变换）
+pub fn inverse_transform_sample(value: f64, min: f64, max: f64, log_scale: bool) -> f64 {
+    let (lo, hi, v) = if log_scale {
+        (min.max(1e-6).ln(), max.max(1e-6).ln(), value.max(1e-6).ln())
+    } else {
+        (min, max, value)
+    };
+    if hi <= lo {
+        return 0.5;
+    }
+    ((v - lo) / (hi - lo)).clamp(0.0, 1.0)
+}
+
+/// TPE 好样本分位比例
+const TPE_GAMMA: f64 = 0.25;
+/// TPE 每维候选数（与 Optuna 默认值一致）
+const TPE_N_CANDIDATES: usize = 24;
+
+/// 标准正态分布函数（Abramowitz-Stegun 7.1.26 近似 erf，误差 < 1.5e-7）
+fn normal_cdf(z: f64) -> f64 {
+    let x = z.abs() / std::f64::consts::SQRT_2;
+    let t = 1.0 / (1.0 + 0.327_591_1 * x);
+    let poly = t
+        * (0.254_829_592
+            + t * (-0.284_496_736
+                + t * (1.421_413_741 + t * (-1.453_152_027 + t * 1.061_405_429))));
+    let erf = 1.0 - poly * (-x * x).exp();
+    if z >= 0.0 {
+        0.5 * (1.0 + erf)
+    } else {
+        0.5 * (1.0 - erf)
+    }
+}
+
+/// [0, 1] 上的一维截断 Parzen 估计器：每个观测一个高斯核，外加一个覆盖全域的先验核。
+struct ParzenEstimator {
+    mus: Vec<f64>,
+    sigmas: Vec<f64>,
+    /// 各核的 ln(权重 / 截断质量)，各核等权
+    log_norms: Vec<f64>,
+}
+
+impl ParzenEstimator {
+    fn new(points: &[f64]) -> Self {
+        let mut mus: Vec<f64> = points.to_vec();
+        mus.push(0.5);
+        mus.sort_by(|a, b| a.partial_cmp(b).unwrap_or(std::cmp::Ordering::Equal));
+
+        // 中文注释：带宽取与左右邻居距离的较大者，并裁剪到 [1 / min(100, n + 1), 1]（Optuna 口径）。
+        let n = mus.len();
+        let min_sigma = 1.0 / (n as f64).min(100.0);
+        let sigmas: Vec<f64> = (0..n)
+            .map(|i| {
+                let left = if i == 0 { mus[i] } else { mus[i] - mus[i - 1] };
+                let right = if i + 1 == n {
+                    1.0 - mus[i]
+                } else {
+                    mus[i + 1] - mus[i]
+                };
+                left.max(right).clamp(min_sigma, 1.0)
+            })
+            .collect();
+        // 先验核固定为 N(0.5, 1)
+        let prior_idx = mus.iter().position(|&m| m == 0.5).unwrap_or(0);
+        let mut sigmas = sigmas;
+        sigmas[prior_idx] = 1.0;
+
+        let weight = 1.0 / n as f64;
+        let log_norms = mus
+            .iter()
+            .zip(&sigmas)
+            .map(|(&mu, &sigma)| {
+                let mass = normal_cdf((1.0 - mu) / sigma) - normal_cdf(-mu / sigma);
+                weight.ln() - mass.max(1e-12).ln()
+            })
+            .collect();
+
+        Self {
+            mus,
+            sigmas,
+            log_norms,
+        }
+    }
+
+    fn sample(&self, rng: &mut impl Rng) -> f64 {
+        let idx = rng.random_range(0..self.mus.len());
+        let normal = Normal::new(self.mus[idx], self.sigmas[idx])
+            .unwrap_or_else(|_| Normal::new(0.5, 1.0).unwrap());
+        // 截断采样：拒绝域外样本，极端情况下回退裁剪
+        for _ in 0..100 {
+            let x = normal.sample(rng);
+            if (0.0..=1.0).contains(&x) {
+                return x;
+            }
+        }
+        normal.sample(rng).clamp(0.0, 1.0)
+    }
+
+    fn log_pdf(&self, x: f64) -> f64 {
+        let terms: Vec<f64> = self
+            .mus
+            .iter()
+            .zip(&self.sigmas)
+            .zip(&self.log_norms)
+            .map(|((&mu, &sigma), &log_norm)| {
+                let z = (x - mu) / sigma;
+                log_norm - 0.5 * z * z - sigma.ln() - 0.5 * (2.0 * std::f64::consts::PI).ln()
+            })
+            .collect();
+        let max = terms.iter().cloned().fold(f64::NEG_INFINITY, f64::max);
+        max + terms.iter().map(|t| (t - max).exp()).sum::<f64>().ln()
+    }
+}
+
+/// 独立 TPE 采样器（单位超立方体 [0, 1]^d，目标最大化）
+///
+/// 观测按目标值降序取前 `TPE_GAMMA` 为好样本集 l(x)、其余为 g(x)，
+/// 每维从 l(x) 抽取候选并选 `ln l(x) - ln g(x)` 最大者。
+pub struct TpeSampler {
+    dims: Vec<(ParzenEstimator, ParzenEstimator)>,
+}
+
+impl TpeSampler {
+    /// `u_points` 为已映射到 [0, 1] 的观测，`scores` 与之逐一对齐。
+    pub fn fit(u_points: &[Vec<f64>], scores: &[f64], n_dims: usize) -> Self {
+        let mut order: Vec<usize> = (0..u_points.len()).collect();
+        order.sort_by(|&a, &b| {
+            scores[b]
+                .partial_cmp(&scores[a])
+                .unwrap_or(std::cmp::Ordering::Equal)
+        });
+        let n_good = ((u_points.len() as f64 * TPE_GAMMA).ceil() as usize).min(u_points.len());
+        let (good, bad) = order.split_at(n_good);
+
+        let dims = (0..n_dims)
+            .map(|dim| {
+                let column =
+                    |idx: &[usize]| idx.iter().map(|&i| u_points[i][dim]).collect::<Vec<_>>();
+                (
+                    ParzenEstimator::new(&column(good)),
+                    ParzenEstimator::new(&column(bad)),
+                )
+            })
+            .collect();
+        Self { dims }
+    }
+
+    /// 生成一个 [0, 1]^d 采样点。
+    pub fn sample(&self, rng: &mut impl Rng) -> Vec<f64> {
+        self.dims
+            .iter()
+            .map(|(good, bad)| {
+                let mut best = (f64::NEG_INFINITY, 0.5);
+                for _ in 0..TPE_N_CANDIDATES {
+                    let x = good.sample(rng);
+                    let score = good.log_pdf(x) - bad.log_pdf(x);
+                    if score > best.0 {
+                        best = (score, x);
+                    }
+                }
+                best.1
+            })
+            .collect()
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use rand::rngs::StdRng;
+    use rand::SeedableRng;
+
+    #[test]
+    fn test_inverse_transform_round_trips() {
+        for &log_scale in &[false, true] {
+            let u = 0.37;
+            let value = transform_sample(u, 0.01, 100.0, log_scale);
+            assert!((inverse_transform_sample(value, 0.01, 100.0, log_scale) - u).abs() < 1e-12);
+        }
+    }
+
+    #[test]
+    fn test_tpe_concentrates_near_good_region() {
+        let mut rng = StdRng::seed_from_u64(3);
+        // 目标在 u = 0.8 附近最大
+        let points: Vec<Vec<f64>> = (0..200).map(|_| vec![rng.random::<f64>()]).collect();
+        let scores: Vec<f64> = points.iter().map(|p| -(p[0] - 0.8).powi(2)).collect();
+        let tpe = TpeSampler::fit(&points, &scores, 1);
+
+        let samples: Vec<f64> = (0..200).map(|_| tpe.sample(&mut rng)[0]).collect();
+        assert!(samples.iter().all(|x| (0.0..=1.0).contains(x)));
+        let mean = samples.iter().sum::<f64>() / samples.len() as f64;
+        assert!((mean - 0.8).abs() < 0.1, "TPE 采样均值 {mean} 应靠近 0.8");
+    }
+}
@@ -1,11 +1,13 @@
 use crate::backtest_engine::backtester;
 use crate::backtest_engine::indicators::calculate_indicators;
+use crate::backtest_engine::indicators::precomputed::PrecomputedIndicators;
 use crate::backtest_engine::performance_analyzer::analyze_performance;
 use crate::backtest_engine::signal_generator::generate_signals;
 use crate::error::QuantError;
 use crate::types::{
     DataPack, PerformanceMetrics, SingleParamSet, TemplateContainer,
 };
+use polars::prelude::DataFrame;
 
 use super::types::{PipelineOutput, PipelineRequest};
 use super::validation::{
@@ -108,6 +110,33 @@ pub fn execute_single_pipeline(
                 performance,
             })
         }
+        PipelineRequest::IndicatorsToSignalsAllCompletedStages { indicators_raw } => {
+            let indicators_raw = normalize_indicator_results(indicators_raw);
+            validate_raw_indicators(data, &indicators_raw)?;
+            let signals = generate_signals(
+                data,
+                &indicators_raw,
+                &param.signal,
+                &template.signal,
+            )?;
+            Ok(PipelineOutput::IndicatorsSignals {
+                indicators_raw,
+                signals,
+            })
+        }
+        PipelineRequest::IndicatorsToPerformanceStopStageOnly { indicators_raw } => {
+            let indicators_raw = normalize_indicator_results(indicators_raw);
+            validate_raw_indicators(data, &indicators_raw)?;
+            let signals = generate_signals(
+                data,
+                &indicators_raw,
+                &param.signal,
+                &template.signal,
+            )?;
+            let backtest = backtester::run_backtest(data, &signals, &param.backtest)?;
+            let performance = analyze_performance(data, &backtest, &param.performance)?;
+            Ok(PipelineOutput::PerformanceOnly { performance })
+        }
         PipelineRequest::SignalsToBacktestStopStageOnly { signals } => {
             validate_frame_height(data, &signals, "PipelineRequest.signals")?;
             let backtest = backtester::run_backtest(data, &signals, &param.backtest)?;
@@ -189,3 +218,66 @@ pub fn evaluate_param_set(
         )),
     }
 }
+
+/// 与 `evaluate_param_set` 相同，但指标取自全量预计算缓存（WF 预计算模式）。
+pub fn evaluate_param_set_precomputed(
+    data: &DataPack,
+    param: &SingleParamSet,
+    template: &TemplateContainer,
+    precomputed: &PrecomputedIndicators<'_>,
+) -> Result<PerformanceMetrics, QuantError> {
+    let indicators_raw = precomputed.calculate(data, &param.indicators)?;
+    let output = execute_single_pipeline(
+        data,
+        param,
+        template,
+        PipelineRequest::IndicatorsToPerformanceStopStageOnly { indicators_raw },
+    )?;
+    match output {
+        PipelineOutput::PerformanceOnly { performance } => Ok(performance),
+        _ => Err(QuantError::InvalidParam(
+            "evaluate_param_set_precomputed(...) 必须返回 PerformanceOnly".to_string(),
+        )),
+    }
+}
+
+/// 只计算到信号阶段，供多组回测参数共享同一份信号。
+pub fn evaluate_signals(
+    data: &DataPack,
+    param: &SingleParamSet,
+    template: &TemplateContainer,
+) -> Result<DataFrame, QuantError> {
+    let output = execute_single_pipeline(
+        data,
+        param,
+        template,
+        PipelineRequest::ScratchToSignalsStopStageOnly,
+    )?;
+    match output {
+        PipelineOutput::SignalsOnly { signals } => Ok(signals),
+        _ => Err(QuantError::InvalidParam(
+            "evaluate_signals(...) 必须返回 SignalsOnly".to_string(),
+        )),
+    }
+}
+
+/// 与 `evaluate_param_set` 相同，但复用已算好的信号，只跑回测与绩效。
+pub fn evaluate_param_set_from_signals(
+    data: &DataPack,
+    param: &SingleParamSet,
+    template: &TemplateContainer,
+    signals: DataFrame,
+) -> Result<PerformanceMetrics, QuantError> {
+    let output = execute_single_pipeline(
+        data,
+        param,
+        template,
+        PipelineRequest::SignalsToPerformanceStopStageOnly { signals },
+    )?;
+    match output {
+        PipelineOutput::PerformanceOnly { performance } => Ok(performance),
+        _ => Err(QuantError::InvalidParam(
+            "evaluate_param_set_from_signals(...) 必须返回 PerformanceOnly".to_string(),
+        )),
+    }
+}
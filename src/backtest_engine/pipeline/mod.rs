@@ -6,7 +6,10 @@ mod tests;
 mod types;
 mod validation;
 
-pub use executor::{evaluate_param_set, execute_single_pipeline};
-pub use public_result::build_public_result_pack;
+pub use executor::{
+    evaluate_param_set, evaluate_param_set_from_signals, evaluate_param_set_precomputed,
+    evaluate_signals, execute_single_pipeline,
+};
+pub use public_result::{build_public_result_pack, retain_tail_rows};
 pub use settings::{compile_public_setting_to_request, validate_mode_settings};
 pub use types::{PipelineOutput, PipelineRequest};
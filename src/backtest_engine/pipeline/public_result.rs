@@ -1,6 +1,6 @@
 use crate::backtest_engine::data_ops::build_result_pack;
 use crate::error::QuantError;
-use crate::types::{DataPack, ResultPack};
+use crate::types::{DataPack, ResultPack, SettingContainer};
 
 use super::types::PipelineOutput;
 
@@ -50,3 +50,27 @@ pub fn build_public_result_pack(
         ),
     }
 }
+
+/// 按 `SettingContainer.tail_rows` 裁剪公开结果，只保留回测输出的最后 N 行。
+///
+/// 中文注释：tail_rows 只允许 Backtest + StopStageOnly（由 compile_public_setting_to_request 保证），
+/// 此时 pack 只有 backtest 与 base mapping；两者同步裁剪，并把 ranges 改写为裁剪后的尾部窗口，
+/// 保持 base 行对齐不变量。
+pub fn retain_tail_rows(mut pack: ResultPack, settings: &SettingContainer) -> ResultPack {
+    let Some(rows) = settings.tail_rows else {
+        return pack;
+    };
+    let Some(backtest) = pack.backtest.as_ref() else {
+        return pack;
+    };
+    let kept = rows.min(backtest.height());
+    pack.backtest = Some(backtest.tail(Some(kept)));
+    pack.mapping = pack.mapping.tail(Some(kept));
+    for range in pack.ranges.values_mut() {
+        let active_bars = range.active_bars.min(kept);
+        range.warmup_bars = kept - active_bars;
+        range.active_bars = active_bars;
+        range.pack_bars = kept;
+    }
+    pack
+}
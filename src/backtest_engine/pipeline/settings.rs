@@ -6,6 +6,26 @@ use super::types::PipelineRequest;
 pub fn compile_public_setting_to_request(
     settings: &SettingContainer,
 ) -> Result<PipelineRequest, QuantError> {
+    // 中文注释：tail_rows 只裁剪回测输出，保留其他阶段产物会破坏 base 行对齐，因此只允许
+    // Backtest + StopStageOnly 组合；0 行会得到空回测表，下游按行读取信号必然失败，直接拒绝。
+    if let Some(rows) = settings.tail_rows {
+        if rows == 0 {
+            return Err(QuantError::InvalidParam(
+                "tail_rows 必须大于 0；不需要裁剪时请传 None".to_string(),
+            ));
+        }
+        if settings.stop_stage != ExecutionStage::Backtest
+            || settings.artifact_retention != ArtifactRetention::StopStageOnly
+        {
+            return Err(QuantError::InvalidParam(format!(
+                "tail_rows={rows} 只接受 SettingContainer {{ stop_stage: {}, artifact_retention: {} }}，当前为 stop_stage={}, artifact_retention={}",
+                ExecutionStage::Backtest.as_str(),
+                ArtifactRetention::StopStageOnly.as_str(),
+                settings.stop_stage.as_str(),
+                settings.artifact_retention.as_str(),
+            )));
+        }
+    }
     match (settings.stop_stage, settings.artifact_retention) {
         (ExecutionStage::Indicator, _) => Ok(PipelineRequest::ScratchToIndicator),
         (ExecutionStage::Signals, ArtifactRetention::StopStageOnly) => {
@@ -44,5 +64,10 @@ pub fn validate_mode_settings(
             settings.artifact_retention.as_str(),
         )));
     }
+    if let Some(rows) = settings.tail_rows {
+        return Err(QuantError::InvalidParam(format!(
+            "{mode_name} 需要完整回测输出，不接受 tail_rows={rows}"
+        )));
+    }
     Ok(())
 }
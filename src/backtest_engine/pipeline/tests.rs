@@ -1,7 +1,9 @@
 use super::{
-    compile_public_setting_to_request, validate_mode_settings, PipelineRequest,
+    compile_public_setting_to_request, retain_tail_rows, validate_mode_settings, PipelineRequest,
 };
-use crate::types::{ArtifactRetention, ExecutionStage, SettingContainer};
+use crate::types::{ArtifactRetention, ExecutionStage, ResultPack, SettingContainer, SourceRange};
+use polars::prelude::*;
+use std::collections::HashMap;
 
 #[test]
 fn test_compile_public_setting_to_request_contract() {
@@ -105,4 +107,103 @@ fn test_validate_mode_settings_contract() {
         ArtifactRetention::StopStageOnly,
     )
     .is_err());
+
+    let tail_settings = SettingContainer {
+        tail_rows: Some(2),
+        ..valid_settings
+    };
+    assert!(validate_mode_settings(
+        &tail_settings,
+        "run_optimization(...)",
+        ExecutionStage::Performance,
+        ArtifactRetention::StopStageOnly,
+    )
+    .is_err());
+}
+
+#[test]
+fn test_tail_rows_only_accepts_backtest_stop_stage_only() {
+    let tail_ok = SettingContainer {
+        tail_rows: Some(2),
+        ..SettingContainer::new(ExecutionStage::Backtest, ArtifactRetention::StopStageOnly)
+    };
+    assert!(matches!(
+        compile_public_setting_to_request(&tail_ok)
+            .expect("Backtest + StopStageOnly 应接受 tail_rows"),
+        PipelineRequest::ScratchToBacktestStopStageOnly
+    ));
+
+    for (stage, retention) in [
+        (
+            ExecutionStage::Backtest,
+            ArtifactRetention::AllCompletedStages,
+        ),
+        (
+            ExecutionStage::Performance,
+            ArtifactRetention::StopStageOnly,
+        ),
+        (
+            ExecutionStage::Performance,
+            ArtifactRetention::AllCompletedStages,
+        ),
+        (ExecutionStage::Signals, ArtifactRetention::StopStageOnly),
+    ] {
+        let settings = SettingContainer {
+            tail_rows: Some(2),
+            ..SettingContainer::new(stage, retention)
+        };
+        assert!(
+            compile_public_setting_to_request(&settings).is_err(),
+            "tail_rows 不应接受 {stage:?} + {retention:?}"
+        );
+    }
+}
+
+#[test]
+fn test_tail_rows_rejects_zero() {
+    let settings = SettingContainer {
+        tail_rows: Some(0),
+        ..SettingContainer::new(ExecutionStage::Backtest, ArtifactRetention::StopStageOnly)
+    };
+    assert!(compile_public_setting_to_request(&settings).is_err());
+}
+
+#[test]
+fn test_retain_tail_rows_keeps_base_rows_aligned() {
+    let height = 6;
+    let time: Vec<i64> = (0..height as i64).collect();
+    let equity: Vec<f64> = (0..height).map(|i| i as f64).collect();
+    let pack = ResultPack::new_checked(
+        None,
+        None,
+        Some(df!("equity" => equity).unwrap()),
+        None,
+        df!("time" => time).unwrap(),
+        HashMap::from([("ohlcv_15m".to_string(), SourceRange::new(4, 2, height))]),
+        "ohlcv_15m".to_string(),
+    );
+    let settings = SettingContainer {
+        tail_rows: Some(3),
+        ..SettingContainer::new(ExecutionStage::Backtest, ArtifactRetention::StopStageOnly)
+    };
+
+    let trimmed = retain_tail_rows(pack, &settings);
+    let backtest = trimmed.backtest.as_ref().expect("backtest 应保留");
+    assert_eq!(backtest.height(), 3);
+    assert_eq!(trimmed.mapping.height(), 3);
+    assert_eq!(
+        trimmed
+            .mapping
+            .column("time")
+            .unwrap()
+            .i64()
+            .unwrap()
+            .get(0),
+        Some(3)
+    );
+    let range = &trimmed.ranges["ohlcv_15m"];
+    assert_eq!(
+        (range.warmup_bars, range.active_bars, range.pack_bars),
+        (1, 2, 3)
+    );
 }
@@ -11,6 +11,12 @@ pub enum PipelineRequest {
     ScratchToBacktestAllCompletedStages,
     ScratchToPerformanceStopStageOnly,
     ScratchToPerformanceAllCompletedStages,
+    IndicatorsToSignalsAllCompletedStages {
+        indicators_raw: IndicatorResults,
+    },
+    IndicatorsToPerformanceStopStageOnly {
+        indicators_raw: IndicatorResults,
+    },
     SignalsToBacktestStopStageOnly {
         signals: DataFrame,
     },
@@ -0,0 +1,251 @@
+//! 逐参数敏感度统计
+//!
+//! 弹性统一定义为中心点附近「目标指标相对变化 / 参数相对变化」：
+//! - Morris 设计：每一步只改一维，直接取该步的差商，并给出基本效应 μ* / σ；
+//! - jitter / sobol 设计：对全部样本做相对变化的多元线性回归，系数即各维弹性。
+
+use crate::backtest_engine::optimizer::param_extractor::FlattenedParam;
+use crate::types::ParameterSensitivity;
+
+use super::design::MorrisTrajectory;
+
+const EPS: f64 = 1e-12;
+
+fn relative(value: f64, center: f64) -> Option<f64> {
+    (center.abs() > EPS).then(|| (value - center) / center.abs())
+}
+
+/// 解 `a · x = b`（部分主元高斯消元）；奇异时返回 None。
+fn solve_linear(mut a: Vec<Vec<f64>>, mut b: Vec<f64>) -> Option<Vec<f64>> {
+    let n = b.len();
+    for col in 0..n {
+        let pivot = (col..n).max_by(|&i, &j| a[i][col].abs().total_cmp(&a[j][col].abs()))?;
+        if a[pivot][col].abs() < EPS {
+            return None;
+        }
+        a.swap(col, pivot);
+        b.swap(col, pivot);
+        for row in col + 1..n {
+            let factor = a[row][col] / a[col][col];
+            for k in col..n {
+                a[row][k] -= factor * a[col][k];
+            }
+            b[row] -= factor * b[col];
+        }
+    }
+    let mut x = vec![0.0; n];
+    for row in (0..n).rev() {
+        let tail: f64 = (row + 1..n).map(|k| a[row][k] * x[k]).sum();
+        x[row] = (b[row] - tail) / a[row][row];
+    }
+    Some(x)
+}
+
+/// jitter / sobol 设计：相对变化多元线性回归求弹性。
+pub fn regression_sensitivity(
+    flat_params: &[FlattenedParam],
+    center_values: &[f64],
+    center_metric: f64,
+    samples: &[(&[f64], f64)],
+) -> Vec<ParameterSensitivity> {
+    let dims = center_values.len();
+    let mut elasticity = vec![f64::NAN; dims];
+
+    // 中文注释：中心值为 0 或样本内未变动的维度无法定义弹性，不参与回归。
+    let usable: Vec<usize> = (0..dims)
+        .filter(|&d| {
+            center_values[d].abs() > EPS
+                && samples
+                    .iter()
+                    .any(|(values, _)| (values[d] - samples[0].0[d]).abs() > EPS)
+        })
+        .collect();
+
+    if center_metric.abs() > EPS && !usable.is_empty() && samples.len() > 1 {
+        let rows: Vec<(Vec<f64>, f64)> = samples
+            .iter()
+            .map(|(values, metric)| {
+                let x = usable
+                    .iter()
+                    .map(|&d| (values[d] - center_values[d]) / center_values[d].abs())
+                    .collect();
+                (x, (metric - center_metric) / center_metric.abs())
+            })
+            .collect();
+        let n = rows.len() as f64;
+        let k = usable.len();
+        let x_mean: Vec<f64> = (0..k)
+            .map(|j| rows.iter().map(|(x, _)| x[j]).sum::<f64>() / n)
+            .collect();
+        let y_mean = rows.iter().map(|(_, y)| y).sum::<f64>() / n;
+
+        let mut normal = vec![vec![0.0; k]; k];
+        let mut rhs = vec![0.0; k];
+        for (x, y) in &rows {
+            for i in 0..k {
+                let xi = x[i] - x_mean[i];
+                rhs[i] += xi * (y - y_mean);
+                for j in 0..k {
+                    normal[i][j] += xi * (x[j] - x_mean[j]);
+                }
+            }
+        }
+        // 中文注释：样本数少于维度时正规方程奇异，加极小岭项保证可解。
+        let ridge = (0..k).map(|i| normal[i][i]).fold(0.0, f64::max) * 1e-9;
+        for (i, row) in normal.iter_mut().enumerate() {
+            row[i] += ridge;
+        }
+        if let Some(beta) = solve_linear(normal, rhs) {
+            for (j, &d) in usable.iter().enumerate() {
+                elasticity[d] = beta[j];
+            }
+        }
+    }
+
+    flat_params
+        .iter()
+        .zip(center_values)
+        .zip(elasticity)
+        .map(|((flat, &center_value), elasticity)| ParameterSensitivity {
+            name: flat.key(),
+            center_value,
+            elasticity,
+            mu_star: None,
+            sigma: None,
+        })
+        .collect()
+}
+
+/// Morris 设计：由每步差商得到弹性与基本效应统计。
+///
+/// `metrics` 与轨迹点逐一对齐，评估失败的点为 None，其相邻两步不计入统计。
+pub fn morris_sensitivity(
+    flat_params: &[FlattenedParam],
+    center_values: &[f64],
+    center_metric: f64,
+    bounds: &[(f64, f64)],
+    trajectories: &[MorrisTrajectory],
+    metrics: &[Vec<Option<f64>>],
+) -> Vec<ParameterSensitivity> {
+    let dims = center_values.len();
+    let mut effects: Vec<Vec<f64>> = vec![Vec::new(); dims];
+    let mut elasticities: Vec<Vec<f64>> = vec![Vec::new(); dims];
+
+    for (trajectory, metric_row) in trajectories.iter().zip(metrics) {
+        for (step, &dim) in trajectory.order.iter().enumerate() {
+            let (Some(f0), Some(f1)) = (metric_row[step], metric_row[step + 1]) else {
+                continue;
+            };
+            let (x0, x1) = (
+                trajectory.points[step][dim],
+                trajectory.points[step + 1][dim],
+            );
+            let span = bounds[dim].1 - bounds[dim].0;
+            if (x1 - x0).abs() <= EPS || span <= EPS {
+                continue;
+            }
+            effects[dim].push((f1 - f0) / ((x1 - x0) / span));
+            if let (Some(df), Some(dx)) = (
+                relative(f1, center_metric).zip(relative(f0, center_metric)),
+                relative(x1, center_values[dim]).zip(relative(x0, center_values[dim])),
+            ) {
+                elasticities[dim].push((df.0 - df.1) / (dx.0 - dx.1));
+            }
+        }
+    }
+
+    let mean = |values: &[f64]| values.iter().sum::<f64>() / values.len() as f64;
+    flat_params
+        .iter()
+        .zip(center_values)
+        .enumerate()
+        .map(|(dim, (flat, &center_value))| {
+            let ee = &effects[dim];
+            let (mu_star, sigma) = if ee.is_empty() {
+                (None, None)
+            } else {
+                let mu = mean(ee);
+                let variance = ee.iter().map(|e| (e - mu).powi(2)).sum::<f64>() / ee.len() as f64;
+                let abs_values: Vec<f64> = ee.iter().map(|e| e.abs()).collect();
+                (Some(mean(&abs_values)), Some(variance.sqrt()))
+            };
+            ParameterSensitivity {
+                name: flat.key(),
+                center_value,
+                elasticity: if elasticities[dim].is_empty() {
+                    f64::NAN
+                } else {
+                    mean(&elasticities[dim])
+                },
+                mu_star,
+                sigma,
+            }
+        })
+        .collect()
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::types::{Param, ParamType};
+
+    fn flat(dims: usize) -> Vec<FlattenedParam> {
+        (0..dims)
+            .map(|i| FlattenedParam {
+                type_idx: 2,
+                group: String::new(),
+                name: format!("p{i}"),
+                param: Param::new(
+                    1.0,
+                    Some(0.0),
+                    Some(10.0),
+                    Some(ParamType::Float),
+                    true,
+                    false,
+                    0.0,
+                ),
+            })
+            .collect()
+    }
+
+    #[test]
+    fn test_regression_recovers_linear_elasticity() {
+        // 中文注释：f = 2·x0 + 0.5·x1 在中心 (1, 2) 处弹性为 (2·1/3, 0.5·2/3)。
+        let center = [1.0, 2.0];
+        let f = |x: &[f64]| 2.0 * x[0] + 0.5 * x[1];
+        let points: Vec<Vec<f64>> = (0..9)
+            .map(|i| vec![0.9 + 0.1 * (i % 3) as f64, 1.8 + 0.2 * (i / 3) as f64])
+            .collect();
+        let samples: Vec<(&[f64], f64)> = points.iter().map(|p| (p.as_slice(), f(p))).collect();
+
+        let result = regression_sensitivity(&flat(2), &center, f(&center), &samples);
+        assert!((result[0].elasticity - 2.0 / 3.0).abs() < 1e-6);
+        assert!((result[1].elasticity - 1.0 / 3.0).abs() < 1e-6);
+        assert!(result[0].mu_star.is_none());
+    }
+
+    #[test]
+    fn test_morris_effects_for_linear_function() {
+        let center = [1.0, 2.0];
+        let bounds = [(0.9, 1.1), (1.8, 2.2)];
+        let trajectory = MorrisTrajectory {
+            points: vec![vec![0.9, 1.8], vec![1.1, 1.8], vec![1.1, 2.2]],
+            order: vec![0, 1],
+        };
+        let f = |x: &[f64]| 2.0 * x[0] + 0.5 * x[1];
+        let metrics = vec![trajectory.points.iter().map(|p| Some(f(p))).collect()];
+
+        let result = morris_sensitivity(
+            &flat(2),
+            &center,
+            f(&center),
+            &bounds,
+            std::slice::from_ref(&trajectory),
+            &metrics,
+        );
+        assert!((result[0].mu_star.unwrap() - 0.4).abs() < 1e-9);
+        assert!((result[1].mu_star.unwrap() - 0.2).abs() < 1e-9);
+        assert!((result[0].elasticity - 2.0 / 3.0).abs() < 1e-9);
+        assert_eq!(result[0].sigma, Some(0.0));
+    }
+}
@@ -0,0 +1,254 @@
+//! 结构化采样设计
+//!
+//! 独立抖动需要大量样本才能给出稳定的稳健性判断。这里提供两种结构化设计：
+//! - Morris：逐维一次只改一个参数的轨迹，每一步直接给出该维的基本效应；
+//! - Sobol：低差异序列，同样样本数下对抖动区间的覆盖远比独立随机均匀。
+//!
+//! 两者都在中心值 `±jitter_ratio` 的区间（并裁剪到参数 min/max）内取点，最后按 step/dtype 量化。
+
+use crate::backtest_engine::optimizer::param_extractor::{quantize_value, FlattenedParam};
+use crate::error::QuantError;
+use rand::rngs::StdRng;
+use rand::seq::SliceRandom;
+use rand::Rng;
+
+/// Sobol 序列支持的最大维度（第 1 维为 van der Corput 序列，其余取自下表）。
+pub const MAX_SOBOL_DIMS: usize = 16;
+
+/// Joe & Kuo (2008) 方向数表第 2..=16 维：(多项式次数 s, 系数 a, 初始方向数 m)。
+const SOBOL_DIRECTIONS: [(u32, u32, &[u32]); MAX_SOBOL_DIMS - 1] = [
+    (1, 0, &[1]),
+    (2, 1, &[1, 3]),
+    (3, 1, &[1, 3, 1]),
+    (3, 2, &[1, 1, 1]),
+    (4, 1, &[1, 1, 3, 3]),
+    (4, 4, &[1, 3, 5, 13]),
+    (5, 2, &[1, 1, 5, 5, 17]),
+    (5, 4, &[1, 1, 5, 5, 5]),
+    (5, 7, &[1, 1, 7, 11, 19]),
+    (5, 11, &[1, 1, 5, 1, 1]),
+    (5, 13, &[1, 1, 1, 3, 11]),
+    (5, 14, &[1, 3, 5, 5, 31]),
+    (6, 1, &[1, 3, 3, 9, 7, 49]),
+    (6, 13, &[1, 1, 1, 15, 21, 21]),
+    (6, 16, &[1, 3, 1, 13, 27, 49]),
+];
+
+/// Morris 网格层数；步长 Δ = p / (2(p - 1))。
+const MORRIS_LEVELS: usize = 4;
+
+const SOBOL_BITS: usize = 32;
+
+/// 每个参数的取值区间 `[lo, hi]`：中心值 ±jitter_ratio，再裁剪到 min/max。
+pub fn parameter_bounds(
+    center_values: &[f64],
+    flat_params: &[FlattenedParam],
+    jitter_ratio: f64,
+) -> Vec<(f64, f64)> {
+    center_values
+        .iter()
+        .zip(flat_params)
+        .map(|(&val, flat)| {
+            let a = val * (1.0 - jitter_ratio);
+            let b = val * (1.0 + jitter_ratio);
+            let lo = a.min(b).clamp(flat.param.min, flat.param.max);
+            let hi = a.max(b).clamp(flat.param.min, flat.param.max);
+            (lo, hi)
+        })
+        .collect()
+}
+
+/// 把单位超立方体中的点映射到参数区间并量化。
+fn scale_point(unit: &[f64], bounds: &[(f64, f64)], flat_params: &[FlattenedParam]) -> Vec<f64> {
+    unit.iter()
+        .zip(bounds)
+        .zip(flat_params)
+        .map(|((&u, &(lo, hi)), flat)| {
+            quantize_value(lo + u * (hi - lo), flat.param.step, flat.param.dtype)
+        })
+        .collect()
+}
+
+/// 32 位 Sobol 序列（格雷码递推），整体叠加随机数字平移以便按种子区分设计。
+struct SobolSequence {
+    directions: Vec<[u32; SOBOL_BITS]>,
+    shift: Vec<u32>,
+    state: Vec<u32>,
+    index: u32,
+}
+
+impl SobolSequence {
+    fn new(dims: usize, rng: &mut StdRng) -> Result<Self, QuantError> {
+        if dims > MAX_SOBOL_DIMS {
+            return Err(QuantError::InvalidParam(format!(
+                "sobol design supports at most {} parameters, got {}; use design=\"morris\" or \"jitter\"",
+                MAX_SOBOL_DIMS, dims
+            )));
+        }
+
+        let mut directions = Vec::with_capacity(dims);
+        if dims > 0 {
+            let mut v = [0u32; SOBOL_BITS];
+            for (k, slot) in v.iter_mut().enumerate() {
+                *slot = 1u32 << (31 - k);
+            }
+            directions.push(v);
+        }
+        for &(s, a, m) in SOBOL_DIRECTIONS.iter().take(dims.saturating_sub(1)) {
+            let s = s as usize;
+            let mut v = [0u32; SOBOL_BITS];
+            for k in 0..SOBOL_BITS {
+                v[k] = if k < s {
+                    m[k] << (31 - k)
+                } else {
+                    let mut next = v[k - s] ^ (v[k - s] >> s);
+                    for j in 1..s {
+                        if (a >> (s - 1 - j)) & 1 == 1 {
+                            next ^= v[k - j];
+                        }
+                    }
+                    next
+                };
+            }
+            directions.push(v);
+        }
+
+        Ok(Self {
+            directions,
+            shift: (0..dims).map(|_| rng.random()).collect(),
+            state: vec![0; dims],
+            index: 0,
+        })
+    }
+
+    /// 下一个点；跳过全零首点。
+    fn next_point(&mut self) -> Vec<f64> {
+        let bit = self.index.trailing_ones() as usize;
+        self.index = self.index.wrapping_add(1);
+        self.state
+            .iter_mut()
+            .zip(&self.directions)
+            .zip(&self.shift)
+            .map(|((x, v), &shift)| {
+                *x ^= v[bit.min(SOBOL_BITS - 1)];
+                f64::from(*x ^ shift) / 4_294_967_296.0
+            })
+            .collect()
+    }
+}
+
+/// 生成 `n_samples` 个 Sobol 采样点。
+pub fn generate_sobol_samples(
+    bounds: &[(f64, f64)],
+    flat_params: &[FlattenedParam],
+    n_samples: usize,
+    rng: &mut StdRng,
+) -> Result<Vec<Vec<f64>>, QuantError> {
+    let mut sequence = SobolSequence::new(bounds.len(), rng)?;
+    Ok((0..n_samples)
+        .map(|_| scale_point(&sequence.next_point(), bounds, flat_params))
+        .collect())
+}
+
+/// 一条 Morris 轨迹：`dims + 1` 个点，第 k 步只改动 `order[k]` 这一维。
+pub struct MorrisTrajectory {
+    pub points: Vec<Vec<f64>>,
+    pub order: Vec<usize>,
+}
+
+/// 生成 `n_trajectories` 条 Morris 轨迹。
+pub fn generate_morris_trajectories(
+    bounds: &[(f64, f64)],
+    flat_params: &[FlattenedParam],
+    n_trajectories: usize,
+    rng: &mut StdRng,
+) -> Vec<MorrisTrajectory> {
+    let dims = bounds.len();
+    let grid_step = 1.0 / (MORRIS_LEVELS - 1) as f64;
+    let delta = MORRIS_LEVELS as f64 / (2.0 * (MORRIS_LEVELS - 1) as f64);
+
+    (0..n_trajectories)
+        .map(|_| {
+            let mut unit: Vec<f64> = (0..dims)
+                .map(|_| rng.random_range(0..MORRIS_LEVELS) as f64 * grid_step)
+                .collect();
+            let mut order: Vec<usize> = (0..dims).collect();
+            order.shuffle(rng);
+
+            let mut points = Vec::with_capacity(dims + 1);
+            points.push(scale_point(&unit, bounds, flat_params));
+            for &dim in &order {
+                // 中文注释：能上移就上移 Δ，否则下移，保证始终落在 [0, 1] 网格内。
+                unit[dim] = if unit[dim] + delta <= 1.0 + 1e-12 {
+                    unit[dim] + delta
+                } else {
+                    unit[dim] - delta
+                };
+                points.push(scale_point(&unit, bounds, flat_params));
+            }
+            MorrisTrajectory { points, order }
+        })
+        .collect()
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::types::{Param, ParamType};
+    use rand::SeedableRng;
+
+    fn flat(dims: usize) -> Vec<FlattenedParam> {
+        (0..dims)
+            .map(|i| FlattenedParam {
+                type_idx: 0,
+                group: "tf:g".to_string(),
+                name: format!("p{i}"),
+                param: Param::new(
+                    10.0,
+                    Some(0.0),
+                    Some(100.0),
+                    Some(ParamType::Float),
+                    true,
+                    false,
+                    0.0,
+                ),
+            })
+            .collect()
+    }
+
+    #[test]
+    fn test_sobol_first_dimension_is_stratified() {
+        let mut rng = StdRng::seed_from_u64(1);
+        let mut sequence = SobolSequence::new(3, &mut rng).expect("3 维应受支持");
+        sequence.shift = vec![0; 3];
+        // 中文注释：无平移时前 8 个点的第 1 维恰好覆盖 8 个等宽区间各一次。
+        let mut cells: Vec<usize> = (0..8)
+            .map(|_| (sequence.next_point()[0] * 8.0) as usize)
+            .collect();
+        cells.sort_unstable();
+        assert_eq!(cells, (0..8).collect::<Vec<_>>());
+
+        let mut rng = StdRng::seed_from_u64(1);
+        assert!(SobolSequence::new(MAX_SOBOL_DIMS + 1, &mut rng).is_err());
+    }
+
+    #[test]
+    fn test_morris_steps_change_one_dimension() {
+        let flat = flat(3);
+        let bounds = parameter_bounds(&[10.0, 20.0, 30.0], &flat, 0.1);
+        let mut rng = StdRng::seed_from_u64(7);
+        let trajectories = generate_morris_trajectories(&bounds, &flat, 4, &mut rng);
+
+        assert_eq!(trajectories.len(), 4);
+        for trajectory in &trajectories {
+            assert_eq!(trajectory.points.len(), 4);
+            for (step, &dim) in trajectory.order.iter().enumerate() {
+                let (before, after) = (&trajectory.points[step], &trajectory.points[step + 1]);
+                for d in 0..3 {
+                    assert_eq!(before[d] != after[d], d == dim);
+                    assert!(after[d] >= bounds[d].0 - 1e-9 && after[d] <= bounds[d].1 + 1e-9);
+                }
+            }
+        }
+    }
+}
@@ -1,7 +1,9 @@
 //! 敏感性分析/参数抖动测试模块
 //!
-//! 在最优参数附近进行随机扰动，评估策略的稳健性。
+//! 在最优参数附近进行随机扰动或结构化采样（Morris / Sobol），评估策略的稳健性与逐参数弹性。
 
+pub mod analysis;
+pub mod design;
 pub mod runner;
 pub mod types;
 
@@ -1,21 +1,76 @@
-use crate::backtest_engine::{evaluate_param_set, validate_mode_settings};
+use super::analysis::{morris_sensitivity, regression_sensitivity};
+use super::design::{generate_morris_trajectories, generate_sobol_samples, parameter_bounds};
+use crate::backtest_engine::optimizer::memo::{memo_key, TrialMemo};
 use crate::backtest_engine::optimizer::param_extractor::{
-    apply_values_to_param, extract_optimizable_params, quantize_value,
+    apply_values_to_param, extract_optimizable_params, quantize_value, FlattenedParam,
 };
 use crate::backtest_engine::utils;
+use crate::backtest_engine::{
+    evaluate_param_set, evaluate_param_set_from_signals, evaluate_signals, validate_mode_settings,
+};
 use crate::error::QuantError;
 use crate::types::{
     DataPack, SensitivityConfig, SensitivityResult, SensitivitySample, SettingContainer,
     SingleParamSet, TemplateContainer,
 };
+use polars::prelude::DataFrame;
 use pyo3::prelude::*;
 use pyo3_stub_gen::derive::*;
 use rand::rngs::StdRng;
 use rand::Rng;
 use rand::SeedableRng;
 use rand_distr::{Distribution, Normal};
-use rayon::prelude::*;
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
+use std::sync::OnceLock;
+
+const DESIGNS: [&str; 3] = ["jitter", "morris", "sobol"];
+
+/// 只有回测参数不同的样本共享同一份信号。
+///
+/// 中文注释：平铺参数按 (指标, 信号, 回测) 排序，回测维度总在末尾；
+/// 前缀（指标 + 信号维度）相同的样本信号完全一致，只需算一次。
+/// 仅为至少两个去重样本共用的前缀建表，避免逐样本缓存整份信号。
+struct SharedSignals {
+    split: usize,
+    cells: HashMap<Vec<u64>, OnceLock<Result<DataFrame, String>>>,
+}
+
+impl SharedSignals {
+    fn new(flat_params: &[FlattenedParam], sample_points: &[Vec<f64>]) -> Self {
+        let split = flat_params
+            .iter()
+            .position(|p| p.type_idx == 2)
+            .unwrap_or(flat_params.len());
+        let mut counts: HashMap<Vec<u64>, usize> = HashMap::new();
+        if split < flat_params.len() {
+            let mut seen = HashSet::new();
+            for values in sample_points {
+                if seen.insert(memo_key(values)) {
+                    *counts.entry(memo_key(&values[..split])).or_default() += 1;
+                }
+            }
+        }
+        let cells = counts
+            .into_iter()
+            .filter(|(_, count)| *count > 1)
+            .map(|(key, _)| (key, OnceLock::new()))
+            .collect();
+        Self { split, cells }
+    }
+
+    /// 取共享信号；前缀未建表时返回 None，由调用方走完整流水线。
+    fn get<F>(&self, values: &[f64], compute: F) -> Option<Result<DataFrame, QuantError>>
+    where
+        F: FnOnce() -> Result<DataFrame, QuantError>,
+    {
+        let cell = self.cells.get(&memo_key(&values[..self.split]))?;
+        Some(
+            cell.get_or_init(|| compute().map_err(|e| e.to_string()))
+                .clone()
+                .map_err(QuantError::InfrastructureError),
+        )
+    }
+}
 
 fn quantile_from_sorted(sorted_values: &[f64], q: f64) -> f64 {
     if sorted_values.is_empty() {
@@ -92,6 +147,12 @@ pub fn run_sensitivity_test(
             config.jitter_ratio
         )));
     }
+    if !DESIGNS.contains(&config.design.as_str()) {
+        return Err(QuantError::InvalidParam(format!(
+            "design must be one of {:?}, got {:?}",
+            DESIGNS, config.design
+        )));
+    }
 
     // 1. 初始化 RNG
     let mut rng = match config.seed {
@@ -109,45 +170,73 @@ pub fn run_sensitivity_test(
 
     let original_values: Vec<f64> = flat_params.iter().map(|p| p.param.value).collect();
 
-    // 3. 生成采样点
-    let sample_points = generate_jitter_samples(&original_values, &flat_params, config, &mut rng);
+    // 3. 生成采样点（Morris 轨迹按点展开，评估后再按轨迹还原）
+    let bounds = parameter_bounds(&original_values, &flat_params, config.jitter_ratio);
+    let trajectories = match config.design.as_str() {
+        "morris" => {
+            let n_trajectories = (config.n_samples / (flat_params.len() + 1)).max(1);
+            generate_morris_trajectories(&bounds, &flat_params, n_trajectories, &mut rng)
+        }
+        _ => Vec::new(),
+    };
+    let sample_points: Vec<Vec<f64>> = match config.design.as_str() {
+        "morris" => trajectories
+            .iter()
+            .flat_map(|t| t.points.iter().cloned())
+            .collect(),
+        "sobol" => generate_sobol_samples(&bounds, &flat_params, config.n_samples, &mut rng)?,
+        _ => generate_jitter_samples(&original_values, &flat_params, config, &mut rng),
+    };
 
     // 4. 并行执行回测
     let metric_key = config.metric.as_str();
 
     let total_samples_requested = sample_points.len();
-    let results: Vec<Result<SensitivitySample, QuantError>> = sample_points
-        .into_par_iter()
-        .map(|vals| {
-            let mut current_set = center_param.clone();
-            apply_values_to_param(&mut current_set, &flat_params, &vals);
-
-            // 强制单线程执行 Polars
-            let result_pack =
-                utils::process_param_in_single_thread(|| evaluate_param_set(data_pack, &current_set, template))?;
+    // 中文注释：量化后的重复抖动样本经记忆表只评估一次；只差回测参数的样本共享信号。
+    let shared_signals = SharedSignals::new(&flat_params, &sample_points);
+    let mut memo = TrialMemo::new();
+    let batch = memo.evaluate_batch(&sample_points, |vals| {
+        let mut current_set = center_param.clone();
+        apply_values_to_param(&mut current_set, &flat_params, vals);
+
+        // 强制单线程执行 Polars
+        let result_pack = utils::process_param_in_single_thread(|| {
+            let shared =
+                shared_signals.get(vals, || evaluate_signals(data_pack, &current_set, template));
+            match shared {
+                Some(signals) => {
+                    evaluate_param_set_from_signals(data_pack, &current_set, template, signals?)
+                }
+                None => evaluate_param_set(data_pack, &current_set, template),
+            }
+        })?;
 
-            let val = result_pack.get(metric_key).cloned().unwrap_or(0.0);
+        let val = result_pack.get(metric_key).cloned().unwrap_or(0.0);
 
-            let mut all_metrics = HashMap::new();
-            for (k, v) in &result_pack {
-                all_metrics.insert(k.clone(), *v);
-            }
+        let mut all_metrics = HashMap::new();
+        for (k, v) in &result_pack {
+            all_metrics.insert(k.clone(), *v);
+        }
 
-            Ok(SensitivitySample {
-                values: vals,
-                metric_value: val,
-                all_metrics,
-            })
+        Ok(SensitivitySample {
+            values: vals.to_vec(),
+            metric_value: val,
+            all_metrics,
         })
-        .collect();
+    });
 
     // 5. 聚合结果（失败样本不直接中断，统一做失败统计）
+    let point_metrics: Vec<Option<f64>> = batch
+        .outcomes
+        .iter()
+        .map(|outcome| outcome.as_ref().map(|s| s.metric_value))
+        .collect();
     let mut successful_samples: Vec<SensitivitySample> = Vec::new();
     let mut failed_samples: usize = 0;
-    for r in results {
-        match r {
-            Ok(sample) => successful_samples.push(sample),
-            Err(_) => failed_samples += 1,
+    for outcome in batch.outcomes {
+        match outcome {
+            Some(sample) => successful_samples.push(sample),
+            None => failed_samples += 1,
         }
     }
 
@@ -207,8 +296,31 @@ pub fn run_sensitivity_test(
     });
     let bottom_k_samples: Vec<SensitivitySample> = by_metric_asc.into_iter().take(5).collect();
 
+    // 8. 逐参数弹性
+    let parameters = if config.design == "morris" {
+        let metrics_by_trajectory: Vec<Vec<Option<f64>>> = point_metrics
+            .chunks(flat_params.len() + 1)
+            .map(<[Option<f64>]>::to_vec)
+            .collect();
+        morris_sensitivity(
+            &flat_params,
+            &original_values,
+            original_value,
+            &bounds,
+            &trajectories,
+            &metrics_by_trajectory,
+        )
+    } else {
+        let points: Vec<(&[f64], f64)> = successful_samples
+            .iter()
+            .map(|s| (s.values.as_slice(), s.metric_value))
+            .collect();
+        regression_sensitivity(&flat_params, &original_values, original_value, &points)
+    };
+
     Ok(SensitivityResult {
         target_metric: metric_key.to_string(),
+        design: config.design.clone(),
         original_value,
         samples: successful_samples,
         total_samples_requested,
@@ -227,6 +339,7 @@ pub fn run_sensitivity_test(
         cv,
         top_k_samples,
         bottom_k_samples,
+        parameters,
     })
 }
 
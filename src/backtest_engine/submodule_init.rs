@@ -88,6 +88,14 @@ pub(super) fn register_all_submodules(m: &Bound<'_, PyModule>) -> PyResult<()> {
         optimizer::py_run_optimizer_benchmark,
         &optimizer_submodule
     )?)?;
+    optimizer_submodule.add_function(wrap_pyfunction!(
+        optimizer::py_run_optimizer_across_symbols,
+        &optimizer_submodule
+    )?)?;
+    optimizer_submodule.add_function(wrap_pyfunction!(
+        optimizer::py_run_optimizer_per_symbol,
+        &optimizer_submodule
+    )?)?;
     m.add_submodule(&optimizer_submodule)?;
     register_submodule_in_sys_modules(
         py,
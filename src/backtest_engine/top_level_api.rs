@@ -1,8 +1,14 @@
+use crate::backtest_engine::optimizer::param_extractor::{
+    assign_values_to_param, extract_optimizable_params, FlattenedParam,
+};
 use crate::backtest_engine::{
-    build_public_result_pack, compile_public_setting_to_request, execute_single_pipeline, utils,
+    build_public_result_pack, compile_public_setting_to_request, execute_single_pipeline,
+    retain_tail_rows, utils,
 };
 use crate::error::QuantError;
 use crate::types::{DataPack, ParamContainer, ResultPack, SettingContainer, SingleParamSet, TemplateContainer};
+use pyo3::buffer::PyBuffer;
+use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
 use pyo3_stub_gen::derive::*;
 use rayon::prelude::*;
@@ -21,7 +27,8 @@ pub fn run_batch_backtest(
             .iter()
             .map(|param| {
                 let output = execute_single_pipeline(data, param, template, request.clone())?;
-                build_public_result_pack(data, output)
+                let pack = build_public_result_pack(data, output)?;
+                Ok(retain_tail_rows(pack, engine_settings))
             })
             .collect()
     } else {
@@ -31,13 +38,71 @@ pub fn run_batch_backtest(
                 utils::process_param_in_single_thread(|| {
                     let output =
                         execute_single_pipeline(data, param, template, request.clone())?;
-                    build_public_result_pack(data, output)
+                    let pack = build_public_result_pack(data, output)?;
+                    Ok(retain_tail_rows(pack, engine_settings))
                 })
             })
             .collect()
     }
 }
 
+/// 按扁平参数矩阵运行批量回测
+///
+/// `values` 为行主序的 `试验数 × 可优化维度` 矩阵，列顺序与 `extract_optimizable_params` 一致；
+/// 每个试验在 Rust 侧克隆 `base_param` 并原样写入该行取值（不按 step 量化）。
+pub fn run_batch_backtest_from_values(
+    data: &DataPack,
+    base_param: &SingleParamSet,
+    values: &[f64],
+    n_dims: usize,
+    template: &TemplateContainer,
+    engine_settings: &SettingContainer,
+) -> Result<Vec<ResultPack>, QuantError> {
+    let flat_params = extract_optimizable_params(base_param);
+    if flat_params.is_empty() {
+        return Err(QuantError::InvalidParam(
+            "base_param 没有 optimize=True 的参数，无法按参数矩阵批量回测".into(),
+        ));
+    }
+    if n_dims != flat_params.len() || values.len() % n_dims != 0 {
+        return Err(QuantError::InvalidParam(format!(
+            "参数矩阵列数 {} 与可优化参数个数 {} 不一致（元素总数 {}）",
+            n_dims,
+            flat_params.len(),
+            values.len()
+        )));
+    }
+
+    let request = compile_public_setting_to_request(engine_settings)?;
+    let run_trial = |row: &[f64]| -> Result<ResultPack, QuantError> {
+        let mut param = base_param.clone();
+        // 中文注释：矩阵取值原样写回，与 Python 侧逐 trial 构造参数集的口径一致。
+        assign_values_to_param(&mut param, &flat_params, row);
+        let output = execute_single_pipeline(data, &param, template, request.clone())?;
+        let pack = build_public_result_pack(data, output)?;
+        Ok(retain_tail_rows(pack, engine_settings))
+    };
+
+    if values.len() == n_dims {
+        values.chunks_exact(n_dims).map(run_trial).collect()
+    } else {
+        values
+            .par_chunks_exact(n_dims)
+            .map(|row| utils::process_param_in_single_thread(|| run_trial(row)))
+            .collect()
+    }
+}
+
+/// 可优化参数的列键，顺序即参数矩阵的列顺序
+///
+/// 键格式为 `{type_idx}_{group}_{name}`，与 Python 侧 Optuna 参数名一致。
+pub fn optimizable_param_keys(base_param: &SingleParamSet) -> Vec<String> {
+    extract_optimizable_params(base_param)
+        .iter()
+        .map(FlattenedParam::key)
+        .collect()
+}
+
 pub fn run_single_backtest(
     data: &DataPack,
     param: &SingleParamSet,
@@ -46,7 +111,8 @@ pub fn run_single_backtest(
 ) -> Result<ResultPack, QuantError> {
     let request = compile_public_setting_to_request(engine_settings)?;
     let output = execute_single_pipeline(data, param, template, request)?;
-    build_public_result_pack(data, output)
+    let pack = build_public_result_pack(data, output)?;
+    Ok(retain_tail_rows(pack, engine_settings))
 }
 
 #[gen_stub_pyfunction(
@@ -96,3 +162,117 @@ pub fn py_run_single_backtest(
 ) -> PyResult<ResultPack> {
     run_single_backtest(&data, &param, &template, &engine_settings).map_err(Into::into)
 }
+
+#[gen_stub_pyfunction(
+    module = "pyo3_quant.backtest_engine",
+    python = r#"
+import numpy
+import numpy.typing
+import pyo3_quant
+
+def run_batch_backtest_from_values(
+    data: pyo3_quant.DataPack,
+    base_param: pyo3_quant.SingleParamSet,
+    values: numpy.typing.NDArray[numpy.float64],
+    template: pyo3_quant.TemplateContainer,
+    engine_settings: pyo3_quant.SettingContainer,
+) -> list[pyo3_quant.ResultPack]:
+    """按 (试验数, 可优化维度) 的 float64 参数矩阵运行批量回测"""
+"#
+)]
+#[pyfunction(name = "run_batch_backtest_from_values")]
+pub fn py_run_batch_backtest_from_values(
+    py: Python<'_>,
+    data: DataPack,
+    base_param: SingleParamSet,
+    values: PyBuffer<f64>,
+    template: TemplateContainer,
+    engine_settings: SettingContainer,
+) -> PyResult<Vec<ResultPack>> {
+    // 中文注释：只接受 C 连续的二维 float64 数组，按行主序一次性拷出，不逐元素穿越边界。
+    if values.dimensions() != 2 || !values.is_c_contiguous() {
+        return Err(PyValueError::new_err(
+            "values 必须是 C 连续的二维 float64 数组 (trials, dims)",
+        ));
+    }
+    let n_dims = values.shape()[1];
+    let flat = values.to_vec(py)?;
+    run_batch_backtest_from_values(
+        &data,
+        &base_param,
+        &flat,
+        n_dims,
+        &template,
+        &engine_settings,
+    )
+    .map_err(Into::into)
+}
+
+#[gen_stub_pyfunction(
+    module = "pyo3_quant.backtest_engine",
+    python = r#"
+import pyo3_quant
+
+def optimizable_param_keys(param: pyo3_quant.SingleParamSet) -> list[str]:
+    """参数矩阵的列键（`{type_idx}_{group}_{name}`），顺序即列顺序"""
+"#
+)]
+#[pyfunction(name = "optimizable_param_keys")]
+pub fn py_optimizable_param_keys(param: SingleParamSet) -> Vec<String> {
+    optimizable_param_keys(&param)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::backtest_engine::optimizer::{
+        create_dummy_backtest_params, create_dummy_performance_params,
+    };
+    use crate::types::{Param, ParamType};
+    use std::collections::HashMap;
+
+    #[test]
+    fn test_optimizable_param_keys_follow_extractor_order() {
+        let param = |optimize| {
+            Param::new(
+                10.0,
+                Some(2.0),
+                Some(50.0),
+                Some(ParamType::Integer),
+                optimize,
+                false,
+                1.0,
+            )
+        };
+        let set = SingleParamSet {
+            indicators: HashMap::from([(
+                "ohlcv_15m".to_string(),
+                HashMap::from([
+                    (
+                        "sma_1".to_string(),
+                        HashMap::from([("period".to_string(), param(true))]),
+                    ),
+                    (
+                        "sma_0".to_string(),
+                        HashMap::from([("period".to_string(), param(true))]),
+                    ),
+                ]),
+            )]),
+            signal: HashMap::from([
+                ("threshold".to_string(), param(true)),
+                ("fixed".to_string(), param(false)),
+            ]),
+            backtest: create_dummy_backtest_params(),
+            performance: create_dummy_performance_params(),
+        };
+
+        assert_eq!(
+            optimizable_param_keys(&set),
+            vec![
+                "0_ohlcv_15m:sma_0_period",
+                "0_ohlcv_15m:sma_1_period",
+                "1__threshold",
+            ]
+        );
+    }
+}
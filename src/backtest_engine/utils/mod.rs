@@ -5,4 +5,4 @@ pub mod rayon_parallel;
 
 pub use common::get_ohlcv_dataframe;
 pub use data_utils::{get_data_length, validate_timestamp_ms};
-pub use rayon_parallel::process_param_in_single_thread;
+pub use rayon_parallel::{inner_parallelism_available, process_param_in_single_thread};
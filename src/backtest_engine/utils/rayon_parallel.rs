@@ -15,3 +15,11 @@ where
 
     pool.install(f)
 }
+
+/// 判断当前调用栈是否允许再开内层并行。
+///
+/// 中文注释：`process_param_in_single_thread` 内部的线程池只有 1 个线程，
+/// 此时说明外层已经在做任务级并行，内层必须保持串行，避免双层并行争抢。
+pub fn inner_parallelism_available() -> bool {
+    rayon::current_num_threads() > 1
+}
@@ -0,0 +1,581 @@
+//! 向前滚动的窗口级断点续跑
+//!
+//! 中文注释：每个窗口完成后把续跑所需的最小状态落盘（Arrow IPC）：
+//! 最优参数的平铺值、下一窗 top-k 先验、跨窗持仓方向，以及测试包 ResultPack 的各张表。
+//! 训练包 / 测试包、active 切片与时间区间都能由完整 DataPack + 窗口几何重新推出，不重复存储。
+//!
+//! 目录布局为 `{checkpoint_dir}/{config_hash}/window_{idx:04}/`；
+//! 配置、参数、模板或数据任一变化都会换一个哈希目录，旧断点自然失效。
+//! 窗口先写入 `.tmp` 目录再整体重命名，目录存在即代表该窗口完整落盘。
+
+use crate::backtest_engine::optimizer::param_extractor::extract_optimizable_params;
+use crate::backtest_engine::walk_forward::injection::CrossSide;
+use crate::error::QuantError;
+use crate::types::{
+    DataPack, IndicatorResults, ResultPack, SingleParamSet, SourceRange, TemplateContainer,
+    WalkForwardConfig,
+};
+use polars::prelude::*;
+use std::collections::{BTreeMap, HashMap};
+use std::fs::{self, File};
+use std::path::{Path, PathBuf};
+
+const STATE_FILE: &str = "state.arrow";
+const BEST_VALUES_FILE: &str = "best_values.arrow";
+const TOP_K_FILE: &str = "top_k.arrow";
+const MAPPING_FILE: &str = "mapping.arrow";
+const RANGES_FILE: &str = "ranges.arrow";
+const SIGNALS_FILE: &str = "signals.arrow";
+const BACKTEST_FILE: &str = "backtest.arrow";
+const PERFORMANCE_FILE: &str = "performance.arrow";
+const INDICATOR_PREFIX: &str = "indicators__";
+
+/// 单个已完成窗口的续跑状态。
+pub(crate) struct WindowCheckpoint {
+    /// 最优参数的平铺值（顺序同 `extract_optimizable_params`）
+    pub best_values: Vec<f64>,
+    pub has_cross_boundary_position: bool,
+    pub next_top_k: Vec<Vec<f64>>,
+    pub next_test_last_position: Option<CrossSide>,
+    pub test_pack_result: ResultPack,
+}
+
+fn io_error(path: &Path, err: std::io::Error) -> QuantError {
+    QuantError::InfrastructureError(format!("checkpoint io failed at {}: {err}", path.display()))
+}
+
+fn write_frame(path: &Path, df: &DataFrame) -> Result<(), QuantError> {
+    let mut file = File::create(path).map_err(|e| io_error(path, e))?;
+    IpcWriter::new(&mut file).finish(&mut df.clone())?;
+    Ok(())
+}
+
+fn read_frame(path: &Path) -> Result<DataFrame, QuantError> {
+    let file = File::open(path).map_err(|e| io_error(path, e))?;
+    Ok(IpcReader::new(file).finish()?)
+}
+
+fn read_optional_frame(path: &Path) -> Result<Option<DataFrame>, QuantError> {
+    if path.exists() {
+        read_frame(path).map(Some)
+    } else {
+        Ok(None)
+    }
+}
+
+fn f64_column(df: &DataFrame, name: &str) -> Result<Vec<f64>, QuantError> {
+    Ok(df
+        .column(name)?
+        .f64()?
+        .into_iter()
+        .map(|v| v.unwrap_or(f64::NAN))
+        .collect())
+}
+
+fn u64_column(df: &DataFrame, name: &str) -> Result<Vec<usize>, QuantError> {
+    Ok(df
+        .column(name)?
+        .u64()?
+        .into_iter()
+        .map(|v| v.unwrap_or(0) as usize)
+        .collect())
+}
+
+fn encode_side(side: Option<CrossSide>) -> i32 {
+    match side {
+        Some(CrossSide::Long) => 1,
+        Some(CrossSide::Short) => -1,
+        None => 0,
+    }
+}
+
+fn decode_side(code: i32) -> Option<CrossSide> {
+    match code {
+        1 => Some(CrossSide::Long),
+        -1 => Some(CrossSide::Short),
+        _ => None,
+    }
+}
+
+/// 参数集的规范化描述：嵌套 HashMap 按键排序，保证同一参数集哈希稳定。
+pub(crate) fn canonical_param_set(param: &SingleParamSet) -> String {
+    let indicators = param
+        .indicators
+        .iter()
+        .map(|(tf, groups)| {
+            let groups = groups
+                .iter()
+                .map(|(group, params)| {
+                    let params = params
+                        .iter()
+                        .map(|(name, p)| (name, format!("{p:?}")))
+                        .collect::<BTreeMap<_, _>>();
+                    (group, params)
+                })
+                .collect::<BTreeMap<_, _>>();
+            (tf, groups)
+        })
+        .collect::<BTreeMap<_, _>>();
+    let signal = param
+        .signal
+        .iter()
+        .map(|(name, p)| (name, format!("{p:?}")))
+        .collect::<BTreeMap<_, _>>();
+    format!(
+        "{indicators:?}|{signal:?}|{:?}|{:?}",
+        param.backtest, param.performance
+    )
+}
+
+/// 固定种子的 FNV-1a 64 位哈希。
+///
+/// 中文注释：断点目录名要跨进程、跨编译器版本稳定，不能用 `DefaultHasher`
+/// （其算法与种子都不保证稳定）。
+struct StableHasher(u64);
+
+impl StableHasher {
+    const OFFSET: u64 = 0xcbf2_9ce4_8422_2325;
+    const PRIME: u64 = 0x0000_0100_0000_01b3;
+
+    fn new() -> Self {
+        Self(Self::OFFSET)
+    }
+
+    fn write(&mut self, bytes: &[u8]) {
+        for byte in bytes {
+            self.0 = (self.0 ^ u64::from(*byte)).wrapping_mul(Self::PRIME);
+        }
+    }
+
+    /// 写入带长度前缀的字符串，避免相邻字段拼接产生歧义。
+    fn write_str(&mut self, text: &str) {
+        self.write(&(text.len() as u64).to_le_bytes());
+        self.write(text.as_bytes());
+    }
+
+    fn finish(&self) -> u64 {
+        self.0
+    }
+}
+
+/// 把一列的全部取值写入哈希：数值列按位模式，其余类型转字符串；空值单独标记。
+fn hash_column(hasher: &mut StableHasher, column: &Column) -> Result<(), QuantError> {
+    hasher.write_str(column.name());
+    hasher.write_str(&column.dtype().to_string());
+    hasher.write(&(column.len() as u64).to_le_bytes());
+    let series = column.as_materialized_series();
+    match series.dtype() {
+        DataType::Float64 | DataType::Float32 => {
+            for value in series.cast(&DataType::Float64)?.f64()? {
+                match value {
+                    Some(v) => hasher.write(&v.to_bits().to_le_bytes()),
+                    None => hasher.write(&[0xff]),
+                }
+            }
+        }
+        dtype if dtype.is_integer() || dtype.is_bool() => {
+            for value in series.cast(&DataType::Int64)?.i64()? {
+                match value {
+                    Some(v) => hasher.write(&v.to_le_bytes()),
+                    None => hasher.write(&[0xff]),
+                }
+            }
+        }
+        _ => {
+            for value in series.cast(&DataType::String)?.str()? {
+                match value {
+                    Some(v) => hasher.write_str(v),
+                    None => hasher.write(&[0xff]),
+                }
+            }
+        }
+    }
+    Ok(())
+}
+
+/// 数据指纹：各 source 全部列的取值、skip_mask、base key 与 ranges。
+fn hash_data_pack(hasher: &mut StableHasher, data_pack: &DataPack) -> Result<(), QuantError> {
+    let sources = data_pack.source.iter().collect::<BTreeMap<_, _>>();
+    for (key, df) in sources {
+        hasher.write_str(key);
+        for column in df.get_columns() {
+            hash_column(hasher, column)?;
+        }
+    }
+    if let Some(skip_mask) = &data_pack.skip_mask {
+        hasher.write_str("skip_mask");
+        for column in skip_mask.get_columns() {
+            hash_column(hasher, column)?;
+        }
+    }
+    let ranges = data_pack
+        .ranges
+        .iter()
+        .map(|(k, r)| (k, (r.warmup_bars, r.active_bars, r.pack_bars)))
+        .collect::<BTreeMap<_, _>>();
+    hasher.write_str(&format!("{}|{ranges:?}", data_pack.base_data_key));
+    Ok(())
+}
+
+/// 写入模板与 WF 配置（含内嵌优化器配置；checkpoint_dir 只决定落盘位置，不参与）。
+fn hash_run_settings(
+    hasher: &mut StableHasher,
+    template: &TemplateContainer,
+    config: &WalkForwardConfig,
+) {
+    let mut config = config.clone();
+    config.checkpoint_dir = None;
+    hasher.write_str(&format!("{config:?}"));
+    hasher.write_str(&format!("{template:?}"));
+}
+
+/// 与数据无关的运行配置哈希：记录在 `WalkForwardResult` 中，增量续跑据此判断旧窗口是否可复用。
+pub(crate) fn run_settings_hash(template: &TemplateContainer, config: &WalkForwardConfig) -> u64 {
+    let mut hasher = StableHasher::new();
+    hash_run_settings(&mut hasher, template, config);
+    hasher.finish()
+}
+
+/// 断点目录对应的配置哈希（checkpoint_dir 本身不参与）。
+fn config_hash(
+    data_pack: &DataPack,
+    param: &SingleParamSet,
+    template: &TemplateContainer,
+    config: &WalkForwardConfig,
+) -> Result<u64, QuantError> {
+    let mut hasher = StableHasher::new();
+    hash_run_settings(&mut hasher, template, config);
+    hasher.write_str(&canonical_param_set(param));
+    hash_data_pack(&mut hasher, data_pack)?;
+    Ok(hasher.finish())
+}
+
+/// 一次 WF 运行绑定的断点目录。
+pub(crate) struct CheckpointStore {
+    dir: PathBuf,
+}
+
+impl CheckpointStore {
+    pub fn open(
+        root: &str,
+        data_pack: &DataPack,
+        param: &SingleParamSet,
+        template: &TemplateContainer,
+        config: &WalkForwardConfig,
+    ) -> Result<Self, QuantError> {
+        let hash = config_hash(data_pack, param, template, config)?;
+        let dir = Path::new(root).join(format!("{hash:016x}"));
+        fs::create_dir_all(&dir).map_err(|e| io_error(&dir, e))?;
+        Ok(Self { dir })
+    }
+
+    fn window_dir(&self, window_idx: usize) -> PathBuf {
+        self.dir.join(format!("window_{window_idx:04}"))
+    }
+
+    /// 读取已完成窗口；不存在或内容与测试包不一致时返回 None，由调用方重新计算。
+    pub fn load(&self, window_idx: usize, test_pack_data: &DataPack) -> Option<WindowCheckpoint> {
+        let dir = self.window_dir(window_idx);
+        if !dir.is_dir() {
+            return None;
+        }
+        load_window(&dir, test_pack_data).ok().filter(|ckpt| {
+            ckpt.test_pack_result.mapping.height() == test_pack_data.mapping.height()
+        })
+    }
+
+    /// 落盘一个已完成窗口。
+    pub fn save(
+        &self,
+        window_idx: usize,
+        best_params: &SingleParamSet,
+        next_top_k: &[Vec<f64>],
+        next_test_last_position: Option<CrossSide>,
+        has_cross_boundary_position: bool,
+        test_pack_result: &ResultPack,
+    ) -> Result<(), QuantError> {
+        let final_dir = self.window_dir(window_idx);
+        let tmp_dir = self.dir.join(format!("window_{window_idx:04}.tmp"));
+        if tmp_dir.exists() {
+            fs::remove_dir_all(&tmp_dir).map_err(|e| io_error(&tmp_dir, e))?;
+        }
+        fs::create_dir_all(&tmp_dir).map_err(|e| io_error(&tmp_dir, e))?;
+
+        let best_values = extract_optimizable_params(best_params)
+            .iter()
+            .map(|p| p.param.value)
+            .collect::<Vec<_>>();
+        write_frame(
+            &tmp_dir.join(STATE_FILE),
+            &df!(
+                "has_cross_boundary_position" => [has_cross_boundary_position],
+                "next_test_last_position" => [encode_side(next_test_last_position)],
+            )?,
+        )?;
+        write_frame(
+            &tmp_dir.join(BEST_VALUES_FILE),
+            &df!("value" => best_values.as_slice())?,
+        )?;
+        let top_k_columns = (0..best_values.len())
+            .map(|dim| {
+                let values = next_top_k.iter().map(|row| row[dim]).collect::<Vec<_>>();
+                Column::new(format!("d{dim}").into(), values)
+            })
+            .collect::<Vec<_>>();
+        write_frame(&tmp_dir.join(TOP_K_FILE), &DataFrame::new(top_k_columns)?)?;
+        save_result_pack(&tmp_dir, test_pack_result)?;
+
+        if final_dir.exists() {
+            fs::remove_dir_all(&final_dir).map_err(|e| io_error(&final_dir, e))?;
+        }
+        fs::rename(&tmp_dir, &final_dir).map_err(|e| io_error(&final_dir, e))?;
+        Ok(())
+    }
+}
+
+fn save_result_pack(dir: &Path, result: &ResultPack) -> Result<(), QuantError> {
+    write_frame(&dir.join(MAPPING_FILE), &result.mapping)?;
+    let mut ranges = result.ranges.iter().collect::<Vec<_>>();
+    ranges.sort_by(|a, b| a.0.cmp(b.0));
+    write_frame(
+        &dir.join(RANGES_FILE),
+        &df!(
+            "key" => ranges.iter().map(|(k, _)| k.as_str()).collect::<Vec<_>>(),
+            "warmup_bars" => ranges.iter().map(|(_, r)| r.warmup_bars as u64).collect::<Vec<_>>(),
+            "active_bars" => ranges.iter().map(|(_, r)| r.active_bars as u64).collect::<Vec<_>>(),
+            "pack_bars" => ranges.iter().map(|(_, r)| r.pack_bars as u64).collect::<Vec<_>>(),
+        )?,
+    )?;
+    if let Some(signals) = &result.signals {
+        write_frame(&dir.join(SIGNALS_FILE), signals)?;
+    }
+    if let Some(backtest) = &result.backtest {
+        write_frame(&dir.join(BACKTEST_FILE), backtest)?;
+    }
+    if let Some(performance) = &result.performance {
+        let mut metrics = performance.iter().collect::<Vec<_>>();
+        metrics.sort_by(|a, b| a.0.cmp(b.0));
+        write_frame(
+            &dir.join(PERFORMANCE_FILE),
+            &df!(
+                "metric" => metrics.iter().map(|(k, _)| k.as_str()).collect::<Vec<_>>(),
+                "value" => metrics.iter().map(|(_, v)| **v).collect::<Vec<_>>(),
+            )?,
+        )?;
+    }
+    if let Some(indicators) = &result.indicators {
+        for (source, df) in indicators {
+            write_frame(&dir.join(format!("{INDICATOR_PREFIX}{source}.arrow")), df)?;
+        }
+    }
+    Ok(())
+}
+
+fn load_window(dir: &Path, test_pack_data: &DataPack) -> Result<WindowCheckpoint, QuantError> {
+    let state = read_frame(&dir.join(STATE_FILE))?;
+    let has_cross_boundary_position = state
+        .column("has_cross_boundary_position")?
+        .bool()?
+        .get(0)
+        .unwrap_or(false);
+    let next_test_last_position = decode_side(
+        state
+            .column("next_test_last_position")?
+            .i32()?
+            .get(0)
+            .unwrap_or(0),
+    );
+
+    let best_values = f64_column(&read_frame(&dir.join(BEST_VALUES_FILE))?, "value")?;
+    let top_k_df = read_frame(&dir.join(TOP_K_FILE))?;
+    let top_k_columns = (0..top_k_df.width())
+        .map(|dim| f64_column(&top_k_df, &format!("d{dim}")))
+        .collect::<Result<Vec<_>, _>>()?;
+    let next_top_k = (0..top_k_df.height())
+        .map(|row| top_k_columns.iter().map(|col| col[row]).collect())
+        .collect();
+
+    let ranges_df = read_frame(&dir.join(RANGES_FILE))?;
+    let range_keys = ranges_df
+        .column("key")?
+        .str()?
+        .into_iter()
+        .map(|k| k.unwrap_or_default().to_string())
+        .collect::<Vec<_>>();
+    let (warmup, active, pack) = (
+        u64_column(&ranges_df, "warmup_bars")?,
+        u64_column(&ranges_df, "active_bars")?,
+        u64_column(&ranges_df, "pack_bars")?,
+    );
+    let ranges = range_keys
+        .into_iter()
+        .enumerate()
+        .map(|(i, key)| (key, SourceRange::new(warmup[i], active[i], pack[i])))
+        .collect::<HashMap<_, _>>();
+
+    let performance = read_optional_frame(&dir.join(PERFORMANCE_FILE))?
+        .map(|df| -> Result<HashMap<String, f64>, QuantError> {
+            let names = df.column("metric")?.str()?;
+            let values = f64_column(&df, "value")?;
+            Ok(names
+                .into_iter()
+                .zip(values)
+                .map(|(name, value)| (name.unwrap_or_default().to_string(), value))
+                .collect())
+        })
+        .transpose()?;
+
+    let mut indicators: IndicatorResults = HashMap::new();
+    let entries = fs::read_dir(dir).map_err(|e| io_error(dir, e))?;
+    for entry in entries {
+        let path = entry.map_err(|e| io_error(dir, e))?.path();
+        let file_name = path
+            .file_name()
+            .and_then(|n| n.to_str())
+            .unwrap_or_default();
+        if let Some(source) = file_name
+            .strip_prefix(INDICATOR_PREFIX)
+            .and_then(|rest| rest.strip_suffix(".arrow"))
+        {
+            indicators.insert(source.to_string(), read_frame(&path)?);
+        }
+    }
+
+    let test_pack_result = ResultPack::new_checked(
+        (!indicators.is_empty()).then_some(indicators),
+        read_optional_frame(&dir.join(SIGNALS_FILE))?,
+        read_optional_frame(&dir.join(BACKTEST_FILE))?,
+        performance,
+        read_frame(&dir.join(MAPPING_FILE))?,
+        ranges,
+        test_pack_data.base_data_key.clone(),
+    );
+
+    Ok(WindowCheckpoint {
+        best_values,
+        has_cross_boundary_position,
+        next_top_k,
+        next_test_last_position,
+        test_pack_result,
+    })
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::backtest_engine::data_ops::build_data_pack;
+    use crate::types::{LogicOp, SignalGroup};
+
+    fn pack() -> DataPack {
+        let n = 16usize;
+        let df = df!(
+            "time" => (0..n as i64).map(|i| i * 60_000).collect::<Vec<_>>(),
+            "close" => (0..n).map(|i| 100.0 + i as f64).collect::<Vec<_>>(),
+        )
+        .expect("frame 应成功");
+        build_data_pack(
+            HashMap::from([("ohlcv_1m".to_string(), df)]),
+            "ohlcv_1m".to_string(),
+            HashMap::from([("ohlcv_1m".to_string(), SourceRange::new(0, n, n))]),
+            None,
+        )
+        .expect("DataPack 构建应成功")
+    }
+
+    #[test]
+    fn test_window_round_trip() {
+        let data = pack();
+        let root = std::env::temp_dir().join(format!("wf_ckpt_test_{}", std::process::id()));
+        let store = CheckpointStore::open(
+            root.to_str().expect("utf8 路径"),
+            &data,
+            &SingleParamSet::default(),
+            &TemplateContainer::new(Default::default()),
+            &WalkForwardConfig::default(),
+        )
+        .expect("打开断点目录");
+
+        let result = ResultPack::new_checked(
+            None,
+            None,
+            Some(df!("equity" => vec![1.0; 16]).expect("backtest")),
+            Some(HashMap::from([("total_return".to_string(), 0.5)])),
+            data.mapping.clone(),
+            data.ranges.clone(),
+            data.base_data_key.clone(),
+        );
+        assert!(store.load(3, &data).is_none());
+        store
+            .save(
+                3,
+                &SingleParamSet::default(),
+                &[],
+                Some(CrossSide::Short),
+                true,
+                &result,
+            )
+            .expect("落盘");
+
+        let loaded = store.load(3, &data).expect("应能读回");
+        assert!(loaded.has_cross_boundary_position);
+        assert_eq!(loaded.next_test_last_position, Some(CrossSide::Short));
+        assert!(loaded.best_values.is_empty() && loaded.next_top_k.is_empty());
+        let restored = loaded.test_pack_result;
+        assert_eq!(restored.performance, result.performance);
+        assert!(restored
+            .backtest
+            .as_ref()
+            .expect("backtest")
+            .equals(result.backtest.as_ref().expect("backtest")));
+        assert_eq!(restored.ranges["ohlcv_1m"].active_bars, 16);
+
+        let _ = fs::remove_dir_all(root);
+    }
+
+    #[test]
+    fn test_config_hash_covers_column_values() {
+        let data = pack();
+        let hash = |data: &DataPack| {
+            config_hash(
+                data,
+                &SingleParamSet::default(),
+                &TemplateContainer::new(Default::default()),
+                &WalkForwardConfig::default(),
+            )
+            .expect("哈希应成功")
+        };
+        assert_eq!(hash(&data), hash(&pack()));
+
+        // 中文注释：行数与首尾时间不变、只改中间一根 close，也必须换断点目录。
+        let mut changed = data.clone();
+        let df = changed.source.get_mut("ohlcv_1m").expect("source");
+        let mut close = f64_column(df, "close").expect("close");
+        close[7] += 1.0;
+        df.replace("close", Series::new("close".into(), close))
+            .expect("替换 close");
+        assert_ne!(hash(&data), hash(&changed));
+    }
+
+    #[test]
+    fn test_run_settings_hash_covers_template_and_optimizer_config() {
+        let template = TemplateContainer::new(Default::default());
+        let config = WalkForwardConfig::default();
+        let base = run_settings_hash(&template, &config);
+
+        let mut relocated = config.clone();
+        relocated.checkpoint_dir = Some("elsewhere".to_string());
+        assert_eq!(run_settings_hash(&template, &relocated), base);
+
+        let mut budget = config.clone();
+        budget.optimizer_config.max_samples += 1;
+        assert_ne!(run_settings_hash(&template, &budget), base);
+
+        let mut changed_template = template.clone();
+        changed_template.signal.entry_long = Some(SignalGroup::new(
+            LogicOp::AND,
+            Some(vec!["close, ohlcv_1m, 0 > open, ohlcv_1m, 0".to_string()]),
+            None,
+        ));
+        assert_ne!(run_settings_hash(&changed_template, &config), base);
+    }
+}
@@ -378,6 +378,8 @@ mod tests {
             warmup_mode: WfWarmupMode::ExtendTest,
             ignore_indicator_warmup: false,
             optimizer_config: Default::default(),
+            precompute_indicators: false,
+            checkpoint_dir: None,
         };
 
         let plan = build_window_indices(
@@ -427,6 +429,8 @@ mod tests {
             warmup_mode: WfWarmupMode::BorrowFromTrain,
             ignore_indicator_warmup: false,
             optimizer_config: Default::default(),
+            precompute_indicators: false,
+            checkpoint_dir: None,
         };
 
         let plan = build_window_indices(
@@ -0,0 +1,161 @@
+//! 增量向前测试
+//!
+//! 窗口几何从 base 第 0 根起按 test_active 步长滚动，数据只在尾部追加时，前面窗口的切片保持不变。
+//! 这里把新计划与上一次 `WalkForwardResult` 逐窗比对：前缀中数据与参数空间完全一致的窗口原样复用，
+//! 只对之后的窗口做训练优化与测试，最后整体重新拼接。模板与 WF / 优化器配置由调用方先按
+//! `WalkForwardResult.settings_hash` 整体比对，不一致时不进入逐窗比对。
+
+use crate::backtest_engine::data_ops::{extract_active, slice_data_pack_by_base_window};
+use crate::backtest_engine::optimizer::param_extractor::{
+    apply_values_to_param, extract_optimizable_params,
+};
+use crate::backtest_engine::walk_forward::checkpoint::canonical_param_set;
+use crate::backtest_engine::walk_forward::data_splitter::WindowPlan;
+use crate::backtest_engine::walk_forward::injection::CrossSide;
+use crate::backtest_engine::walk_forward::window_runner::{
+    replay_test_last_position, CompletedWindow,
+};
+use crate::error::{OptimizerError, QuantError};
+use crate::types::{DataPack, SingleParamSet, TemplateContainer, WindowArtifact};
+
+/// 两个 DataPack 的 source、mapping 与 ranges 完全一致。
+fn same_pack(a: &DataPack, b: &DataPack) -> bool {
+    a.base_data_key == b.base_data_key
+        && a.ranges == b.ranges
+        && a.source.len() == b.source.len()
+        && a.source.iter().all(|(key, df)| {
+            b.source
+                .get(key)
+                .is_some_and(|other| df.equals_missing(other))
+        })
+        && a.mapping.equals_missing(&b.mapping)
+}
+
+/// 旧窗口的最优参数能否由当前参数集复现：优化维度一致，且非优化部分（取值、范围、模板参数）未变。
+fn same_param_space(param: &SingleParamSet, best_params: &SingleParamSet) -> bool {
+    let previous_flat = extract_optimizable_params(best_params);
+    let current_flat = extract_optimizable_params(param);
+    if previous_flat.len() != current_flat.len()
+        || previous_flat
+            .iter()
+            .zip(&current_flat)
+            .any(|(a, b)| a.key() != b.key())
+    {
+        return false;
+    }
+    let values = previous_flat
+        .iter()
+        .map(|p| p.param.value)
+        .collect::<Vec<_>>();
+    let mut rebuilt = param.clone();
+    apply_values_to_param(&mut rebuilt, &current_flat, &values);
+    canonical_param_set(&rebuilt) == canonical_param_set(best_params)
+}
+
+/// 上一次结果中从第 0 窗起、可原样复用的窗口数。
+pub(crate) fn count_reusable_windows(
+    data_pack: &DataPack,
+    param: &SingleParamSet,
+    windows: &[WindowPlan],
+    previous: &[WindowArtifact],
+) -> Result<usize, QuantError> {
+    let mut reusable = 0;
+    for (window, artifact) in windows.iter().zip(previous) {
+        if artifact.meta.window_id != window.window_idx
+            || !same_param_space(param, &artifact.meta.best_params)
+        {
+            break;
+        }
+        // 中文注释：先比测试包；尾部追加数据时最先变化的就是上一轮最后一窗的测试段。
+        let test_pack_data = slice_data_pack_by_base_window(data_pack, &window.indices.test_pack)?;
+        if !same_pack(&test_pack_data, &artifact.test_pack_data) {
+            break;
+        }
+        let train_pack_data =
+            slice_data_pack_by_base_window(data_pack, &window.indices.train_pack)?;
+        if !same_pack(&train_pack_data, &artifact.train_pack_data) {
+            break;
+        }
+        reusable += 1;
+    }
+    Ok(reusable)
+}
+
+/// 把旧窗口产物还原为拼接所需的完成窗口。
+pub(crate) fn reuse_window(artifact: &WindowArtifact) -> Result<CompletedWindow, QuantError> {
+    let (_test_active_data, test_active_result) =
+        extract_active(&artifact.test_pack_data, &artifact.test_pack_result)?;
+    Ok(CompletedWindow {
+        public_artifact: artifact.clone(),
+        test_active_result,
+    })
+}
+
+/// 第 `idx` 窗测试 active 首根注入的 carry 方向。
+///
+/// 中文注释：注入时只点亮对应方向的 entry 并清掉反向 entry，因此 entry_long 为真即多头，否则为空头。
+fn injected_carry_side(
+    previous: &[WindowArtifact],
+    idx: usize,
+) -> Result<Option<CrossSide>, QuantError> {
+    if idx == 0 || !previous[idx - 1].meta.has_cross_boundary_position {
+        return Ok(None);
+    }
+    let result = &previous[idx].test_pack_result;
+    let signals = result.signals.as_ref().ok_or_else(|| {
+        OptimizerError::InvalidConfig(format!(
+            "window {idx} test_pack_result 缺少 signals，无法恢复跨窗持仓方向"
+        ))
+    })?;
+    let warmup_bars = result
+        .ranges
+        .get(&result.base_data_key)
+        .map(|range| range.warmup_bars)
+        .ok_or_else(|| {
+            OptimizerError::InvalidConfig(format!("window {idx} test_pack_result 缺少 base range"))
+        })?;
+    let long = signals
+        .column("entry_long")?
+        .bool()?
+        .get(warmup_bars)
+        .unwrap_or(false);
+    Ok(Some(if long {
+        CrossSide::Long
+    } else {
+        CrossSide::Short
+    }))
+}
+
+/// 复用前缀之后的续跑状态：(下一窗 TopK 先验, 下一窗 carry 方向)。
+pub(crate) fn resume_state(
+    previous: &[WindowArtifact],
+    reusable: usize,
+    template: &TemplateContainer,
+) -> Result<(Option<Vec<Vec<f64>>>, Option<CrossSide>), QuantError> {
+    let Some(last) = reusable.checked_sub(1).map(|idx| &previous[idx]) else {
+        return Ok((None, None));
+    };
+
+    // 中文注释：公开结果不含 TopK 样本，以最后一个复用窗口的最优参数作为热启动先验。
+    let prior = extract_optimizable_params(&last.meta.best_params)
+        .iter()
+        .map(|p| p.param.value)
+        .collect::<Vec<_>>();
+    let prior_top_k = (!prior.is_empty()).then(|| vec![prior]);
+
+    let side = if !last.meta.has_cross_boundary_position {
+        None
+    } else if reusable < previous.len() {
+        // 旧结果里的下一窗已经记录了注入方向，无需重算。
+        injected_carry_side(previous, reusable)?
+    } else {
+        replay_test_last_position(
+            &last.test_pack_data,
+            &last.test_pack_result,
+            &last.meta.best_params,
+            template,
+            injected_carry_side(previous, reusable - 1)?,
+        )?
+    };
+    Ok((prior_top_k, side))
+}
@@ -1,4 +1,6 @@
+pub mod checkpoint;
 pub mod data_splitter;
+pub mod incremental;
 pub mod injection;
 pub mod next_window_hint;
 pub mod runner;
@@ -11,6 +13,7 @@ use pyo3::prelude::*;
 
 pub fn register_py_module(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(runner::py_run_walk_forward, m)?)?;
+    m.add_function(wrap_pyfunction!(runner::py_run_walk_forward_incremental, m)?)?;
     // Config 和 Result 都是直接转换的，不需要作为类注册，
     // 除非我们需要在 Python 端构造 Config (DTO)。
     // WalkForwardConfig 有 #[derive(FromPyObject)]，Python传参会自动转换。
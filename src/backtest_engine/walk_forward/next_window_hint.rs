@@ -155,6 +155,8 @@ mod tests {
             crate::types::WfWarmupMode::ExtendTest,
             false,
             None,
+            false,
+            None,
         );
         let fallback_windows = vec![dummy_window(2, (100, 130), (10, 13), 3)];
         let fallback_hint =
@@ -1,9 +1,14 @@
 use crate::backtest_engine::data_ops::build_warmup_requirements;
+use crate::backtest_engine::indicators::precomputed::PrecomputedIndicators;
 use crate::backtest_engine::validate_mode_settings;
+use crate::backtest_engine::walk_forward::checkpoint::{run_settings_hash, CheckpointStore};
 use crate::backtest_engine::walk_forward::data_splitter::build_window_indices;
+use crate::backtest_engine::walk_forward::incremental::{
+    count_reusable_windows, resume_state, reuse_window,
+};
 use crate::backtest_engine::walk_forward::injection::CrossSide;
 use crate::backtest_engine::walk_forward::stitch::build_stitched_artifact;
-use crate::backtest_engine::walk_forward::window_runner::execute_window;
+use crate::backtest_engine::walk_forward::window_runner::{execute_window, restore_window};
 use crate::error::{OptimizerError, QuantError};
 use crate::types::WalkForwardConfig;
 use crate::types::{
@@ -19,6 +24,38 @@ pub fn run_walk_forward(
     template: &TemplateContainer,
     settings: &SettingContainer,
     config: &WalkForwardConfig,
+) -> Result<WalkForwardResult, QuantError> {
+    run_walk_forward_from(data_pack, param, template, settings, config, None)
+}
+
+/// 增量向前测试：复用上一次结果中数据未变的前缀窗口，只优化、测试新增的尾部窗口后重新拼接。
+///
+/// 中文注释：窗口是否可复用按切片数据与参数空间逐窗比对；template / settings 需与上一次保持一致。
+pub fn run_walk_forward_incremental(
+    data_pack: &DataPack,
+    param: &SingleParamSet,
+    template: &TemplateContainer,
+    settings: &SettingContainer,
+    config: &WalkForwardConfig,
+    previous: &WalkForwardResult,
+) -> Result<WalkForwardResult, QuantError> {
+    if previous.optimize_metric != config.optimizer_config.optimize_metric {
+        return Err(OptimizerError::InvalidConfig(format!(
+            "incremental walk-forward requires the same optimize_metric: previous={:?}, current={:?}",
+            previous.optimize_metric, config.optimizer_config.optimize_metric
+        ))
+        .into());
+    }
+    run_walk_forward_from(data_pack, param, template, settings, config, Some(previous))
+}
+
+fn run_walk_forward_from(
+    data_pack: &DataPack,
+    param: &SingleParamSet,
+    template: &TemplateContainer,
+    settings: &SettingContainer,
+    config: &WalkForwardConfig,
+    previous: Option<&WalkForwardResult>,
 ) -> Result<WalkForwardResult, QuantError> {
     validate_mode_settings(
         settings,
@@ -51,23 +88,79 @@ pub fn run_walk_forward(
     optimize_settings.stop_stage = ExecutionStage::Performance;
     optimize_settings.artifact_retention = ArtifactRetention::StopStageOnly;
 
+    // 中文注释：预计算模式下整个 WF 运行共享一份全量指标缓存，各窗口按时间切片取用。
+    let precomputed = if config.precompute_indicators {
+        Some(PrecomputedIndicators::new(data_pack)?)
+    } else {
+        None
+    };
+
+    // 中文注释：断点目录按配置哈希隔离；只要前缀窗口全部命中就直接恢复，
+    // 一旦某窗重新计算，其后窗口的 TopK 热启动与跨窗持仓都可能变化，不再读取旧断点。
+    let checkpoint = config
+        .checkpoint_dir
+        .as_deref()
+        .map(|root| CheckpointStore::open(root, data_pack, param, template, config))
+        .transpose()?;
+    let mut resuming = checkpoint.is_some();
+
     let mut completed_windows = Vec::new();
     let mut window_results: Vec<WindowArtifact> = Vec::new();
     let mut prev_top_k: Option<Vec<Vec<f64>>> = None;
     let mut prev_test_last_position: Option<CrossSide> = None;
 
-    for window in &plan.windows {
-        let window_output = execute_window(
-            data_pack,
-            param,
-            template,
-            settings,
-            &optimize_settings,
-            config,
-            window,
-            prev_top_k.as_deref(),
-            prev_test_last_position,
-        )?;
+    // 中文注释：模板或优化器配置（预算、种子、目标等）变化时旧窗口的最优参数不再可信，全部重算。
+    let settings_hash = run_settings_hash(template, config);
+    let reusable = match previous {
+        Some(previous) if previous.settings_hash == settings_hash => {
+            let reusable =
+                count_reusable_windows(data_pack, param, &plan.windows, &previous.window_results)?;
+            for artifact in &previous.window_results[..reusable] {
+                window_results.push(artifact.clone());
+                completed_windows.push(reuse_window(artifact)?);
+            }
+            (prev_top_k, prev_test_last_position) =
+                resume_state(&previous.window_results, reusable, template)?;
+            reusable
+        }
+        _ => 0,
+    };
+
+    for window in &plan.windows[reusable..] {
+        let restored = match &checkpoint {
+            Some(store) if resuming => restore_window(data_pack, param, window, store)?,
+            _ => None,
+        };
+        let window_output = match restored {
+            Some(output) => output,
+            None => {
+                resuming = false;
+                let output = execute_window(
+                    data_pack,
+                    param,
+                    template,
+                    settings,
+                    &optimize_settings,
+                    config,
+                    window,
+                    prev_top_k.as_deref(),
+                    prev_test_last_position,
+                    precomputed.as_ref(),
+                )?;
+                if let Some(store) = &checkpoint {
+                    let artifact = &output.completed_window.public_artifact;
+                    store.save(
+                        window.window_idx,
+                        &artifact.meta.best_params,
+                        &output.next_top_k,
+                        output.next_test_last_position,
+                        artifact.meta.has_cross_boundary_position,
+                        &artifact.test_pack_result,
+                    )?;
+                }
+                output
+            }
+        };
         prev_top_k = Some(window_output.next_top_k);
         prev_test_last_position = window_output.next_test_last_position;
         window_results.push(window_output.completed_window.public_artifact.clone());
@@ -81,6 +174,7 @@ pub fn run_walk_forward(
         optimize_metric: config.optimizer_config.optimize_metric,
         window_results,
         stitched_result,
+        settings_hash,
     })
 }
 
@@ -111,3 +205,39 @@ pub fn py_run_walk_forward(
 ) -> PyResult<WalkForwardResult> {
     run_walk_forward(&data, &param, &template, &engine_settings, &config).map_err(|e| e.into())
 }
+
+#[gen_stub_pyfunction(
+    module = "pyo3_quant.backtest_engine.walk_forward",
+    python = r#"
+import pyo3_quant
+
+def run_walk_forward_incremental(
+    data: pyo3_quant.DataPack,
+    param: pyo3_quant.SingleParamSet,
+    template: pyo3_quant.TemplateContainer,
+    engine_settings: pyo3_quant.SettingContainer,
+    walk_forward_config: pyo3_quant.WalkForwardConfig,
+    previous: pyo3_quant.WalkForwardResult,
+) -> pyo3_quant.WalkForwardResult:
+    """增量滚动前推测试：复用上一次结果中未变化的窗口，只计算新增窗口"""
+"#
+)]
+#[pyfunction(name = "run_walk_forward_incremental")]
+pub fn py_run_walk_forward_incremental(
+    data: DataPack,
+    param: SingleParamSet,
+    template: TemplateContainer,
+    engine_settings: SettingContainer,
+    config: WalkForwardConfig,
+    previous: WalkForwardResult,
+) -> PyResult<WalkForwardResult> {
+    run_walk_forward_incremental(
+        &data,
+        &param,
+        &template,
+        &engine_settings,
+        &config,
+        &previous,
+    )
+    .map_err(|e| e.into())
+}
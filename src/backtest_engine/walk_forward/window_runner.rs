@@ -1,8 +1,15 @@
-use crate::backtest_engine::data_ops::{extract_active, slice_data_pack_by_base_window};
+use crate::backtest_engine::data_ops::{
+    extract_active, slice_data_pack_by_base_window, strip_indicator_time_columns,
+};
 use crate::backtest_engine::{
     build_public_result_pack, execute_single_pipeline, PipelineOutput, PipelineRequest,
 };
-use crate::backtest_engine::optimizer::run_optimization;
+use crate::backtest_engine::indicators::precomputed::PrecomputedIndicators;
+use crate::backtest_engine::optimizer::param_extractor::{
+    apply_values_to_param, extract_optimizable_params,
+};
+use crate::backtest_engine::optimizer::run_optimization_with_precomputed;
+use crate::backtest_engine::walk_forward::checkpoint::CheckpointStore;
 use crate::backtest_engine::walk_forward::data_splitter::WindowPlan;
 use crate::backtest_engine::walk_forward::injection::{
     build_carry_only_signals_for_window, build_final_signals_for_window, detect_last_bar_position,
@@ -38,6 +45,7 @@ pub(crate) fn execute_window(
     window: &WindowPlan,
     prev_top_k: Option<&[Vec<f64>]>,
     prev_test_last_position: Option<CrossSide>,
+    precomputed: Option<&PrecomputedIndicators<'_>>,
 ) -> Result<WindowExecutionOutput, QuantError> {
     let train_pack_data = slice_data_pack_by_base_window(data_pack, &window.indices.train_pack)?;
 
@@ -49,23 +57,31 @@ pub(crate) fn execute_window(
         }
     }
 
-    let train_result = run_optimization(
+    let train_result = run_optimization_with_precomputed(
         &train_pack_data,
         param,
         template,
         optimize_settings,
         &opt_config,
+        precomputed,
     )?;
 
     let test_pack_data = slice_data_pack_by_base_window(data_pack, &window.indices.test_pack)?;
     let test_warmup_bars = test_pack_data.ranges[&test_pack_data.base_data_key].warmup_bars;
     let test_active_bars = test_pack_data.ranges[&test_pack_data.base_data_key].active_bars;
 
+    let first_eval_request = match precomputed {
+        Some(precomputed) => PipelineRequest::IndicatorsToSignalsAllCompletedStages {
+            indicators_raw: precomputed
+                .calculate(&test_pack_data, &train_result.best_params.indicators)?,
+        },
+        None => PipelineRequest::ScratchToSignalsAllCompletedStages,
+    };
     let first_eval_output = execute_single_pipeline(
         &test_pack_data,
         &train_result.best_params,
         template,
-        PipelineRequest::ScratchToSignalsAllCompletedStages,
+        first_eval_request,
     )?;
     let (first_eval_raw_indicators, first_eval_signals_df) = match first_eval_output {
         PipelineOutput::IndicatorsSignals {
@@ -87,25 +103,12 @@ pub(crate) fn execute_window(
         prev_test_last_position,
     )?;
 
-    // 中文注释：自然回放只注入 carry，不追加尾部强平；跨窗状态只能从这条链读取。
-    let natural_output = execute_single_pipeline(
+    let next_test_last_position = natural_last_position(
         &test_pack_data,
         &train_result.best_params,
         template,
-        PipelineRequest::SignalsToBacktestStopStageOnly {
-            signals: carry_only_signals_df.clone(),
-        },
+        &carry_only_signals_df,
     )?;
-    let natural_backtest_df = match natural_output {
-        PipelineOutput::BacktestOnly { ref backtest } => backtest,
-        _ => {
-            return Err(OptimizerError::SamplingFailed(
-                "Walk-forward natural replay 必须返回 BacktestOnly".into(),
-            )
-            .into())
-        }
-    };
-    let next_test_last_position = detect_last_bar_position(natural_backtest_df)?;
     let has_cross_boundary_position = next_test_last_position.is_some();
 
     let final_signals_df =
@@ -133,13 +136,137 @@ pub(crate) fn execute_window(
     };
     validate_window_capital_series(test_backtest_df)?;
     let test_pack_result = build_public_result_pack(&test_pack_data, final_output)?;
+
+    let next_top_k = train_result
+        .top_k_samples
+        .iter()
+        .map(|sample| sample.values.clone())
+        .collect::<Vec<_>>();
+
+    Ok(WindowExecutionOutput {
+        completed_window: assemble_completed_window(
+            train_pack_data,
+            test_pack_data,
+            window,
+            train_result.best_params,
+            has_cross_boundary_position,
+            test_pack_result,
+        )?,
+        next_top_k,
+        next_test_last_position,
+    })
+}
+
+/// 中文注释：自然回放只注入 carry，不追加尾部强平；跨窗状态只能从这条链读取。
+fn natural_last_position(
+    test_pack_data: &DataPack,
+    best_params: &SingleParamSet,
+    template: &TemplateContainer,
+    carry_only_signals_df: &DataFrame,
+) -> Result<Option<CrossSide>, QuantError> {
+    let natural_output = execute_single_pipeline(
+        test_pack_data,
+        best_params,
+        template,
+        PipelineRequest::SignalsToBacktestStopStageOnly {
+            signals: carry_only_signals_df.clone(),
+        },
+    )?;
+    match natural_output {
+        PipelineOutput::BacktestOnly { ref backtest } => detect_last_bar_position(backtest),
+        _ => Err(OptimizerError::SamplingFailed(
+            "Walk-forward natural replay 必须返回 BacktestOnly".into(),
+        )
+        .into()),
+    }
+}
+
+/// 对已有窗口重放测试段（不做训练优化），求下一窗的 carry 方向。
+///
+/// 中文注释：同一测试包、同一最优参数算出的指标与窗口结果中保存的完全一致，
+/// 有保存的指标时直接复用，递推指标（EMA / RMA / PSAR / ADX 等）不再从测试包首行重算。
+pub(crate) fn replay_test_last_position(
+    test_pack_data: &DataPack,
+    test_pack_result: &ResultPack,
+    best_params: &SingleParamSet,
+    template: &TemplateContainer,
+    prev_test_last_position: Option<CrossSide>,
+) -> Result<Option<CrossSide>, QuantError> {
+    let base_range = &test_pack_data.ranges[&test_pack_data.base_data_key];
+    let request = match &test_pack_result.indicators {
+        Some(indicators) => PipelineRequest::IndicatorsToSignalsAllCompletedStages {
+            indicators_raw: strip_indicator_time_columns(indicators)?,
+        },
+        None => PipelineRequest::ScratchToSignalsAllCompletedStages,
+    };
+    let signals_df = match execute_single_pipeline(test_pack_data, best_params, template, request)?
+    {
+        PipelineOutput::IndicatorsSignals { signals, .. } => signals,
+        _ => {
+            return Err(OptimizerError::SamplingFailed(
+                "Walk-forward replay evaluation 必须返回 IndicatorsSignals".into(),
+            )
+            .into())
+        }
+    };
+    let carry_only_signals_df = build_carry_only_signals_for_window(
+        &signals_df,
+        base_range.warmup_bars,
+        base_range.active_bars,
+        prev_test_last_position,
+    )?;
+    natural_last_position(test_pack_data, best_params, template, &carry_only_signals_df)
+}
+
+/// 中文注释：从断点恢复单窗；断点缺失或与当前参数维度不符时返回 None，由调用方重新执行。
+pub(crate) fn restore_window(
+    data_pack: &DataPack,
+    param: &SingleParamSet,
+    window: &WindowPlan,
+    store: &CheckpointStore,
+) -> Result<Option<WindowExecutionOutput>, QuantError> {
+    let test_pack_data = slice_data_pack_by_base_window(data_pack, &window.indices.test_pack)?;
+    let Some(checkpoint) = store.load(window.window_idx, &test_pack_data) else {
+        return Ok(None);
+    };
+    let flat_params = extract_optimizable_params(param);
+    if checkpoint.best_values.len() != flat_params.len() {
+        return Ok(None);
+    }
+    let mut best_params = param.clone();
+    apply_values_to_param(&mut best_params, &flat_params, &checkpoint.best_values);
+
+    let train_pack_data = slice_data_pack_by_base_window(data_pack, &window.indices.train_pack)?;
+    Ok(Some(WindowExecutionOutput {
+        completed_window: assemble_completed_window(
+            train_pack_data,
+            test_pack_data,
+            window,
+            best_params,
+            checkpoint.has_cross_boundary_position,
+            checkpoint.test_pack_result,
+        )?,
+        next_top_k: checkpoint.next_top_k,
+        next_test_last_position: checkpoint.next_test_last_position,
+    }))
+}
+
+/// 由训练包、测试包与测试结果组装窗口产物；新执行与断点恢复共用。
+fn assemble_completed_window(
+    train_pack_data: DataPack,
+    test_pack_data: DataPack,
+    window: &WindowPlan,
+    best_params: SingleParamSet,
+    has_cross_boundary_position: bool,
+    test_pack_result: ResultPack,
+) -> Result<CompletedWindow, QuantError> {
     let (_test_active_data, test_active_result) =
         extract_active(&test_pack_data, &test_pack_result)?;
 
     let time_ranges = build_window_time_ranges(&train_pack_data, &test_pack_data)?;
     let meta = WindowMeta {
         window_id: window.window_idx,
-        best_params: train_result.best_params,
+        best_params,
         has_cross_boundary_position,
         test_active_base_row_range: window.indices.test_active_base_row_range,
         train_warmup_time_range: time_ranges.train_warmup_time_range,
@@ -150,26 +277,14 @@ pub(crate) fn execute_window(
         test_pack_time_range: time_ranges.test_pack_time_range,
     };
 
-    let artifact = WindowArtifact {
-        train_pack_data,
-        test_pack_data,
-        test_pack_result: test_pack_result.clone(),
-        meta,
-    };
-
-    let next_top_k = train_result
-        .top_k_samples
-        .iter()
-        .map(|sample| sample.values.clone())
-        .collect::<Vec<_>>();
-
-    Ok(WindowExecutionOutput {
-        completed_window: CompletedWindow {
-            public_artifact: artifact,
-            test_active_result,
+    Ok(CompletedWindow {
+        public_artifact: WindowArtifact {
+            train_pack_data,
+            test_pack_data,
+            test_pack_result,
+            meta,
         },
-        next_top_k,
-        next_test_last_position,
+        test_active_result,
     })
 }
 
@@ -21,6 +21,7 @@ fn _pyo3_quant(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<backtest_engine::data_ops::DataPackFetchPlanner>()?;
     m.add_class::<types::OptimizerConfig>()?;
     m.add_class::<types::OptimizeMetric>()?;
+    m.add_class::<types::OptimizerSampler>()?;
     m.add_class::<types::BenchmarkFunction>()?;
     m.add_class::<types::SettingContainer>()?;
     m.add_class::<types::ArtifactRetention>()?;
@@ -47,6 +48,7 @@ fn _pyo3_quant(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<types::StitchedArtifact>()?;
     m.add_class::<types::WalkForwardResult>()?;
     m.add_class::<types::SensitivitySample>()?;
+    m.add_class::<types::ParameterSensitivity>()?;
     m.add_class::<types::SensitivityResult>()?;
 
     let backtest_engine_submodule = PyModule::new(m.py(), "backtest_engine")?;
@@ -1,9 +1,10 @@
 use polars::prelude::*;
 use pyo3::prelude::*;
-use pyo3_polars::PyDataFrame;
 use pyo3_stub_gen::derive::*;
 use std::collections::HashMap;
 
+use crate::types::py_view_cache::{PyFrameCell, PyObjectMap};
+
 pub type DataSource = HashMap<String, DataFrame>;
 
 /// source 级别的真实预热 / 生效 / pack 边界。
@@ -64,6 +65,15 @@ pub struct DataPack {
     pub(crate) skip_mask: Option<DataFrame>,
     pub(crate) ranges: HashMap<String, SourceRange>,
     pub(crate) base_data_key: String,
+    pub(crate) views: DataPackViews,
+}
+
+/// 中文注释：DataPack 各表的 Python 视图缓存，转换一次后复用。
+#[derive(Clone, Debug, Default)]
+pub(crate) struct DataPackViews {
+    mapping: PyFrameCell,
+    skip_mask: PyFrameCell,
+    source: PyObjectMap,
 }
 
 #[gen_stub_pymethods]
@@ -71,17 +81,17 @@ pub struct DataPack {
 impl DataPack {
     #[getter]
     pub fn mapping(&self, py: Python<'_>) -> PyResult<Py<PyAny>> {
-        let py_df = PyDataFrame(self.mapping.clone());
-        Ok(py_df.into_pyobject(py)?.into_any().unbind())
+        Ok(self
+            .views
+            .mapping
+            .get_or_convert(py, &self.mapping)?
+            .unbind())
     }
 
     #[getter]
     pub fn skip_mask(&self, py: Python<'_>) -> PyResult<Option<Py<PyAny>>> {
         match &self.skip_mask {
-            Some(df) => {
-                let py_df = PyDataFrame(df.clone());
-                Ok(Some(py_df.into_pyobject(py)?.into_any().unbind()))
-            }
+            Some(df) => Ok(Some(self.views.skip_mask.get_or_convert(py, df)?.unbind())),
             None => Ok(None),
         }
     }
@@ -90,8 +100,8 @@ impl DataPack {
     pub fn source(&self, py: Python<'_>) -> PyResult<HashMap<String, Py<PyAny>>> {
         let mut py_map = HashMap::new();
         for (k, v) in &self.source {
-            let py_df = PyDataFrame(v.clone());
-            py_map.insert(k.clone(), py_df.into_pyobject(py)?.into_any().unbind());
+            let py_df = self.views.source.get_or_convert(py, k, v)?;
+            py_map.insert(k.clone(), py_df.unbind());
         }
         Ok(py_map)
     }
@@ -126,6 +136,7 @@ impl DataPack {
             skip_mask,
             ranges,
             base_data_key,
+            views: DataPackViews::default(),
         }
     }
 }
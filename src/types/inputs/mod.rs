@@ -12,7 +12,7 @@ pub use self::backtest::{
     SignalParams, SingleParamSet,
 };
 pub use self::data::{DataPack, DataSource, SourceRange};
-pub use self::optimizer::{BenchmarkFunction, OptimizeMetric, OptimizerConfig};
+pub use self::optimizer::{BenchmarkFunction, OptimizeMetric, OptimizerConfig, OptimizerSampler};
 pub use self::params_base::{Param, ParamType};
 pub use self::sensitivity::SensitivityConfig;
 pub use self::settings::{ArtifactRetention, ExecutionStage, SettingContainer};
@@ -204,6 +204,67 @@ pyo3_stub_gen::inventory::submit! {
     }
 }
 
+/// 利用阶段采样器枚举
+#[pyclass(eq, eq_int, hash, frozen)]
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Hash)]
+pub enum OptimizerSampler {
+    /// 以 TopK 为中心的加权高斯采样
+    Gaussian,
+    /// 树结构 Parzen 估计器（TPE）
+    Tpe,
+}
+
+impl OptimizerSampler {
+    fn variant_name(&self) -> &'static str {
+        match self {
+            Self::Gaussian => "Gaussian",
+            Self::Tpe => "Tpe",
+        }
+    }
+}
+
+#[gen_stub_pymethods]
+#[pymethods]
+impl OptimizerSampler {
+    /// 返回稳定的业务键名（用于程序逻辑）
+    pub fn as_str(&self) -> &'static str {
+        match self {
+            Self::Gaussian => "gaussian",
+            Self::Tpe => "tpe",
+        }
+    }
+
+    fn __str__(&self) -> String {
+        self.variant_name().to_string()
+    }
+
+    fn __repr__(&self) -> String {
+        format!("OptimizerSampler.{}", self.variant_name())
+    }
+}
+
+impl PyStubType for OptimizerSampler {
+    fn type_output() -> pyo3_stub_gen::TypeInfo {
+        pyo3_stub_gen::TypeInfo::locally_defined(
+            "OptimizerSampler",
+            pyo3_stub_gen::ModuleRef::Default,
+        )
+    }
+}
+
+pyo3_stub_gen::inventory::submit! {
+    pyo3_stub_gen::type_info::PyEnumInfo {
+        enum_id: || std::any::TypeId::of::<OptimizerSampler>(),
+        pyclass_name: "OptimizerSampler",
+        module: Some("pyo3_quant._pyo3_quant"),
+        doc: "利用阶段采样器枚举",
+        variants: &[
+            ("Gaussian", "以 TopK 为中心的加权高斯采样"),
+            ("Tpe", "树结构 Parzen 估计器（TPE）"),
+        ],
+    }
+}
+
 #[gen_stub_pyclass]
 #[pyclass(get_all, set_all)]
 #[derive(Debug, Clone)]
@@ -229,13 +290,21 @@ pub struct OptimizerConfig {
     pub return_top_k: usize,
     /// 随机种子（None 表示使用系统随机源）
     pub seed: Option<u64>,
+    /// 异步稳态模式：取消轮次屏障，试验完成即补派新试验（固定种子下结果仍可复现）
+    pub async_mode: bool,
+    /// 多保真度筛选：低保真评估使用的 active 段前缀比例（1.0 = 关闭）
+    pub fidelity_ratio: f64,
+    /// 多保真度筛选：每轮晋级全量评估的候选比例
+    pub promote_ratio: f64,
+    /// 利用阶段采样器（Gaussian = 加权高斯，Tpe = 树结构 Parzen 估计器）
+    pub sampler: OptimizerSampler,
 }
 
 #[gen_stub_pymethods]
 #[pymethods]
 impl OptimizerConfig {
     #[new]
-    #[pyo3(signature = (*, explore_ratio=0.20, sigma_ratio=0.10, weight_decay=0.15, top_k_ratio=0.70, samples_per_round=100, max_samples=10000, min_samples=400, max_rounds=200, stop_patience=10, optimize_metric=crate::types::OptimizeMetric::CalmarRatioRaw, init_samples=None, return_top_k=10, seed=None))]
+    #[pyo3(signature = (*, explore_ratio=0.20, sigma_ratio=0.10, weight_decay=0.15, top_k_ratio=0.70, samples_per_round=100, max_samples=10000, min_samples=400, max_rounds=200, stop_patience=10, optimize_metric=crate::types::OptimizeMetric::CalmarRatioRaw, init_samples=None, return_top_k=10, seed=None, async_mode=false, fidelity_ratio=1.0, promote_ratio=0.3, sampler=self::OptimizerSampler::Gaussian))]
     #[allow(clippy::too_many_arguments)]
     pub fn new(
         explore_ratio: f64,
@@ -251,6 +320,10 @@ impl OptimizerConfig {
         init_samples: Option<Vec<Vec<f64>>>,
         return_top_k: usize,
         seed: Option<u64>,
+        async_mode: bool,
+        fidelity_ratio: f64,
+        promote_ratio: f64,
+        sampler: OptimizerSampler,
     ) -> Self {
         Self {
             explore_ratio,
@@ -266,6 +339,10 @@ impl OptimizerConfig {
             init_samples,
             return_top_k,
             seed,
+            async_mode,
+            fidelity_ratio,
+            promote_ratio,
+            sampler,
         }
     }
 }
@@ -286,6 +363,10 @@ impl Default for OptimizerConfig {
             None,
             10,
             None,
+            false,
+            1.0,
+            0.3,
+            OptimizerSampler::Gaussian,
         )
     }
 }
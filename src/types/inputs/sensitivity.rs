@@ -11,8 +11,12 @@ pub struct SensitivityConfig {
     pub jitter_ratio: f64,
     /// 采样次数
     pub n_samples: usize,
-    /// 分布类型: "uniform" (默认) 或 "normal"
+    /// 分布类型: "uniform" (默认) 或 "normal"，仅 jitter 设计使用
     pub distribution: String,
+    /// 采样设计: "jitter" (默认，独立随机抖动)、"morris" (逐维 Morris 轨迹) 或 "sobol" (Sobol 低差异序列)
+    ///
+    /// morris 设计按 `n_samples / (维度 + 1)` 条轨迹取整，sobol 最多支持 16 维
+    pub design: String,
     /// 随机种子 (保证可复现)
     pub seed: Option<u64>,
     /// 评价指标 (默认 CalmarRatioRaw)
@@ -23,11 +27,12 @@ pub struct SensitivityConfig {
 #[pymethods]
 impl SensitivityConfig {
     #[new]
-    #[pyo3(signature = (*, jitter_ratio=0.05, n_samples=100, distribution="uniform".to_string(), seed=None, metric=OptimizeMetric::CalmarRatioRaw))]
+    #[pyo3(signature = (*, jitter_ratio=0.05, n_samples=100, distribution="uniform".to_string(), design="jitter".to_string(), seed=None, metric=OptimizeMetric::CalmarRatioRaw))]
     pub fn new(
         jitter_ratio: f64,
         n_samples: usize,
         distribution: String,
+        design: String,
         seed: Option<u64>,
         metric: OptimizeMetric,
     ) -> Self {
@@ -35,6 +40,7 @@ impl SensitivityConfig {
             jitter_ratio,
             n_samples,
             distribution,
+            design,
             seed,
             metric,
         }
@@ -47,6 +53,7 @@ impl Default for SensitivityConfig {
             0.05,
             100,
             "uniform".to_string(),
+            "jitter".to_string(),
             None,
             OptimizeMetric::CalmarRatioRaw,
         )
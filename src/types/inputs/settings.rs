@@ -132,17 +132,33 @@ pyo3_stub_gen::inventory::submit! {
 pub struct SettingContainer {
     pub stop_stage: ExecutionStage,
     pub artifact_retention: ArtifactRetention,
+    /// 只保留回测输出的最后 N 行（N > 0，live 信号解析用）；None 表示完整输出
+    pub tail_rows: Option<usize>,
 }
 
-#[gen_stub_pymethods]
-#[pymethods]
 impl SettingContainer {
-    #[new]
-    #[pyo3(signature = (*, stop_stage=self::ExecutionStage::Performance, artifact_retention=self::ArtifactRetention::AllCompletedStages))]
     pub fn new(stop_stage: ExecutionStage, artifact_retention: ArtifactRetention) -> Self {
         Self {
             stop_stage,
             artifact_retention,
+            tail_rows: None,
+        }
+    }
+}
+
+#[gen_stub_pymethods]
+#[pymethods]
+impl SettingContainer {
+    #[new]
+    #[pyo3(signature = (*, stop_stage=self::ExecutionStage::Performance, artifact_retention=self::ArtifactRetention::AllCompletedStages, tail_rows=None))]
+    pub fn py_new(
+        stop_stage: ExecutionStage,
+        artifact_retention: ArtifactRetention,
+        tail_rows: Option<usize>,
+    ) -> Self {
+        Self {
+            tail_rows,
+            ..Self::new(stop_stage, artifact_retention)
         }
     }
 }
@@ -76,13 +76,17 @@ pub struct WalkForwardConfig {
     pub ignore_indicator_warmup: bool,
     /// 内嵌的单次优化器配置
     pub optimizer_config: OptimizerConfig,
+    /// 是否在完整 DataPack 上预计算 sliceable 指标，并按窗口切片复用（非 sliceable 指标逐窗计算一次，窗口内各试验复用）
+    pub precompute_indicators: bool,
+    /// 断点目录；设置后每个完成的窗口落盘，同配置重跑时跳过已完成窗口
+    pub checkpoint_dir: Option<String>,
 }
 
 #[gen_stub_pymethods]
 #[pymethods]
 impl WalkForwardConfig {
     #[new]
-    #[pyo3(signature = (*, train_active_bars, test_active_bars, min_warmup_bars=0, warmup_mode=self::WfWarmupMode::ExtendTest, ignore_indicator_warmup=false, optimizer_config=None))]
+    #[pyo3(signature = (*, train_active_bars, test_active_bars, min_warmup_bars=0, warmup_mode=self::WfWarmupMode::ExtendTest, ignore_indicator_warmup=false, optimizer_config=None, precompute_indicators=false, checkpoint_dir=None))]
     pub fn new(
         train_active_bars: usize,
         test_active_bars: usize,
@@ -90,6 +94,8 @@ impl WalkForwardConfig {
         warmup_mode: WfWarmupMode,
         ignore_indicator_warmup: bool,
         optimizer_config: Option<OptimizerConfig>,
+        precompute_indicators: bool,
+        checkpoint_dir: Option<String>,
     ) -> Self {
         Self {
             train_active_bars,
@@ -98,6 +104,8 @@ impl WalkForwardConfig {
             warmup_mode,
             ignore_indicator_warmup,
             optimizer_config: optimizer_config.unwrap_or_default(),
+            precompute_indicators,
+            checkpoint_dir,
         }
     }
 }
@@ -105,6 +113,15 @@ impl WalkForwardConfig {
 impl Default for WalkForwardConfig {
     fn default() -> Self {
         // 中文注释：默认使用固定 active bar 口径，避免随总样本增长导致窗口漂移。
-        Self::new(500, 200, 0, WfWarmupMode::ExtendTest, false, None)
+        Self::new(
+            500,
+            200,
+            0,
+            WfWarmupMode::ExtendTest,
+            false,
+            None,
+            false,
+            None,
+        )
     }
 }
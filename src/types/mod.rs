@@ -1,19 +1,20 @@
 pub mod inputs;
 pub mod outputs;
+pub mod py_view_cache;
 pub mod utils;
 
 pub use self::inputs::{
     ArtifactRetention, BacktestParams, BenchmarkFunction, DataPack, DataSource, ExecutionStage,
-    IndicatorsParams, LogicOp, OptimizeMetric, OptimizerConfig, Param, ParamContainer, ParamType,
-    PerformanceMetric, PerformanceParams, SensitivityConfig, SettingContainer, SignalGroup,
-    SignalParams, SignalTemplate, SingleParamSet, SourceRange, TemplateContainer,
-    WalkForwardConfig, WfWarmupMode,
+    IndicatorsParams, LogicOp, OptimizeMetric, OptimizerConfig, OptimizerSampler, Param,
+    ParamContainer, ParamType, PerformanceMetric, PerformanceParams, SensitivityConfig,
+    SettingContainer, SignalGroup, SignalParams, SignalTemplate, SingleParamSet, SourceRange,
+    TemplateContainer, WalkForwardConfig, WfWarmupMode,
 };
 
 pub use self::outputs::{
     IndicatorContract, IndicatorContractReport, IndicatorResults, NextWindowHint,
-    OptimizationResult, PerformanceMetrics, ResultPack, RoundSummary, SamplePoint,
-    SensitivityResult, SensitivitySample, StitchedArtifact, StitchedMeta, WalkForwardResult,
-    WindowArtifact, WindowMeta,
+    OptimizationResult, ParameterSensitivity, PerformanceMetrics, ResultPack, RoundSummary,
+    SamplePoint, SensitivityResult, SensitivitySample, StitchedArtifact, StitchedMeta,
+    WalkForwardResult, WindowArtifact, WindowMeta,
 };
 pub use self::utils::*;
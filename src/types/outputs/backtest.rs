@@ -1,10 +1,10 @@
 use polars::prelude::*;
+use pyo3::exceptions::PyKeyError;
 use pyo3::prelude::*;
-use pyo3::IntoPyObjectExt;
-use pyo3_polars::PyDataFrame;
 use pyo3_stub_gen::derive::*;
 use std::collections::HashMap;
 
+use crate::types::py_view_cache::{PyFrameCell, PyObjectMap};
 use crate::types::SourceRange;
 
 pub type PerformanceMetrics = HashMap<String, f64>;
@@ -21,6 +21,17 @@ pub struct ResultPack {
     pub(crate) mapping: DataFrame,
     pub(crate) ranges: HashMap<String, SourceRange>,
     pub(crate) base_data_key: String,
+    pub(crate) views: ResultPackViews,
+}
+
+/// 中文注释：ResultPack 各产物的 Python 视图缓存，转换一次后复用。
+#[derive(Debug, Clone, Default)]
+pub(crate) struct ResultPackViews {
+    indicators: PyObjectMap,
+    signals: PyFrameCell,
+    backtest: PyFrameCell,
+    mapping: PyFrameCell,
+    columns: PyObjectMap,
 }
 
 #[gen_stub_pymethods]
@@ -33,9 +44,10 @@ impl ResultPack {
     ) -> PyResult<Option<Bound<'py, pyo3::types::PyDict>>> {
         match &self.indicators {
             Some(map) => {
+                // 中文注释：每次返回新 dict，避免调用方增删键污染缓存；值为缓存的 DataFrame。
                 let dict = pyo3::types::PyDict::new(py);
                 for (k, v) in map {
-                    dict.set_item(k, PyDataFrame(v.clone()))?;
+                    dict.set_item(k, self.views.indicators.get_or_convert(py, k, v)?)?;
                 }
                 Ok(Some(dict))
             }
@@ -46,7 +58,7 @@ impl ResultPack {
     #[getter]
     pub fn signals<'py>(&self, py: Python<'py>) -> PyResult<Option<Bound<'py, PyAny>>> {
         match &self.signals {
-            Some(df) => Ok(Some(PyDataFrame(df.clone()).into_bound_py_any(py)?)),
+            Some(df) => Ok(Some(self.views.signals.get_or_convert(py, df)?)),
             None => Ok(None),
         }
     }
@@ -54,14 +66,14 @@ impl ResultPack {
     #[getter]
     pub fn backtest_result<'py>(&self, py: Python<'py>) -> PyResult<Option<Bound<'py, PyAny>>> {
         match &self.backtest {
-            Some(df) => Ok(Some(PyDataFrame(df.clone()).into_bound_py_any(py)?)),
+            Some(df) => Ok(Some(self.views.backtest.get_or_convert(py, df)?)),
             None => Ok(None),
         }
     }
 
     #[getter]
     pub fn mapping<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
-        PyDataFrame(self.mapping.clone()).into_bound_py_any(py)
+        self.views.mapping.get_or_convert(py, &self.mapping)
     }
 
     #[getter]
@@ -82,6 +94,29 @@ impl ResultPack {
     pub fn base_data_key(&self) -> String {
         self.base_data_key.clone()
     }
+
+    /// 按列名返回 NumPy 数组（先查 backtest_result，再查 signals），结果缓存复用。
+    /// 单 chunk 且无缺失值的数值列为零拷贝只读视图，不会转换整张表或 Python list。
+    pub fn column<'py>(&self, py: Python<'py>, name: &str) -> PyResult<Bound<'py, PyAny>> {
+        self.views.columns.get_or_try_insert(py, name, || {
+            let frame = match (&self.backtest, &self.signals) {
+                (Some(df), _) if df.get_column_index(name).is_some() => {
+                    self.views.backtest.get_or_convert(py, df)?
+                }
+                (_, Some(df)) if df.get_column_index(name).is_some() => {
+                    self.views.signals.get_or_convert(py, df)?
+                }
+                _ => {
+                    return Err(PyKeyError::new_err(format!(
+                        "ResultPack 中不存在列 '{name}'（已查找 backtest_result 与 signals）"
+                    )))
+                }
+            };
+            frame
+                .call_method1("get_column", (name,))?
+                .call_method0("to_numpy")
+        })
+    }
 }
 
 impl ResultPack {
@@ -103,6 +138,7 @@ impl ResultPack {
             mapping,
             ranges,
             base_data_key,
+            views: ResultPackViews::default(),
         }
     }
 }
@@ -7,7 +7,7 @@ pub mod walk_forward;
 pub use self::backtest::{IndicatorResults, PerformanceMetrics, ResultPack};
 pub use self::indicator_contract::{IndicatorContract, IndicatorContractReport};
 pub use self::optimizer::{OptimizationResult, RoundSummary, SamplePoint};
-pub use self::sensitivity::{SensitivityResult, SensitivitySample};
+pub use self::sensitivity::{ParameterSensitivity, SensitivityResult, SensitivitySample};
 pub use self::walk_forward::{
     NextWindowHint, StitchedArtifact, StitchedMeta, WalkForwardResult, WindowArtifact, WindowMeta,
 };
@@ -15,6 +15,8 @@ pub struct SamplePoint {
     pub metric_value: f64,
     /// 所有已计算的性能指标
     pub all_metrics: HashMap<String, f64>,
+    /// 评估保真度：参与计算的 active 段比例（1.0 = 全量）
+    pub fidelity: f64,
 }
 
 #[gen_stub_pyclass]
@@ -24,7 +26,12 @@ pub struct RoundSummary {
     pub round: usize,
     pub best_value: f64,
     pub median_value: f64,
+    /// 本轮样本总数（含记忆表命中的重复样本）
     pub sample_count: usize,
+    /// 本轮实际执行评估的去重样本数
+    pub unique_count: usize,
+    /// 本轮低保真筛选后未晋级全量评估的样本数
+    pub pruned_count: usize,
 }
 
 #[gen_stub_pyclass]
@@ -47,4 +54,6 @@ pub struct OptimizationResult {
 
     // Internal use (for debugging)
     pub top_k_samples: Vec<SamplePoint>,
+    /// 低保真筛选中未晋级的样本（fidelity < 1.0），指标只反映 active 前缀，不参与 top-k / TPE
+    pub pruned_samples: Vec<SamplePoint>,
 }
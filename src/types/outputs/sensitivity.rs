@@ -15,15 +15,34 @@ pub struct SensitivitySample {
     pub all_metrics: HashMap<String, f64>,
 }
 
+/// 单个可优化参数的敏感度
+#[gen_stub_pyclass]
+#[pyclass(get_all)]
+#[derive(Debug, Clone)]
+pub struct ParameterSensitivity {
+    /// 参数唯一键 `{type_idx}_{group}_{name}`
+    pub name: String,
+    /// 中心参数值
+    pub center_value: f64,
+    /// 弹性：目标指标相对变化 / 参数相对变化（中心值或中心指标为 0、参数未变动时为 NaN）
+    pub elasticity: f64,
+    /// Morris 基本效应绝对值均值 μ*（归一化参数区间，仅 morris 设计）
+    pub mu_star: Option<f64>,
+    /// Morris 基本效应标准差 σ（仅 morris 设计）
+    pub sigma: Option<f64>,
+}
+
 /// 敏感性测试总结果
 #[gen_stub_pyclass]
 #[pyclass(get_all)]
 #[derive(Debug, Clone)]
 pub struct SensitivityResult {
     pub target_metric: String,
+    /// 采样设计: "jitter" / "morris" / "sobol"
+    pub design: String,
     pub original_value: f64,
     pub samples: Vec<SensitivitySample>,
-    /// 请求采样总数（配置中的 n_samples）
+    /// 请求采样总数（采样设计生成的点数；jitter / sobol 即 n_samples）
     pub total_samples_requested: usize,
     /// 实际成功样本数
     pub successful_samples: usize,
@@ -47,6 +66,8 @@ pub struct SensitivityResult {
     pub top_k_samples: Vec<SensitivitySample>,
     /// 最差样本（按目标指标升序，最多 5）
     pub bottom_k_samples: Vec<SensitivitySample>,
+    /// 逐参数敏感度，顺序与样本 `values` 一致
+    pub parameters: Vec<ParameterSensitivity>,
 }
 
 #[gen_stub_pymethods]
@@ -79,7 +100,10 @@ impl SensitivityResult {
         let mut lines = Vec::with_capacity(20);
         lines.push(String::new());
         lines.push("=".repeat(50));
-        lines.push(format!("敏感性测试报告 (Target: {})", self.target_metric));
+        lines.push(format!(
+            "敏感性测试报告 (Target: {}, Design: {})",
+            self.target_metric, self.design
+        ));
         lines.push("-".repeat(50));
         lines.push(format!(
             "样本请求/成功/失败 : {}/{}/{} (failed_rate={:.2}%)",
@@ -105,6 +129,17 @@ impl SensitivityResult {
             crash_rate * 100.0,
             threshold
         ));
+        if !self.parameters.is_empty() {
+            lines.push("-".repeat(50));
+            lines.push("参数弹性 (Elasticity / μ* / σ):".to_string());
+            for p in &self.parameters {
+                let morris = match (p.mu_star, p.sigma) {
+                    (Some(mu_star), Some(sigma)) => format!(" / {:.4} / {:.4}", mu_star, sigma),
+                    _ => String::new(),
+                };
+                lines.push(format!("  {}: {:.4}{}", p.name, p.elasticity, morris));
+            }
+        }
         lines.push("=".repeat(50));
         lines.join("\n")
     }
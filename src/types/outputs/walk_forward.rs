@@ -72,4 +72,6 @@ pub struct WalkForwardResult {
     pub optimize_metric: OptimizeMetric,
     pub window_results: Vec<WindowArtifact>,
     pub stitched_result: StitchedArtifact,
+    /// 模板与 WF 配置（含优化器配置）的稳定哈希；增量续跑时不一致则不复用任何旧窗口
+    pub settings_hash: u64,
 }
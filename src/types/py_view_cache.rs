@@ -0,0 +1,106 @@
+//! 中文注释：pack 对象的 Python 视图缓存。
+//!
+//! getter 首次访问时把 Rust `DataFrame` 转成 Polars Python 对象，之后复用同一个对象，
+//! 避免每次访问都重新走一遍 Arrow 导出。克隆时不共享缓存：克隆出的 pack
+//! 可能在 Rust 侧被改写（例如 tail 截断），共享缓存会返回过期视图。
+
+use polars::prelude::DataFrame;
+use pyo3::prelude::*;
+use pyo3::IntoPyObjectExt;
+use pyo3_polars::PyDataFrame;
+use std::collections::HashMap;
+use std::fmt;
+use std::sync::{Mutex, OnceLock};
+
+/// 单个 DataFrame 的 Python 视图缓存。
+#[derive(Default)]
+pub struct PyFrameCell(OnceLock<Py<PyAny>>);
+
+impl PyFrameCell {
+    pub fn get_or_convert<'py>(
+        &self,
+        py: Python<'py>,
+        df: &DataFrame,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        if let Some(obj) = self.0.get() {
+            return Ok(obj.bind(py).clone());
+        }
+        let obj = PyDataFrame(df.clone()).into_py_any(py)?;
+        // 中文注释：并发首访时以先写入者为准，后到者丢弃自己的转换结果。
+        let _ = self.0.set(obj);
+        Ok(self.0.get().expect("PyFrameCell 已初始化").bind(py).clone())
+    }
+}
+
+impl Clone for PyFrameCell {
+    fn clone(&self) -> Self {
+        Self::default()
+    }
+}
+
+impl fmt::Debug for PyFrameCell {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        let state = if self.0.get().is_some() {
+            "cached"
+        } else {
+            "empty"
+        };
+        write!(f, "PyFrameCell({state})")
+    }
+}
+
+/// 按键缓存的 Python 对象表（多周期 source / indicators、列投影等）。
+#[derive(Default)]
+pub struct PyObjectMap(Mutex<HashMap<String, Py<PyAny>>>);
+
+impl PyObjectMap {
+    pub fn get_or_try_insert<'py, F>(
+        &self,
+        py: Python<'py>,
+        key: &str,
+        make: F,
+    ) -> PyResult<Bound<'py, PyAny>>
+    where
+        F: FnOnce() -> PyResult<Bound<'py, PyAny>>,
+    {
+        if let Some(obj) = self.lock().get(key) {
+            return Ok(obj.bind(py).clone());
+        }
+        // 中文注释：构建期间不持锁，make 内部可能再次访问同一个 pack 的其他缓存。
+        let obj = make()?;
+        let cached = self
+            .lock()
+            .entry(key.to_string())
+            .or_insert_with(|| obj.clone().unbind())
+            .bind(py)
+            .clone();
+        Ok(cached)
+    }
+
+    pub fn get_or_convert<'py>(
+        &self,
+        py: Python<'py>,
+        key: &str,
+        df: &DataFrame,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        self.get_or_try_insert(py, key, || PyDataFrame(df.clone()).into_bound_py_any(py))
+    }
+
+    fn lock(&self) -> std::sync::MutexGuard<'_, HashMap<String, Py<PyAny>>> {
+        self.0
+            .lock()
+            .unwrap_or_else(|poisoned| poisoned.into_inner())
+    }
+}
+
+impl Clone for PyObjectMap {
+    fn clone(&self) -> Self {
+        Self::default()
+    }
+}
+
+impl fmt::Debug for PyObjectMap {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        write!(f, "PyObjectMap(len={})", self.lock().len())
+    }
+}